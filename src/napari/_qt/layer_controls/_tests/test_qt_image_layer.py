@@ -145,6 +145,20 @@ def test_auto_contrast_buttons(qtbot):
     assert layer.contrast_limits == [192, 255]
 
 
+def test_auto_contrast_once_uses_histogram_quantiles(qtbot):
+    data = np.arange(10_000, dtype=np.uint16).reshape(100, 100)
+    data[0, 0] = 60_000
+    layer = Image(data)
+    qtctrl = QtImageControls(layer)
+    qtbot.addWidget(qtctrl)
+    layer.histogram.enabled = True
+
+    qtctrl._contrast_limits_control.auto_scale_buttons.once_btn.click()
+    np.testing.assert_allclose(
+        layer.contrast_limits, np.quantile(data, (0.001, 0.999))
+    )
+
+
 def test_histogram_button_toggles_inline_histogram(qtbot):
     layer = Image(np.random.rand(8, 8))
     qtctrl = QtImageControls(layer)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Optional, cast
 
 import numpy as np
 from qtpy.QtCore import Qt, Signal
@@ -26,12 +26,13 @@ from napari._qt.layer_controls.widgets.qt_widget_controls_base import (
     QtWidgetControlsBase,
     QtWrappedLabel,
 )
+from napari._qt.qthreading import GeneratorWorker, create_worker
 from napari._qt.utils import qt_signals_blocked
 from napari._qt.widgets.qt_mode_buttons import QtModePushButton
 from napari.layers import Image, Surface
 from napari.utils._dtype import normalize_dtype
 from napari.utils.events import disconnect_events
-from napari.utils.events.event_utils import connect_no_arg, connect_setattr
+from napari.utils.events.event_utils import connect_setattr
 
 
 def range_to_decimals(range_, dtype):
@@ -325,11 +326,17 @@ class QContrastLimitsPopup(QtPopup):
         return widget
 
 
+# Quantiles of the histogram data used as contrast limits by the "once"
+# auto-contrast button when the histogram is shown.
+AUTO_CONTRAST_QUANTILES = (0.001, 0.999)
+
+
 class AutoScaleButtons(QWidget):
     def __init__(
         self, layer: Image | Surface, parent: Optional[QWidget] = None
     ) -> None:
         super().__init__(parent=parent)
+        self._layer = layer
 
         self.setLayout(QHBoxLayout())
         self.layout().setSpacing(2)
@@ -342,12 +349,27 @@ class AutoScaleButtons(QWidget):
         self.auto_btn.setChecked(layer.auto_contrast)
         self.auto_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         self.once_btn.clicked.connect(lambda: self.auto_btn.setChecked(False))
-        connect_no_arg(self.once_btn.clicked, layer, 'reset_contrast_limits')
+        self.once_btn.clicked.connect(self._on_once_clicked)
         connect_setattr(self.auto_btn.toggled, layer, 'auto_contrast')
 
         self.layout().addWidget(self.once_btn)
         self.layout().addWidget(self.auto_btn)
 
+    def _on_once_clicked(self) -> None:
+        """Set the contrast limits once from the data.
+
+        When the histogram is shown and up to date, the contrast limits are
+        set to its 0.1 and 99.9 percentiles, ignoring outliers, and otherwise
+        to the range of the data.
+        """
+        histogram = self._layer.histogram
+        if histogram.enabled and not histogram._dirty:
+            low, high = histogram.quantiles(AUTO_CONTRAST_QUANTILES)
+            if low < high:
+                self._layer.contrast_limits = (float(low), float(high))
+                return
+        self._layer.reset_contrast_limits()
+
 
 class QtContrastLimitsControl(QtWidgetControlsBase):
     """
@@ -461,6 +483,41 @@ class QtContrastLimitsControl(QtWidgetControlsBase):
             self._on_histogram_model_enabled
         )
 
+        # Estimate the range of large data in the background
+        self._data_range_worker: GeneratorWorker | None = None
+        self._layer.events.data.connect(self._start_data_range_estimate)
+        self._start_data_range_estimate()
+
+    def _start_data_range_estimate(self) -> None:
+        """Estimate the range of the layer data in a background thread."""
+        self._stop_data_range_estimate()
+        if (
+            not isinstance(self._layer, Image)
+            or not self._layer._should_estimate_data_range()
+        ):
+            return
+        worker = cast(
+            GeneratorWorker,
+            create_worker(
+                self._layer._estimate_data_range,  # type: ignore[arg-type]
+                _progress={'desc': 'Estimating data range'},
+            ),
+        )
+        worker.yielded.connect(self._on_data_range_estimate)
+        self._data_range_worker = worker
+        worker.start()
+
+    def _stop_data_range_estimate(self) -> None:
+        if self._data_range_worker is not None:
+            self._data_range_worker.yielded.disconnect(
+                self._on_data_range_estimate
+            )
+            self._data_range_worker.quit()
+            self._data_range_worker = None
+
+    def _on_data_range_estimate(self, data_estimate) -> None:
+        self._layer._on_data_range_estimate(*data_estimate)
+
     def show_clim_popup(self):
         self.clim_popup = QContrastLimitsPopup(
             self._layer,
@@ -568,6 +625,7 @@ class QtContrastLimitsControl(QtWidgetControlsBase):
 
     def disconnect_widget_controls(self) -> None:
         """Disconnect histogram model events and base controls."""
+        self._stop_data_range_estimate()
         disconnect_events(self._layer.histogram.events, self)
         super().disconnect_widget_controls()
 
@@ -153,6 +153,10 @@ class LockableData:
     def shape(self) -> tuple[int, ...]:
         return self.data.shape
 
+    @property
+    def size(self) -> int:
+        return self.data.size
+
     @property
     def ndim(self) -> int:
         # LayerDataProtocol does not have ndim, but this should be equivalent.
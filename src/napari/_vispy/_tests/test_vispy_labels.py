@@ -2,6 +2,7 @@ import numpy as np
 import pytest
 
 from napari._vispy.layers.labels import (
+    build_textures_from_colors,
     build_textures_from_dict,
 )
 
@@ -22,3 +23,15 @@ def test_build_textures_from_dict_exc():
             {0: (0, 0, 0, 0), 1: (1, 1, 1, 1), 2: (2, 2, 2, 2)},
             max_size=1,
         )
+
+
+def test_build_textures_from_colors():
+    colors = np.arange(28, dtype=np.float32).reshape(7, 4)
+    values = build_textures_from_colors(colors, max_size=3)
+    assert values.shape == (3, 3, 4)
+    np.testing.assert_array_equal(
+        values,
+        build_textures_from_dict(dict(enumerate(colors)), max_size=3),
+    )
+    for index, color in enumerate(colors):
+        np.testing.assert_array_equal(values[index % 3, index // 3], color)
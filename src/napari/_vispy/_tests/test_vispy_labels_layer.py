@@ -122,6 +122,8 @@ def test_labels_painting(qtbot, array_type, qt_viewer):
     QCoreApplication.instance().processEvents()
     layer.paint((10, 10), 1, refresh=True)
     visual = qt_viewer.layer_to_visual[layer]
+    # the changes are sent right before the canvas draws
+    qt_viewer.canvas._on_before_draw()
     assert np.any(visual.node._data)
 
 
@@ -143,6 +145,7 @@ def test_labels_fill_slice(qtbot, array_type, qt_viewer):
     layer.n_edit_dimensions = 3
     QCoreApplication.instance().processEvents()
     layer.fill((1, 10, 10), 13, refresh=True)
+    qt_viewer.canvas._on_before_draw()
     visual = qt_viewer.layer_to_visual[layer]
     assert np.sum(visual.node._data) == 13
 
@@ -171,6 +174,7 @@ def test_labels_painting_with_mouse(MouseEvent, qtbot, array_type, qt_viewer):
     visual = qt_viewer.layer_to_visual[layer]
     assert not np.any(visual.node._data)
     mouse_press_callbacks(layer, event)
+    qt_viewer.canvas._on_before_draw()
     assert np.any(visual.node._data)
 
 
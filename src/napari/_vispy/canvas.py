@@ -254,6 +254,9 @@ class VispyCanvas:
         self._scene_canvas.events.mouse_wheel.connect(self._on_mouse_wheel)
         self._scene_canvas.events.resize.connect(self._on_vispy_size_change)
         self._scene_canvas.events.draw.connect(self.on_draw, position='last')
+        self._scene_canvas.events.draw.connect(
+            self._on_before_draw, position='first'
+        )
         self.viewer.cursor.events.style.connect(self._on_cursor)
         self.viewer.cursor.events.size.connect(self._on_cursor)
 
@@ -685,6 +688,11 @@ class VispyCanvas:
         bottom_right = self._map_canvas2world(view.rect.size, view)
         return np.array([top_left, bottom_right])
 
+    def _on_before_draw(self, event: DrawEvent | None = None) -> None:
+        """Let the layer visuals send their changes before the scene is drawn."""
+        for vispy_layer in self.layer_to_visual.values():
+            vispy_layer._on_before_draw()
+
     def on_draw(self, event: DrawEvent | None = None) -> None:
         """Called whenever the canvas is drawn.
 
@@ -322,6 +322,13 @@ class VispyBaseLayer(ABC, Generic[_L]):
         self._on_experimental_clipping_planes_change()
         self._on_camera_move()
 
+    def _on_before_draw(self) -> None:
+        """Called right before the canvas draws the scene.
+
+        Visuals can send data that changed since the last frame here, so
+        that successive changes are only sent once per frame.
+        """
+
     def _on_poll(self, event=None):
         """Called when camera moves, before we are drawn.
 
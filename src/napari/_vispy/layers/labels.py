@@ -153,28 +153,36 @@ def build_textures_from_dict(
     If any keys are larger than the size of the dictionary, they will
     overwrite earlier keys in the best case, or it might just crash.
     """
-    if len(color_dict) > 2**23:
+    colors = np.zeros((len(color_dict), 4), dtype=np.float32)
+    for key, value in color_dict.items():
+        colors[key] = value
+    return build_textures_from_colors(colors, max_size)
+
+
+def build_textures_from_colors(
+    colors: np.ndarray, max_size: int
+) -> np.ndarray:
+    """Lay out an (N, 4) array of colors in a 2D texture.
+
+    The color of texture value ``i`` is at ``[i % rows, i // rows]``, where
+    ``rows`` is the first dimension of the texture, at most ``max_size``.
+    """
+    if len(colors) > 2**23:
         raise ValueError(  # pragma: no cover
             'Cannot map more than 2**23 colors because of float32 precision. '
-            f'Got {len(color_dict)}'
+            f'Got {len(colors)}'
         )
-    if len(color_dict) > max_size**2:
+    if len(colors) > max_size**2:
         raise ValueError(
             'Cannot create a 2D texture holding more than '
             f'{max_size}**2={max_size**2} colors.'
-            f'Got {len(color_dict)}'
+            f'Got {len(colors)}'
         )
-    data = np.zeros(
-        (
-            min(len(color_dict), max_size),
-            math.ceil(len(color_dict) / max_size),
-            4,
-        ),
-        dtype=np.float32,
-    )
-    for key, value in color_dict.items():
-        data[key % data.shape[0], key // data.shape[0]] = value
-    return data
+    rows = min(len(colors), max_size)
+    columns = math.ceil(len(colors) / max_size)
+    data = np.zeros((columns * rows, 4), dtype=np.float32)
+    data[: len(colors)] = colors
+    return np.ascontiguousarray(data.reshape(columns, rows, 4).swapaxes(0, 1))
 
 
 def _select_colormap_texture(
@@ -199,6 +207,8 @@ class VispyLabelsLayer(VispyScalarFieldBaseLayer):
         self, layer, node=None, texture_format='r8', **kwargs
     ) -> None:
         self._colormap_dtypes: tuple[np.dtype, np.dtype] | None = None
+        # whether the canvas is about to draw, see _on_before_draw
+        self._drawing = False
         super().__init__(
             layer,
             node=node,
@@ -208,6 +218,10 @@ class VispyLabelsLayer(VispyScalarFieldBaseLayer):
         )
 
         self.layer.events.labels_update.connect(self._on_partial_labels_update)
+        # the changed regions are refreshed before drawing, see
+        # Labels._request_partial_labels_refresh
+        self.layer._deferred_refresh_views += 1
+        self.layer.events.labels_dirty.connect(self._on_labels_dirty)
         self.layer.events.selected_label.connect(self._on_colormap_change)
         self.layer.events.show_selected_label.connect(self._on_colormap_change)
         self.layer.events.iso_gradient_mode.connect(
@@ -281,9 +295,10 @@ class VispyLabelsLayer(VispyScalarFieldBaseLayer):
             self.texture_data = color_texture
 
         elif not auto_mode:  # only for raw_dtype.itemsize > 2
-            color_dict = colormap._values_mapping_to_minimum_values_set()[1]
             max_size = get_max_texture_sizes()[0]
-            val_texture = build_textures_from_dict(color_dict, max_size)
+            val_texture = build_textures_from_colors(
+                colormap._texture_colors(), max_size
+            )
 
             dtype = _texture_dtype(
                 self.layer._direct_colormap._num_unique_colors + 2,
@@ -316,6 +331,17 @@ class VispyLabelsLayer(VispyScalarFieldBaseLayer):
         if isinstance(self.node, VolumeNode):
             self.node.iso_gradient_mode = self.layer.iso_gradient_mode
 
+    def _on_labels_dirty(self) -> None:
+        self.node.update()
+
+    def _on_before_draw(self) -> None:
+        # the updates sent now are drawn in this frame, without another draw
+        self._drawing = True
+        try:
+            self.layer._partial_labels_refresh()
+        finally:
+            self._drawing = False
+
     def _on_partial_labels_update(self, event):
         if not self.layer.loaded:
             return
@@ -331,13 +357,18 @@ class VispyLabelsLayer(VispyScalarFieldBaseLayer):
         self.node._texture.scale_and_set_data(
             event.data, copy=False, offset=event.offset
         )
-        self.node.update()
+        if not self._drawing:
+            self.node.update()
 
     def reset(self, event=None) -> None:
         super().reset()
         self._on_colormap_change()
         self._on_iso_gradient_mode_change()
 
+    def close(self):
+        self.layer._deferred_refresh_views -= 1
+        super().close()
+
 
 class LabelLayerNode(ScalarFieldLayerNode):
     def __init__(self, custom_node: Node = None, texture_format=None):
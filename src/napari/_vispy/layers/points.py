@@ -53,7 +53,10 @@ class VispyPointsLayer(VispyBaseLayer):
         # Set vispy data, noting that the order of the points needs to be
         # reversed to make the most recently added point appear on top
         # and the rows / columns need to be switched for vispy's x / y ordering
-        if len(self.layer._indices_view) == 0:
+        lod = self.layer._lod_view_indices
+        if len(self.layer._indices_view) == 0 or (
+            lod is not None and len(lod) == 0
+        ):
             # always pass one invisible point to avoid issues
             data = np.zeros((1, self.layer._slice_input.ndisplay))
             size = np.zeros(1)
@@ -61,6 +64,15 @@ class VispyPointsLayer(VispyBaseLayer):
             face_color = np.array([[1.0, 1.0, 1.0, 1.0]], dtype=np.float32)
             border_width = np.zeros(1)
             symbol = ['o']
+        elif lod is not None:
+            # only upload the level-of-detail subset of the points in view
+            indices = self.layer._indices_view[lod]
+            data = self.layer._view_data_at(lod)
+            size = self.layer._view_size_at(lod)
+            border_color = self.layer.border_color[indices]
+            face_color = self.layer.face_color[indices]
+            border_width = self.layer.border_width[indices]
+            symbol = [str(x) for x in self.layer.symbol[indices]]
         else:
             data = self.layer._view_data
             size = self.layer._view_size
@@ -40,13 +40,52 @@ class VispyShapesLayer(VispyBaseLayer):
         self.node.highlight_vertices.symbol = 'square'
         self.node.highlight_vertices.scaling = False
 
+        # The displayed triangles and mesh vertices last given to the node,
+        # and how many in place updates of them it has received, or None.
+        self._uploaded_mesh: tuple[np.ndarray, np.ndarray, int] | None = None
+
         self.reset()
         self._on_data_change()
 
     def _on_data_change(self):
-        faces = self.layer._data_view._mesh.displayed_triangles
-        colors = self.layer._data_view._mesh.displayed_triangles_colors
-        vertices = self.layer._data_view._mesh.vertices
+        mesh = self.layer._data_view._mesh
+        faces = mesh.displayed_triangles
+        colors = mesh.displayed_triangles_colors
+        vertices = mesh.vertices
+        updates = mesh.displayed_triangles_updates
+        uploaded = self._uploaded_mesh
+
+        if (
+            uploaded is not None
+            and uploaded[0] is faces
+            and uploaded[1] is vertices
+            and uploaded[2] <= len(updates)
+        ):
+            # only some shapes changed in place since the last upload
+            rows = updates[uploaded[2] :]
+            if rows:
+                self.node.shape_faces.set_faces_subdata(
+                    np.concatenate(rows), vertices[:, ::-1], faces, colors
+                )
+            self._uploaded_mesh = (faces, vertices, len(updates))
+        else:
+            self._set_faces_data()
+
+        # Call to update order of translation values with new dims:
+        self._on_matrix_change()
+        self._update_text(update_node=False)
+        self.node.update()
+
+    def _set_faces_data(self):
+        mesh = self.layer._data_view._mesh
+        faces = mesh.displayed_triangles
+        colors = mesh.displayed_triangles_colors
+        vertices = mesh.vertices
+        self._uploaded_mesh = (
+            faces,
+            vertices,
+            len(mesh.displayed_triangles_updates),
+        )
 
         # Note that the indices of the vertices need to be reversed to
         # go from numpy style to xyz
@@ -57,6 +96,7 @@ class VispyShapesLayer(VispyBaseLayer):
             vertices = np.zeros((3, self.layer._slice_input.ndisplay))
             faces = np.array([[0, 1, 2]])
             colors = np.array([[0, 0, 0, 0]])
+            self._uploaded_mesh = None
 
         if (
             len(self.layer.data)
@@ -64,16 +104,12 @@ class VispyShapesLayer(VispyBaseLayer):
             and self.layer.ndim == 2
         ):
             vertices = np.pad(vertices, ((0, 0), (0, 1)), mode='constant')
+            self._uploaded_mesh = None
 
         self.node.shape_faces.set_data(
             vertices=vertices, faces=faces, face_colors=colors
         )
 
-        # Call to update order of translation values with new dims:
-        self._on_matrix_change()
-        self._update_text(update_node=False)
-        self.node.update()
-
     def _on_highlight_change(self):
         if len(self.layer.selected_data) > 1000:
             # Defer to next frame to avoid blocking UI
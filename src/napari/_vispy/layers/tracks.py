@@ -20,6 +20,10 @@ class VispyTracksLayer(VispyBaseLayer):
         node = TracksVisual(font_info=font_info)
         super().__init__(layer, node, font_info=font_info)
 
+        # time window of the track vertices in the line visual, or None if
+        # all the vertices are
+        self._track_window: tuple[float, float] | None = None
+
         self.layer.events.tail_width.connect(self._on_appearance_change)
         self.layer.events.tail_length.connect(self._on_appearance_change)
         self.layer.events.head_length.connect(self._on_appearance_change)
@@ -54,8 +58,12 @@ class VispyTracksLayer(VispyBaseLayer):
             self.node._subvisuals[1].pos = labels_pos
 
         # If hide_completed_tracks is enabled, update track connections
-        # when the current time changes
-        if self.layer.hide_completed_tracks:
+        # when the current time changes, and upload the vertices of the new
+        # window when the current time leaves the displayed one
+        if (
+            self.layer.hide_completed_tracks
+            or self.layer._track_window != self._track_window
+        ):
             self._on_tracks_change()
 
         self.node.update()
@@ -84,31 +92,43 @@ class VispyTracksLayer(VispyBaseLayer):
         self.node._subvisuals[1].visible = self.layer.display_id
         self.node._subvisuals[2].visible = self.layer.display_graph
 
+        # the displayed time window depends on the tail and head lengths
+        if self.layer._track_window != self._track_window:
+            self._on_tracks_change()
+
         # set the width of the track tails
         self.node._subvisuals[0].set_data(
             width=self.layer.tail_width,
-            color=self.layer.track_colors,
+            color=self.layer._windowed_track_colors(self._track_window),
         )
         self.node._subvisuals[2].set_data(
             width=self.layer.tail_width,
         )
 
     def _on_tracks_change(self):
-        """Update the shader when the track data changes."""
+        """Update the shader when the track data changes.
+
+        For large datasets, only the vertices within a time window around
+        the current time are sent to the line visual.
+        """
+        self._track_window = self.layer._track_window
+        pos, connex, times = self.layer._windowed_track_data(
+            self._track_window
+        )
 
         self.node.tracks_filter.use_fade = self.layer.use_fade
         self.node.tracks_filter.tail_length = self.layer.tail_length
-        self.node.tracks_filter.vertex_time = self.layer.track_times
+        self.node.tracks_filter.vertex_time = times
         self.node.tracks_filter.hide_completed_tracks = (
             self.layer.hide_completed_tracks
         )
 
         # change the data to the vispy line visual
         self.node._subvisuals[0].set_data(
-            pos=self.layer._view_data,
-            connect=self.layer.track_connex,
+            pos=pos,
+            connect=connex,
             width=self.layer.tail_width,
-            color=self.layer.track_colors,
+            color=self.layer._windowed_track_colors(self._track_window),
         )
 
         # Call to update order of translation values with new dims:
@@ -23,14 +23,22 @@ class VispyVectorsLayer(VispyBaseLayer):
         self._on_data_change()
 
     def _on_data_change(self):
+        lod = self.layer._lod_view
+        if lod is None:
+            view_data = self.layer._view_data
+            face_color = self.layer._view_face_color
+        else:
+            # only mesh the level-of-detail vectors in view
+            view_data, colors = lod
+            face_color = self.layer._triangle_colors(colors)
+
         # Make meshes
         vertices, faces = generate_vector_meshes(
-            self.layer._view_data,
+            view_data,
             self.layer.edge_width,
             self.layer.length,
             self.layer.vector_style,
         )
-        face_color = self.layer._view_face_color
         ndisplay = self.layer._slice_input.ndisplay
         ndim = self.layer.ndim
 
@@ -2,7 +2,16 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from vispy.scene.visuals import Compound, Line, Markers, Mesh
+import numpy as np
+from vispy.geometry import MeshData
+from vispy.scene.visuals import (
+    Compound,
+    Line,
+    Markers,
+    Mesh,
+    create_visual_node,
+)
+from vispy.visuals.mesh import MeshVisual
 
 from napari._vispy.visuals.clipping_planes_mixin import ClippingPlanesMixin
 from napari._vispy.visuals.text import Text
@@ -11,6 +20,60 @@ if TYPE_CHECKING:
     from napari._vispy.utils.qt_font import FontInfo
 
 
+class ShapesMeshVisual(MeshVisual):
+    """Mesh visual with face colors that can update some faces in place."""
+
+    def set_faces_subdata(
+        self,
+        rows: np.ndarray,
+        vertices: np.ndarray,
+        faces: np.ndarray,
+        face_colors: np.ndarray,
+    ) -> None:
+        """Set the mesh data after some faces changed.
+
+        The number of faces must be the same as in the current data. Only
+        the range of faces between the first and last changed face is
+        uploaded to the GPU.
+
+        Parameters
+        ----------
+        rows : np.ndarray
+            Indices of the faces that changed.
+        vertices : np.ndarray
+            The vertices.
+        faces : np.ndarray
+            The faces.
+        face_colors : np.ndarray
+            Colors to use for each face.
+        """
+        self._meshdata = MeshData(
+            vertices=vertices, faces=faces, face_colors=face_colors
+        )
+        self._bounds = self._meshdata.get_bounds()
+        if self._data_changed or len(rows) == 0:
+            # the whole data will be uploaded on the next draw anyway
+            self.update()
+            return
+
+        start, stop = int(np.min(rows)), int(np.max(rows)) + 1
+        positions = vertices[faces[start:stop]].reshape(-1, vertices.shape[1])
+        if positions.shape[1] == 2:
+            positions = np.pad(positions, ((0, 0), (0, 1)))
+        # buffers hold the 3 vertices of each face one after the other
+        self._vertices.set_subdata(
+            positions.astype(np.float32), offset=3 * start
+        )
+        colors = np.repeat(face_colors[start:stop], 3, axis=0)
+        self.shared_program.vert['base_color'].set_subdata(
+            colors.astype(np.float32), offset=3 * start
+        )
+        self.update()
+
+
+ShapesMesh = create_visual_node(ShapesMeshVisual)
+
+
 class ShapesVisual(ClippingPlanesMixin, Compound):
     """
     Compound vispy visual for shapes visualization with
@@ -27,7 +90,7 @@ class ShapesVisual(ClippingPlanesMixin, Compound):
     def __init__(self, font_info: FontInfo) -> None:
         super().__init__(
             [
-                Mesh(),
+                ShapesMesh(),
                 Mesh(),
                 Line(antialias=True),
                 Markers(),
@@ -37,7 +100,7 @@ class ShapesVisual(ClippingPlanesMixin, Compound):
         )
 
     @property
-    def shape_faces(self) -> Mesh:
+    def shape_faces(self) -> ShapesMesh:
         """Mesh for shape faces"""
         return self._subvisuals[0]
 
@@ -9,6 +9,7 @@ import logging
 import weakref
 from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
 from contextlib import contextmanager
+from functools import partial
 from threading import RLock
 from typing import (
     TYPE_CHECKING,
@@ -42,6 +43,21 @@ class _SliceRequest(Protocol):
     def __call__(self) -> Any: ...
 
 
+@runtime_checkable
+class _RefinableSliceRequest(Protocol):
+    """A slice request whose response can be progressively refined.
+
+    After the response of the request is emitted, the responses of its
+    refinements are computed and emitted in order, unless a newer slice
+    request is made for the same layer in the meantime.
+    """
+
+    id: int
+    refinements: tuple[_SliceRequest, ...]
+
+    def __call__(self) -> Any: ...
+
+
 @runtime_checkable
 class _AsyncSliceable(Protocol):
     """The methods needed for async slicing to be supported on a layer.
@@ -77,6 +93,24 @@ class _AsyncSliceable(Protocol):
         """
 
 
+@runtime_checkable
+class _PrefetchSliceable(Protocol):
+    """The methods needed for slices of a layer to be prefetched.
+
+    These methods are private to avoid inflating the public API of
+    layers while async slicing is being developed.
+    """
+
+    def _make_prefetch_request(self, dims: Dims) -> _SliceRequest | None:
+        """Makes a callable slice request that warms the layer's slice cache.
+
+        This method should run quickly, as it is expected to run on the main thread.
+        Calling the request should store its response in a cache that is used by
+        later slice requests with the same dims. Returns None if there is nothing
+        to prefetch, for example because the slice is already cached.
+        """
+
+
 class _LayerSlicer:
     """
     High level class to control the creation of a slice (via a slice request),
@@ -86,16 +120,25 @@ class _LayerSlicer:
     Events
     ------
     ready
-        emitted after slicing is done with a dict value that maps from layer
-        to slice response. Note that this may be emitted on the main or
+        emitted after slicing of each layer is done with a dict value that
+        maps from layer to slice response. When multiple layers are submitted
+        together, this is emitted once per layer as soon as that layer's slice
+        is ready. Note that this may be emitted on the main or
         a non-main thread. If usage of this event relies on something happening
         on the main thread, actions should be taken to ensure that the callback
         is also executed on the main thread (e.g. by decorating the callback
         with `@ensure_main_thread`).
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_workers: int | None = None) -> None:
         """
+        Parameters
+        ----------
+        max_workers : int, optional
+            The number of threads used to slice layers concurrently. If None,
+            the value of the ``async_slicing_workers`` experimental setting
+            is used.
+
         Attributes
         ----------
         _executor : concurrent.futures.ThreadPoolExecutor
@@ -106,12 +149,28 @@ class _LayerSlicer:
             task storage for cancellation logic
         _task_to_requests : dict of futures to slice requests
             maps completed tasks back to their layer and slice requests,
+        _task_to_layer_tasks : dict of futures to dicts of layer futures
+            maps each task to the per-layer futures that are executing
+            its slice requests
         _lock_futures_dicts : threading.RLock
-            lock to guard against concurrent changes to `_layers_to_task`
-            and `_task_to_requests` when finding, adding, or removing tasks
+            lock to guard against concurrent changes to `_layers_to_task`,
+            `_task_to_requests` and `_task_to_layer_tasks` when finding,
+            adding, or removing tasks
+        _prefetch_executor : concurrent.futures.ThreadPoolExecutor
+            single thread running the speculative slicing tasks, so that
+            they never take a slicing thread away from a slice being waited
+            for, and at most one of them is in flight at a time
+        _prefetch_tasks : list of futures
+            pending speculative slicing tasks, which are cancelled when the
+            dims point moves again
+        _last_dims_state : tuple or None
+            the dims state of the last submission, used to find the axis and
+            direction of motion to prefetch along
         """
         self.events = EmitterGroup(source=self, ready=Event)
-        self._executor: Executor = ThreadPoolExecutor(max_workers=1)
+        if max_workers is None:
+            max_workers = get_settings().experimental.async_slicing_workers
+        self._executor: Executor = _make_executor(max_workers)
         self._force_sync = not get_settings().experimental.async_
         self._layers_to_task: dict[
             tuple[weakref.ReferenceType[Layer], ...], Future
@@ -119,7 +178,32 @@ class _LayerSlicer:
         self._task_to_requests: dict[
             Future, dict[weakref.ReferenceType[Layer], _SliceRequest]
         ] = {}
+        self._task_to_layer_tasks: dict[
+            Future, dict[weakref.ReferenceType[Layer], Future]
+        ] = {}
         self._lock_futures_dicts = RLock()
+        self._prefetch_executor: Executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='napari-prefetch'
+        )
+        self._prefetch_tasks: list[Future] = []
+        self._last_dims_state: tuple | None = None
+
+    def set_max_workers(self, max_workers: int) -> None:
+        """Replaces the slicing thread pool with one of the given size.
+
+        Tasks that were already submitted to the previous pool are left
+        to complete, but new tasks are only submitted to the new pool.
+        This should only be called from the main thread.
+
+        Parameters
+        ----------
+        max_workers : int
+            The number of threads used to slice layers concurrently.
+        """
+        logger.debug('_LayerSlicer.set_max_workers: %s', max_workers)
+        old_executor = self._executor
+        self._executor = _make_executor(max_workers)
+        old_executor.shutdown(wait=False)
 
     @contextmanager
     def force_sync(self):
@@ -170,14 +254,20 @@ class _LayerSlicer:
     ) -> Future[dict] | None:
         """Slices the given layers with the given dims.
 
-        Submitting multiple layers at one generates multiple requests, but only ONE task.
+        Submitting multiple layers at once generates multiple requests, but only
+        ONE task. Each request is executed as its own future on the slicing
+        thread pool, so that layers can be sliced in parallel and the ``ready``
+        event is emitted for each layer as soon as its slice is done. The
+        returned task completes once all of its layers have been sliced.
 
         This will attempt to cancel all pending slicing tasks that can be entirely
         replaced the new ones. If multiple layers are sliced, any task that contains
         only one of those layers can safely be cancelled. If a single layer is sliced,
         it will wait for any existing tasks that include that layer AND another layer,
         In other words, it will only cancel if the new task will replace the
-        slices of all the layers in the pending task.
+        slices of all the layers in the pending task. If the replaceable task
+        has already started, the requests of that task that have not started
+        yet are cancelled instead.
 
         This should only be called from the main thread.
 
@@ -205,7 +295,8 @@ class _LayerSlicer:
         )
         if existing_task := self._find_existing_task(layers):
             logger.debug('Cancelling task %s', id(existing_task))
-            existing_task.cancel()
+            if not existing_task.cancel():
+                self._cancel_pending_layer_tasks(existing_task)
 
         # Not all layer types will initially be asynchronously sliceable.
         # The following logic gives us a way to handle those in the short
@@ -238,14 +329,25 @@ class _LayerSlicer:
         # First maybe submit an async slicing task to start it ASAP.
         task = None
         if len(requests) > 0:
+            task = Future()
             logger.debug('Submitting task %s', id(task))
-            task = self._executor.submit(self._slice_layers, requests)
-            # Store task before adding done callback to ensure there is always
-            # a task to remove in the done callback.
+            layer_tasks = {
+                weak_layer: self._executor.submit(
+                    self._slice_layer, task, weak_layer, request
+                )
+                for weak_layer, request in requests.items()
+            }
+            # Store task before adding done callbacks to ensure there is always
+            # a task to remove in the done callbacks.
             with self._lock_futures_dicts:
                 self._layers_to_task[tuple(requests)] = task
                 self._task_to_requests[task] = requests
+                self._task_to_layer_tasks[task] = layer_tasks
             task.add_done_callback(self._on_slice_done)
+            for layer_task in layer_tasks.values():
+                layer_task.add_done_callback(
+                    partial(self._on_layer_slice_done, task)
+                )
 
         # Then execute sync slicing tasks to run concurrent with async ones.
         for layer in sync_layers:
@@ -254,6 +356,9 @@ class _LayerSlicer:
                 force=force,
             )
 
+        # Finally speculatively slice ahead of the current point.
+        self._prefetch(layers=layers, dims=dims)
+
         return task
 
     def shutdown(self) -> None:
@@ -265,27 +370,182 @@ class _LayerSlicer:
         """
         logger.debug('_LayerSlicer.shutdown')
         self._executor.shutdown(wait=True, cancel_futures=True)
+        self._prefetch_executor.shutdown(wait=True, cancel_futures=True)
         self.events.disconnect()
         self.events.ready.disconnect()
 
-    def _slice_layers(self, requests: dict) -> dict:
+    def _prefetch(self, *, layers: Iterable[Layer], dims: Dims) -> None:
+        """Speculatively slices the next steps along the axis being moved.
+
+        If the dims point moved along exactly one non-displayed axis since the
+        last submission, prefetch requests are made for the next
+        ``slice_prefetch_steps`` steps in the same direction, so that their
+        slices are already cached when the point gets there. Pending prefetch
+        tasks are cancelled every time the point moves, so that slices in a
+        previous direction of motion are not loaded needlessly. Nothing is
+        prefetched while slicing is synchronous.
+
+        This should only be called from the main thread.
+        """
+        state = (
+            dims.ndim,
+            dims.ndisplay,
+            dims.order,
+            dims.margin_left,
+            dims.margin_right,
+            dims.point,
+        )
+        last_state, self._last_dims_state = self._last_dims_state, state
+        if last_state == state:
+            # Slicing was triggered by something other than motion
+            # (e.g. a layer was added), so keep prefetching.
+            return
+
+        for prefetch_task in self._prefetch_tasks:
+            prefetch_task.cancel()
+        self._prefetch_tasks = []
+
+        steps = get_settings().experimental.slice_prefetch_steps
+        if (
+            steps == 0
+            or self._force_sync
+            or last_state is None
+            or last_state[:-1] != state[:-1]
+        ):
+            return
+
+        last_point = last_state[-1]
+        moved = [
+            axis
+            for axis, (last, current) in enumerate(
+                zip(last_point, dims.point, strict=True)
+            )
+            if last != current
+        ]
+        if len(moved) != 1 or moved[0] in dims.displayed:
+            return
+
+        axis = moved[0]
+        delta = dims.point[axis] - last_point[axis]
+        axis_range = dims.range[axis]
+        low = min(axis_range.start, axis_range.stop)
+        high = max(axis_range.start, axis_range.stop)
+        prefetch_layers = [
+            layer
+            for layer in layers
+            if layer.visible
+            and isinstance(layer._slicing_state, _PrefetchSliceable)
+        ]
+        for step in range(1, steps + 1):
+            value = dims.point[axis] + step * delta
+            if not low <= value <= high:
+                break
+            point = list(dims.point)
+            point[axis] = value
+            prefetch_dims = dims.model_copy(update={'point': tuple(point)})
+            for layer in prefetch_layers:
+                request = layer._slicing_state._make_prefetch_request(
+                    prefetch_dims
+                )
+                if request is not None:
+                    logger.debug('Prefetching %s for %s', request, layer)
+                    # Errors are not reported here, but will be if the
+                    # request is made again when the point gets there.
+                    self._prefetch_tasks.append(
+                        self._prefetch_executor.submit(request)
+                    )
+
+    def _slice_layer(
+        self,
+        task: Future[dict],
+        weak_layer: weakref.ReferenceType[Layer],
+        request: _SliceRequest,
+    ) -> Any:
         """
-        Iterates through a dictionary of request objects and call the slice
-        on each individual layer. Can be called from the main or slicing thread.
+        Calls the slice request of a single layer and emits the response.
+        Called from a slicing thread.
 
         Attributes
         ----------
-        requests: dict[Layer, SliceRequest]
-            Dictionary of request objects to be used for constructing the slice
+        task: Future[dict]
+            The task that the request belongs to. It is marked as running
+            when its first request starts.
+        weak_layer: weakref.ReferenceType[Layer]
+            The layer to be sliced.
+        request: SliceRequest
+            The request object to be used for constructing the slice.
 
         Returns
         -------
-        dict[Layer, SliceResponse]: which contains the results of the slice
+        SliceResponse or None: the result of the slice, or None if the
+        task was cancelled before the request started. If the request
+        was progressively refined, this is the last refined result.
+        """
+        logger.debug('_LayerSlicer._slice_layer: %s', request)
+        with self._lock_futures_dicts:
+            if task.cancelled() or (
+                not task.running() and not task.set_running_or_notify_cancel()
+            ):
+                return None
+        response = request()
+        self.events.ready(value={weak_layer: response})
+        if isinstance(request, _RefinableSliceRequest):
+            for refinement in request.refinements:
+                layer = weak_layer()
+                if (
+                    layer is None
+                    or layer._slicing_state._last_slice_id != request.id
+                ):
+                    logger.debug('Stopped refining %s', request)
+                    break
+                del layer
+                logger.debug('Refining %s with %s', request, refinement)
+                response = refinement()
+                self.events.ready(value={weak_layer: response})
+        return response
+
+    def _on_layer_slice_done(
+        self, task: Future[dict], layer_task: Future
+    ) -> None:
         """
-        logger.debug('_LayerSlicer._slice_layers: %s', requests)
-        result = {layer: request() for layer, request in requests.items()}
-        self.events.ready(value=result)
-        return result
+        This is the "done_callback" which is added to each per-layer future.
+        Completes the given task once all of its layers are done.
+        Can be called from the main or slicing thread.
+        """
+        with self._lock_futures_dicts:
+            layer_tasks = self._task_to_layer_tasks.get(task)
+            if layer_tasks is None or not all(
+                t.done() for t in layer_tasks.values()
+            ):
+                return
+            del self._task_to_layer_tasks[task]
+            if task.done():
+                return
+            if not task.running():
+                # None of the requests started, e.g. because they were all
+                # cancelled on shutdown.
+                task.cancel()
+                return
+
+        result = {}
+        exception = None
+        for weak_layer, t in layer_tasks.items():
+            if t.cancelled():
+                continue
+            if (exception := t.exception()) is not None:
+                break
+            result[weak_layer] = t.result()
+        if exception is not None:
+            task.set_exception(exception)
+        else:
+            task.set_result(result)
+
+    def _cancel_pending_layer_tasks(self, task: Future[dict]) -> None:
+        """Cancels the per-layer futures of a task that have not started."""
+        with self._lock_futures_dicts:
+            layer_tasks = self._task_to_layer_tasks.get(task, {})
+            for layer_task in layer_tasks.values():
+                layer_task.cancel()
 
     def _on_slice_done(self, task: Future[dict]) -> None:
         """
@@ -301,6 +561,7 @@ class _LayerSlicer:
 
         if task.cancelled():
             logger.debug('Cancelled task: %s', id(task))
+            self._cancel_pending_layer_tasks(task)
             return
 
         if exception := task.exception():
@@ -353,3 +614,9 @@ class _LayerSlicer:
                     logger.debug('Found existing task for %s', task_layers)
                     return task
         return None
+
+
+def _make_executor(max_workers: int) -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix='napari-slicing'
+    )
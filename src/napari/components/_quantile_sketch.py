@@ -0,0 +1,226 @@
+"""Mergeable sketch of a distribution of values, to estimate quantiles."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+__all__ = ('QuantileSketch',)
+
+# Compression of the t-digest: about half as many centroids are kept, and
+# the rank error of quantiles is roughly proportional to its inverse, with
+# much smaller errors close to the extreme quantiles.
+DEFAULT_COMPRESSION: int = 500
+# Number of values added to a t-digest at once, to bound temporary memory.
+_BLOCK_SIZE: int = 2**20
+
+
+class QuantileSketch:
+    """Mergeable sketch of a distribution of values, to estimate quantiles.
+
+    Values of integer types of at most 16 bits are counted exactly, so that
+    their quantiles are exact. Other values are summarized by a t-digest:
+    sorted centroids whose weights are small close to the extreme quantiles
+    and large close to the median, so that extreme quantiles, like the ones
+    used for auto-contrast, are accurate. Non-finite values are ignored.
+
+    Sketches of parts of the data, e.g. of each of its chunks, can be
+    merged into a sketch of the whole data.
+
+    Parameters
+    ----------
+    dtype : np.dtype
+        Data type of the values.
+    compression : int
+        Compression of the t-digest, when the values are not counted exactly.
+
+    Attributes
+    ----------
+    count : float
+        Number, or total weight, of the values added to the sketch.
+    min : float
+        Smallest value added to the sketch.
+    max : float
+        Largest value added to the sketch.
+    """
+
+    def __init__(
+        self,
+        dtype: npt.DTypeLike = np.float64,
+        compression: int = DEFAULT_COMPRESSION,
+    ) -> None:
+        self.dtype = np.dtype(dtype)
+        self.compression = compression
+        self.count = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+        self._offset = 0
+        self._counts: np.ndarray | None = None
+        if self.dtype.kind == 'b':
+            self._counts = np.zeros(2)
+        elif self.dtype.kind in 'iu' and self.dtype.itemsize <= 2:
+            info = np.iinfo(self.dtype)
+            self._offset = int(info.min)
+            self._counts = np.zeros(int(info.max) - int(info.min) + 1)
+        self._means = np.zeros(0)
+        self._weights = np.zeros(0)
+
+    @property
+    def exact(self) -> bool:
+        """Whether the values are counted exactly."""
+        return self._counts is not None
+
+    def update(
+        self,
+        values: npt.ArrayLike,
+        weights: npt.ArrayLike | None = None,
+    ) -> None:
+        """Add values to the sketch.
+
+        Parameters
+        ----------
+        values : array-like
+            The values.
+        weights : array-like, optional
+            The weight of each value, e.g. the number of times it occurs.
+            Values added with weights to an exact sketch are rounded to the
+            nearest integer.
+        """
+        values = np.asarray(values).ravel()
+        keep = None
+        if values.dtype.kind in 'fc':
+            keep = np.isfinite(values)
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64).ravel()
+            keep = weights > 0 if keep is None else keep & (weights > 0)
+        if keep is not None and not keep.all():
+            values = values[keep]
+            if weights is not None:
+                weights = weights[keep]
+        if values.size == 0:
+            return
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self.count += float(values.size if weights is None else weights.sum())
+
+        if self._counts is not None:
+            if values.dtype.kind not in 'iub':
+                values = np.rint(values)
+            indices = values.astype(np.int64) - self._offset
+            np.clip(indices, 0, len(self._counts) - 1, out=indices)
+            self._counts += np.bincount(
+                indices, weights=weights, minlength=len(self._counts)
+            )
+            return
+
+        for start in range(0, values.size, _BLOCK_SIZE):
+            block = values[start : start + _BLOCK_SIZE].astype(np.float64)
+            if weights is None:
+                block_weights = np.ones(len(block))
+            else:
+                block_weights = weights[start : start + _BLOCK_SIZE]
+            self._add_centroids(block, block_weights)
+
+    def merge(self, other: QuantileSketch) -> None:
+        """Add the values of another sketch to this sketch."""
+        if other.count == 0:
+            return
+        if (
+            self._counts is not None
+            and other._counts is not None
+            and self._offset == other._offset
+            and len(self._counts) == len(other._counts)
+        ):
+            self._counts += other._counts
+            self.count += other.count
+        else:
+            self.update(*other._centroids())
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantiles(self, q: npt.ArrayLike) -> np.ndarray:
+        """Estimate quantiles of the values.
+
+        The quantiles are linearly interpolated between values, like
+        ``np.quantile``, and are exact for values counted exactly.
+
+        Parameters
+        ----------
+        q : array-like of float
+            The quantiles, between 0 and 1.
+
+        Returns
+        -------
+        np.ndarray
+            The quantiles, of the shape of q, or NaN if the sketch is empty.
+        """
+        q = np.asarray(q, dtype=np.float64)
+        if self.count == 0:
+            return np.full(q.shape, np.nan)
+        means, weights = self._centroids()
+        # rank of each quantile, with the first value at rank 0.5 and the
+        # last at rank count - 0.5
+        ranks = np.clip(q, 0, 1) * (self.count - 1) + 0.5
+        if self._counts is not None:
+            # values with the same rank on either side of the quantile
+            cumulative = np.cumsum(weights)
+            lower = np.floor(ranks - 0.5)
+            below = means[
+                np.minimum(
+                    np.searchsorted(cumulative, lower, side='right'),
+                    len(means) - 1,
+                )
+            ]
+            above = means[
+                np.minimum(
+                    np.searchsorted(cumulative, lower + 1, side='right'),
+                    len(means) - 1,
+                )
+            ]
+            return below + (above - below) * (ranks - 0.5 - lower)
+        # the smallest and largest values are known exactly, at the ranks of
+        # the first and last values
+        centers = np.clip(
+            np.cumsum(weights) - weights / 2, 0.5, self.count - 0.5
+        )
+        return np.interp(
+            ranks,
+            np.concatenate([[0.5], centers, [self.count - 0.5]]),
+            np.concatenate([[self.min], means, [self.max]]),
+        )
+
+    def _centroids(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the sorted values, or centroids, and their weights."""
+        if self._counts is None:
+            return self._means, self._weights
+        (present,) = np.nonzero(self._counts)
+        return (present + self._offset).astype(np.float64), self._counts[
+            present
+        ]
+
+    def _add_centroids(self, means: np.ndarray, weights: np.ndarray) -> None:
+        """Merge weighted values into the centroids of the t-digest.
+
+        The values and centroids are sorted and grouped into new centroids
+        whose quantiles span at most one unit of the scale function
+        ``compression / (2 pi) * arcsin(2 q - 1)``, which is steep at the
+        extreme quantiles where the centroids stay small.
+        """
+        means = np.concatenate([self._means, means])
+        weights = np.concatenate([self._weights, weights])
+        order = np.argsort(means, kind='stable')
+        means, weights = means[order], weights[order]
+        cumulative = np.cumsum(weights)
+        quantiles = (cumulative - weights / 2) / cumulative[-1]
+        scale = self.compression / (2 * np.pi) * np.arcsin(2 * quantiles - 1)
+        groups = np.floor(scale).astype(np.intp)
+        groups -= groups[0]
+        merged_weights = np.bincount(groups, weights=weights)
+        merged_sums = np.bincount(groups, weights=means * weights)
+        nonempty = merged_weights > 0
+        self._weights = merged_weights[nonempty]
+        self._means = merged_sums[nonempty] / self._weights
@@ -15,6 +15,7 @@ from napari.components.histogram import (
     DEFAULT_MAX_SAMPLES,
 )
 from napari.layers import Image
+from napari.settings import get_settings
 
 
 def _model(data, **kwargs):
@@ -1153,3 +1154,72 @@ class TestComputeProgressive:
         for _ in gen:
             pass
         assert model._computing
+
+    def test_chunks_read_before_are_not_read_again(self, monkeypatch):
+        """Once every chunk was read, the full histogram is merged from the
+        chunk statistics without reading the data."""
+        dask = pytest.importorskip('dask.array')
+        get_settings().experimental.cache_chunk_statistics = True
+        values = np.arange(100 * 100, dtype=np.float32).reshape(100, 100)
+        data = dask.from_array(values, chunks=(50, 50))
+        model = _model(np.zeros((10, 10)))
+        model._layer = Image(data, contrast_limits=(0, 10_000))
+        model.mode = 'full'
+        model.enabled = True
+
+        first = list(model.compute())
+        assert len(first) == 4
+
+        def _fail(*args):
+            raise AssertionError('chunk read again')
+
+        monkeypatch.setattr(model, '_load_chunk', _fail)
+        model._invalidate()
+        ((bin_edges, counts),) = model.compute()
+        expected, _ = np.histogram(values, bins=256, range=(0, 10_000))
+        # the chunk statistics only approximate the histogram
+        np.testing.assert_allclose(counts, expected, rtol=0.15)
+        assert counts.sum() == pytest.approx(values.size)
+        np.testing.assert_array_equal(bin_edges, first[-1][0])
+
+
+class TestQuantiles:
+    """Test quantiles estimated alongside the histogram."""
+
+    def test_quantiles_of_canvas_data(self):
+        data = np.random.default_rng(0).normal(size=(200, 200))
+        model = _model(data)
+        model.enabled = True
+        np.testing.assert_allclose(
+            model.quantiles([0.001, 0.5, 0.999]),
+            np.quantile(data, [0.001, 0.5, 0.999]),
+            atol=0.05,
+        )
+
+    def test_quantiles_without_data(self):
+        model = _model(np.random.rand(10, 10))
+        model._set_empty_data()
+        assert np.isnan(model.quantiles([0.1, 0.9])).all()
+
+    def test_quantiles_of_chunked_data(self):
+        """Quantiles of chunked data are merged from each chunk, and
+        restored with the full histogram when switching modes."""
+        dask = pytest.importorskip('dask.array')
+        values = np.random.default_rng(0).integers(
+            0, 4096, (200, 200), dtype=np.uint16
+        )
+        values[0, 0] = 60_000
+        data = dask.from_array(values, chunks=(50, 50))
+        model = _model(np.zeros((10, 10)))
+        model._layer = Image(data)
+        model.mode = 'full'
+        model.enabled = True
+        q = [0, 0.001, 0.5, 0.999, 1]
+        expected = np.quantile(values, q)
+        # 16 bit integers are counted exactly
+        np.testing.assert_array_equal(model.quantiles(q), expected)
+
+        model.mode = 'canvas'
+        model.mode = 'full'
+        assert not model._dirty
+        np.testing.assert_array_equal(model.quantiles(q), expected)
@@ -1,7 +1,7 @@
 import time
 from concurrent.futures import Future, wait
 from dataclasses import dataclass
-from threading import RLock, current_thread, main_thread
+from threading import Event, RLock, current_thread, main_thread
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -11,6 +11,7 @@ from napari._tests.utils import DEFAULT_TIMEOUT_SECS, LockableData
 from napari.components import Dims
 from napari.components._layer_slicer import _LayerSlicer
 from napari.layers import Image, Labels, Points
+from napari.settings import get_settings
 from napari.utils.notifications import notification_manager
 
 if TYPE_CHECKING:
@@ -125,7 +126,86 @@ def test_submit_emits_ready_event_when_done(layer_slicer):
     future = layer_slicer.submit(layers=[layer], dims=Dims())
     actual_result = _wait_for_result(future)
 
-    assert actual_result is event_result
+    assert actual_result == event_result
+
+
+def test_submit_emits_ready_event_per_layer(layer_slicer):
+    layer1 = FakeAsyncLayer()
+    layer2 = FakeAsyncLayer()
+    event_results = []
+
+    def on_done(event):
+        event_results.append(event.value)
+
+    layer_slicer.events.ready.connect(on_done)
+
+    with layer2.lock:
+        future = layer_slicer.submit(layers=[layer1, layer2], dims=Dims())
+        _wait_until_ready_count(event_results, 1)
+        assert not future.done()
+
+    actual_result = _wait_for_result(future)
+
+    assert len(event_results) == 2
+    assert {k: v for r in event_results for k, v in r.items()} == actual_result
+
+
+def test_submit_with_multiple_workers_slices_layers_in_parallel():
+    layer_slicer = _LayerSlicer(max_workers=2)
+    layer_slicer._force_sync = False
+    layer1 = FakeAsyncLayer()
+    layer2 = FakeAsyncLayer()
+
+    try:
+        with layer1.lock:
+            future = layer_slicer.submit(layers=[layer1, layer2], dims=Dims())
+            layer_tasks = layer_slicer._task_to_layer_tasks[future]
+            layer2_task = next(
+                t for w, t in layer_tasks.items() if w() is layer2
+            )
+            # layer2 is sliced while layer1 is still blocked.
+            assert layer2_task.result(timeout=DEFAULT_TIMEOUT_SECS).id == 1
+            assert not future.done()
+
+        result = _wait_for_response(future)
+        assert result[layer1].id == 1
+        assert result[layer2].id == 1
+    finally:
+        layer_slicer.shutdown()
+
+
+def test_submit_cancels_pending_layers_of_running_task(layer_slicer):
+    dims = Dims()
+    layer1 = FakeAsyncLayer()
+    layer2 = FakeAsyncLayer()
+
+    with layer1.lock:
+        blocked = layer_slicer.submit(layers=[layer1, layer2], dims=dims)
+        _wait_until_running(blocked)
+        layer_tasks = layer_slicer._task_to_layer_tasks[blocked]
+        replacing = layer_slicer.submit(layers=[layer1, layer2], dims=dims)
+        assert all(
+            t.cancelled() for w, t in layer_tasks.items() if w() is layer2
+        )
+
+    blocked_result = _wait_for_response(blocked)
+    assert layer1 in blocked_result
+    assert layer2 not in blocked_result
+    replacing_result = _wait_for_response(replacing)
+    assert replacing_result[layer1].id == 2
+    assert replacing_result[layer2].id == 2
+
+
+def test_set_max_workers(layer_slicer):
+    layer = FakeAsyncLayer()
+    old_executor = layer_slicer._executor
+
+    layer_slicer.set_max_workers(3)
+
+    assert layer_slicer._executor is not old_executor
+    assert layer_slicer._executor._max_workers == 3
+    future = layer_slicer.submit(layers=[layer], dims=Dims())
+    assert _wait_for_response(future)[layer].id == 1
 
 
 def test_submit_with_one_sync_layer(layer_slicer):
@@ -407,6 +487,198 @@ def test_submit_with_one_3d_points(layer_slicer):
         assert not future.done()
 
 
+def test_submit_prefetches_along_direction_of_motion(layer_slicer):
+    get_settings().experimental.slice_prefetch_steps = 2
+    data = np.random.rand(8, 7, 6)
+    layer = Image(data=data, multiscale=False)
+    dims = Dims(
+        ndim=3,
+        ndisplay=2,
+        range=((0, 8, 1), (0, 7, 1), (0, 6, 1)),
+        point=(2, 0, 0),
+    )
+    cache = layer._slicing_state._slice_cache
+
+    layer_slicer.submit(layers=[layer], dims=dims)
+    # no motion yet, so nothing is prefetched
+    assert layer_slicer._prefetch_tasks == []
+
+    dims.point = (3, 0, 0)
+    layer_slicer.submit(layers=[layer], dims=dims)
+    assert len(layer_slicer._prefetch_tasks) == 2
+    wait(layer_slicer._prefetch_tasks, timeout=DEFAULT_TIMEOUT_SECS)
+
+    for z in (4, 5):
+        prefetch_dims = dims.model_copy(update={'point': (z, 0, 0)})
+        request = layer._slicing_state._make_slice_request(prefetch_dims)
+        assert request.cache_key in cache
+        response = request()
+        np.testing.assert_equal(response.image.view, data[z])
+        assert response.request_id == request.id
+
+    # moving to a prefetched slice uses the cached response
+    dims.point = (4, 0, 0)
+    future = layer_slicer.submit(layers=[layer], dims=dims)
+    np.testing.assert_equal(
+        _wait_for_response(future)[layer].image.view, data[4]
+    )
+    # only the slice that is not cached yet is prefetched
+    assert len(layer_slicer._prefetch_tasks) == 1
+
+
+def test_prefetch_cancelled_on_direction_change(layer_slicer):
+    get_settings().experimental.slice_prefetch_steps = 3
+    data = np.random.rand(10, 7, 6)
+    lockable_data = LockableData(data)
+    layer = Image(data=lockable_data, multiscale=False)
+    dims = Dims(
+        ndim=3,
+        ndisplay=2,
+        range=((0, 10, 1), (0, 7, 1), (0, 6, 1)),
+        point=(4, 0, 0),
+    )
+    layer_slicer.submit(layers=[layer], dims=dims)
+    layer_slicer.wait_until_idle(timeout=DEFAULT_TIMEOUT_SECS)
+
+    with lockable_data.lock:
+        dims.point = (5, 0, 0)
+        layer_slicer.submit(layers=[layer], dims=dims)
+        forward_tasks = layer_slicer._prefetch_tasks
+        assert len(forward_tasks) == 3
+        dims.point = (4, 0, 0)
+        layer_slicer.submit(layers=[layer], dims=dims)
+        # the prefetch thread is blocked by at most the first task, so the
+        # others have not started
+        assert sum(not t.cancelled() for t in forward_tasks) <= 1
+        assert all(t.cancelled() for t in forward_tasks[1:])
+        assert len(layer_slicer._prefetch_tasks) == 3
+
+    layer_slicer.wait_until_idle(timeout=DEFAULT_TIMEOUT_SECS)
+
+
+def test_prefetch_does_not_delay_slicing(layer_slicer):
+    get_settings().experimental.slice_prefetch_steps = 2
+    data = np.random.rand(8, 7, 6)
+    layer = Image(data=data, multiscale=False)
+    dims = Dims(
+        ndim=3,
+        ndisplay=2,
+        range=((0, 8, 1), (0, 7, 1), (0, 6, 1)),
+        point=(2, 0, 0),
+    )
+    layer_slicer.submit(layers=[layer], dims=dims)
+    layer_slicer.wait_until_idle(timeout=DEFAULT_TIMEOUT_SECS)
+
+    # a slow prefetch is running
+    blocker = Event()
+    layer_slicer._prefetch_executor.submit(blocker.wait)
+    dims.point = (3, 0, 0)
+    future = layer_slicer.submit(layers=[layer], dims=dims)
+    np.testing.assert_equal(
+        _wait_for_response(future)[layer].image.view, data[3]
+    )
+    assert len(layer_slicer._prefetch_tasks) == 2
+    assert not any(t.done() for t in layer_slicer._prefetch_tasks)
+    blocker.set()
+    wait(layer_slicer._prefetch_tasks, timeout=DEFAULT_TIMEOUT_SECS)
+
+
+def test_no_prefetch_when_sync(layer_slicer):
+    get_settings().experimental.slice_prefetch_steps = 2
+    data = np.random.rand(8, 7, 6)
+    layer = Image(data=data, multiscale=False)
+    dims = Dims(
+        ndim=3,
+        ndisplay=2,
+        range=((0, 8, 1), (0, 7, 1), (0, 6, 1)),
+        point=(2, 0, 0),
+    )
+    with layer_slicer.force_sync():
+        layer_slicer.submit(layers=[layer], dims=dims)
+        dims.point = (3, 0, 0)
+        layer_slicer.submit(layers=[layer], dims=dims)
+
+    assert layer_slicer._prefetch_tasks == []
+
+
+def test_prefetch_disabled_by_default(layer_slicer):
+    data = np.random.rand(8, 7, 6)
+    layer = Image(data=data, multiscale=False)
+    dims = Dims(
+        ndim=3,
+        ndisplay=2,
+        range=((0, 8, 1), (0, 7, 1), (0, 6, 1)),
+        point=(2, 0, 0),
+    )
+
+    layer_slicer.submit(layers=[layer], dims=dims)
+    dims.point = (3, 0, 0)
+    layer_slicer.submit(layers=[layer], dims=dims)
+
+    assert layer_slicer._prefetch_tasks == []
+    assert len(layer._slicing_state._slice_cache) == 0
+
+
+def test_submit_progressively_refines_3d_multiscale(layer_slicer):
+    # only the two coarsest levels fit within the budget
+    get_settings().experimental.multiscale_3d_memory = 0.1
+    data = [np.random.rand(s, s, s) for s in (32, 16, 8)]
+    layer = Image(data=data, multiscale=True)
+    dims = Dims(ndim=3, ndisplay=3)
+    responses = []
+    layer_slicer.events.ready.connect(
+        lambda event: responses.extend(event.value.values())
+    )
+
+    future = layer_slicer.submit(layers=[layer], dims=dims)
+    response = _wait_for_response(future)[layer]
+
+    assert [r.data_level for r in responses] == [2, 1]
+    assert response is responses[-1]
+    np.testing.assert_equal(response.image.view, data[1])
+    # all responses belong to the same request, so the layer is loaded
+    # as soon as the coarsest level is shown
+    assert len({r.request_id for r in responses}) == 1
+
+    layer._slicing_state._update_slice_response(response)
+    assert layer.data_level == 1
+
+
+def test_progressive_refinement_stops_on_new_request(layer_slicer):
+    get_settings().experimental.multiscale_3d_memory = 1
+    data = [np.random.rand(s, s, s) for s in (32, 16, 8)]
+    lockable_data = LockableData(data[1])
+    layer = Image(data=[data[0], lockable_data, data[2]], multiscale=True)
+    dims = Dims(ndim=3, ndisplay=3)
+    responses = []
+    layer_slicer.events.ready.connect(
+        lambda event: responses.extend(event.value.values())
+    )
+
+    with lockable_data.lock:
+        first_task = layer_slicer.submit(layers=[layer], dims=dims)
+        # wait until the coarsest level is shown
+        start = time.monotonic()
+        while (
+            not responses and time.monotonic() - start < DEFAULT_TIMEOUT_SECS
+        ):
+            time.sleep(0.01)
+        dims.point = (1, 1, 1)
+        layer_slicer.submit(layers=[layer], dims=dims)
+
+    _wait_for_response(first_task)
+    layer_slicer.wait_until_idle(timeout=DEFAULT_TIMEOUT_SECS)
+    first_id = responses[0].request_id
+    first_levels = [
+        r.data_level for r in responses if r.request_id == first_id
+    ]
+    # the first request is not refined to the finest level
+    assert first_levels[0] == 2
+    assert 0 not in first_levels
+    assert responses[-1].request_id != first_id
+    assert responses[-1].data_level == 0
+
+
 def test_submit_after_shutdown_raises():
     layer_slicer = _LayerSlicer()
     layer_slicer._force_sync = False
@@ -428,6 +700,19 @@ def _wait_until_running(future: Future):
             )
 
 
+def _wait_until_ready_count(event_results: list, count: int):
+    """Waits until the given number of ready events have been recorded."""
+    sleep_secs = 0.01
+    total_sleep_secs = 0
+    while len(event_results) < count:
+        time.sleep(sleep_secs)
+        total_sleep_secs += sleep_secs
+        if total_sleep_secs > DEFAULT_TIMEOUT_SECS:
+            raise TimeoutError(
+                f'Ready event was not emitted after a timeout of {DEFAULT_TIMEOUT_SECS} seconds.'
+            )
+
+
 # if remove quotes once we are Python 3.9+
 def _wait_for_result(future: 'Future[Any]') -> Any:
     """Waits until the given future is finished returns its result."""
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from napari.components._quantile_sketch import QuantileSketch
+
+QUANTILES = [0, 0.001, 0.01, 0.5, 0.99, 0.999, 1]
+
+
+@pytest.mark.parametrize('dtype', [np.uint8, np.int16, np.uint16, bool])
+def test_small_integers_are_exact(dtype):
+    rng = np.random.default_rng(0)
+    data = rng.integers(0, 2 if dtype is bool else 200, 10_000).astype(dtype)
+    sketch = QuantileSketch(dtype)
+    sketch.update(data)
+    assert sketch.exact
+    np.testing.assert_array_equal(
+        sketch.quantiles(QUANTILES),
+        np.quantile(data.astype(np.float64), QUANTILES),
+    )
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        np.random.default_rng(0).normal(size=500_000).astype(np.float32),
+        np.random.default_rng(0).lognormal(size=500_000),
+        np.random.default_rng(0).integers(0, 2**20, 500_000),
+    ],
+)
+def test_merged_sketch_rank_error(data):
+    sketch = QuantileSketch(data.dtype)
+    for chunk in np.array_split(data, 7):
+        chunk_sketch = QuantileSketch(data.dtype)
+        chunk_sketch.update(chunk)
+        sketch.merge(chunk_sketch)
+    assert not sketch.exact
+    assert sketch.count == data.size
+    estimates = sketch.quantiles(QUANTILES)
+    assert estimates[0] == data.min()
+    assert estimates[-1] == data.max()
+    ranks = np.searchsorted(np.sort(data), estimates) / data.size
+    np.testing.assert_allclose(ranks, QUANTILES, atol=2e-4)
+
+
+def test_few_values_are_exact():
+    data = np.random.default_rng(0).random(100)
+    sketch = QuantileSketch(data.dtype)
+    sketch.update(data)
+    np.testing.assert_allclose(
+        sketch.quantiles(QUANTILES), np.quantile(data, QUANTILES)
+    )
+
+
+def test_non_finite_values_are_ignored():
+    sketch = QuantileSketch(np.float32)
+    sketch.update(np.array([np.nan, 1, 2, np.inf, 3], dtype=np.float32))
+    assert sketch.count == 3
+    np.testing.assert_allclose(sketch.quantiles([0, 0.5, 1]), [1, 2, 3])
+
+
+def test_weighted_values():
+    sketch = QuantileSketch(np.uint8)
+    sketch.update([1, 2, 3, 4], weights=[1, 1, 2, 0])
+    assert sketch.count == 4
+    np.testing.assert_allclose(
+        sketch.quantiles(QUANTILES), np.quantile([1, 2, 3, 3], QUANTILES)
+    )
+
+
+def test_empty_sketch():
+    sketch = QuantileSketch(np.uint16)
+    assert np.isnan(sketch.quantiles(0.5))
+    other = QuantileSketch(np.float64)
+    other.update([1.5, 2.5])
+    sketch.merge(other)
+    # values merged into an exact sketch are rounded
+    np.testing.assert_array_equal(sketch.quantiles([0, 1]), [2, 2])
+    assert (sketch.min, sketch.max) == (1.5, 2.5)
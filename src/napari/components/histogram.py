@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import math
 import warnings
 from collections.abc import Generator, Sequence
 from typing import Any, Literal
@@ -11,8 +10,15 @@ from typing import Any, Literal
 import numpy as np
 from pydantic import PrivateAttr
 
+from napari.components._quantile_sketch import QuantileSketch
 from napari.layers.image.image import Image
 from napari.layers.surface.surface import Surface
+from napari.layers.utils._chunk_stats import (
+    chunk_boundaries,
+    chunk_slices,
+    chunk_statistics,
+    save_chunk_statistics,
+)
 from napari.utils._dask_utils import _is_dask_data
 from napari.utils.events import Event, EventedModel
 
@@ -93,9 +99,15 @@ class HistogramModel(EventedModel):
     # model, preventing a second competing worker. Distinct from _computing
     # (set inside the worker thread) since scheduling is serialized on the main thread.
     _compute_scheduled: bool = PrivateAttr(default=False)
-    _full_cache: tuple[np.ndarray, np.ndarray, bool] | None = PrivateAttr(
+    # The quantile sketch of the histogram data, or the data itself when it
+    # is in memory, to only be sketched when quantiles are requested.
+    _quantile_source: QuantileSketch | np.ndarray | None = PrivateAttr(
         default=None
     )
+    _full_cache: (
+        tuple[np.ndarray, np.ndarray, bool, QuantileSketch | np.ndarray | None]
+        | None
+    ) = PrivateAttr(default=None)
 
     def __init__(
         self,
@@ -184,10 +196,43 @@ class HistogramModel(EventedModel):
                 pass
         return self._counts
 
+    def quantiles(self, q: float | Sequence[float]) -> np.ndarray:
+        """Return quantiles of the data of the histogram.
+
+        Like ``counts``, this triggers computation if the model is dirty.
+        The quantiles are estimated from a mergeable sketch of the data,
+        built from each chunk of chunked data in ``'full'`` mode. They are
+        exact for integer data of at most 16 bits, and otherwise accurate
+        to a small fraction of a percent in rank, even for extreme quantiles.
+
+        Parameters
+        ----------
+        q : float or sequence of float
+            The quantiles, between 0 and 1, e.g. ``(0.001, 0.999)`` for the
+            0.1 and 99.9 percentiles.
+
+        Returns
+        -------
+        np.ndarray
+            The quantiles, of the shape of q, or NaN when there is no data.
+        """
+        if self._dirty:
+            for _ in self.compute():
+                pass
+        source = self._quantile_source
+        if isinstance(source, np.ndarray):
+            source = QuantileSketch(source.dtype)
+            source.update(self._quantile_source)
+            self._quantile_source = source
+        if source is None:
+            return np.full(np.shape(q), np.nan)
+        return source.quantiles(q)
+
     def _set_empty_data(self) -> None:
         """Set histogram to empty bin/edge state."""
         self._bin_edges = np.array([0.0, 1.0])
         self._counts = np.array([0.0])
+        self._quantile_source = None
         self._dirty = False
 
     def compute(
@@ -254,9 +299,10 @@ class HistogramModel(EventedModel):
         bin_edges, counts = self._calc_histogram(data, range_min, range_max)
         self._bin_edges = bin_edges
         self._counts = counts
+        self._quantile_source = data
         self._dirty = False
         if self.mode == 'full':
-            self._full_cache = (bin_edges, counts, self.log_scale)
+            self._full_cache = (bin_edges, counts, self.log_scale, data)
 
     def _compute_chunked_progressive(
         self, data: Any, generation: int
@@ -277,6 +323,36 @@ class HistogramModel(EventedModel):
             Generation counter; stale results are discarded if this doesn't
             match ``self._compute_generation``.
         """
+        range_min, range_max = self._layer.contrast_limits_range
+        if range_min is None or range_max is None:
+            range_min = 0.0
+            range_max = 1.0
+        bins = np.linspace(range_min, range_max, self.bins + 1).astype(
+            np.float32
+        )
+
+        stats = chunk_statistics(data)
+        sketch = QuantileSketch(data.dtype)
+        if stats.complete:
+            # Every chunk was already read, e.g. when the data was opened
+            # before, so the histogram of the whole data is merged from the
+            # chunk statistics without reading anything.
+            counts = stats.histogram(
+                self.bins, (float(range_min), float(range_max))
+            ).astype(np.float32)
+            if self.log_scale:
+                counts = np.log10(counts + 1).astype(np.float32)
+            summary_counts, summary_means = stats.summaries()
+            sketch.update(summary_means, weights=summary_counts)
+            if self._compute_generation == generation:
+                self._bin_edges = bins
+                self._counts = counts
+                self._quantile_source = sketch
+                self._dirty = False
+                self._full_cache = (bins, counts, self.log_scale, sketch)
+                yield bins, counts
+            return
+
         n = min(self.max_samples, data.size)
         chunk_sizes = self._chunk_sizes(data)
         rng = np.random.default_rng()
@@ -285,37 +361,41 @@ class HistogramModel(EventedModel):
         probs = np.asarray(chunk_sizes) / sum(chunk_sizes)
         order = rng.choice(n_chunks, size=n_selected, p=probs, replace=False)
 
-        range_min, range_max = self._layer.contrast_limits_range
-        if range_min is None or range_max is None:
-            range_min = 0.0
-            range_max = 1.0
-
         running_counts = np.zeros(self.bins, dtype=np.float64)
         for ci in order:
             # Early stale guard to abort worker early if a new compute has started.
             if self._compute_generation != generation:
                 return
-            try:
-                block = self._load_chunk(data, ci)
-            except Exception:
-                # Chunk load failure (e.g. remote zarr read error) is
-                # non-fatal. Stop the generator instead of letting the
-                # exception propagate through the GeneratorWorker's Qt
-                # signal/slot machinery, which causes qFatal/abort on
-                # PyQt6. The dirty guard in _on_async_compute_done
-                # prevents any retry loop.
-                logger.warning('Histogram chunk load failed', exc_info=True)
-                return
-            chunk_counts, _ = np.histogram(
-                block,
-                bins=self.bins,
-                range=(float(range_min), float(range_max)),
-            )
+            if stats.computed[ci]:
+                # Chunks summarized before are not read again.
+                chunk_counts = stats.histogram(
+                    self.bins, (float(range_min), float(range_max)), [ci]
+                )
+                summary_counts, summary_means = stats.summaries([ci])
+                sketch.update(summary_means, weights=summary_counts)
+            else:
+                try:
+                    block = self._load_chunk(data, ci)
+                except Exception:
+                    # Chunk load failure (e.g. remote zarr read error) is
+                    # non-fatal. Stop the generator instead of letting the
+                    # exception propagate through the GeneratorWorker's Qt
+                    # signal/slot machinery, which causes qFatal/abort on
+                    # PyQt6. The dirty guard in _on_async_compute_done
+                    # prevents any retry loop.
+                    logger.warning(
+                        'Histogram chunk load failed', exc_info=True
+                    )
+                    return
+                stats.summarize(ci, block)
+                sketch.update(block)
+                chunk_counts, _ = np.histogram(
+                    block,
+                    bins=self.bins,
+                    range=(float(range_min), float(range_max)),
+                )
             running_counts += chunk_counts.astype(np.float64)
 
-            bins = np.linspace(range_min, range_max, self.bins + 1).astype(
-                np.float32
-            )
             if self.log_scale:
                 counts = np.log10(running_counts + 1).astype(np.float32)
             else:
@@ -326,13 +406,15 @@ class HistogramModel(EventedModel):
                 return
             yield bins, counts
 
+        save_chunk_statistics(stats)
         # Guard final model-state update against stale async workers.
         if self._compute_generation == generation:
             self._bin_edges = bins
             self._counts = counts
+            self._quantile_source = sketch
             self._dirty = False
             # This generator only runs for chunked full mode, so cache it.
-            self._full_cache = (bins, counts, self.log_scale)
+            self._full_cache = (bins, counts, self.log_scale, sketch)
 
     def _calc_histogram(
         self,
@@ -524,51 +606,16 @@ class HistogramModel(EventedModel):
         Works for both dask (per-chunk tuple-of-tuples) and zarr
         (per-dimension scalar) arrays — only metadata is accessed.
         """
-        import dask.array as da
-
-        if isinstance(data, da.Array):
-            nb, ch = data.numblocks, data.chunks
-        else:
-            # zarr: .chunks is (chunk_dim_0, chunk_dim_1, ...) not
-            # per-chunk tuples. Compute block count from shape/chunks.
-            nb = tuple(
-                max(1, math.ceil(s / c))
-                for s, c in zip(data.shape, data.chunks, strict=True)
-            )
-            ch = tuple(
-                tuple(min(c, s - i * c) for i in range(n))
-                for s, c, n in zip(data.shape, data.chunks, nb, strict=True)
-            )
-
-        sizes: list[int] = []
-        for idx in np.ndindex(*nb):
-            sz = 1
-            for d, i in enumerate(idx):
-                sz *= ch[d][i]
-            sizes.append(sz)
-        return sizes
+        sizes = np.ones(1, dtype=np.int64)
+        for boundaries in chunk_boundaries(data):
+            sizes = np.multiply.outer(sizes, np.diff(boundaries)).ravel()
+        return sizes.tolist()
 
     @staticmethod
     def _load_chunk(data: Any, flat_idx: int) -> np.ndarray:
         """Load a single chunk by its flat index (dask or zarr)."""
-        import dask.array as da
-
-        if isinstance(data, da.Array):
-            idx = np.unravel_index(flat_idx, data.numblocks)
-            return np.asarray(data.blocks[idx]).ravel()
-
-        # zarr path: convert flat chunk index to data-space slices
-        nb = tuple(
-            max(1, math.ceil(s / c))
-            for s, c in zip(data.shape, data.chunks, strict=True)
-        )
-        idx = np.unravel_index(flat_idx, nb)
-        slices: list[slice] = []
-        for d, i in enumerate(idx):
-            start = i * int(data.chunks[d])
-            stop = min(start + int(data.chunks[d]), int(data.shape[d]))
-            slices.append(slice(start, stop))
-        return np.asarray(data[tuple(slices)]).ravel()
+        slices = chunk_slices(chunk_boundaries(data), flat_idx)
+        return np.asarray(data[slices]).ravel()
 
     def _sample_data(self, data: np.ndarray, max_samples: int) -> np.ndarray:
         """Randomly sample data to reduce computation."""
@@ -649,9 +696,10 @@ class HistogramModel(EventedModel):
     def _on_mode_change(self) -> None:
         """Restore cached full histogram or trigger recompute on mode switch."""
         if self.mode == 'full' and self._full_cache is not None:
-            bin_edges, counts, cached_log = self._full_cache
+            bin_edges, counts, cached_log, quantile_source = self._full_cache
             self._bin_edges = bin_edges
             self._counts = counts
+            self._quantile_source = quantile_source
             self._dirty = False
             if cached_log != self.log_scale:
                 # Counts were computed in the other log state; reuse the live
@@ -688,6 +736,7 @@ class HistogramModel(EventedModel):
         self.mode = 'canvas'
         self._bin_edges = np.array([0.0, 1.0])
         self._counts = np.array([0.0])
+        self._quantile_source = None
         self._dirty = True
         self._full_cache = None
         # Bump generation so in-flight async compute discards its results;
@@ -260,6 +260,9 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
         )
 
         settings.experimental.events.async_.connect(self._update_async)
+        settings.experimental.events.async_slicing_workers.connect(
+            self._update_async_slicing_workers
+        )
 
         # Add extra reset_view event. Ideally this should be removed in the
         # future.
@@ -802,6 +805,10 @@ class ViewerModel(KeymapProvider, MousemapProviderPydantic, EventedModel):
         """Set layer slicer to force synchronous if async is disabled."""
         self._layer_slicer._force_sync = not event.value
 
+    def _update_async_slicing_workers(self, event: Event) -> None:
+        """Resize the layer slicer thread pool when the setting changes."""
+        self._layer_slicer.set_max_workers(event.value)
+
     def _calc_status_from_cursor(
         self,
     ) -> tuple[str | Dict, str] | None:
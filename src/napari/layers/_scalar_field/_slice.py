@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import itertools
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import numpy.typing as npt
 
 from napari.layers.base._slice import _next_request_id
+from napari.layers.utils._slice_cache import _SliceCache
 from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
 from napari.types import ArrayLike
 from napari.utils._dask_utils import DaskIndexer
@@ -15,7 +17,7 @@ from napari.utils.misc import reorder_after_dim_reduction
 from napari.utils.transforms import Affine
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Hashable
 
     from numpy.typing import DTypeLike
 
@@ -79,6 +81,8 @@ class _ScalarFieldSliceResponse:
         Describes the slicing plane or bounding box in the layer's dimensions.
     request_id : int
         The identifier of the request from which this was generated.
+    data_level : int
+        The multiscale level of the sliced image data.
     """
 
     image: _ScalarFieldView = field(repr=False)
@@ -87,6 +91,7 @@ class _ScalarFieldSliceResponse:
     slice_input: _SliceInput
     request_id: int
     empty: bool = False
+    data_level: int = 0
 
     @classmethod
     def make_empty(
@@ -140,6 +145,15 @@ class _ScalarFieldSliceResponse:
             empty=True,
         )
 
+    @property
+    def nbytes(self) -> int:
+        """The total size in bytes of the sliced image and thumbnail data."""
+        arrays = {}
+        for view in (self.image, self.thumbnail):
+            arrays[id(view.raw)] = view.raw
+            arrays[id(view.view)] = view.view
+        return sum(np.asarray(array).nbytes for array in arrays.values())
+
     def to_displayed(
         self, converter: Callable[[np.ndarray], np.ndarray]
     ) -> _ScalarFieldSliceResponse:
@@ -172,6 +186,7 @@ class _ScalarFieldSliceResponse:
             slice_input=self.slice_input,
             request_id=self.request_id,
             empty=self.empty,
+            data_level=self.data_level,
         )
 
 
@@ -200,6 +215,26 @@ class _ScalarFieldSliceRequest:
         The slicing coordinates and margins in data space.
     others
         See the corresponding attributes in `Layer` and `Image`.
+    cache : _SliceCache | None
+        The cache in which responses are looked up and stored. If None,
+        the response is always computed.
+    cache_generation : int
+        The generation of the cache when this request was made.
+    tile_cache : _SliceCache | None
+        The cache in which tiles of 2D multiscale data are looked up and
+        stored. If None, the displayed region is read in one go.
+    tile_cache_generation : int
+        The generation of the tile cache when this request was made.
+    tile_size : int
+        The size in pixels of the square tiles of 2D multiscale data.
+    tiles_to_load : frozenset of tuple of int, optional
+        The indices of the tiles that may be read from the data when they
+        are not in ``tile_cache``. The other missing tiles are replaced by
+        placeholders upsampled from the thumbnail level. If None, all the
+        missing tiles are read.
+    refinements : tuple of _ScalarFieldSliceRequest
+        Requests for the same slice at finer multiscale levels, from coarsest
+        to finest, that progressively refine the response of this request.
     id : int
         The identifier of this slice request.
     """
@@ -218,9 +253,58 @@ class _ScalarFieldSliceRequest:
     thumbnail_level: int = field(repr=False)
     level_shapes: np.ndarray = field(repr=False)
     downsample_factors: np.ndarray = field(repr=False)
+    cache: _SliceCache | None = field(default=None, repr=False, compare=False)
+    cache_generation: int = field(default=0, repr=False)
+    tile_cache: _SliceCache | None = field(
+        default=None, repr=False, compare=False
+    )
+    tile_cache_generation: int = field(default=0, repr=False)
+    tile_size: int = field(default=0, repr=False)
+    tiles_to_load: frozenset[tuple[int, ...]] | None = field(
+        default=None, repr=False, compare=False
+    )
+    refinements: tuple[_ScalarFieldSliceRequest, ...] = field(
+        default=(), repr=False, compare=False
+    )
     id: int = field(default_factory=_next_request_id)
 
     def __call__(self) -> _ScalarFieldSliceResponse:
+        if self.cache is None:
+            return self._call_uncached()
+        key = self.cache_key
+        if (response := self.cache.get(key)) is not None:
+            return replace(
+                response, slice_input=self.slice_input, request_id=self.id
+            )
+        response = self._call_uncached()
+        self.cache.put(
+            key, response, self.cache_generation, nbytes=response.nbytes
+        )
+        return response
+
+    @property
+    def cache_key(self) -> Hashable:
+        """The key identifying the response of this request in the cache.
+
+        Two requests with the same key produce the same response, other than
+        their ``slice_input`` and ``request_id``.
+        """
+        corner_pixels = (
+            np.asarray(self.corner_pixels).tobytes()
+            if self.multiscale
+            else None
+        )
+        return (
+            self.slice_input.ndisplay,
+            self.slice_input.order,
+            np.nan_to_num(self.data_slice.as_array()).tobytes(),
+            str(self.projection_mode),
+            self.data_level,
+            self.thumbnail_level,
+            corner_pixels,
+        )
+
+    def _call_uncached(self) -> _ScalarFieldSliceResponse:
         if self._slice_out_of_bounds():
             return _ScalarFieldSliceResponse.make_empty(
                 slice_input=self.slice_input,
@@ -284,21 +368,24 @@ class _ScalarFieldSliceRequest:
             ndim=self.slice_input.ndim,
         )
 
-        # slice displayed dimensions to get the right tile data
-        data = data[tuple(disp_slice)]
+        thumbnail_data_slice = self._thick_slice_at_level(self.thumbnail_level)
+        thumbnail_data = self._project_thick_slice(
+            self.data_at_thumbnail_level, thumbnail_data_slice
+        )
 
-        # project the thick slice
         data_slice = self._thick_slice_at_level(self.data_level)
-        data = self._project_thick_slice(data, data_slice)
+        if self.slice_input.ndisplay == 2 and self.tile_cache is not None:
+            data = self._project_tiled_region(data, data_slice, thumbnail_data)
+        else:
+            # slice displayed dimensions to get the right tile data
+            data = data[tuple(disp_slice)]
+            # project the thick slice
+            data = self._project_thick_slice(data, data_slice)
 
         order = self._get_order()
         data = np.transpose(data, order)
         image = _ScalarFieldView.from_view(data)
 
-        thumbnail_data_slice = self._thick_slice_at_level(self.thumbnail_level)
-        thumbnail_data = self._project_thick_slice(
-            self.data_at_thumbnail_level, thumbnail_data_slice
-        )
         thumbnail_data = np.transpose(thumbnail_data, order)
         thumbnail = _ScalarFieldView.from_view(thumbnail_data)
 
@@ -308,8 +395,189 @@ class _ScalarFieldSliceRequest:
             tile_to_data=tile_to_data,
             slice_input=self.slice_input,
             request_id=self.id,
+            data_level=self.data_level,
+        )
+
+    def missing_tiles(self) -> list[tuple[int, ...]]:
+        """
+        Get the tiles of the displayed region that are not in the tile cache.
+
+        The tiles are sorted from the center of the region outwards, which is
+        the order in which they are progressively loaded.
+        """
+        if self.tile_cache is None:
+            return []
+        region = self._tile_region()
+        if region is None:
+            return []
+        start, stop, _ = region
+        slice_key = self._tile_slice_key()
+        missing = [
+            index
+            for index in self._tile_indices(start, stop)
+            if (slice_key, index) not in self.tile_cache
+        ]
+        center = (start + stop) / 2
+        size = self.tile_size
+        return sorted(
+            missing,
+            key=lambda index: float(
+                np.sum(((np.asarray(index) + 0.5) * size - center) ** 2)
+            ),
+        )
+
+    def _tile_region(self) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+        """
+        Get the start and stop of the displayed region at the data level,
+        along the sorted displayed dimensions, and the shape of the level.
+
+        Returns None if the region is empty.
+        """
+        displayed = sorted(self.slice_input.displayed)
+        level_shape = np.take(self.level_shapes[self.data_level], displayed)
+        start = np.asarray(self.corner_pixels[0, displayed], dtype=int)
+        stop = np.minimum(
+            np.asarray(self.corner_pixels[1, displayed], dtype=int) + 1,
+            level_shape,
+        )
+        if np.any(stop <= start):
+            return None
+        return start, stop, level_shape
+
+    def _tile_slice_key(self) -> Hashable:
+        """The part of the keys of the tiles that identifies this slice."""
+        return (
+            self.data_level,
+            np.nan_to_num(
+                self._thick_slice_at_level(self.data_level).as_array()
+            ).tobytes(),
+            str(self.projection_mode),
+        )
+
+    def _tile_indices(
+        self, start: np.ndarray, stop: np.ndarray
+    ) -> list[tuple[int, ...]]:
+        """Get the indices of the tiles intersecting a region."""
+        size = self.tile_size
+        return list(
+            itertools.product(
+                *(
+                    range(a // size, (b - 1) // size + 1)
+                    for a, b in zip(start, stop, strict=True)
+                )
+            )
         )
 
+    def _project_tiled_region(
+        self,
+        data: ArrayLike,
+        data_slice: _ThickNDSlice,
+        thumbnail_data: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Read and project the displayed region of 2D multiscale data tile by tile.
+
+        The data at the current level is split in a grid of square tiles of
+        ``tile_size`` pixels. Only the tiles intersecting the region given by
+        ``corner_pixels`` are used, and each is only read from the data if it
+        is not already in ``tile_cache``, so panning only reads newly exposed
+        tiles. Tiles are keyed by level, tile index and the thick slice of the
+        non-displayed dimensions. Missing tiles that are not in
+        ``tiles_to_load`` are upsampled from the thumbnail data instead.
+        """
+        assert self.tile_cache is not None
+        displayed = sorted(self.slice_input.displayed)
+        region_bounds = self._tile_region()
+        if region_bounds is None:
+            # the region is empty, so there are no tiles to read
+            start = np.asarray(self.corner_pixels[0, displayed], dtype=int)
+            stop = np.minimum(
+                np.asarray(self.corner_pixels[1, displayed], dtype=int) + 1,
+                np.take(self.level_shapes[self.data_level], displayed),
+            )
+            slices = [slice(None)] * len(data.shape)
+            for d, a, b in zip(displayed, start, stop, strict=True):
+                slices[d] = slice(a, max(a, b))
+            return self._project_thick_slice(data[tuple(slices)], data_slice)
+        start, stop, level_shape = region_bounds
+        size = self.tile_size
+        slice_key = self._tile_slice_key()
+        region: np.ndarray | None = None
+        for index in self._tile_indices(start, stop):
+            tile_start = np.asarray(index) * size
+            tile_stop = np.minimum(tile_start + size, level_shape)
+            key = (slice_key, index)
+            tile = self.tile_cache.get(key)
+            if tile is None and (
+                self.tiles_to_load is not None
+                and index not in self.tiles_to_load
+            ):
+                tile = self._placeholder_tile(
+                    thumbnail_data, tile_start, tile_stop
+                )
+            elif tile is None:
+                slices = [slice(None)] * len(data.shape)
+                for d, a, b in zip(
+                    displayed, tile_start, tile_stop, strict=True
+                ):
+                    slices[d] = slice(a, b)
+                tile = self._project_thick_slice(
+                    data[tuple(slices)], data_slice
+                )
+                self.tile_cache.put(
+                    key, tile, self.tile_cache_generation, nbytes=tile.nbytes
+                )
+            low = np.maximum(tile_start, start)
+            high = np.minimum(tile_stop, stop)
+            if region is None:
+                region = np.empty(
+                    tuple(stop - start) + tile.shape[len(displayed) :],
+                    dtype=tile.dtype,
+                )
+            region[
+                tuple(
+                    slice(a, b)
+                    for a, b in zip(low - start, high - start, strict=True)
+                )
+            ] = tile[
+                tuple(
+                    slice(a, b)
+                    for a, b in zip(
+                        low - tile_start, high - tile_start, strict=True
+                    )
+                )
+            ]
+        assert region is not None
+        return region
+
+    def _placeholder_tile(
+        self,
+        thumbnail_data: np.ndarray,
+        tile_start: np.ndarray,
+        tile_stop: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Upsample a tile from the thumbnail data, to show until it is loaded.
+        """
+        displayed = sorted(self.slice_input.displayed)
+        ratio = np.take(
+            self.downsample_factors[self.data_level], displayed
+        ) / np.take(self.downsample_factors[self.thumbnail_level], displayed)
+        indices = [
+            np.minimum(
+                ((np.arange(a, b) + 0.5) * r).astype(int),
+                n - 1,
+            )
+            for a, b, r, n in zip(
+                tile_start,
+                tile_stop,
+                ratio,
+                thumbnail_data.shape,
+                strict=False,
+            )
+        ]
+        return thumbnail_data[np.ix_(*indices)]
+
     def _thick_slice_at_level(self, level: int) -> _ThickNDSlice:
         """
         Get the data_slice rescaled for a specific level.
@@ -3,6 +3,7 @@ from __future__ import annotations
 import types
 from abc import ABC, abstractmethod
 from contextlib import nullcontext
+from dataclasses import replace
 from functools import lru_cache
 from typing import TYPE_CHECKING, cast
 
@@ -22,6 +23,7 @@ from napari.layers.image._image_mouse_bindings import (
     set_plane_position as plane_double_click_callback,
 )
 from napari.layers.image._image_utils import guess_multiscale
+from napari.layers.utils._slice_cache import _SliceCache
 from napari.layers.utils._slice_input import (
     _SliceInput,
     _ThickNDSlice,
@@ -30,6 +32,7 @@ from napari.layers.utils.layer_utils import (
     compute_multiscale_level_and_corners,
 )
 from napari.layers.utils.plane import SlicingPlane
+from napari.settings import get_settings
 from napari.types import LayerDataType
 from napari.utils._dask_utils import DaskIndexer
 from napari.utils._dtype import normalize_dtype
@@ -49,6 +52,10 @@ if TYPE_CHECKING:
 
 __all__ = ('ScalarFieldBase',)
 
+# Maximum number of steps in which the missing tiles of a 2D multiscale
+# slice are progressively loaded.
+_MAX_TILE_REFINEMENTS = 8
+
 
 def _make_level_materializer(
     data: MultiScaleData,
@@ -368,6 +375,7 @@ class ScalarFieldBase(Layer, ABC):
         self._data_raw = data
         # note, we don't support changing from/to multiscale after construction
         self._data = MultiScaleData(data) if self.multiscale else data  # type: ignore[arg-type]
+        self._slicing_state._on_data_modified()
         self._reset_data_level()
         self._reset_thumbnail_level_data()
         self._update_dims()
@@ -495,7 +503,7 @@ class ScalarFieldBase(Layer, ABC):
             )
             self.corner_pixels = corners
             if old_level != locked:
-                self.refresh(extent=False, thumbnail=False)
+                self._refresh_view(extent=False, thumbnail=False)
         elif self._slice_input.ndisplay == 2:
             level, scaled_corners = compute_multiscale_level_and_corners(
                 data_bbox_int,
@@ -510,6 +518,18 @@ class ScalarFieldBase(Layer, ABC):
             )
             if any(s == 0 for s in display_shape):
                 return
+            tile_size = get_settings().experimental.multiscale_tile_size
+            if tile_size > 0:
+                # Load whole tiles, so that panning within them needs no
+                # new data and loaded tiles can be reused.
+                corners[0, displayed_axes] = (
+                    corners[0, displayed_axes] // tile_size * tile_size
+                )
+                corners[1, displayed_axes] = np.minimum(
+                    (corners[1, displayed_axes] // tile_size + 1) * tile_size
+                    - 1,
+                    max_coords,
+                )
             # Only update when level changes or
             # when new view is outside current corner_pixels
             if (
@@ -525,10 +545,16 @@ class ScalarFieldBase(Layer, ABC):
             ):
                 self._data_level = level
                 self.corner_pixels = corners
-                self.refresh(extent=False, thumbnail=False)
+                self._refresh_view(extent=False, thumbnail=False)
         else:
-            # 3D: use the coarsest level, full extent
+            # 3D: use the coarsest level, full extent, unless the
+            # volume is being progressively refined to finer levels.
             new_level = len(self.level_shapes) - 1
+            refinement_levels = self._slicing_state._refinement_levels(
+                self._slice_input
+            )
+            if self._data_level in refinement_levels:
+                new_level = self._data_level
             level_changed = self._data_level != new_level
             self._data_level = new_level
             corners = np.zeros((2, self.ndim), dtype=int)
@@ -537,7 +563,7 @@ class ScalarFieldBase(Layer, ABC):
             )
             self.corner_pixels = corners
             if level_changed:
-                self.refresh(extent=False, thumbnail=False)
+                self._refresh_view(extent=False, thumbnail=False)
 
     def _reset_thumbnail_level_data(self) -> None:
         """Set ``_thumbnail_level`` and ``_level_materializer`` for the current data.
@@ -858,6 +884,69 @@ class ScalarFieldSlicingState(_LayerSlicingState):
             rgb=len(self.layer.data.shape) != self.ndim,
             dtype=self.layer._slice_dtype(),
         )
+        self._cache = cache
+        self._slice_cache = _SliceCache()
+        self._tile_cache = _SliceCache()
+
+    def _on_data_modified(self) -> None:
+        """Discard cached slices, as the layer data has changed."""
+        self._slice_cache.clear()
+        self._tile_cache.clear()
+
+    def _update_slice_cache_limits(self) -> None:
+        """Size the slice cache according to the experimental settings.
+
+        With a memory budget, as many recent slices as fit in it are kept.
+        Otherwise, only the current slice and the prefetched slices ahead of
+        and behind it when playing or scrubbing through an axis are kept.
+        """
+        settings = get_settings().experimental
+        if not self._cache:
+            self._slice_cache.max_entries = 0
+        elif settings.slice_cache_size > 0:
+            self._slice_cache.max_entries = None
+            self._slice_cache.max_bytes = int(settings.slice_cache_size * 1e6)
+        else:
+            steps = settings.slice_prefetch_steps
+            self._slice_cache.max_bytes = None
+            self._slice_cache.max_entries = 2 * steps + 1 if steps > 0 else 0
+
+    def _update_tile_cache_limits(self, slice_input: _SliceInput) -> int:
+        """Size the tile cache according to the experimental settings.
+
+        With a memory budget, as many recent tiles as fit in it are kept.
+        Otherwise, tiles for about twice the current region are kept, so
+        that tiles around it are reused when panning back and forth.
+
+        Tiled slices are assembled from the tile cache rather than kept in
+        the slice cache, so only one of the two caches holds data at a time
+        and they share the memory budget.
+
+        Returns the tile size, or 0 if the data should not be tiled.
+        """
+        settings = get_settings().experimental
+        tile_size = settings.multiscale_tile_size
+        if (
+            not self._cache
+            or not self.layer.multiscale
+            or slice_input.ndisplay != 2
+            or tile_size == 0
+        ):
+            self._tile_cache.max_entries = 0
+            return 0
+        self._slice_cache.max_entries = 0
+        if settings.slice_cache_size > 0:
+            self._tile_cache.max_entries = None
+            self._tile_cache.max_bytes = int(settings.slice_cache_size * 1e6)
+        else:
+            displayed = list(slice_input.displayed)
+            corners = self.layer.corner_pixels[:, displayed]
+            n_tiles = np.prod(
+                corners[1] // tile_size - corners[0] // tile_size + 1
+            )
+            self._tile_cache.max_bytes = None
+            self._tile_cache.max_entries = 2 * int(n_tiles)
+        return tile_size
 
     def _set_view_slice(self):
         if (
@@ -910,11 +999,98 @@ class ScalarFieldSlicingState(_LayerSlicingState):
         # things either by caching the world-to-data transform on the layer
         # or by lazily evaluating it in the slice task itself.
         data_slice = self._slice_indices(slice_input, dims)
-        return self._make_slice_request_internal(
+        request = self._make_slice_request_internal(
             slice_input=slice_input,
             data_slice=data_slice,
             dask_indexer=self.dask_optimized_slicing,
         )
+        if levels := self._refinement_levels(slice_input):
+            # Progressively refine 3D multiscale volumes after showing the
+            # coarsest level. Refinements keep the id of the request, so that
+            # the layer is loaded as soon as the coarsest level is shown.
+            data = self.layer.data
+            request = replace(
+                request,
+                refinements=tuple(
+                    replace(
+                        request,
+                        data_level=level,
+                        data_at_data_level=data[level],
+                    )
+                    for level in levels
+                ),
+            )
+        elif request.data_level != request.thumbnail_level and (
+            missing := request.missing_tiles()
+        ):
+            # Show the missing tiles of 2D multiscale data upsampled from the
+            # thumbnail level, then load them in batches from the center of
+            # the view outwards, the last refinement loading all of them.
+            batches = np.array_split(
+                np.arange(len(missing)),
+                min(len(missing), _MAX_TILE_REFINEMENTS),
+            )
+            refinements = [
+                replace(
+                    request,
+                    tiles_to_load=frozenset(missing[: batch[-1] + 1]),
+                )
+                for batch in batches[:-1]
+            ]
+            request = replace(
+                request,
+                tiles_to_load=frozenset(),
+                refinements=(*refinements, request),
+            )
+        return request
+
+    def _refinement_levels(self, slice_input: _SliceInput) -> list[int]:
+        """Get the finer levels used to progressively refine a 3D slice.
+
+        These are the levels finer than the coarsest one, from coarsest
+        to finest, whose displayed volume fits within the memory budget
+        set by the experimental settings.
+        """
+        budget = get_settings().experimental.multiscale_3d_memory * 1e6
+        if (
+            budget == 0
+            or not self.layer.multiscale
+            or slice_input.ndisplay != 3
+            or self.layer._locked_data_level is not None
+        ):
+            return []
+        displayed = list(slice_input.displayed)
+        itemsize = np.dtype(normalize_dtype(self.layer.dtype)).itemsize
+        level_shapes = self.layer.level_shapes
+        levels = []
+        for level in range(len(level_shapes) - 2, -1, -1):
+            shape = level_shapes[level]
+            nbytes = np.prod(np.take(shape, displayed)) * itemsize
+            if len(shape) != self.ndim:
+                # rgb(a) channels
+                nbytes *= shape[-1]
+            if nbytes > budget:
+                break
+            levels.append(level)
+        return levels
+
+    def _make_prefetch_request(
+        self, dims: Dims
+    ) -> _ScalarFieldSliceRequest | None:
+        """Make a slice request that only warms the slice cache.
+
+        Returns None if slice caching is disabled or if the response
+        for the given dims is already cached.
+        """
+        request = self._make_slice_request(dims)
+        if request.tile_cache is not None:
+            # tiled slices are not cached as a whole, but their tiles are
+            if not request.missing_tiles():
+                return None
+            return replace(request, tiles_to_load=None, refinements=())
+        if request.cache is None or request.cache_key in request.cache:
+            return None
+        return request
 
     def _make_slice_request_internal(
         self,
@@ -962,6 +1138,8 @@ class ScalarFieldSlicingState(_LayerSlicingState):
         else:
             data_at_data_level = data[data_level]
 
+        self._update_slice_cache_limits()
+        tile_size = self._update_tile_cache_limits(slice_input)
         return self._slice_request_class(
             slice_input=slice_input,
             data_at_data_level=data_at_data_level,
@@ -977,6 +1155,11 @@ class ScalarFieldSlicingState(_LayerSlicingState):
             thumbnail_level=thumbnail_level,
             level_shapes=self.layer.level_shapes,
             downsample_factors=self.layer.downsample_factors,
+            cache=self._slice_cache if self._slice_cache.enabled else None,
+            cache_generation=self._slice_cache.generation,
+            tile_cache=self._tile_cache if tile_size > 0 else None,
+            tile_cache_generation=self._tile_cache.generation,
+            tile_size=tile_size,
         )
 
     def _update_slice_response(
@@ -990,6 +1173,21 @@ class ScalarFieldSlicingState(_LayerSlicingState):
         # are outside the range of supported by vispy, then data view is
         # rescaled to fit within the range.
         self._slice_input = response.slice_input
+        if (
+            self.layer.multiscale
+            and response.slice_input.ndisplay == 3
+            and not response.empty
+            and response.data_level != self.layer._data_level
+        ):
+            # The volume may have been progressively refined to a finer level.
+            level = response.data_level
+            corners = np.zeros((2, self.ndim), dtype=int)
+            displayed = list(response.slice_input.displayed)
+            corners[1, displayed] = (
+                np.take(self.layer.level_shapes[level], displayed) - 1
+            )
+            self.layer._data_level = level
+            self.layer.corner_pixels = corners
         # this is the temporary patch
         self.layer._transforms[0] = response.tile_to_data
         #
@@ -293,6 +293,12 @@ class _LayerSlicingState(ABC):
     def _set_view_slice(self):
         raise NotImplementedError
 
+    def _on_data_modified(self) -> None:  # noqa: B027
+        """Notify that the layer data may have been modified.
+
+        Slicing states that cache slices should discard them here.
+        """
+
     @property
     def loaded(self) -> bool:
         """True if this layer is fully loaded in memory, False otherwise.
@@ -1691,6 +1697,31 @@ class Layer(KeymapProvider, MousemapProvider, ABC, metaclass=PostInit):
         force: bool = False,
     ) -> None:
         """Refresh all layer data based on current view slice."""
+        if data_displayed:
+            # The data may have been modified in place.
+            self._slicing_state._on_data_modified()
+        self._refresh_view(
+            thumbnail=thumbnail,
+            data_displayed=data_displayed,
+            highlight=highlight,
+            extent=extent,
+            force=force,
+        )
+
+    def _refresh_view(
+        self,
+        *,
+        thumbnail: bool = True,
+        data_displayed: bool = True,
+        highlight: bool = True,
+        extent: bool = True,
+        force: bool = False,
+    ) -> None:
+        """Refresh the layer like `refresh`, assuming the data is unchanged.
+
+        This should be used when only the viewed region of the data changes,
+        so that slices cached by the slicing state can be reused.
+        """
         if self._refresh_blocked:
             logger.debug('Layer.refresh blocked: %s', self)
             return
@@ -8,7 +8,9 @@ from napari._tests.utils import check_layer_world_data_extent
 from napari.components.dims import Dims
 from napari.layers import Image
 from napari.layers.image._image_constants import ImageRendering
+from napari.layers.utils._data_range import iter_data_range
 from napari.layers.utils.plane import ClippingPlaneList, SlicingPlane
+from napari.settings import get_settings
 from napari.utils import Colormap
 from napari.utils._test_utils import (
     validate_all_params_in_docstring,
@@ -261,6 +263,32 @@ def test_changing_image_dims():
     assert layer._data_view.shape == shape_b[-2:]
 
 
+def test_toggling_slices_uses_slice_cache():
+    """Test that going back to a previous slice does not read data again."""
+    get_settings().experimental.slice_cache_size = 1
+    np.random.seed(0)
+    data = np.random.random((5, 10, 15))
+    layer = Image(data)
+    cache = layer._slicing_state._slice_cache
+
+    for z in (1, 2, 1, 2):
+        layer._slice_dims(Dims(ndim=3, point=(z, 0, 0)))
+        np.testing.assert_array_equal(layer._data_view, data[z])
+
+    assert cache.hits == 2
+    assert len(cache) >= 2
+    assert cache.nbytes <= 1e6
+
+
+def test_slice_cache_disabled_with_cache_false():
+    get_settings().experimental.slice_cache_size = 1
+    layer = Image(np.zeros((5, 10, 15)), cache=False)
+
+    layer._slice_dims(Dims(ndim=3, point=(1, 0, 0)))
+
+    assert len(layer._slicing_state._slice_cache) == 0
+
+
 def test_name():
     """Test setting layer name."""
     np.random.seed(0)
@@ -1076,3 +1104,36 @@ def test_contrast_outside_range():
 def test_docstring():
     validate_all_params_in_docstring(Image)
     validate_kwargs_sorted(Image)
+
+
+def test_estimated_data_range_updates_contrast_limits_range():
+    get_settings().experimental.estimate_data_range = True
+    data = np.zeros((20, 64, 64), dtype=np.float32)
+    data[7, 3, 3] = 500
+    layer = Image(da.from_array(data, chunks=(4, 64, 64)))
+    assert layer._should_estimate_data_range()
+    assert not Image(data)._should_estimate_data_range()
+    assert not Image(
+        da.from_array(data), contrast_limits=(0, 1)
+    )._should_estimate_data_range()
+
+    estimates = list(layer._estimate_data_range())
+    for estimate in estimates:
+        layer._on_data_range_estimate(*estimate)
+    assert layer.contrast_limits_range == [0, 500]
+    # the exact range is reused when computing the range of the data again
+    layer.contrast_limits_range = (0, 1)
+    layer.reset_contrast_limits_range('data')
+    assert layer.contrast_limits_range == [0, 500]
+
+
+def test_known_data_range_used_on_creation():
+    get_settings().experimental.cache_chunk_statistics = True
+    data = np.zeros((20, 64, 64), dtype=np.float32)
+    data[7, 3, 3] = 500
+    data = da.from_array(data, chunks=(4, 64, 64))
+    assert Image(data).contrast_limits_range == [0, 1]
+    list(iter_data_range(data))
+    layer = Image(data)
+    assert layer.contrast_limits_range == [0, 500]
+    assert layer.contrast_limits == [0, 500]
@@ -4,7 +4,9 @@ import skimage
 from skimage.transform import pyramid_gaussian
 
 from napari._tests.utils import check_layer_world_data_extent
+from napari.components import Dims
 from napari.layers import Image
+from napari.settings import get_settings
 from napari.utils import Colormap
 
 
@@ -510,3 +512,102 @@ def test_update_draw_variable_canvas_size_fixed_fov(
 
     assert layer.data_level == exp_level
     np.testing.assert_equal(layer.corner_pixels, exp_corner_pixels_data)
+
+
+def test_update_draw_snaps_corners_to_tiles():
+    get_settings().experimental.multiscale_tile_size = 8
+    shapes = [(40, 40), (20, 20), (10, 10)]
+    data = [np.zeros(s) for s in shapes]
+    layer = Image(data, multiscale=True)
+
+    layer._update_draw(
+        scale_factor=1,
+        corner_pixels_displayed=np.array([[5, 10], [15, 20]]),
+        shape_threshold=(16, 16),
+    )
+
+    assert layer.data_level == 0
+    np.testing.assert_equal(layer.corner_pixels, [[0, 8], [15, 23]])
+
+
+def test_tiled_multiscale_slicing_reuses_tiles():
+    get_settings().experimental.multiscale_tile_size = 8
+    np.random.seed(0)
+    shapes = [(40, 40), (20, 20), (10, 10)]
+    data = [np.random.random(s) for s in shapes]
+    layer = Image(data, multiscale=True)
+    tile_cache = layer._slicing_state._tile_cache
+
+    layer._update_draw(
+        scale_factor=1,
+        corner_pixels_displayed=np.array([[5, 5], [15, 15]]),
+        shape_threshold=(16, 16),
+    )
+    np.testing.assert_array_equal(layer._data_view, data[0][:16, :16])
+    hits = tile_cache.hits
+
+    # panning right only reads the newly visible tiles
+    layer._update_draw(
+        scale_factor=1,
+        corner_pixels_displayed=np.array([[5, 13], [15, 23]]),
+        shape_threshold=(16, 16),
+    )
+    np.testing.assert_array_equal(layer._data_view, data[0][:16, 8:24])
+    assert tile_cache.hits == hits + 2
+
+
+def test_tiled_multiscale_slicing_refines_placeholders():
+    get_settings().experimental.multiscale_tile_size = 8
+    np.random.seed(0)
+    shapes = [(40, 40), (20, 20), (10, 10)]
+    data = [np.random.random(s) for s in shapes]
+    layer = Image(data, multiscale=True)
+    layer._update_draw(
+        scale_factor=1,
+        corner_pixels_displayed=np.array([[5, 5], [15, 15]]),
+        shape_threshold=(16, 16),
+    )
+    layer._slicing_state._tile_cache.clear()
+
+    request = layer._slicing_state._make_slice_request(Dims(ndim=2))
+    assert request.missing_tiles() == [(0, 0), (0, 1), (1, 0), (1, 1)]
+    # the missing tiles are first upsampled from the thumbnail level
+    placeholder = np.minimum((np.arange(16) + 0.5) / 4, 9).astype(int)
+    np.testing.assert_array_equal(
+        request().image.view, data[2][np.ix_(placeholder, placeholder)]
+    )
+    # then progressively loaded, keeping the id of the request
+    assert len(request.refinements) == 4
+    assert all(r.id == request.id for r in request.refinements)
+    view = request.refinements[0]().image.view
+    np.testing.assert_array_equal(view[:8, :8], data[0][:8, :8])
+    np.testing.assert_array_equal(
+        view[8:, 8:], data[2][np.ix_(placeholder[8:], placeholder[8:])]
+    )
+    np.testing.assert_array_equal(
+        request.refinements[-1]().image.view, data[0][:16, :16]
+    )
+    assert request.missing_tiles() == []
+    # once loaded, the tiles are not refined again
+    assert (
+        layer._slicing_state._make_slice_request(Dims(ndim=2)).refinements
+        == ()
+    )
+
+
+def test_tiled_multiscale_shares_cache_budget():
+    get_settings().experimental.multiscale_tile_size = 8
+    get_settings().experimental.slice_cache_size = 1
+    data = [np.zeros(s) for s in [(40, 40), (20, 20), (10, 10)]]
+    layer = Image(data, multiscale=True)
+    layer._update_draw(
+        scale_factor=1,
+        corner_pixels_displayed=np.array([[5, 5], [15, 15]]),
+        shape_threshold=(16, 16),
+    )
+    slicing_state = layer._slicing_state
+    assert slicing_state._tile_cache.max_bytes == 1e6
+    assert 0 < slicing_state._tile_cache.nbytes <= 1e6
+    # the assembled region is not also kept in the slice cache
+    assert not slicing_state._slice_cache.enabled
+    assert len(slicing_state._slice_cache) == 0
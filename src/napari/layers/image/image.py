@@ -24,14 +24,20 @@ from napari.layers.image._image_constants import (
 from napari.layers.image._image_utils import guess_rgb
 from napari.layers.image._slice import _ImageSliceRequest
 from napari.layers.intensity_mixin import IntensityVisualizationMixin
+from napari.layers.utils._data_range import (
+    DataRangeEstimate,
+    cached_data_range,
+    iter_data_range,
+)
 from napari.layers.utils.layer_utils import calc_data_range
+from napari.settings import get_settings
 from napari.types import LayerDataType
 from napari.utils._dtype import get_dtype_limits, normalize_dtype
 from napari.utils.colormaps import ensure_colormap
 from napari.utils.colormaps.colormap_utils import _coerce_contrast_limits
 
 if typing.TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Generator, Sequence
 
     import numpy.typing as npt
     import pint
@@ -336,14 +342,20 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         self._attenuation = attenuation
 
         # Set contrast limits, colormaps and plane parameters
+        self._data_range_from_data = contrast_limits is None
         if contrast_limits is None:
             if not isinstance(data, np.ndarray):
                 dtype = normalize_dtype(getattr(data, 'dtype', np.float32))
-                if np.issubdtype(dtype, np.integer):
-                    self.contrast_limits_range = get_dtype_limits(dtype)
+                estimate = cached_data_range(self._data_range_input())
+                if estimate is not None:
+                    # the range is known from a previous visit of the data
+                    self.contrast_limits_range = _estimate_to_range(estimate)
                 else:
-                    self.contrast_limits_range = (0, 1)
-                self._should_calc_clims = dtype != np.uint8
+                    if np.issubdtype(dtype, np.integer):
+                        self.contrast_limits_range = get_dtype_limits(dtype)
+                    else:
+                        self.contrast_limits_range = (0, 1)
+                    self._should_calc_clims = dtype != np.uint8
             else:
                 self.contrast_limits_range = self._calc_data_range()
         else:
@@ -600,7 +612,10 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
         """
         input_data: np.ndarray
         if mode == 'data':
-            input_data = self.data[-1] if self.multiscale else self.data
+            input_data = self._data_range_input()
+            estimate = cached_data_range(input_data)
+            if estimate is not None:
+                return _estimate_to_range(estimate)
         elif mode == 'slice':
             input_data = self._slice.image.raw  # ugh
         else:
@@ -611,6 +626,46 @@ class Image(IntensityVisualizationMixin, ScalarFieldBase):
             cast(LayerDataProtocol, input_data), rgb=self.rgb, dtype=self.dtype
         )
 
+    def _data_range_input(self) -> LayerDataProtocol:
+        """Return the data whose range is used as contrast limits range."""
+        return self.data[-1] if self.multiscale else self.data
+
+    def _should_estimate_data_range(self) -> bool:
+        """Whether to estimate the range of the data in the background.
+
+        This is the case when the contrast limits were not given, and the
+        data is too large or too slow to read for its range to have been
+        computed exactly on creation.
+        """
+        if (
+            not get_settings().experimental.estimate_data_range
+            or not self._data_range_from_data
+            or self.rgb
+            or normalize_dtype(self.dtype) == np.uint8
+        ):
+            return False
+        data = self._data_range_input()
+        return not isinstance(data, np.ndarray) or data.size > 1e7
+
+    def _estimate_data_range(
+        self,
+    ) -> Generator[tuple[LayerDataProtocol, DataRangeEstimate], None, None]:
+        """Yield progressively refined estimates of the range of the data.
+
+        This is meant to run in a background thread, with the estimates
+        passed to `_on_data_range_estimate` on the main thread.
+        """
+        data = self._data_range_input()
+        for estimate in iter_data_range(data):
+            yield data, estimate
+
+    def _on_data_range_estimate(
+        self, data: LayerDataProtocol, estimate: DataRangeEstimate
+    ) -> None:
+        """Use the exact range of the data as contrast limits range."""
+        if estimate.done and data is self._data_range_input():
+            self.contrast_limits_range = _estimate_to_range(estimate)
+
     def _raw_to_displayed(self, raw: np.ndarray) -> np.ndarray:
         """Determine displayed image from raw image.
 
@@ -735,3 +790,12 @@ class _ImageSlicingState(ScalarFieldSlicingState):
             self.layer._should_calc_clims = False
         elif self.layer.auto_contrast:
             self.layer.reset_contrast_limits()
+
+
+def _estimate_to_range(estimate: DataRangeEstimate) -> tuple[float, float]:
+    """Return the range of an estimate, as `calc_data_range` would."""
+    min_val, max_val = estimate.min, estimate.max
+    if min_val == max_val:
+        min_val = min(min_val, 0)
+        max_val = max(max_val, 1)
+    return float(min_val), float(max_val)
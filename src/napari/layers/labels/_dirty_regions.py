@@ -0,0 +1,175 @@
+"""Coalesced regions of a Labels layer that changed since the last refresh."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+# The size of the blocks used to split scattered changed pixels into
+# separate regions.
+_BLOCK_SIZE = 64
+
+
+class _DirtyRegions:
+    """Set of boxes covering the pixels of an array that changed.
+
+    Regions are merged as they are added when their bounding box is not
+    larger than the two regions together, e.g. when they overlap a lot or
+    are adjacent, so that successive brush strokes become a single region
+    while distant ones stay separate. When there are more than
+    ``max_regions`` regions, the two regions whose bounding box adds the
+    fewest pixels are merged.
+
+    Parameters
+    ----------
+    max_regions : int
+        The maximum number of regions to keep.
+    """
+
+    def __init__(self, max_regions: int = 16) -> None:
+        self.max_regions = max_regions
+        # start and stop of each region along each axis
+        self._starts: list[np.ndarray] = []
+        self._stops: list[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[tuple[slice, ...]]:
+        for starts, stops in zip(self._starts, self._stops, strict=True):
+            yield tuple(
+                slice(int(a), int(b))
+                for a, b in zip(starts, stops, strict=True)
+            )
+
+    def clear(self) -> None:
+        """Forget all the regions."""
+        self._starts = []
+        self._stops = []
+
+    def add(self, region: Sequence[slice]) -> None:
+        """Add a region.
+
+        Parameters
+        ----------
+        region : sequence of slice
+            The region, with one slice with a start and a stop per axis.
+        """
+        starts = np.array([s.start for s in region], dtype=np.int64)
+        stops = np.array([s.stop for s in region], dtype=np.int64)
+        if np.any(stops <= starts):
+            return
+        self._add(starts, stops)
+        while len(self._starts) > self.max_regions:
+            self._merge_closest()
+
+    def add_points(self, indices: Sequence[np.ndarray]) -> None:
+        """Add regions covering some pixels.
+
+        The pixels are grouped by blocks, so that scattered pixels do not
+        result in a single large region.
+
+        Parameters
+        ----------
+        indices : sequence of array of int
+            The coordinates of the pixels along each axis.
+        """
+        coords = np.stack([np.asarray(i, dtype=np.int64) for i in indices])
+        if coords.size == 0:
+            return
+        blocks, inverse = np.unique(
+            coords // _BLOCK_SIZE, axis=1, return_inverse=True
+        )
+        if blocks.shape[1] > self.max_regions:
+            # too many blocks to track separately
+            self.add(
+                [
+                    slice(int(a), int(b) + 1)
+                    for a, b in zip(
+                        coords.min(axis=1), coords.max(axis=1), strict=True
+                    )
+                ]
+            )
+            return
+        inverse = inverse.ravel()
+        for block in range(blocks.shape[1]):
+            block_coords = coords[:, inverse == block]
+            self.add(
+                [
+                    slice(int(a), int(b) + 1)
+                    for a, b in zip(
+                        block_coords.min(axis=1),
+                        block_coords.max(axis=1),
+                        strict=True,
+                    )
+                ]
+            )
+
+    def bounding_region(self) -> tuple[slice, ...] | None:
+        """Return the bounding box of all the regions, or None if empty."""
+        if not self._starts:
+            return None
+        starts = np.min(self._starts, axis=0)
+        stops = np.max(self._stops, axis=0)
+        return tuple(
+            slice(int(a), int(b)) for a, b in zip(starts, stops, strict=True)
+        )
+
+    def project(self, axes: Sequence[int]) -> _DirtyRegions:
+        """Return the regions restricted to some axes.
+
+        Regions that overlap once restricted are merged.
+
+        Parameters
+        ----------
+        axes : sequence of int
+            The axes to keep.
+        """
+        projected = _DirtyRegions(self.max_regions)
+        for region in self:
+            projected.add([region[axis] for axis in axes])
+        return projected
+
+    def _add(self, starts: np.ndarray, stops: np.ndarray) -> None:
+        # Merging two regions can make the merged region mergeable with
+        # other regions, so merge until no region can be merged.
+        merged = True
+        while merged:
+            merged = False
+            volume = np.prod(stops - starts)
+            for i, (other_starts, other_stops) in enumerate(
+                zip(self._starts, self._stops, strict=True)
+            ):
+                union_starts = np.minimum(starts, other_starts)
+                union_stops = np.maximum(stops, other_stops)
+                if np.prod(union_stops - union_starts) <= volume + np.prod(
+                    other_stops - other_starts
+                ):
+                    del self._starts[i], self._stops[i]
+                    starts, stops = union_starts, union_stops
+                    merged = True
+                    break
+        self._starts.append(starts)
+        self._stops.append(stops)
+
+    def _merge_closest(self) -> None:
+        starts = np.array(self._starts)
+        stops = np.array(self._stops)
+        volumes = np.prod(stops - starts, axis=1)
+        union_volumes = np.prod(
+            np.maximum(stops[:, np.newaxis], stops[np.newaxis])
+            - np.minimum(starts[:, np.newaxis], starts[np.newaxis]),
+            axis=2,
+        )
+        added = union_volumes - volumes[:, np.newaxis] - volumes[np.newaxis]
+        added[np.diag_indices(len(volumes))] = np.iinfo(added.dtype).max
+        i, j = np.unravel_index(np.argmin(added), added.shape)
+        union_starts = np.minimum(starts[i], starts[j])
+        union_stops = np.maximum(stops[i], stops[j])
+        for index in sorted((int(i), int(j)), reverse=True):
+            del self._starts[index], self._stops[index]
+        self._add(union_starts, union_stops)
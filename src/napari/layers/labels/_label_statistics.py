@@ -0,0 +1,337 @@
+"""Incrementally maintained per-label statistics of a Labels layer."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import pandas as pd
+
+    from napari.layers._data_protocols import LayerDataProtocol
+
+# The number of elements read and processed at once when building
+# the statistics from the whole data.
+_BLOCK_SIZE = 2**22
+
+
+class _GroupStatistics(NamedTuple):
+    """Statistics of a set of labelled pixels, grouped by label.
+
+    Attributes
+    ----------
+    labels : ndarray
+        The unique labels, shape (N,).
+    counts : ndarray
+        The number of pixels of each label, shape (N,).
+    sums : ndarray
+        The sum of the coordinates of the pixels of each label, shape (N, D).
+    mins : ndarray
+        The minimum coordinates of the pixels of each label, shape (N, D).
+    maxs : ndarray
+        The maximum coordinates of the pixels of each label, shape (N, D).
+    """
+
+    labels: np.ndarray
+    counts: np.ndarray
+    sums: np.ndarray
+    mins: np.ndarray
+    maxs: np.ndarray
+
+    @classmethod
+    def from_pixels(
+        cls, values: np.ndarray, coords: Sequence[np.ndarray]
+    ) -> _GroupStatistics:
+        """Group the given pixel values and coordinates by label.
+
+        Parameters
+        ----------
+        values : ndarray
+            The labels of the pixels, shape (M,).
+        coords : sequence of ndarray
+            The coordinates of the pixels along each axis, each of shape (M,).
+        """
+        labels, inverse = np.unique(values, return_inverse=True)
+        inverse = inverse.ravel()
+        counts = np.bincount(inverse, minlength=len(labels))
+        order = np.argsort(inverse, kind='stable')
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        ndim = len(coords)
+        sums = np.empty((len(labels), ndim))
+        mins = np.empty((len(labels), ndim), dtype=np.int64)
+        maxs = np.empty((len(labels), ndim), dtype=np.int64)
+        for axis, axis_coords in enumerate(coords):
+            axis_coords = np.asarray(axis_coords, dtype=np.int64)
+            sums[:, axis] = np.bincount(
+                inverse, weights=axis_coords, minlength=len(labels)
+            )
+            if len(labels) > 0:
+                sorted_coords = axis_coords[order]
+                mins[:, axis] = np.minimum.reduceat(sorted_coords, starts)
+                maxs[:, axis] = np.maximum.reduceat(sorted_coords, starts)
+        return cls(labels, counts, sums, mins, maxs)
+
+    @classmethod
+    def from_block(
+        cls, values: np.ndarray, offset: Sequence[int]
+    ) -> _GroupStatistics:
+        """Group the pixels of a dense block of data by label.
+
+        Parameters
+        ----------
+        values : ndarray
+            The block of data.
+        offset : sequence of int
+            The coordinates of the first pixel of the block.
+        """
+        coords = [
+            np.broadcast_to(
+                np.arange(start, start + size).reshape(
+                    (-1,) + (1,) * (values.ndim - axis - 1)
+                ),
+                values.shape,
+            ).ravel()
+            for axis, (start, size) in enumerate(
+                zip(offset, values.shape, strict=True)
+            )
+        ]
+        return cls.from_pixels(values.ravel(), coords)
+
+
+class _LabelStatistics:
+    """Pixel count, bounding box and centroid of each label of some data.
+
+    The statistics are built once from the whole data, reading it in blocks
+    that are processed in parallel. After that, they should be updated with
+    `update` every time pixels of the data change, which only takes time
+    proportional to the number of changed pixels.
+
+    Bounding boxes cannot be shrunk incrementally, so when a label loses
+    pixels its bounding box is marked as outdated, and it is recomputed from
+    the data within the previous bounding box when it is next queried.
+
+    Parameters
+    ----------
+    data : LayerDataProtocol
+        The labels data.
+
+    Attributes
+    ----------
+    version : int
+        The number of updates since the statistics were built, used to
+        tell whether tables made from them are outdated.
+    """
+
+    def __init__(self, data: LayerDataProtocol) -> None:
+        self._data = data
+        self.version = 0
+        self._ndim = len(data.shape)
+        self._counts: dict[int, int] = {}
+        self._sums: dict[int, np.ndarray] = {}
+        self._mins: dict[int, np.ndarray] = {}
+        self._maxs: dict[int, np.ndarray] = {}
+        self._outdated_bboxes: set[int] = set()
+        self._build()
+
+    def _build(self) -> None:
+        shape = self._data.shape
+        # Split the data into blocks along the first axis, aligned
+        # with the chunks of chunked arrays when possible.
+        row_size = int(np.prod(shape[1:]))
+        step = max(1, _BLOCK_SIZE // max(row_size, 1))
+        chunks = getattr(self._data, 'chunks', None)
+        if chunks is not None and len(chunks) > 0:
+            chunk_rows = chunks[0]
+            if not isinstance(chunk_rows, int):
+                # dask chunks are tuples of chunk sizes
+                chunk_rows = max(chunk_rows, default=1)
+            step = max(1, step // chunk_rows) * chunk_rows
+        starts = range(0, shape[0], step) if self._ndim > 0 else range(0)
+
+        def block_statistics(start: int) -> _GroupStatistics:
+            values = np.asarray(self._data[start : start + step])
+            offset = (start,) + (0,) * (self._ndim - 1)
+            return _GroupStatistics.from_block(values, offset)
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for stats in executor.map(block_statistics, starts):
+                self._add(stats)
+        self._outdated_bboxes.clear()
+
+    def update(
+        self,
+        coords: Sequence[np.ndarray],
+        old_values: np.ndarray,
+        new_values: np.ndarray | int,
+    ) -> None:
+        """Update the statistics after some pixels changed.
+
+        Parameters
+        ----------
+        coords : sequence of ndarray
+            The coordinates of the changed pixels along each axis.
+        old_values : ndarray
+            The labels of the changed pixels before the change.
+        new_values : ndarray or int
+            The labels of the changed pixels after the change.
+        """
+        coords = [np.asarray(c).ravel() for c in coords]
+        shape = coords[0].shape
+        # Values are either scalars or arrays with one value per pixel.
+        old_values = np.broadcast_to(np.asarray(old_values).ravel(), shape)
+        new_values = np.broadcast_to(np.asarray(new_values).ravel(), shape)
+        # A pixel given several times is only counted once, with the last
+        # value written to it, as in numpy fancy indexing assignment.
+        flat = np.ravel_multi_index(coords, self._data.shape, mode='wrap')
+        _, last = np.unique(flat[::-1], return_index=True)
+        if len(last) < len(flat):
+            keep = len(flat) - 1 - last
+            coords = [c[keep] for c in coords]
+            old_values = old_values[keep]
+            new_values = new_values[keep]
+        self._update(coords, old_values, new_values)
+
+    def _update(
+        self,
+        coords: Sequence[np.ndarray],
+        old_values: np.ndarray,
+        new_values: np.ndarray,
+    ) -> None:
+        """Update the statistics given distinct changed pixels."""
+        self._remove(_GroupStatistics.from_pixels(old_values, coords))
+        self._add(_GroupStatistics.from_pixels(new_values, coords))
+        self.version += 1
+
+    def update_region(
+        self,
+        slice_key: tuple[slice, ...],
+        mask: np.ndarray | None,
+        old_values: np.ndarray,
+        new_values: np.ndarray | int,
+    ) -> None:
+        """Update the statistics after pixels of a bounding box changed.
+
+        Parameters
+        ----------
+        slice_key : tuple of slice
+            The bounding box of the change, with one slice per axis.
+        mask : ndarray or None
+            The changed pixels within the bounding box, or None if all
+            the pixels of the bounding box changed.
+        old_values : ndarray
+            The labels of the changed pixels before the change.
+        new_values : ndarray or int
+            The labels of the changed pixels after the change.
+        """
+        ranges = [
+            range(*s.indices(size))
+            for s, size in zip(slice_key, self._data.shape, strict=True)
+        ]
+        if mask is None:
+            mask = np.ones(tuple(len(r) for r in ranges), dtype=bool)
+        local_coords = np.nonzero(mask)
+        coords = [
+            r.start + c for c, r in zip(local_coords, ranges, strict=True)
+        ]
+        shape = coords[0].shape
+        self._update(
+            coords,
+            np.broadcast_to(np.asarray(old_values).ravel(), shape),
+            np.broadcast_to(np.asarray(new_values).ravel(), shape),
+        )
+
+    def _add(self, stats: _GroupStatistics) -> None:
+        for label, count, sums, mins, maxs in zip(*stats, strict=True):
+            label = int(label)
+            if label in self._counts:
+                self._counts[label] += int(count)
+                self._sums[label] += sums
+                self._mins[label] = np.minimum(self._mins[label], mins)
+                self._maxs[label] = np.maximum(self._maxs[label], maxs)
+            else:
+                self._counts[label] = int(count)
+                self._sums[label] = sums.copy()
+                self._mins[label] = mins.copy()
+                self._maxs[label] = maxs.copy()
+
+    def _remove(self, stats: _GroupStatistics) -> None:
+        for label, count, sums in zip(
+            stats.labels, stats.counts, stats.sums, strict=True
+        ):
+            label = int(label)
+            self._counts[label] -= int(count)
+            if self._counts[label] <= 0:
+                del self._counts[label]
+                del self._sums[label]
+                del self._mins[label]
+                del self._maxs[label]
+                self._outdated_bboxes.discard(label)
+            else:
+                self._sums[label] -= sums
+                self._outdated_bboxes.add(label)
+
+    def _update_bboxes(self) -> None:
+        for label in self._outdated_bboxes:
+            slice_key = tuple(
+                slice(int(a), int(b) + 1)
+                for a, b in zip(
+                    self._mins[label], self._maxs[label], strict=True
+                )
+            )
+            region = np.asarray(self._data[slice_key])
+            local_coords = np.nonzero(region == label)
+            start = self._mins[label].copy()
+            for axis, axis_coords in enumerate(local_coords):
+                self._mins[label][axis] = start[axis] + axis_coords.min()
+                self._maxs[label][axis] = start[axis] + axis_coords.max()
+        self._outdated_bboxes.clear()
+
+    def to_table(self, background_value: int | None = None) -> pd.DataFrame:
+        """Make a table of the statistics, with one row per label.
+
+        The table has an ``index`` column with the labels, so it can be used
+        as the features of a Labels layer, and ``area``, ``centroid-{axis}``
+        and ``bbox-{i}`` columns following the naming of
+        ``skimage.measure.regionprops_table`` (``bbox`` has the minimum
+        coordinates followed by the exclusive maximum coordinates).
+
+        Parameters
+        ----------
+        background_value : int or None
+            A label to leave out of the table.
+        """
+        import pandas as pd
+
+        self._update_bboxes()
+        labels = sorted(
+            label for label in self._counts if label != background_value
+        )
+        ndim = self._ndim
+        counts = np.array([self._counts[label] for label in labels])
+        sums = np.array([self._sums[label] for label in labels]).reshape(
+            -1, ndim
+        )
+        mins = np.array([self._mins[label] for label in labels]).reshape(
+            -1, ndim
+        )
+        maxs = np.array([self._maxs[label] for label in labels]).reshape(
+            -1, ndim
+        )
+        columns: dict[str, np.ndarray] = {
+            'index': np.array(labels, dtype=np.int64),
+            'area': counts,
+        }
+        for axis in range(ndim):
+            columns[f'centroid-{axis}'] = (
+                sums[:, axis] / counts if len(labels) else sums[:, axis]
+            )
+        for axis in range(ndim):
+            columns[f'bbox-{axis}'] = mins[:, axis]
+        for axis in range(ndim):
+            columns[f'bbox-{ndim + axis}'] = maxs[:, axis] + 1
+        return pd.DataFrame(columns)
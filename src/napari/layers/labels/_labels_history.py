@@ -0,0 +1,264 @@
+"""Undo/redo history storage for the Labels layer."""
+
+from __future__ import annotations
+
+import pickle
+import tempfile
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeAlias
+
+import numpy as np
+import numpy.typing as npt
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class _MaskedPaintAtom(NamedTuple):
+    """A single undoable mask-based edit of a Labels layer.
+
+    Replay (see ``Labels._replay_masked_atom``) reads the bounding box with
+    basic slicing, applies the masked update locally on a numpy array, and
+    writes the bounding box back. Only basic indexing ever reaches the data
+    backend, so replay behaves identically across numpy, zarr, tensorstore,
+    dask and xarray (whose advanced-indexing semantics all differ).
+
+    Attributes
+    ----------
+    slice_key : tuple of slice
+        Bounding box of the edit in data coordinates.
+    mask : ndarray of bool or None
+        Changed pixels within the bounding box, or None when every pixel in
+        the bounding box changed (the mask is dropped to save memory).
+    old_values : ndarray
+        The values under ``mask`` before the edit (1D), or a snapshot of the
+        whole bounding box when ``mask`` is None.
+    new_value : int
+        The label that was painted.
+    """
+
+    slice_key: tuple[slice, ...]
+    mask: npt.NDArray[np.bool_] | None
+    old_values: np.ndarray
+    new_value: int
+
+
+# A single atom stored in the undo/redo history: either a mask-based edit
+# (paint/fill/paint_polygon) or the legacy fancy-index 3-tuple of
+# ``(indices, old_values, new_values)`` produced by ``data_setitem`` (where
+# ``indices`` is a numpy multi-index and the new values may be a scalar).
+HistoryAtom: TypeAlias = (
+    _MaskedPaintAtom | tuple[Any, npt.NDArray, np.ndarray | int]
+)
+
+
+class _CompressedArray(NamedTuple):
+    """A numpy array compressed with zlib.
+
+    Boolean arrays are bit-packed before compression.
+    """
+
+    data: bytes
+    dtype: str
+    shape: tuple[int, ...]
+
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> _CompressedArray:
+        array = np.ascontiguousarray(array)
+        raw = np.packbits(array) if array.dtype == bool else array
+        # Level 1 is much faster than the default and compresses the
+        # typically large uniform regions of labels almost as well.
+        return cls(
+            data=zlib.compress(raw.tobytes(), 1),
+            dtype=array.dtype.str,
+            shape=array.shape,
+        )
+
+    def to_array(self) -> np.ndarray:
+        raw = zlib.decompress(self.data)
+        if np.dtype(self.dtype) == bool:
+            count = int(np.prod(self.shape))
+            bits = np.unpackbits(np.frombuffer(raw, dtype=np.uint8))
+            return bits[:count].astype(bool).reshape(self.shape)
+        return np.frombuffer(raw, dtype=self.dtype).reshape(self.shape).copy()
+
+
+class _CompressedPaintAtom(NamedTuple):
+    """A `_MaskedPaintAtom` whose arrays are compressed."""
+
+    slice_key: tuple[slice, ...]
+    mask: _CompressedArray | None
+    old_values: _CompressedArray
+    new_value: int
+
+    @classmethod
+    def from_atom(cls, atom: _MaskedPaintAtom) -> _CompressedPaintAtom:
+        return cls(
+            slice_key=atom.slice_key,
+            mask=(
+                None
+                if atom.mask is None
+                else _CompressedArray.from_array(atom.mask)
+            ),
+            old_values=_CompressedArray.from_array(atom.old_values),
+            new_value=atom.new_value,
+        )
+
+    def to_atom(self) -> _MaskedPaintAtom:
+        return _MaskedPaintAtom(
+            slice_key=self.slice_key,
+            mask=None if self.mask is None else self.mask.to_array(),
+            old_values=self.old_values.to_array(),
+            new_value=self.new_value,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        mask_nbytes = 0 if self.mask is None else len(self.mask.data)
+        return mask_nbytes + len(self.old_values.data)
+
+
+def _atom_nbytes(atom: HistoryAtom | _CompressedPaintAtom) -> int:
+    """Estimate the memory used by a stored history atom."""
+    if isinstance(atom, _CompressedPaintAtom):
+        return atom.nbytes
+    return sum(
+        getattr(value, 'nbytes', 0)
+        for element in atom
+        for value in (element if isinstance(element, tuple) else (element,))
+    )
+
+
+@dataclass(eq=False)
+class _StoredItem:
+    """A history item, stored compressed in memory or spilled to disk."""
+
+    atoms: list[HistoryAtom | _CompressedPaintAtom] | None
+    path: Path | None
+    nbytes: int
+
+
+class _LabelsHistory:
+    """A bounded queue of Labels history items with compressed storage.
+
+    This behaves like a ``deque`` of history items (lists of `HistoryAtom`),
+    but the arrays of each `_MaskedPaintAtom` are compressed when an item
+    is appended and decompressed when it is accessed. Once the compressed
+    items use more than ``max_bytes`` of memory, the oldest ones are either
+    spilled to temporary files, if ``spill`` is True, or discarded.
+
+    Parameters
+    ----------
+    maxlen : int or None
+        The maximum number of items. Once reached, the oldest item is
+        discarded when a new one is appended.
+    max_bytes : int or None
+        The maximum memory in bytes used by the items kept in memory.
+        The newest item is always kept in memory. If None, the memory
+        is not limited.
+    spill : bool
+        If True, items exceeding ``max_bytes`` are spilled to temporary
+        files on disk instead of being discarded.
+    """
+
+    def __init__(
+        self,
+        maxlen: int | None = None,
+        max_bytes: int | None = None,
+        spill: bool = False,
+    ) -> None:
+        self.maxlen = maxlen
+        self.max_bytes = max_bytes
+        self.spill = spill
+        self._items: deque[_StoredItem] = deque()
+        self._nbytes = 0
+        self._spill_dir: tempfile.TemporaryDirectory | None = None
+        self._spill_count = 0
+
+    @property
+    def nbytes(self) -> int:
+        """The memory in bytes used by the items kept in memory."""
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: int) -> list[HistoryAtom]:
+        return self._load(self._items[index])
+
+    def __iter__(self) -> Iterator[list[HistoryAtom]]:
+        for item in list(self._items):
+            yield self._load(item)
+
+    def append(self, item: list[HistoryAtom]) -> None:
+        atoms = [
+            _CompressedPaintAtom.from_atom(atom)
+            if isinstance(atom, _MaskedPaintAtom)
+            else atom
+            for atom in item
+        ]
+        nbytes = sum(_atom_nbytes(atom) for atom in atoms)
+        self._items.append(_StoredItem(atoms=atoms, path=None, nbytes=nbytes))
+        self._nbytes += nbytes
+        while self.maxlen is not None and len(self._items) > self.maxlen:
+            self._discard(self._items.popleft())
+        self._limit_memory()
+
+    def pop(self) -> list[HistoryAtom]:
+        item = self._items.pop()
+        atoms = self._load(item)
+        self._discard(item)
+        return atoms
+
+    def clear(self) -> None:
+        while self._items:
+            self._discard(self._items.pop())
+
+    def _limit_memory(self) -> None:
+        if self.max_bytes is None:
+            return
+        # The newest item is last, and is always kept in memory.
+        for item in list(self._items)[:-1]:
+            if self._nbytes <= self.max_bytes:
+                return
+            if item.atoms is None:
+                continue
+            if self.spill:
+                self._spill(item)
+            else:
+                self._items.remove(item)
+                self._discard(item)
+
+    def _spill(self, item: _StoredItem) -> None:
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.TemporaryDirectory(
+                prefix='napari-labels-history-'
+            )
+        self._spill_count += 1
+        path = Path(self._spill_dir.name) / f'{self._spill_count}.pkl'
+        with path.open('wb') as file:
+            pickle.dump(item.atoms, file)
+        self._nbytes -= item.nbytes
+        item.atoms = None
+        item.path = path
+
+    def _discard(self, item: _StoredItem) -> None:
+        if item.path is not None:
+            item.path.unlink(missing_ok=True)
+        else:
+            self._nbytes -= item.nbytes
+
+    @staticmethod
+    def _load(item: _StoredItem) -> list[HistoryAtom]:
+        atoms = item.atoms
+        if atoms is None:
+            assert item.path is not None
+            with item.path.open('rb') as file:
+                atoms = pickle.load(file)
+        return [
+            atom.to_atom() if isinstance(atom, _CompressedPaintAtom) else atom
+            for atom in atoms
+        ]
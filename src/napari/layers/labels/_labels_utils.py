@@ -1,3 +1,6 @@
+import itertools
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
 from functools import lru_cache
 
 import numpy as np
@@ -250,3 +253,153 @@ def expand_slice(
         )
         for s, max_size in zip(axes_slice, shape, strict=False)
     )
+
+
+def get_chunk_shape(data) -> tuple[int, ...] | None:
+    """Return the shape of the storage chunks of an array, if it has any.
+
+    Supports zarr and xarray-like ``chunks``, dask ``chunksize`` and
+    tensorstore chunk layouts. Irregular chunks are approximated by the
+    largest chunk along each axis.
+
+    Parameters
+    ----------
+    data : array-like
+        The array to inspect.
+
+    Returns
+    -------
+    tuple of int or None
+        The chunk shape, or None if the array is not chunked.
+    """
+    chunks = getattr(data, 'chunksize', None)
+    if chunks is None:
+        chunk_layout = getattr(data, 'chunk_layout', None)
+        if chunk_layout is not None:
+            chunks = chunk_layout.read_chunk.shape
+    if chunks is None:
+        chunks = getattr(data, 'chunks', None)
+    if not isinstance(chunks, tuple) or len(chunks) != len(data.shape):
+        return None
+    return tuple(
+        int(c) if isinstance(c, int | np.integer) else int(max(c, default=1))
+        for c in chunks
+    )
+
+
+def flood_fill_chunks(
+    read: Callable[[tuple[slice, ...]], np.ndarray],
+    shape: Sequence[int],
+    chunk_shape: Sequence[int],
+    seed: Sequence[int],
+    label: int,
+    contiguous: bool = True,
+) -> Iterator[tuple[tuple[slice, ...], np.ndarray, np.ndarray]]:
+    """Flood fill an array one chunk at a time.
+
+    Only the chunks reached by the fill front are read. Within each chunk,
+    the pixels of ``label`` connected (with connectivity 1) to the seeds
+    entering the chunk are filled; seeds are then passed across the chunk
+    faces to the neighbouring chunks. A chunk is visited again if the
+    front later re-enters it from another side.
+
+    The caller must write the filled pixels of each yielded chunk, with a
+    value other than ``label``, before resuming the iteration, so that
+    revisited chunks are not filled twice.
+
+    Parameters
+    ----------
+    read : callable
+        Function reading the data within the given tuple of slices.
+    shape : sequence of int
+        The shape of the array.
+    chunk_shape : sequence of int
+        The shape of the chunks to read.
+    seed : sequence of int
+        The coordinates of the pixel where the fill starts.
+    label : int
+        The label to fill, i.e. the label at ``seed``.
+    contiguous : bool
+        If False, all the pixels of ``label`` are filled, visiting every
+        chunk once, instead of only those connected to ``seed``.
+
+    Yields
+    ------
+    slices : tuple of slice
+        The region of the chunk in the array.
+    region : ndarray
+        The data of the chunk.
+    mask : ndarray of bool
+        The pixels of the chunk to fill.
+    """
+    from scipy import ndimage as ndi
+
+    grid_shape = tuple(
+        -(-size // chunk)
+        for size, chunk in zip(shape, chunk_shape, strict=True)
+    )
+
+    def chunk_slices(index: tuple[int, ...]) -> tuple[slice, ...]:
+        return tuple(
+            slice(i * chunk, min((i + 1) * chunk, size))
+            for i, chunk, size in zip(index, chunk_shape, shape, strict=True)
+        )
+
+    if not contiguous:
+        for index in itertools.product(*(range(n) for n in grid_shape)):
+            slices = chunk_slices(index)
+            region = np.asarray(read(slices))
+            mask = region == label
+            if mask.any():
+                yield slices, region, mask
+        return
+
+    seed_index = tuple(
+        int(c) // chunk for c, chunk in zip(seed, chunk_shape, strict=True)
+    )
+    seed_local = tuple(
+        int(c) % chunk for c, chunk in zip(seed, chunk_shape, strict=True)
+    )
+    # Seeds waiting to be processed in each chunk, as coordinate arrays.
+    pending: dict[tuple[int, ...], list[tuple[np.ndarray, ...]]] = {
+        seed_index: [tuple(np.array([c]) for c in seed_local)]
+    }
+    queue = deque([seed_index])
+    structure = ndi.generate_binary_structure(len(shape), 1)
+    while queue:
+        index = queue.popleft()
+        seeds = pending.pop(index)
+        slices = chunk_slices(index)
+        region = np.asarray(read(slices))
+        candidates = region == label
+        seed_coords = tuple(
+            np.concatenate(axis_coords)
+            for axis_coords in zip(*seeds, strict=True)
+        )
+        seed_coords = tuple(c[candidates[seed_coords]] for c in seed_coords)
+        if seed_coords[0].size == 0:
+            continue
+        components, _ = ndi.label(candidates, structure=structure)
+        seed_components = np.unique(components[seed_coords])
+        mask = np.isin(components, seed_components)
+        yield slices, region, mask
+
+        for axis in range(len(shape)):
+            for step in (-1, 1):
+                neighbour = list(index)
+                neighbour[axis] += step
+                if not 0 <= neighbour[axis] < grid_shape[axis]:
+                    continue
+                face = 0 if step == -1 else mask.shape[axis] - 1
+                face_coords = list(np.nonzero(np.take(mask, [face], axis)))
+                if face_coords[0].size == 0:
+                    continue
+                # Enter the neighbour through its facing side.
+                face_coords[axis][:] = (
+                    0 if step == 1 else chunk_shape[axis] - 1
+                )
+                neighbour_index = tuple(neighbour)
+                if neighbour_index not in pending:
+                    pending[neighbour_index] = []
+                    queue.append(neighbour_index)
+                pending[neighbour_index].append(tuple(face_coords))
@@ -0,0 +1,91 @@
+import numpy as np
+
+from napari.layers import Labels
+from napari.layers.labels._dirty_regions import _DirtyRegions
+
+
+def test_overlapping_regions_are_merged():
+    regions = _DirtyRegions()
+    regions.add((slice(0, 10), slice(0, 10)))
+    regions.add((slice(5, 15), slice(0, 10)))
+    # adjacent to the merged region
+    regions.add((slice(15, 20), slice(0, 10)))
+    assert list(regions) == [(slice(0, 20), slice(0, 10))]
+
+
+def test_distant_regions_are_kept_separate():
+    regions = _DirtyRegions()
+    regions.add((slice(0, 10), slice(0, 10)))
+    regions.add((slice(90, 100), slice(90, 100)))
+    assert len(regions) == 2
+    assert regions.bounding_region() == (slice(0, 100), slice(0, 100))
+    # once restricted to the first axis, the regions are still distant
+    assert len(regions.project([0])) == 2
+    regions.clear()
+    assert regions.bounding_region() is None
+
+
+def test_max_regions():
+    regions = _DirtyRegions(max_regions=3)
+    for start in (0, 20, 100, 1000):
+        regions.add((slice(start, start + 1),))
+    assert list(regions) == [
+        (slice(100, 101),),
+        (slice(1000, 1001),),
+        (slice(0, 21),),
+    ]
+
+
+def test_add_points_by_block():
+    regions = _DirtyRegions()
+    regions.add_points((np.array([0, 3, 500]), np.array([1, 2, 500])))
+    assert sorted(regions, key=lambda r: r[0].start) == [
+        (slice(0, 4), slice(1, 3)),
+        (slice(500, 501), slice(500, 501)),
+    ]
+
+
+def test_partial_refresh_sends_each_region():
+    layer = Labels(np.zeros((200, 200), dtype=np.uint8))
+    updates = []
+    layer.events.labels_update.connect(updates.append)
+    layer.brush_size = 3
+    layer.paint((10, 10), 1, refresh=False)
+    layer.paint((190, 190), 2, refresh=False)
+    layer._partial_labels_refresh()
+    assert len(updates) == 2
+    assert sum(update.data.size for update in updates) < 40 * 4
+    np.testing.assert_array_equal(
+        layer._slice.image.view,
+        layer.colormap._data_to_texture(layer.data),
+    )
+
+
+def test_refresh_deferred_to_views_drawing():
+    layer = Labels(np.zeros((200, 200), dtype=np.uint8))
+    # a view refreshing the changed regions before it draws, like the
+    # vispy labels layer
+    layer._deferred_refresh_views = 1
+    dirty = []
+    updates = []
+    layer.events.labels_dirty.connect(dirty.append)
+    layer.events.labels_update.connect(updates.append)
+    layer.brush_size = 3
+    layer.paint((10, 10), 1)
+    layer.paint((11, 11), 1)
+    layer.data_setitem((np.array([11]), np.array([11])), 2)
+    assert len(dirty) == 3
+    assert updates == []
+
+    # the edits between two frames are sent once, as a single region
+    layer._partial_labels_refresh()
+    assert len(updates) == 1
+    assert updates[0].offset == [9, 9]
+    np.testing.assert_array_equal(
+        layer._slice.image.view,
+        layer.colormap._data_to_texture(layer.data),
+    )
+
+    layer._deferred_refresh_views = 0
+    layer.paint((100, 100), 2)
+    assert len(updates) == 2
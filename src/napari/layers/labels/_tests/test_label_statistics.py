@@ -0,0 +1,164 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from napari.layers import Labels
+from napari.layers.labels._label_statistics import _LabelStatistics
+
+
+def _expected_table(data, background_value=0):
+    rows = []
+    for label in np.unique(data):
+        if label == background_value:
+            continue
+        coords = np.nonzero(data == label)
+        row = {'index': int(label), 'area': len(coords[0])}
+        for axis, axis_coords in enumerate(coords):
+            row[f'centroid-{axis}'] = axis_coords.mean()
+        for axis, axis_coords in enumerate(coords):
+            row[f'bbox-{axis}'] = axis_coords.min()
+        for axis, axis_coords in enumerate(coords):
+            row[f'bbox-{data.ndim + axis}'] = axis_coords.max() + 1
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def _assert_table_equal(table, expected):
+    pd.testing.assert_frame_equal(
+        table.reset_index(drop=True),
+        expected.reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+@pytest.mark.parametrize('ndim', [2, 3])
+def test_label_statistics_build(ndim):
+    rng = np.random.default_rng(0)
+    data = rng.integers(0, 5, size=(12,) * ndim)
+    stats = _LabelStatistics(data)
+    _assert_table_equal(
+        stats.to_table(background_value=0), _expected_table(data)
+    )
+
+
+def test_label_statistics_build_in_blocks(monkeypatch):
+    monkeypatch.setattr(
+        'napari.layers.labels._label_statistics._BLOCK_SIZE', 16
+    )
+    rng = np.random.default_rng(1)
+    data = rng.integers(0, 4, size=(20, 8))
+    stats = _LabelStatistics(data)
+    _assert_table_equal(
+        stats.to_table(background_value=0), _expected_table(data)
+    )
+
+
+def test_label_statistics_bbox_shrinks():
+    data = np.zeros((10, 10), dtype=np.uint8)
+    data[1:3, 1:3] = 1
+    data[7:9, 7:9] = 1
+    stats = _LabelStatistics(data)
+    coords = np.nonzero(data[5:] == 1)
+    coords = (coords[0] + 5, coords[1])
+    stats.update(coords, data[coords], 0)
+    data[coords] = 0
+    table = stats.to_table(background_value=0)
+    _assert_table_equal(table, _expected_table(data))
+    assert table['bbox-2'].item() == 3
+
+
+def test_labels_label_statistics_edits():
+    data = np.zeros((20, 20), dtype=np.int32)
+    data[2:6, 2:6] = 1
+    data[10:15, 4:9] = 2
+    layer = Labels(data)
+    _assert_table_equal(
+        layer.get_label_statistics(), _expected_table(layer.data)
+    )
+
+    layer.brush_size = 3
+    layer.paint((12, 12), 3)
+    _assert_table_equal(
+        layer.get_label_statistics(), _expected_table(layer.data)
+    )
+
+    layer.fill((3, 3), 4)
+    _assert_table_equal(
+        layer.get_label_statistics(), _expected_table(layer.data)
+    )
+
+    layer.data_setitem((np.array([0, 1]), np.array([0, 1])), 5)
+    _assert_table_equal(
+        layer.get_label_statistics(), _expected_table(layer.data)
+    )
+
+    for _ in range(3):
+        layer.undo()
+        _assert_table_equal(
+            layer.get_label_statistics(), _expected_table(layer.data)
+        )
+    assert 4 not in layer.get_label_statistics()['index'].to_numpy()
+    for _ in range(3):
+        layer.redo()
+        _assert_table_equal(
+            layer.get_label_statistics(), _expected_table(layer.data)
+        )
+
+
+def test_label_statistics_repeated_pixels():
+    data = np.zeros((5, 5), dtype=np.int32)
+    stats = _LabelStatistics(data)
+    coords = (np.array([1, 1, 2, 3, 3]), np.array([1, 1, 2, 3, 3]))
+    values = np.array([3, 3, 3, 3, 4])
+    stats.update(coords, data[coords], values)
+    data[coords] = values
+    _assert_table_equal(
+        stats.to_table(background_value=None),
+        _expected_table(data, background_value=None),
+    )
+
+    layer = Labels(np.zeros((5, 5), dtype=np.int32))
+    layer.data_setitem((np.array([1, 1, 2]), np.array([1, 1, 2])), 3)
+    table = layer.get_label_statistics()
+    assert table['area'].tolist() == [2]
+    _assert_table_equal(table, _expected_table(layer.data))
+    layer.undo()
+    assert len(layer.get_label_statistics()) == 0
+
+
+def test_labels_label_statistics_reset_with_data():
+    layer = Labels(np.zeros((5, 5), dtype=np.int32))
+    assert len(layer.get_label_statistics()) == 0
+    data = np.zeros((5, 5), dtype=np.int32)
+    data[1, 1] = 7
+    layer.data = data
+    _assert_table_equal(layer.get_label_statistics(), _expected_table(data))
+
+
+def test_labels_label_statistics_in_features():
+    data = np.zeros((20, 20), dtype=np.int32)
+    data[2:6, 2:6] = 1
+    data[10:15, 4:9] = 2
+    layer = Labels(
+        data, features={'index': [1, 2], 'class': ['cell', 'nucleus']}
+    )
+    layer.get_label_statistics(add_to_features=True)
+    features = layer.features
+    assert list(features['class']) == ['cell', 'nucleus']
+    np.testing.assert_array_equal(features['area'], [16, 25])
+
+    layer.brush_size = 3
+    layer.paint((12, 12), 3)
+    features = layer.features
+    expected = _expected_table(layer.data)
+    np.testing.assert_array_equal(features['index'], expected['index'])
+    np.testing.assert_array_equal(features['area'], expected['area'])
+    np.testing.assert_array_equal(
+        features['centroid-1'], expected['centroid-1']
+    )
+    assert features['class'].isna().to_numpy()[-1]
+
+    # setting the features stops keeping the statistics in them
+    layer.features = {'index': [1], 'class': ['cell']}
+    layer.paint((3, 3), 4)
+    assert 'area' not in layer.features
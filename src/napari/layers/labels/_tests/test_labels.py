@@ -22,6 +22,7 @@ from napari.layers import Labels
 from napari.layers.labels._labels_constants import LabelsRendering
 from napari.layers.labels._labels_utils import get_contours
 from napari.layers.labels.labels import WrongSelectedLabelError
+from napari.settings import get_settings
 from napari.utils import Colormap
 from napari.utils._test_utils import (
     validate_all_params_in_docstring,
@@ -714,6 +715,25 @@ def test_data_setitem_transposed_axes():
     labels.data_setitem((np.array([9]), np.array([99])), 2)
 
 
+def test_editing_data_clears_slice_cache():
+    get_settings().experimental.slice_prefetch_steps = 1
+    data = zarr.zeros((3, 10, 10), chunks=(1, 5, 5), dtype=np.uint32)
+    labels = Labels(data)
+    cache = labels._slicing_state._slice_cache
+    labels.refresh()
+    assert len(cache) == 1
+
+    labels.data_setitem((np.array([1]), np.array([1]), np.array([1])), 2)
+    assert len(cache) == 0
+
+    labels.refresh()
+    assert len(cache) == 1
+    labels.paint((0, 5, 5), 3, refresh=False)
+    assert len(cache) == 0
+    labels._slice_dims(Dims(ndim=3, point=(0, 0, 0)))
+    assert labels._slice.image.raw[5, 5] == 3
+
+
 def test_selecting_label():
     """Test selecting label."""
     np.random.seed(0)
@@ -1568,6 +1588,32 @@ def test_fill_tensorstore(tmp_path, zarr_format, zarr_driver):
     np.testing.assert_array_equal(modified_labels, np.asarray(data))
 
 
+@pytest.mark.parametrize('contiguous', [True, False])
+@pytest.mark.parametrize('preserve_labels', [True, False])
+def test_fill_chunked_matches_in_memory(contiguous, preserve_labels):
+    rng = np.random.default_rng(0)
+    labels = rng.integers(0, 3, size=(6, 20, 20), dtype=np.uint32)
+    labels[:, 5:15, 5:15] = 0
+    data = zarr.zeros(labels.shape, chunks=(2, 6, 6), dtype=np.uint32)
+    data[:] = labels
+
+    layers = [Labels(labels.copy()), Labels(data)]
+    for layer in layers:
+        layer.n_edit_dimensions = 3
+        layer.contiguous = contiguous
+        layer.preserve_labels = preserve_labels
+        layer.fill((3, 10, 10), 5)
+    assert layers[1]._use_chunked_fill([0, 1, 2])
+    np.testing.assert_array_equal(np.asarray(data), layers[0].data)
+
+    # all the chunks are undone together
+    assert len(layers[1]._undo_history) == 1
+    layers[1].undo()
+    np.testing.assert_array_equal(np.asarray(data), labels)
+    layers[1].redo()
+    np.testing.assert_array_equal(np.asarray(data), layers[0].data)
+
+
 def test_fill_with_xarray():
     """See https://github.com/napari/napari/issues/2374"""
     data = xr.DataArray(np.zeros((5, 4, 4), dtype=int))
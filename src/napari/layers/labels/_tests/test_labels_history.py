@@ -0,0 +1,112 @@
+import numpy as np
+import numpy.testing as npt
+
+from napari.layers import Labels
+from napari.layers.labels._labels_history import (
+    _LabelsHistory,
+    _MaskedPaintAtom,
+)
+from napari.settings import get_settings
+
+
+def _make_atom(size: int, value: int) -> _MaskedPaintAtom:
+    mask = np.zeros((size, size), dtype=bool)
+    mask[::2, ::3] = True
+    old_values = np.arange(np.count_nonzero(mask), dtype=np.uint32)
+    return _MaskedPaintAtom(
+        slice_key=(slice(0, size), slice(0, size)),
+        mask=mask,
+        old_values=old_values,
+        new_value=value,
+    )
+
+
+def test_labels_history_round_trip():
+    history = _LabelsHistory()
+    atom = _make_atom(100, 3)
+    legacy_atom = ((np.array([1]), np.array([2])), np.array([0]), 5)
+
+    history.append([atom, legacy_atom])
+
+    assert len(history) == 1
+    loaded_atom, loaded_legacy_atom = history.pop()
+    assert len(history) == 0
+    assert loaded_atom.slice_key == atom.slice_key
+    npt.assert_array_equal(loaded_atom.mask, atom.mask)
+    npt.assert_array_equal(loaded_atom.old_values, atom.old_values)
+    assert loaded_atom.old_values.dtype == atom.old_values.dtype
+    assert loaded_atom.new_value == 3
+    assert loaded_legacy_atom is legacy_atom
+
+
+def test_labels_history_compresses_atoms():
+    history = _LabelsHistory()
+    atom = _make_atom(1000, 3)._replace(mask=None)
+    atom = atom._replace(old_values=np.zeros((1000, 1000), dtype=np.uint32))
+
+    history.append([atom])
+
+    assert history.nbytes < atom.old_values.nbytes / 100
+    npt.assert_array_equal(history[0][0].old_values, atom.old_values)
+
+
+def test_labels_history_maxlen():
+    history = _LabelsHistory(maxlen=2)
+    for value in range(3):
+        history.append([_make_atom(10, value)])
+
+    assert len(history) == 2
+    assert [item[0].new_value for item in history] == [1, 2]
+
+
+def test_labels_history_discards_oldest_over_memory_limit():
+    history = _LabelsHistory()
+    history.append([_make_atom(100, 0)])
+    item_nbytes = history.nbytes
+    history.max_bytes = 2 * item_nbytes
+
+    for value in range(1, 4):
+        history.append([_make_atom(100, value)])
+
+    assert len(history) == 2
+    assert history.nbytes <= 2 * item_nbytes
+    assert [item[0].new_value for item in history] == [2, 3]
+
+
+def test_labels_history_spills_to_disk_over_memory_limit():
+    history = _LabelsHistory(spill=True)
+    history.append([_make_atom(100, 0)])
+    history.max_bytes = history.nbytes
+
+    for value in range(1, 4):
+        history.append([_make_atom(100, value)])
+
+    assert len(history) == 4
+    assert history.nbytes <= history.max_bytes
+    for value in range(3, -1, -1):
+        atom = history.pop()[0]
+        assert atom.new_value == value
+        npt.assert_array_equal(atom.mask, _make_atom(100, value).mask)
+    assert len(history) == 0
+
+
+def test_labels_undo_redo_with_spilled_history():
+    settings = get_settings().experimental
+    settings.labels_history_memory = 1e-6
+    settings.labels_history_spill = True
+    data = np.zeros((20, 20), dtype=np.uint8)
+    layer = Labels(data)
+    layer.brush_size = 3
+
+    states = [layer.data.copy()]
+    for i in range(1, 5):
+        layer.paint((4 * i, 4 * i), i)
+        states.append(layer.data.copy())
+    assert layer._undo_history._items[0].path is not None
+
+    for state in reversed(states[:-1]):
+        layer.undo()
+        npt.assert_array_equal(layer.data, state)
+    for state in states[1:]:
+        layer.redo()
+        npt.assert_array_equal(layer.data, state)
@@ -1,9 +1,12 @@
 import numpy as np
+import zarr
 
 from napari.components.dims import Dims
 from napari.layers.labels import Labels
 from napari.layers.labels._labels_utils import (
     first_nonzero_coordinate,
+    flood_fill_chunks,
+    get_chunk_shape,
     get_dtype,
     interpolate_coordinates,
     mouse_event_to_labels_coordinate,
@@ -153,3 +156,72 @@ def test_mouse_event_to_labels_coordinate_3d(MouseEvent):
 
     coord = mouse_event_to_labels_coordinate(layer, event)
     assert coord is None
+
+
+def test_get_chunk_shape():
+    assert get_chunk_shape(np.zeros((4, 4))) is None
+    data = zarr.zeros((10, 10), chunks=(5, 2), dtype=np.uint8)
+    assert get_chunk_shape(data) == (5, 2)
+
+
+def _flood_fill_chunks(data, chunk_shape, seed, contiguous=True):
+    """Run flood_fill_chunks on data, writing 2, and return the read chunks."""
+    read_chunks = []
+
+    def read(slices):
+        read_chunks.append(tuple(s.start for s in slices))
+        return data[slices]
+
+    label = data[seed]
+    for slices, region, mask in flood_fill_chunks(
+        read, data.shape, chunk_shape, seed, label, contiguous
+    ):
+        region = region.copy()
+        region[mask] = 2
+        data[slices] = region
+    return read_chunks
+
+
+def test_flood_fill_chunks_matches_flood():
+    from skimage.segmentation import flood
+
+    rng = np.random.default_rng(0)
+    data = (rng.random((20, 20)) > 0.4).astype(np.uint8)
+    seed = tuple(int(c) for c in np.argwhere(data == 1)[0])
+    expected = data.copy()
+    expected[flood(data, seed, connectivity=1)] = 2
+
+    _flood_fill_chunks(data, (4, 6), seed)
+    np.testing.assert_array_equal(data, expected)
+
+
+def test_flood_fill_chunks_reenters_chunks():
+    # A U-shaped region leaves the seed chunk and comes back into it.
+    data = np.zeros((8, 8), dtype=np.uint8)
+    data[0:6, 1] = 1
+    data[0:6, 3] = 1
+    data[5, 1:4] = 1
+    expected = np.where(data == 1, 2, data)
+
+    _flood_fill_chunks(data, (4, 4), (0, 1))
+    np.testing.assert_array_equal(data, expected)
+
+
+def test_flood_fill_chunks_only_reads_reached_chunks():
+    data = np.zeros((16, 16), dtype=np.uint8)
+    data[:, 8] = 1
+
+    read_chunks = _flood_fill_chunks(data, (4, 4), (0, 0))
+    # The chunks beyond the wall are read to check the front, but the
+    # chunks after them are not reached.
+    assert {start[1] for start in read_chunks} == {0, 4, 8}
+    assert np.all(data[:, :8] == 2)
+    assert np.all(data[:, 9:] == 0)
+
+
+def test_flood_fill_chunks_not_contiguous():
+    data = np.zeros((10, 10), dtype=np.uint8)
+    data[:, 5] = 1
+
+    _flood_fill_chunks(data, (3, 3), (0, 0), contiguous=False)
+    np.testing.assert_array_equal(data, np.where(data == 1, 1, 2))
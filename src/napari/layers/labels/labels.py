@@ -2,15 +2,12 @@ from __future__ import annotations
 
 import typing
 import warnings
-from collections import deque
 from collections.abc import Callable, Generator, Sequence
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
-    NamedTuple,
-    TypeAlias,
 )
 
 import numpy as np
@@ -28,12 +25,19 @@ from napari.layers.base._base_mouse_bindings import (
     transform_with_box,
 )
 from napari.layers.image._image_utils import guess_multiscale
+from napari.layers.labels._dirty_regions import _DirtyRegions
+from napari.layers.labels._label_statistics import _LabelStatistics
 from napari.layers.labels._labels_constants import (
     IsoCategoricalGradientMode,
     LabelColorMode,
     LabelsRendering,
     Mode,
 )
+from napari.layers.labels._labels_history import (
+    HistoryAtom,
+    _LabelsHistory,
+    _MaskedPaintAtom,
+)
 from napari.layers.labels._labels_mouse_bindings import (
     BrushSizeOnMouseMove,
     draw,
@@ -41,12 +45,15 @@ from napari.layers.labels._labels_mouse_bindings import (
 )
 from napari.layers.labels._labels_utils import (
     expand_slice,
+    flood_fill_chunks,
+    get_chunk_shape,
     get_contours,
     get_dtype,
     interpolate_coordinates,
 )
 from napari.layers.labels._slice import _LabelsSliceRequest
 from napari.layers.utils.layer_utils import _FeatureTable
+from napari.settings import get_settings
 from napari.types import LayerDataType
 from napari.utils._dtype import (
     get_dtype_limits,
@@ -76,44 +83,6 @@ if TYPE_CHECKING:
 __all__ = ('Labels',)
 
 
-class _MaskedPaintAtom(NamedTuple):
-    """A single undoable mask-based edit of a Labels layer.
-
-    Replay (see ``Labels._replay_masked_atom``) reads the bounding box with
-    basic slicing, applies the masked update locally on a numpy array, and
-    writes the bounding box back. Only basic indexing ever reaches the data
-    backend, so replay behaves identically across numpy, zarr, tensorstore,
-    dask and xarray (whose advanced-indexing semantics all differ).
-
-    Attributes
-    ----------
-    slice_key : tuple of slice
-        Bounding box of the edit in data coordinates.
-    mask : ndarray of bool or None
-        Changed pixels within the bounding box, or None when every pixel in
-        the bounding box changed (the mask is dropped to save memory).
-    old_values : ndarray
-        The values under ``mask`` before the edit (1D), or a snapshot of the
-        whole bounding box when ``mask`` is None.
-    new_value : int
-        The label that was painted.
-    """
-
-    slice_key: tuple[slice, ...]
-    mask: npt.NDArray[np.bool_] | None
-    old_values: np.ndarray
-    new_value: int
-
-
-# A single atom stored in the undo/redo history: either a mask-based edit
-# (paint/fill/paint_polygon) or the legacy fancy-index 3-tuple of
-# ``(indices, old_values, new_values)`` produced by ``data_setitem`` (where
-# ``indices`` is a numpy multi-index and the new values may be a scalar).
-HistoryAtom: TypeAlias = (
-    _MaskedPaintAtom | tuple[Any, npt.NDArray, np.ndarray | int]
-)
-
-
 class Labels(ScalarFieldBase):
     """Labels (or segmentation) layer.
 
@@ -433,6 +402,7 @@ class Labels(ScalarFieldBase):
             contour=Event,
             features=Event,
             iso_gradient_mode=Event,
+            labels_dirty=Event,
             labels_update=Event,
             n_edit_dimensions=Event,
             paint=Event,
@@ -472,7 +442,11 @@ class Labels(ScalarFieldBase):
         self.colormap.use_selection = self._show_selected_label
         self._prev_selected_label = None
         self._selected_color = self.get_color(self._selected_label)
-        self._updated_slice: tuple[slice, ...] | None = None
+        # regions of the data changed since the last partial refresh
+        self._dirty_regions = _DirtyRegions()
+        # number of views refreshing the changed regions right before they
+        # draw, see _request_partial_labels_refresh
+        self._deferred_refresh_views = 0
         if colormap is not None:
             self._set_colormap(colormap)
 
@@ -480,10 +454,15 @@ class Labels(ScalarFieldBase):
         self._preserve_labels = False
 
         # Each history undo step is a list of atoms.
-        self._undo_history: deque[list[HistoryAtom]]
-        self._redo_history: deque[list[HistoryAtom]]
+        self._undo_history: _LabelsHistory
+        self._redo_history: _LabelsHistory
         self._staged_history: list[HistoryAtom]
         self._block_history: bool
+        # Built on the first get_label_statistics call, then kept up to date.
+        self._label_statistics: _LabelStatistics | None = None
+        # The version of the statistics last merged into the features, or
+        # None if the statistics are not kept in the features.
+        self._features_statistics_version: int | None = None
 
     def _slice_dtype(self):
         """Calculate dtype of data view based on data dtype and current colormap"""
@@ -627,6 +606,10 @@ class Labels(ScalarFieldBase):
             self._colormap = self._random_colormap
             color_mode = LabelColorMode.AUTO
         else:
+            if colormap is not self._direct_colormap:
+                # when only a few label colors changed, update the lookup
+                # table of the previous colormap instead of rebuilding it
+                colormap._update_label_lut(self._direct_colormap)
             self._direct_colormap = colormap
             # `self._direct_colormap.color_dict` may contain just the default None and background label
             # colors, in which case we need to be in AUTO color mode. Otherwise,
@@ -653,6 +636,7 @@ class Labels(ScalarFieldBase):
     def data(self, data: LayerDataProtocol | MultiScaleData) -> None:
         data = self._ensure_int_labels(data)
         ScalarFieldBase.data.fset(self, data)  # type: ignore[attr-defined]
+        self._label_statistics = None
         self.events.features()
 
     @property
@@ -671,6 +655,8 @@ class Labels(ScalarFieldBase):
         ----------
         .. [1] https://data-apis.org/dataframe-protocol/latest/API.html
         """
+        if self._features_statistics_version is not None:
+            self._update_statistics_features()
         return self._feature_table.values
 
     @features.setter
@@ -680,9 +666,78 @@ class Labels(ScalarFieldBase):
     ) -> None:
         self._feature_table.set_values(features)
         self._label_index = self._make_label_index()
+        self._features_statistics_version = None
         self.events.properties()
         self.events.features()
 
+    def get_label_statistics(
+        self, *, add_to_features: bool = False
+    ) -> pd.DataFrame:
+        """Return the pixel count, centroid and bounding box of each label.
+
+        The table has one row per label, other than the background label,
+        with the label in an ``index`` column, so it can be used as (part
+        of) the ``features`` of this layer. The other columns are named like
+        those of ``skimage.measure.regionprops_table``: ``area``,
+        ``centroid-{axis}`` and ``bbox-{i}``.
+
+        The statistics are computed from the whole data on the first call.
+        After that, they are updated incrementally whenever the data is
+        edited through this layer (painting, filling, ``data_setitem``,
+        undo and redo), so calling this again is cheap. Edits made directly
+        to the data array are not tracked; set ``data`` again to recompute.
+
+        Parameters
+        ----------
+        add_to_features : bool
+            If True, also add the statistics columns to ``features``,
+            matching rows by label, and keep them up to date with later
+            edits until ``features`` is set again. The columns are brought
+            up to date when ``features`` is next read, so editing only
+            costs the incremental update of the statistics.
+        """
+        if self._label_statistics is None:
+            data = self.data[0] if self.multiscale else self.data
+            self._label_statistics = _LabelStatistics(data)
+        table = self._label_statistics.to_table(
+            background_value=self.colormap.background_value
+        )
+        if add_to_features:
+            self._merge_statistics_features(table)
+            self.events.properties()
+            self.events.features()
+        return table
+
+    def _update_statistics_features(self) -> None:
+        """Merge the statistics into the features if they changed."""
+        if (
+            self._label_statistics is not None
+            and self._label_statistics.version
+            == self._features_statistics_version
+        ):
+            return
+        self._merge_statistics_features(self.get_label_statistics())
+
+    def _merge_statistics_features(self, table: pd.DataFrame) -> None:
+        """Replace the statistics columns of the features with ``table``."""
+        features = self._feature_table.values
+        if features.shape[1] > 0:
+            if 'index' not in features:
+                # rows without an index column are indexed by label
+                features = features.assign(index=np.arange(len(features)))
+            features = features.drop(
+                columns=[
+                    name
+                    for name in table.columns
+                    if name != 'index' and name in features
+                ]
+            )
+            table = features.merge(table, on='index', how='outer')
+        self._feature_table.set_values(table)
+        self._label_index = self._make_label_index()
+        assert self._label_statistics is not None
+        self._features_statistics_version = self._label_statistics.version
+
     @property
     def properties(self) -> dict[str, np.ndarray]:
         """dict {str: array (N,)}, DataFrame: Properties for each label."""
@@ -926,38 +981,59 @@ class Labels(ScalarFieldBase):
         """
         return vispy_texture_dtype(data)
 
+    @property
+    def _updated_slice(self) -> tuple[slice, ...] | None:
+        """Bounding box of the regions changed since the last refresh."""
+        return self._dirty_regions.bounding_region()
+
+    def _request_partial_labels_refresh(self) -> None:
+        """Refresh the regions changed since the last refresh.
+
+        When the layer is shown by views that refresh the changed regions
+        right before they draw, the refresh is left to them, so that the
+        regions changed by all the edits made between two frames are merged
+        and only converted and sent once. ``labels_dirty`` is emitted for
+        them to schedule a draw.
+        """
+        if not self._deferred_refresh_views:
+            self._partial_labels_refresh()
+        elif self._dirty_regions:
+            self.events.labels_dirty()
+
     def _partial_labels_refresh(self) -> None:
-        """Prepares and displays only an updated part of the labels."""
+        """Prepares and displays only the updated parts of the labels.
+
+        The regions changed since the last refresh are converted and sent
+        separately, so that distant changes do not refresh everything in
+        between.
+        """
 
-        if self._updated_slice is None or not self._slicing_state.loaded:
+        if not self._dirty_regions or not self._slicing_state.loaded:
             return
 
         dims_displayed = self._slice_input.displayed
         raw_displayed = self._slice.image.raw
 
         # Keep only the dimensions that correspond to the current view
-        updated_slice = tuple(
-            self._updated_slice[index] for index in dims_displayed
-        )
+        for updated_slice in self._dirty_regions.project(dims_displayed):
+            offset = [axis_slice.start for axis_slice in updated_slice]
 
-        offset = [axis_slice.start for axis_slice in updated_slice]
-
-        if self.contour > 0:
-            colors_sliced = self._raw_to_displayed(
-                raw_displayed, data_slice=updated_slice
-            )
-        else:
-            colors_sliced = self._slice.image.view[updated_slice]
-        # The next line is needed to make the following tests pass in
-        # napari/_vispy/_tests/:
-        # - test_vispy_labels_layer.py::test_labels_painting
-        # - test_vispy_labels_layer.py::test_labels_fill_slice
-        # See https://github.com/napari/napari/pull/6112/files#r1291613760
-        # and https://github.com/napari/napari/issues/6185
-        self._slice.image.view[updated_slice] = colors_sliced
-
-        self.events.labels_update(data=colors_sliced, offset=offset)
-        self._updated_slice = None
+            if self.contour > 0:
+                colors_sliced = self._raw_to_displayed(
+                    raw_displayed, data_slice=updated_slice
+                )
+            else:
+                colors_sliced = self._slice.image.view[updated_slice]
+            # The next line is needed to make the following tests pass in
+            # napari/_vispy/_tests/:
+            # - test_vispy_labels_layer.py::test_labels_painting
+            # - test_vispy_labels_layer.py::test_labels_fill_slice
+            # See https://github.com/napari/napari/pull/6112/files#r1291613760
+            # and https://github.com/napari/napari/issues/6185
+            self._slice.image.view[updated_slice] = colors_sliced
+
+            self.events.labels_update(data=colors_sliced, offset=offset)
+        self._dirty_regions.clear()
 
     def _calculate_contour(
         self, labels: np.ndarray, data_slice: tuple[slice, ...]
@@ -1086,8 +1162,22 @@ class Labels(ScalarFieldBase):
         return col
 
     def _reset_history(self, event: Event | None = None) -> None:
-        self._undo_history = deque(maxlen=self._history_limit)
-        self._redo_history = deque(maxlen=self._history_limit)
+        settings = get_settings().experimental
+        max_bytes = (
+            int(settings.labels_history_memory * 1e6)
+            if settings.labels_history_memory > 0
+            else None
+        )
+        self._undo_history = _LabelsHistory(
+            maxlen=self._history_limit,
+            max_bytes=max_bytes,
+            spill=settings.labels_history_spill,
+        )
+        self._redo_history = _LabelsHistory(
+            maxlen=self._history_limit,
+            max_bytes=max_bytes,
+            spill=settings.labels_history_spill,
+        )
         self._staged_history = []
         self._block_history = False
 
@@ -1133,8 +1223,7 @@ class Labels(ScalarFieldBase):
             if isinstance(atom, _MaskedPaintAtom):
                 self._replay_masked_atom(atom, undoing=True)
                 continue
-            indices, prev_values, _ = atom
-            self.data[indices] = prev_values
+            self._replay_indexed_atom(atom, undoing=True)
         self._staged_history = []
         self._block_history = False
         self.refresh()
@@ -1207,8 +1296,7 @@ class Labels(ScalarFieldBase):
             if isinstance(atom, _MaskedPaintAtom):
                 self._replay_masked_atom(atom, undoing)
                 continue
-            prev_indices, prev_values, next_values = atom
-            self.data[prev_indices] = prev_values if undoing else next_values
+            self._replay_indexed_atom(atom, undoing)
 
         self.refresh()
 
@@ -1222,6 +1310,13 @@ class Labels(ScalarFieldBase):
         backend's advanced-indexing semantics.
         """
         values = atom.old_values if undoing else atom.new_value
+        if self._label_statistics is not None:
+            self._label_statistics.update_region(
+                atom.slice_key,
+                atom.mask,
+                atom.new_value if undoing else atom.old_values,
+                values,
+            )
         if atom.mask is None:
             # The whole bounding box changed: assign directly.
             self.data[atom.slice_key] = values
@@ -1230,6 +1325,16 @@ class Labels(ScalarFieldBase):
         region[atom.mask] = values
         self.data[atom.slice_key] = region
 
+    def _replay_indexed_atom(self, atom: HistoryAtom, undoing: bool) -> None:
+        """Replay a fancy-index edit made by ``data_setitem``."""
+        indices, prev_values, next_values = atom
+        values = prev_values if undoing else next_values
+        if self._label_statistics is not None:
+            self._label_statistics.update(
+                indices, next_values if undoing else prev_values, values
+            )
+        self.data[indices] = values
+
     def undo(self) -> None:
         self._load_history(
             self._undo_history, self._redo_history, undoing=True
@@ -1253,6 +1358,10 @@ class Labels(ScalarFieldBase):
         replaced using ``skimage.segmentation.flood(..., connectivity=1)``.
         Otherwise, all pixels with the same label are replaced.
 
+        When the data is chunked (e.g. zarr, dask or tensorstore) and the
+        filled plane or volume spans several chunks, the fill is computed
+        chunk by chunk, reading only the chunks reached by the fill.
+
         Parameters
         ----------
         coord : sequence of float
@@ -1270,6 +1379,10 @@ class Labels(ScalarFieldBase):
         slice_coord = [int(np.round(c)) for c in coord]
         self._validate_non_painted_coord(slice_coord, dims_to_paint)
 
+        if self._use_chunked_fill(dims_to_paint):
+            self._fill_chunked(slice_coord, new_label, dims_to_paint, refresh)
+            return
+
         fill_info = self._get_flood_mask_and_bbox(
             slice_coord, new_label, dims_to_paint
         )
@@ -1325,22 +1438,10 @@ class Labels(ScalarFieldBase):
         from skimage.segmentation import flood
 
         int_coord = tuple(np.round(coord).astype(int))
-        # If requested fill location is outside data shape then return
-        if np.any(np.less(int_coord, 0)) or np.any(
-            np.greater_equal(int_coord, self.data.shape)
-        ):
-            return None
-
-        # If requested new label doesn't change old label then return
-        old_label = np.asarray(self.data[int_coord]).item()
-        if old_label == new_label:
+        old_label = self._get_fill_source_label(int_coord, new_label)
+        if old_label is None:
             return None
 
-        if self.preserve_labels:
-            source_label = self._get_preserve_labels_source_label(new_label)
-            if old_label != source_label:
-                return None
-
         # Create the slice to extract the full working volume/plane
         data_slice_list = list(int_coord)
         for dim in dims_to_paint:
@@ -1377,6 +1478,112 @@ class Labels(ScalarFieldBase):
 
         return cropped_mask, min_vals, max_vals, labels[bbox_slices]
 
+    def _get_fill_source_label(
+        self, int_coord: tuple[int, ...], new_label: int
+    ) -> int | None:
+        """Return the label replaced by a fill at a coordinate.
+
+        Returns None if the fill would not change anything: the coordinate
+        is outside the data, already has ``new_label``, or may not be
+        changed because of ``preserve_labels``.
+        """
+        # If requested fill location is outside data shape then return
+        if np.any(np.less(int_coord, 0)) or np.any(
+            np.greater_equal(int_coord, self.data.shape)
+        ):
+            return None
+
+        # If requested new label doesn't change old label then return
+        old_label = np.asarray(self.data[int_coord]).item()
+        if old_label == new_label:
+            return None
+
+        if self.preserve_labels:
+            source_label = self._get_preserve_labels_source_label(new_label)
+            if old_label != source_label:
+                return None
+        return old_label
+
+    def _use_chunked_fill(self, dims_to_paint: list[int]) -> bool:
+        """Whether to fill chunk by chunk rather than in one go.
+
+        This is the case when the data is chunked (e.g. zarr, dask or
+        tensorstore) and the filled plane or volume spans several chunks,
+        so that only the chunks reached by the fill need to be read.
+        """
+        if isinstance(self.data, np.ndarray):
+            return False
+        chunk_shape = get_chunk_shape(self.data)
+        if chunk_shape is None:
+            return False
+        return any(
+            chunk_shape[dim] < self.data.shape[dim] for dim in dims_to_paint
+        )
+
+    def _fill_chunked(
+        self,
+        slice_coord: list[int],
+        new_label: int,
+        dims_to_paint: list[int],
+        refresh: bool = True,
+    ) -> None:
+        """Flood fill chunked data, reading and writing one chunk at a time.
+
+        This has the same semantics as the in-memory fill of `fill`, but
+        only the chunks reached by the fill are read, so it also works on
+        data much larger than memory. All the chunks are recorded in a
+        single undo history item.
+        """
+        int_coord = tuple(slice_coord)
+        old_label = self._get_fill_source_label(int_coord, new_label)
+        if old_label is None:
+            return
+
+        chunk_shape = get_chunk_shape(self.data)
+        assert chunk_shape is not None
+
+        def read(slices: tuple[slice, ...]) -> np.ndarray:
+            slice_key = list(int_coord)
+            for dim, dim_slice in zip(dims_to_paint, slices, strict=True):
+                slice_key[dim] = dim_slice
+            return self.data[tuple(slice_key)]
+
+        chunks = flood_fill_chunks(
+            read,
+            shape=[self.data.shape[dim] for dim in dims_to_paint],
+            chunk_shape=[chunk_shape[dim] for dim in dims_to_paint],
+            seed=[int_coord[dim] for dim in dims_to_paint],
+            label=old_label,
+            contiguous=self.contiguous,
+        )
+        history = (
+            nullcontext() if self._block_history else self.block_history()
+        )
+        with history:
+            for slices, region, mask in chunks:
+                min_vals, max_vals = self._compute_mask_bbox(mask)
+                bbox_slices = tuple(
+                    slice(min_v, max_v)
+                    for min_v, max_v in zip(min_vals, max_vals, strict=True)
+                )
+                offsets = np.array([s.start for s in slices])
+                slice_key = self._build_slice_key(
+                    slice_coord,
+                    dims_to_paint,
+                    offsets + min_vals,
+                    offsets + max_vals,
+                )
+                self._paint_region_with_mask(
+                    slice_key,
+                    mask[bbox_slices],
+                    new_label,
+                    dims_to_paint,
+                    refresh=False,
+                    region_data=region[bbox_slices].copy(),
+                )
+        if refresh:
+            self._request_partial_labels_refresh()
+
     def _get_preserve_labels_source_label(self, new_label: int) -> int:
         """Return the existing label value that preserve_labels allows to change.
 
@@ -1430,7 +1637,7 @@ class Labels(ScalarFieldBase):
                 self.paint(c, new_label, refresh=False)
             elif self._mode == Mode.FILL:
                 self.fill(c, new_label, refresh=False)
-        self._partial_labels_refresh()
+        self._request_partial_labels_refresh()
 
     def paint(
         self,
@@ -1793,15 +2000,7 @@ class Labels(ScalarFieldBase):
     ) -> None:
         """Merge a newly dirtied region into the pending partial refresh."""
         updated_slice = self._expand_updated_slice_for_contour(updated_slice)
-
-        if self._updated_slice is None:
-            self._updated_slice = updated_slice
-            return
-
-        self._updated_slice = tuple(
-            slice(min(s1.start, s2.start), max(s1.stop, s2.stop))
-            for s1, s2 in zip(self._updated_slice, updated_slice, strict=True)
-        )
+        self._dirty_regions.add(updated_slice)
 
     def _paint_region_with_mask(
         self,
@@ -1868,6 +2067,7 @@ class Labels(ScalarFieldBase):
         # no-op; for copy-returning backends (zarr, tensorstore, dask, ...)
         # this is the actual write-back.
         self.data[slice_key] = region_data
+        self._slicing_state._on_data_modified()
 
         # Update caches (raw and view) for non-shared memory backends
         # This handles mapping the N-D painted region to the currently displayed slice
@@ -1879,7 +2079,7 @@ class Labels(ScalarFieldBase):
         self._accumulate_updated_slice(slice_key)
 
         if refresh:
-            self._partial_labels_refresh()
+            self._request_partial_labels_refresh()
 
     def _apply_mask_to_data(
         self,
@@ -1936,6 +2136,10 @@ class Labels(ScalarFieldBase):
                 volume_slice, data, effective_mask, new_label
             )
         )
+        if self._label_statistics is not None:
+            self._label_statistics.update_region(
+                volume_slice, effective_mask, data[effective_mask], new_label
+            )
         data[effective_mask] = new_label
 
         return effective_mask
@@ -2155,16 +2359,14 @@ class Labels(ScalarFieldBase):
         if not indices or indices[0].size == 0:
             return
 
-        self._save_history(
-            (
-                indices,
-                np.array(self.data[indices], copy=True),
-                value,
-            )
-        )
+        old_values = np.array(self.data[indices], copy=True)
+        self._save_history((indices, old_values, value))
+        if self._label_statistics is not None:
+            self._label_statistics.update(indices, old_values, value)
 
         # update the labels image
         self.data[indices] = value
+        self._slicing_state._on_data_modified()
 
         pt_not_disp = self._get_pt_not_disp()
         displayed_indices = index_in_slice(
@@ -2191,21 +2393,20 @@ class Labels(ScalarFieldBase):
         if not isinstance(self.data, np.ndarray):
             indices = [np.array(x).flatten() for x in indices]
 
-        updated_slice = tuple(
-            slice(int(axis_indices.min()), int(axis_indices.max()) + 1)
-            for axis_indices in indices
-        )
-
         if self.contour == 0:
             # update data view
             self._slice.image.view[displayed_indices] = (
                 self.colormap._data_to_texture(visible_values)
             )
 
-        self._accumulate_updated_slice(updated_slice)
+        # group scattered changes into separate regions
+        updated_regions = _DirtyRegions()
+        updated_regions.add_points(indices)
+        for updated_slice in updated_regions:
+            self._accumulate_updated_slice(updated_slice)
 
         if refresh is True:
-            self._partial_labels_refresh()
+            self._request_partial_labels_refresh()
 
     def _calculate_value_from_ray(self, values):
         non_bg = values != self.colormap.background_value
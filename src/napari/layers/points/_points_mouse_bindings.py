@@ -240,9 +240,18 @@ def _select_points_from_drag(
     assert layer._drag_box is not None
     # if there is data in view, find the points in the drag box
     if n_display == 2:
-        selection = points_in_box(
-            layer._drag_box, layer._view_data, layer._view_size
+        # only check the points close enough to the box to be in it
+        radius = layer._max_view_size / 2
+        view_indices = layer._view_indices_in_box(
+            np.min(layer._drag_box, axis=0) - radius,
+            np.max(layer._drag_box, axis=0) + radius,
         )
+        inside = points_in_box(
+            layer._drag_box,
+            layer._view_data_at(view_indices),
+            layer._view_size_at(view_indices),
+        )
+        selection = view_indices[inside]
     else:
         assert layer._drag_normal is not None
         assert layer._drag_up is not None
@@ -1,5 +1,7 @@
+from __future__ import annotations
+
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import numpy.typing as npt
@@ -8,6 +10,9 @@ from napari.layers.base._slice import _next_request_id
 from napari.layers.points._points_constants import PointsProjectionMode
 from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
 
+if TYPE_CHECKING:
+    from napari.layers.utils._spatial_index import _SortedAxisIndex
+
 
 @dataclass(frozen=True)
 class _PointSliceResponse:
@@ -53,6 +58,9 @@ class _PointSliceRequest:
         The slicing coordinates and margins in data space.
     size : array like
         Size of each point. This is used in calculating visibility.
+    spatial_index : _SortedAxisIndex or None
+        Index of ``data`` used to find the points near the slice without
+        checking all of them.
     others
         See the corresponding attributes in `Layer` and `Points`.
     """
@@ -63,6 +71,7 @@ class _PointSliceRequest:
     projection_mode: PointsProjectionMode
     size: Any = field(repr=False)
     out_of_slice_display: bool = field(repr=False)
+    spatial_index: _SortedAxisIndex | None = field(default=None, repr=False)
     id: int = field(default_factory=_next_request_id)
 
     def __call__(self) -> _PointSliceResponse:
@@ -98,7 +107,6 @@ class _PointSliceRequest:
     def _get_slice_data(
         self, not_disp: list[int]
     ) -> tuple[npt.NDArray, npt.NDArray | int]:
-        data = self.data[:, not_disp]
         scale: npt.NDArray | int = 1
 
         point, m_left, m_right = self.data_slice[not_disp].as_array()
@@ -116,11 +124,28 @@ class _PointSliceRequest:
         low[too_thin_slice] -= 0.5
         high[too_thin_slice] += 0.5
 
+        out_of_slice = self.out_of_slice_display and self.slice_input.ndim > 2
+        if (
+            self.spatial_index is not None
+            and self.spatial_index.data is self.data
+        ):
+            # Only check the points that may be displayed.
+            margin = np.max(self.size) / 2 if out_of_slice else 0
+            candidates = self.spatial_index.query_box(
+                not_disp, low - margin, high + margin
+            )
+            data = self.data[np.ix_(candidates, not_disp)]
+            size = self.size[candidates]
+        else:
+            candidates = None
+            data = self.data[:, not_disp]
+            size = self.size
+
         inside_slice = np.all((data >= low) & (data <= high), axis=1)
         slice_indices = np.where(inside_slice)[0].astype(int)
 
-        if self.out_of_slice_display and self.slice_input.ndim > 2:
-            sizes = self.size[:, np.newaxis] / 2
+        if out_of_slice:
+            sizes = size[:, np.newaxis] / 2
 
             # add out of slice points with progressively lower sizes
             dist_from_low = np.abs(data - low)
@@ -139,4 +164,6 @@ class _PointSliceRequest:
             scale = np.prod(scale_per_dim, axis=1)
             slice_indices = np.where(matches)[0].astype(int)
 
+        if candidates is not None:
+            slice_indices = candidates[slice_indices].astype(int)
         return slice_indices, scale
@@ -1,3 +1,4 @@
+import dataclasses
 from copy import copy
 from itertools import cycle, islice
 from unittest.mock import Mock
@@ -23,6 +24,7 @@ from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
 from napari.layers.utils._text_constants import Anchor
 from napari.layers.utils.color_encoding import ConstantColorEncoding
 from napari.layers.utils.color_manager import ColorProperties
+from napari.settings import get_settings
 from napari.utils._test_utils import (
     validate_all_params_in_docstring,
     validate_docstring_parent_class_consistency,
@@ -636,6 +638,119 @@ def test_move():
     assert np.array_equal(layer.data[1:2], unmoved[1:2] + [-3, 4])
 
 
+def _brute_force_slice(layer, dims):
+    request = layer._slicing_state._make_slice_request(dims)
+    return dataclasses.replace(request, spatial_index=None)()
+
+
+@pytest.mark.parametrize('out_of_slice_display', [True, False])
+def test_slicing_with_spatial_index_after_edits(out_of_slice_display):
+    rng = np.random.default_rng(0)
+    data = rng.uniform(0, 10, size=(200, 3))
+    layer = Points(
+        data,
+        size=rng.uniform(0.5, 3, 200),
+        out_of_slice_display=out_of_slice_display,
+    )
+    dims = Dims(ndim=3, point=(5, 0, 0))
+
+    def check():
+        layer._slice_dims(dims)
+        expected = _brute_force_slice(layer, dims)
+        np.testing.assert_array_equal(
+            layer._indices_view,
+            expected.indices[layer.shown[expected.indices]],
+        )
+        np.testing.assert_allclose(layer._view_size_scale, expected.scale)
+
+    check()
+    layer.add(rng.uniform(0, 10, size=(10, 3)))
+    check()
+    layer.remove([0, 3, 100])
+    check()
+    layer._slice_dims(dims)
+    layer._move(list(layer._indices_view[:2]), [5, 0, 0])
+    layer._move(list(layer._indices_view[:2]), [5, 2, 2])
+    check()
+    layer.data[:5, 0] = 5
+    layer.refresh()
+    check()
+
+
+def test_add_remove_update_spatial_index(monkeypatch):
+    rng = np.random.default_rng(0)
+    layer = Points(rng.uniform(0, 10, size=(1000, 3)))
+    layer._slice_dims(Dims(ndim=3, point=(5, 0, 0)))
+
+    sorted_sizes = []
+    argsort = np.argsort
+
+    def counting_argsort(a, *args, **kwargs):
+        sorted_sizes.append(np.size(a))
+        return argsort(a, *args, **kwargs)
+
+    monkeypatch.setattr(np, 'argsort', counting_argsort)
+    layer.add(rng.uniform(0, 10, size=(2, 3)))
+    layer.remove([0, 10])
+    # only the added points are sorted, the index is not rebuilt
+    assert all(size < 1000 for size in sorted_sizes)
+    monkeypatch.undo()
+    expected = _brute_force_slice(layer, Dims(ndim=3, point=(5, 0, 0)))
+    np.testing.assert_array_equal(layer._indices_view, expected.indices)
+
+
+def test_get_value_after_move_uses_spatial_index():
+    layer = Points(np.array([[0, 0], [10, 10], [20, 20]]), size=2)
+    assert layer.get_value((10, 10)) == 1
+    layer._move([1], [10, 10])
+    layer._move([1], [15, 5])
+    assert layer.get_value((15, 5)) == 1
+    assert layer.get_value((10, 10)) is None
+    assert layer.get_value((20, 20)) == 2
+
+
+def test_level_of_detail():
+    get_settings().experimental.points_lod_max_points = 500
+    rng = np.random.default_rng(0)
+    layer = Points(rng.uniform(0, 100, size=(20000, 2)), size=0.5)
+    layer.events.set_data = Mock()
+    layer._update_draw(1, np.array([[0, 0], [30, 30]]), (100, 100))
+    layer.events.set_data.assert_called_once()
+
+    lod = layer._lod_view_indices
+    assert 0 < len(lod) <= 500
+    np.testing.assert_array_equal(lod, np.unique(lod))
+    coords = layer._view_data_at(lod)
+    # the view padded by the point size, snapped to steps of 8
+    assert np.all(coords >= -8)
+    assert np.all(coords <= 32)
+    # at most one point per cell of the grid
+    cells = np.floor(coords / 2).astype(int)
+    assert len(np.unique(cells, axis=0)) == len(lod)
+    # unchanged view, no new data event and the same points
+    layer._update_draw(1, np.array([[0, 0], [30, 30]]), (100, 100))
+    layer.events.set_data.assert_called_once()
+    np.testing.assert_array_equal(layer._lod_view_indices, lod)
+    # panning within a step does not change the rendered points
+    layer._update_draw(1, np.array([[12, 12], [42, 42]]), (100, 100))
+    assert layer.events.set_data.call_count == 2
+    lod = layer._lod_view_indices
+    layer._update_draw(1, np.array([[14, 14], [44, 44]]), (100, 100))
+    assert layer.events.set_data.call_count == 2
+    np.testing.assert_array_equal(layer._lod_view_indices, lod)
+    layer._update_draw(1, np.array([[20, 20], [50, 50]]), (100, 100))
+    assert layer.events.set_data.call_count == 3
+
+    # zoomed in, all the points of the padded view are rendered
+    layer._update_draw(0.1, np.array([[10, 10], [13, 13]]), (100, 100))
+    lod = layer._lod_view_indices
+    visible = np.all((layer.data >= 8) & (layer.data <= 15), axis=1)
+    np.testing.assert_array_equal(lod, np.flatnonzero(visible))
+
+    get_settings().experimental.points_lod_max_points = 0
+    assert layer._lod_view_indices is None
+
+
 def test_changing_modes():
     """Test changing modes."""
     shape = (10, 2)
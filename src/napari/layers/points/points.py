@@ -41,6 +41,7 @@ from napari.layers.utils._slice_input import (
     _SliceInput,
     _ThickNDSlice,
 )
+from napari.layers.utils._spatial_index import _SortedAxisIndex
 from napari.layers.utils.color_manager import ColorManager
 from napari.layers.utils.color_transformations import ColorType
 from napari.layers.utils.interactivity_utils import (
@@ -52,6 +53,7 @@ from napari.layers.utils.layer_utils import (
     _unique_element,
 )
 from napari.layers.utils.text_manager import TextManager
+from napari.settings import get_settings
 from napari.types import LayerDataType
 from napari.utils.colormaps import Colormap, ValidColormapArg
 from napari.utils.colormaps.standardize_color import hex_to_name, rgb_to_hex
@@ -61,6 +63,10 @@ from napari.utils.geometry import project_points_onto_plane, rotate_points
 from napari.utils.status_messages import format_feature_value
 from napari.utils.transforms import Affine
 
+# The number of steps per view size by which the region rendered with
+# level of detail moves while panning, see Points._lod_box
+_LOD_VIEW_STEPS = 4
+
 if TYPE_CHECKING:
     from collections.abc import (
         Callable,
@@ -494,6 +500,7 @@ class Points(Layer):
 
         # Save the point coordinates
         self._data = np.asarray(data)
+        self._spatial_index = _SortedAxisIndex(self._data)
 
         self._feature_table = _FeatureTable.from_layer(
             features=features,
@@ -619,12 +626,39 @@ class Points(Layer):
         self.events.data(**kwargs)
         self.events.features()
 
-    def _set_data(self, data: np.ndarray | None) -> None:
-        """Set the .data array attribute, without emitting an event."""
+    def _set_data(
+        self,
+        data: np.ndarray | None,
+        spatial_index: _SortedAxisIndex | None = None,
+    ) -> None:
+        """Set the .data array attribute, without emitting an event.
+
+        Parameters
+        ----------
+        data : array or None
+            The new coordinates of the points.
+        spatial_index : _SortedAxisIndex, optional
+            An index of ``data`` updated from the previous index, installed
+            before anything slices the new data so that it does not need
+            to be sorted again. By default, a new index is built.
+        """
         data, _ = fix_data_points(data, self.ndim)
         cur_npoints = len(self._data)
         self._data = data
+        if spatial_index is None or spatial_index.data is not data:
+            spatial_index = _SortedAxisIndex(data)
+        self._spatial_index = spatial_index
+        self._slicing_state._spatial_index_current = True
+        try:
+            self._update_data_styles(cur_npoints)
+            self._update_dims()
+        finally:
+            self._slicing_state._spatial_index_current = False
+        self._reset_editable()
 
+    def _update_data_styles(self, cur_npoints: int) -> None:
+        """Add or remove style values to match the number of points."""
+        data = self._data
         # Add/remove property and style values based on the number of new points.
         with (
             self.events.blocker_all(),
@@ -679,9 +713,6 @@ class Points(Layer):
                 )
                 self.symbol = np.concatenate((self._symbol, symbol), axis=0)
 
-        self._update_dims()
-        self._reset_editable()
-
     def _on_selection(self, selected: bool) -> None:
         if selected:
             self._set_highlight()
@@ -870,7 +901,7 @@ class Points(Layer):
         self._out_of_slice_display = bool(out_of_slice_display)
         self.events.out_of_slice_display()
         self.events.n_dimensional()
-        self.refresh(extent=False)
+        self._refresh_view(extent=False)
 
     @property
     def n_dimensional(self) -> bool:
@@ -936,7 +967,7 @@ class Points(Layer):
                 'Size is not compatible for broadcasting (may be anisotropic)'
             ) from e
         # TODO: technically not needed to cleat the non-augmented extent... maybe it's fine like this to avoid complexity
-        self.refresh(highlight=False)
+        self._refresh_view(highlight=False)
 
     @property
     def current_size(self) -> int | float:
@@ -959,7 +990,7 @@ class Points(Layer):
             idx = np.fromiter(self.selected_data, dtype=int)
             self.size[idx] = size
             # TODO: also here technically no need to clear base extent
-            self.refresh(highlight=False)
+            self._refresh_view(highlight=False)
             self.events.size()
         self.events.current_size()
 
@@ -1012,7 +1043,7 @@ class Points(Layer):
     @shown.setter
     def shown(self, shown):
         self._shown = np.broadcast_to(shown, self.data.shape[0]).astype(bool)
-        self.refresh(extent=False, highlight=False)
+        self._refresh_view(extent=False, highlight=False)
 
     @property
     def border_width(self) -> np.ndarray:
@@ -1035,7 +1066,7 @@ class Points(Layer):
 
         self._border_width = border_width
         self.events.border_width(value=border_width)
-        self.refresh(extent=False)
+        self._refresh_view(extent=False)
 
     @property
     def border_width_is_relative(self) -> bool:
@@ -1064,7 +1095,7 @@ class Points(Layer):
         if self._update_properties and len(self.selected_data) > 0:
             idx = np.fromiter(self.selected_data, dtype=int)
             self.border_width[idx] = border_width
-            self.refresh(highlight=False)
+            self._refresh_view(highlight=False)
             self.events.border_width()
         self.events.current_border_width()
 
@@ -1562,6 +1593,169 @@ class Points(Layer):
             sizes = np.array([])
         return sizes
 
+    def _view_data_at(self, view_indices: npt.NDArray) -> np.ndarray:
+        """Get the coords of some of the points in view
+
+        Parameters
+        ----------
+        view_indices : (M,) np.ndarray
+            Indices of the points within the points in view.
+
+        Returns
+        -------
+        view_data : (M x D) np.ndarray
+            Array of coordinates of the M points, like
+            `_view_data[view_indices]`.
+        """
+        return self.data[
+            np.ix_(
+                self._indices_view[view_indices], self._slice_input.displayed
+            )
+        ]
+
+    def _view_size_at(self, view_indices: npt.NDArray) -> np.ndarray:
+        """Get the sizes of some of the points in view.
+
+        Parameters
+        ----------
+        view_indices : (M,) np.ndarray
+            Indices of the points within the points in view.
+
+        Returns
+        -------
+        view_size : (M,) np.ndarray
+            Array of sizes of the M points, like `_view_size[view_indices]`.
+        """
+        scale = self._view_size_scale
+        if isinstance(scale, np.ndarray):
+            scale = scale[view_indices]
+        return self.size[self._indices_view[view_indices]] * scale
+
+    @property
+    def _max_view_size(self) -> float:
+        """Size of the largest point in view, or 0 if there are none."""
+        if self._slicing_state._max_view_size is None:
+            view_size = self._view_size
+            self._slicing_state._max_view_size = (
+                float(np.max(view_size)) if len(view_size) > 0 else 0.0
+            )
+        return self._slicing_state._max_view_size
+
+    def _view_indices_in_box(
+        self, low: npt.ArrayLike, high: npt.ArrayLike
+    ) -> npt.NDArray[np.intp]:
+        """Find the points in view within a box along the displayed dims.
+
+        This uses the spatial index of the data, so it does not check all
+        the points in view.
+
+        Parameters
+        ----------
+        low : array-like
+            The lower (inclusive) bounds of the box.
+        high : array-like
+            The upper (inclusive) bounds of the box.
+
+        Returns
+        -------
+        view_indices : np.ndarray
+            The sorted indices of the points within the points in view.
+        """
+        candidates = self._spatial_index.query_box(
+            self._slice_input.displayed, low, high
+        )
+        # _indices_view is sorted, so look the candidates up in it
+        indices_view = self._indices_view
+        positions = np.searchsorted(indices_view, candidates)
+        positions = positions[positions < len(indices_view)]
+        in_view = indices_view[positions] == candidates[: len(positions)]
+        return positions[in_view]
+
+    @property
+    def _lod_view_indices(self) -> npt.NDArray[np.intp] | None:
+        """Indices within the points in view of the points to render.
+
+        When there are more points in view than the
+        ``points_lod_max_points`` experimental setting, only the points in
+        the visible region are rendered. If there are still too many, they
+        are reduced to the top-most point in each cell of a grid of canvas
+        pixels (or of larger cells, if needed). The grid is anchored at the
+        data origin, so the selected points are stable while panning.
+
+        The visible region is padded and snapped to steps of about a
+        quarter of the view, see `_lod_box`, so that the rendered points
+        are only computed again after panning by one step.
+
+        Returns
+        -------
+        view_indices : np.ndarray or None
+            The sorted indices of the points to render, or None to render
+            all the points in view.
+        """
+        max_points = get_settings().experimental.points_lod_max_points
+        if (
+            max_points == 0
+            or len(self._indices_view) <= max_points
+            or self._slice_input.ndisplay != 2
+        ):
+            return None
+        key = self._lod_key(max_points)
+        lod = self._slicing_state._lod
+        if lod is not None and lod[0] == key:
+            return lod[1]
+
+        displayed = list(self._slice_input.displayed)
+        view_indices = self._view_indices_in_box(*self._lod_box())
+        # size of a canvas pixel in data coordinates
+        cell_size = self.scale_factor / np.abs(self.scale[displayed])
+        coords = self._view_data_at(view_indices)
+        while len(view_indices) > max_points:
+            cells = np.floor(coords / cell_size).astype(np.int64)
+            cells -= cells.min(axis=0)
+            flat_cells = np.ravel_multi_index(
+                tuple(cells.T), tuple(cells.max(axis=0) + 1)
+            )
+            # keep the last point of each cell, which is drawn on top
+            _, last = np.unique(flat_cells[::-1], return_index=True)
+            keep = np.sort(len(flat_cells) - 1 - last)
+            view_indices = view_indices[keep]
+            coords = coords[keep]
+            cell_size = cell_size * 2
+        self._slicing_state._lod = (key, view_indices)
+        return view_indices
+
+    def _lod_box(self) -> tuple[np.ndarray, np.ndarray]:
+        """The region of the displayed dimensions to render points in.
+
+        The visible region, padded by the size of the largest point, is
+        snapped outwards to a grid whose step is the power of two closest
+        above a quarter of the size of the view. The region is therefore
+        unchanged while panning within a step.
+
+        Returns
+        -------
+        low, high : np.ndarray
+            The lower and upper bounds of the region.
+        """
+        displayed = list(self._slice_input.displayed)
+        corners = self.corner_pixels[:, displayed]
+        padding = self._max_view_size / 2 + 1
+        view_size = np.maximum(corners[1] - corners[0], 1)
+        step = 2.0 ** np.ceil(np.log2(view_size / _LOD_VIEW_STEPS))
+        low = np.floor((corners[0] - padding) / step) * step
+        high = np.ceil((corners[1] + padding) / step) * step
+        return low, high
+
+    def _lod_key(self, max_points: int) -> tuple:
+        """The state of the view that the rendered points depend on."""
+        low, high = self._lod_box()
+        return (
+            max_points,
+            self.scale_factor,
+            low.tobytes(),
+            high.tobytes(),
+        )
+
     @property
     def _view_symbol(self) -> np.ndarray:
         """Get the symbols of the points in view
@@ -1628,6 +1822,15 @@ class Points(Layer):
         )
         # update highlight only if scale has changed, otherwise causes a cycle
         self._set_highlight(force=(prev_scale != self.scale_factor))
+        # the rendered points depend on the view when using level of detail
+        max_points = get_settings().experimental.points_lod_max_points
+        lod = self._slicing_state._lod
+        if (
+            max_points > 0
+            and len(self._indices_view) > max_points
+            and (lod is None or lod[0] != self._lod_key(max_points))
+        ):
+            self.events.set_data()
 
     def _get_value_(
         self,
@@ -1662,29 +1865,36 @@ class Points(Layer):
             Index of point that is at the current coordinate if any.
         """
         # Display points if there are any in this slice
-        view_data = self._view_data
         selection = None
-        if len(view_data) > 0:
-            displayed_position = [
-                position[i] for i in self._slice_input.displayed
-            ]
+        if len(self._indices_view) > 0:
+            displayed = list(self._slice_input.displayed)
+            displayed_position = np.array([position[i] for i in displayed])
             # positions are scaled anisotropically by scale, but sizes are not,
             # so we need to calculate the ratio to correctly map to screen coordinates
-            scale_ratio = np.abs(
-                self.scale[self._slice_input.displayed] / self.scale[-1]
+            scale_ratio = np.abs(self.scale[displayed] / self.scale[-1])
+            # Only check the points in view that are close enough to
+            # possibly contain the position.
+            radius = self._max_view_size / scale_ratio / 2
+            view_indices = self._view_indices_in_box(
+                displayed_position - radius, displayed_position + radius
             )
             # Get the point sizes
             # TODO: calculate distance in canvas space to account for canvas_size_limits.
             # Without this implementation, point hover and selection (and anything depending
             # on self.get_value()) won't be aware of the real extent of points, causing
             # unexpected behaviour. See #3734 for details.
-            sizes = np.expand_dims(self._view_size, axis=1) / scale_ratio / 2
+            sizes = (
+                np.expand_dims(self._view_size_at(view_indices), axis=1)
+                / scale_ratio
+                / 2
+            )
+            view_data = self._view_data_at(view_indices)
             distances = abs(view_data - displayed_position)
             in_slice_matches = np.all(
                 distances <= sizes,
                 axis=1,
             )
-            indices = np.where(in_slice_matches)[0]
+            indices = view_indices[in_slice_matches]
             if len(indices) > 0:
                 selection = self._indices_view[indices[-1]]
 
@@ -1818,6 +2028,22 @@ class Points(Layer):
         )
         return start_point, end_point
 
+    def _display_bounding_box_augmented(
+        self, dims_displayed: list[int]
+    ) -> npt.NDArray:
+        """An augmented, axis-aligned (ndisplay, 2) bounding box.
+
+        This includes the size of the points, like `_extent_data_augmented`,
+        but uses the spatial index instead of scanning all the points.
+        """
+        if len(self.data) == 0:
+            return super()._display_bounding_box_augmented(dims_displayed)
+        mins, maxs = self._spatial_index.bounds(dims_displayed)
+        max_point_size = np.max(self.size)
+        return np.stack(
+            [mins - max_point_size / 2, maxs + max_point_size / 2], axis=1
+        )
+
     def _set_highlight(self, force: bool = False) -> None:
         """Render highlights of shapes including boundaries, vertices,
         interaction boxes, and the drag selection box when appropriate.
@@ -1946,7 +2172,8 @@ class Points(Layer):
             data_indices=(-1,),
             vertex_indices=((),),
         )
-        self._set_data(np.append(self.data, np.atleast_2d(coords), axis=0))
+        data = np.append(self.data, np.atleast_2d(coords), axis=0)
+        self._set_data(data, self._spatial_index.appended(data))
         self.events.data(
             value=self.data,
             action=ActionType.ADDED,
@@ -1995,7 +2222,8 @@ class Points(Layer):
                     self._value -= offset
                     self._value_stored -= offset
 
-            self._set_data(np.delete(self.data, indices, axis=0))
+            data = np.delete(self.data, indices, axis=0)
+            self._set_data(data, self._spatial_index.removed(indices, data))
 
             if len(self.data) == 0 and self.selected_data:
                 self.selected_data.clear()
@@ -2107,7 +2335,8 @@ class Points(Layer):
             self.data[np.ix_(selection_indices, disp)] = (
                 self.data[np.ix_(selection_indices, disp)] + shift
             )
-            self.refresh()
+            self._spatial_index.moved(selection_indices, disp)
+            self._refresh_view()
             self.events.data(
                 value=self.data,
                 action=ActionType.CHANGED,
@@ -2159,6 +2388,7 @@ class Points(Layer):
             ]
             data[:, not_disp] = data[:, not_disp] + np.array(offset)
             self._data = np.append(self.data, data, axis=0)
+            self._spatial_index = self._spatial_index.appended(self._data)
             self._shown = np.append(
                 self.shown, deepcopy(self._clipboard['shown']), axis=0
             )
@@ -2197,7 +2427,7 @@ class Points(Layer):
             self._selected_data.update(
                 set(range(totpoints, totpoints + len(self._clipboard['data'])))
             )
-            self.refresh()
+            self._refresh_view()
 
     def _copy_data(self) -> None:
         """Copy selected points to clipboard."""
@@ -2446,6 +2676,21 @@ class _PointsSlicingState(_LayerSlicingState):
         self._view_size_scale: (
             float | np.ndarray[tuple[int], np.dtype[np.float64]]
         ) = 1.0
+        # Size of the largest point in view, computed when first needed
+        self._max_view_size: float | None = None
+        # The view state and the indices of the points to render with
+        # level of detail, see Points._lod_view_indices
+        self._lod: tuple[tuple, npt.NDArray[np.intp]] | None = None
+        # Whether the spatial index was just made for new data, so that
+        # it does not need to be built again on refresh
+        self._spatial_index_current = False
+
+    def _on_data_modified(self) -> None:
+        if self._spatial_index_current:
+            return
+        # The data may have been modified in place, so the spatial index
+        # must be built again.
+        self.layer._spatial_index = _SortedAxisIndex(self.layer.data)
 
     def _set_view_slice(self) -> None:
         """Sets the view given the indices to slice with."""
@@ -2477,6 +2722,7 @@ class _PointsSlicingState(_LayerSlicingState):
             projection_mode=self.layer.projection_mode,
             out_of_slice_display=self.layer.out_of_slice_display,
             size=self.layer.size,
+            spatial_index=self.layer._spatial_index,
         )
 
     def _update_slice_response(self, response: _PointSliceResponse) -> None:
@@ -2521,6 +2767,8 @@ class _PointsSlicingState(_LayerSlicingState):
 
     @_indices_view.setter
     def _indices_view(self, value):
+        self._max_view_size = None
+        self._lod = None
         if len(self.layer.shown) == 0:
             self.__indices_view = np.empty(0, int)
         else:
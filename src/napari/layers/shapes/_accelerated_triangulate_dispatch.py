@@ -9,15 +9,21 @@ knowing which implementation is being used.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import TYPE_CHECKING, TypeVar
 
 import numpy as np
 
 from napari.layers.shapes import _accelerated_triangulate_python
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
     from types import ModuleType
 
+_T = TypeVar('_T')
+_R = TypeVar('_R')
+
 _accelerated_triangulate_numba: ModuleType | None
 
 try:
@@ -80,6 +86,52 @@ else:
     )
 
 
+# The minimum number of items per thread when triangulating in parallel,
+# below which the overhead of the threads outweighs the gain.
+MIN_ITEMS_PER_WORKER = 64
+
+
+def triangulate_batch(
+    func: Callable[[_T], _R], items: Sequence[_T], workers: int = 1
+) -> list[_R]:
+    """Apply a triangulating function to each item, using multiple threads.
+
+    The items are split into one contiguous chunk per thread, and the
+    results are returned in the order of the items. This only speeds up
+    triangulation when ``func`` spends most of its time in compiled code
+    that releases the GIL, such as the compiled triangulation backends.
+
+    Parameters
+    ----------
+    func : callable
+        The function to apply to each item.
+    items : sequence
+        The items to triangulate, such as the data of shapes.
+    workers : int
+        The maximum number of threads to use. With 1, or when there are
+        too few items to split, the items are processed in the calling
+        thread.
+
+    Returns
+    -------
+    results : list
+        The result of ``func`` for each item.
+    """
+    workers = min(workers, len(items) // MIN_ITEMS_PER_WORKER)
+    if workers <= 1:
+        return [func(item) for item in items]
+
+    bounds = np.linspace(0, len(items), workers + 1).astype(int)
+
+    def process(chunk: int) -> list[_R]:
+        return [
+            func(item) for item in items[bounds[chunk] : bounds[chunk + 1]]
+        ]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(chain.from_iterable(executor.map(process, range(workers))))
+
+
 def _set_numba(value: bool) -> None:
     """Set the Numba backend to use.
 
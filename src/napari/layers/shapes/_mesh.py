@@ -54,6 +54,11 @@ class Mesh:
     triangles_z_order : np.ndarray
         Length P array of the z order of each triangle. Must be a permutation
         of (0, ..., P-1)
+    displayed_triangles_updates : list of np.ndarray
+        Rows of `displayed_triangles` and `displayed_triangles_colors` that
+        were updated in place, in order, since these arrays were last
+        rebuilt. Their rows may also change because the vertices of their
+        triangles were updated.
 
     Notes
     -----
@@ -72,6 +77,7 @@ class Mesh:
     displayed_triangles: TriangleArray
     displayed_triangles_colors: ShapeColorArray
     displayed_triangles_to_shape_index: IndexArray
+    displayed_triangles_updates: list[IndexArray]
     vertices_index: IndexArray
     triangles_index: IndexArray
 
@@ -99,6 +105,7 @@ class Mesh:
         self.displayed_triangles_colors = np.empty(
             (0, 4), dtype=ShapeColorDtype
         )
+        self.displayed_triangles_updates = []
 
     @property
     def ndisplay(self) -> int:
@@ -8,6 +8,7 @@ from typing import Literal, TypedDict
 import numpy as np
 import numpy.typing as npt
 
+from napari.layers.labels._labels_utils import get_chunk_shape
 from napari.layers.shapes._mesh import Mesh
 from napari.layers.shapes._shapes_constants import ShapeType, shape_classes
 from napari.layers.shapes._shapes_models import Line, Path, Shape
@@ -25,6 +26,7 @@ from napari.layers.shapes.shape_types import (
     ZOrderArray,
     ZOrderDtype,
 )
+from napari.layers.utils._spatial_index import _BoxTree
 from napari.utils.geometry import (
     inside_triangles,
     intersect_line_with_triangles,
@@ -81,6 +83,175 @@ class MeshArrayDict(TypedDict):
     mesh_vertices_index: IndexArray  # offset of mesh vertices for each shape
 
 
+class ShapeColumnDict(TypedDict):
+    """Per-shape column arrays of a ShapeList.
+
+    Each array has one row per shape, so that operations over all shapes
+    (slicing, picking, selection) are vectorized instead of iterating over
+    the Shape objects.
+
+    This is not a columnar storage of the shapes: the Shape objects are
+    still built (and triangulated) for every shape and remain the source
+    of truth. The columns are a cache of values derived from them, which
+    ShapeList updates whenever it adds, edits or removes a shape. They do
+    not make adding shapes faster, since most of that time is spent
+    triangulating the shapes.
+
+    Fields
+    ------
+    shape_type_codes : np.ndarray
+        (N,) array with the index of the type of each shape in `ShapeType`.
+    edge_widths : np.ndarray
+        (N,) array with the edge width of each shape.
+    slice_keys : np.ndarray
+        (N, 2, P) array with the min and max values of each shape along
+        the P non-displayed dimensions.
+    bounding_boxes : np.ndarray
+        (N, 2, ndisplay) array with the bounding box of each shape in the
+        displayed dimensions, including its edge width.
+    data_bounding_boxes : np.ndarray
+        (N, 2, D) array with the bounding box of the data of each shape.
+    vertices_counts : IndexArray
+        (N,) array with the number of displayed vertices of each shape.
+    triangles_counts : IndexArray
+        (N,) array with the number of mesh triangles of each shape.
+    """
+
+    shape_type_codes: npt.NDArray[np.uint8]
+    edge_widths: npt.NDArray[np.float64]
+    slice_keys: npt.NDArray[np.int64]
+    bounding_boxes: npt.NDArray[np.float64]
+    data_bounding_boxes: npt.NDArray[np.float64]
+    vertices_counts: IndexArray
+    triangles_counts: IndexArray
+
+
+_SHAPE_TYPE_NAMES = tuple(str(shape_type) for shape_type in ShapeType)
+_SHAPE_TYPE_CODES = {name: code for code, name in enumerate(_SHAPE_TYPE_NAMES)}
+
+
+def _shape_columns(shapes: Sequence[Shape], ndisplay: int) -> ShapeColumnDict:
+    """Build the column arrays of a sequence of shapes.
+
+    Parameters
+    ----------
+    shapes : Sequence of Shape
+        Each Shape must be a subclass of Shape, with the same number of
+        dimensions.
+    ndisplay : int
+        Number of displayed dimensions.
+
+    Returns
+    -------
+    columns : dict
+        Dictionary containing one array per column, with one row per shape.
+    """
+    n_shapes = len(shapes)
+    if n_shapes:
+        ndim = shapes[0].data.shape[1]
+        ndisplay = shapes[0].bounding_box.shape[1]
+    else:
+        ndim = ndisplay
+    columns: ShapeColumnDict = {
+        'shape_type_codes': np.fromiter(
+            (_SHAPE_TYPE_CODES[s.name] for s in shapes),
+            dtype=np.uint8,
+            count=n_shapes,
+        ),
+        'edge_widths': np.fromiter(
+            (s.edge_width for s in shapes), dtype=np.float64, count=n_shapes
+        ),
+        'slice_keys': np.empty((n_shapes, 2, ndim - ndisplay), dtype=np.int64),
+        'bounding_boxes': np.empty((n_shapes, 2, ndisplay)),
+        'data_bounding_boxes': np.empty((n_shapes, 2, ndim)),
+        'vertices_counts': np.fromiter(
+            (len(s.data_displayed) for s in shapes),
+            dtype=IndexDtype,
+            count=n_shapes,
+        ),
+        'triangles_counts': np.fromiter(
+            (s.triangles_count for s in shapes),
+            dtype=IndexDtype,
+            count=n_shapes,
+        ),
+    }
+    for i, shape in enumerate(shapes):
+        columns['slice_keys'][i] = shape.slice_key
+        columns['bounding_boxes'][i] = shape.bounding_box
+        columns['data_bounding_boxes'][i] = shape._bounding_box
+    return columns
+
+
+def _ranges_to_array(starts: npt.NDArray, counts: npt.NDArray) -> IndexArray:
+    """Concatenate the ranges ``start, ..., start + count - 1``.
+
+    Parameters
+    ----------
+    starts : np.ndarray
+        (N,) array with the first element of each range.
+    counts : np.ndarray
+        (N,) array with the length of each range.
+
+    Returns
+    -------
+    indices : np.ndarray
+        Array with the elements of all the ranges, in order.
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    ends = np.cumsum(counts)
+    # position of each element within its range
+    positions = np.arange(ends[-1] if len(ends) else 0) - np.repeat(
+        ends - counts, counts
+    )
+    return np.repeat(np.asarray(starts, dtype=np.int64), counts) + positions
+
+
+def _repeat_indices(
+    indices: npt.NDArray, counts: npt.NDArray, size: int
+) -> IndexArray:
+    """Repeat each index by its count, in an array of the given size.
+
+    The result is truncated to ``size``, or padded with -1 up to ``size``.
+    """
+    repeated = np.repeat(indices, counts)[:size]
+    result = np.full(size, -1, dtype=IndexDtype)
+    result[: len(repeated)] = repeated
+    return result
+
+
+def _find_in_ranges(
+    ranges: npt.NDArray | slice, values: npt.NDArray
+) -> tuple[IndexArray, IndexArray]:
+    """Find values within sorted ranges of positions.
+
+    Parameters
+    ----------
+    ranges : np.ndarray or slice
+        Sorted array of positions, or slice with a step of 1.
+    values : np.ndarray
+        Positions to look for.
+
+    Returns
+    -------
+    rows : np.ndarray
+        The indices within ``ranges`` of the values found in it.
+    found : np.ndarray
+        The values found in ``ranges``.
+    """
+    if isinstance(ranges, slice):
+        rows = values - ranges.start
+        inside = (rows >= 0) & (values < ranges.stop)
+        return rows[inside], values[inside]
+    rows = np.searchsorted(ranges, values)
+    inside = rows < len(ranges)
+    inside[inside] = ranges[rows[inside]] == values[inside]
+    return rows[inside], values[inside]
+
+
+# Maximum number of in place updates of the displayed data before it is
+# rebuilt, which bounds the length of Mesh.displayed_triangles_updates.
+_MAX_DISPLAYED_UPDATES = 256
+
 _SizeInformation = tuple[int, int, int, int, int]
 
 
@@ -358,6 +529,75 @@ def _fill_arrays(
         triangles_offset += n_edge_triangles
 
 
+# The number of rasterized points written at once by `ShapeList.to_labels`
+# into chunked arrays.
+_RASTERIZE_BATCH_SIZE = 2**24
+
+
+def _write_labels_by_chunk(
+    out,
+    chunk_shape: Sequence[int],
+    shapes_coords: Sequence[tuple[int, tuple[np.ndarray, ...]]],
+) -> None:
+    """Write the points of rasterized shapes into an array, chunk by chunk.
+
+    Each chunk of `out` containing points is read, updated and written back
+    once. Shapes are painted in order, so later shapes overwrite earlier
+    ones where they overlap.
+
+    Parameters
+    ----------
+    out : array-like
+        The array to write into, supporting reading and writing with slices.
+    chunk_shape : sequence of int
+        The shape of the chunks of `out`.
+    shapes_coords : sequence of (int, tuple of np.ndarray)
+        The label of each shape and the coordinates of its points in `out`.
+    """
+    if not shapes_coords:
+        return
+    shape = np.asarray(out.shape)
+    chunk_shape = np.asarray(chunk_shape)
+    grid_shape = tuple(-(-shape // chunk_shape))
+    counts = [len(coords[0]) for _, coords in shapes_coords]
+    values = np.repeat([label for label, _ in shapes_coords], counts)
+    coords = np.stack(
+        [
+            np.concatenate([c[axis] for _, c in shapes_coords])
+            for axis in range(len(shape))
+        ]
+    )
+    chunk_ids = np.ravel_multi_index(
+        tuple(coords // chunk_shape[:, np.newaxis]), grid_shape
+    )
+    # a stable sort keeps the points of each chunk in painting order
+    order = np.argsort(chunk_ids, kind='stable')
+    unique_ids, starts = np.unique(chunk_ids[order], return_index=True)
+    stops = np.append(starts[1:], len(order))
+    for chunk_id, start, stop in zip(unique_ids, starts, stops, strict=True):
+        positions = order[start:stop]
+        chunk_start = np.array(np.unravel_index(chunk_id, grid_shape))
+        chunk_start *= chunk_shape
+        slice_key = tuple(
+            slice(int(a), int(b))
+            for a, b in zip(
+                chunk_start,
+                np.minimum(chunk_start + chunk_shape, shape),
+                strict=True,
+            )
+        )
+        block = np.array(out[slice_key])
+        flat = np.ravel_multi_index(
+            tuple(coords[:, positions] - chunk_start[:, np.newaxis]),
+            block.shape,
+        )
+        # keep the last painted value of points painted more than once
+        _, last = np.unique(flat[::-1], return_index=True)
+        last = len(flat) - 1 - last
+        block.flat[flat[last]] = values[positions[last]]
+        out[slice_key] = block
+
+
 def _batch_dec(meth):
     """
     Decorator to apply `self.batched_updates` to the current method.
@@ -384,7 +624,8 @@ class ShapeList:
     Attributes
     ----------
     shapes : (N, ) list
-        Shape objects.
+        Shape objects, the source of truth of the data of the shapes. They
+        are built, and triangulated, when the shapes are added.
     data : (N, ) list of (M, D) array
         Data arrays for each shape.
     ndisplay : int
@@ -421,6 +662,11 @@ class ShapeList:
     _mesh : Mesh
         Mesh object containing all the mesh information that will ultimately
         be rendered.
+    _columns : dict
+        Per-shape arrays (type, edge width, slice key, bounding boxes, and
+        vertex and triangle counts) derived from the Shape objects, see
+        `ShapeColumnDict`. They duplicate values of the shapes and must be
+        updated together with them.
     """
 
     def __init__(
@@ -437,6 +683,7 @@ class ShapeList:
         self._vertices_index: IndexArray = np.zeros(1, dtype=IndexDtype)
         self._z_index: IndexArray = np.empty(0, dtype=IndexDtype)
         self._z_order: IndexArray = np.empty(0, dtype=IndexDtype)
+        self._columns = _shape_columns([], self.ndisplay)
 
         self._mesh = Mesh(ndisplay=self.ndisplay)
 
@@ -449,6 +696,23 @@ class ShapeList:
 
         # Counter of number of time _update_displayed has been requested
         self.__update_displayed_called = 0
+        # Whether a full rebuild of the displayed data has been requested,
+        # and otherwise the shapes whose displayed data should be updated
+        # in place.
+        self.__rebuild_displayed = False
+        self.__updated_shapes: set[int] = set()
+        # Positions in the mesh triangles (ordered by z_order) and in the
+        # vertices of the displayed triangles and vertices, set on rebuild.
+        self._displayed_triangles_range: IndexArray | slice = np.array(
+            [], dtype=np.int64
+        )
+        self._displayed_vertices_range: IndexArray | slice = np.array(
+            [], dtype=np.int64
+        )
+        # triangles_z_order and its inverse permutation, computed lazily
+        self._triangles_z_positions: tuple[ZOrderArray, IndexArray] | None = (
+            None
+        )
         if not isinstance(data, Sequence):
             data = list(data)
         self.add(data)
@@ -483,17 +747,6 @@ class ShapeList:
         shape = self.shapes[shape_index]
         return slice(start, start + shape.triangles_count)
 
-    @staticmethod
-    def _slicess_to_array(slices: Sequence[slice]) -> np.ndarray:
-        count = sum(r.stop - r.start for r in slices)
-        res = np.empty(count, dtype=np.int64)
-        begin = 0
-        for r in slices:
-            end = begin + (r.stop - r.start)
-            res[begin:end] = np.arange(r.start, r.stop)
-            begin = end
-        return res
-
     def _mesh_triangles_range_seq(
         self, shape_indexes: IndexArray
     ) -> np.ndarray | slice:
@@ -503,11 +756,13 @@ class ShapeList:
         ):  # If the sequence is continuous, return a range
             start = self._mesh.triangles_index[shape_indexes[0]]
             end = self._mesh.triangles_index[shape_indexes[-1]]
-            end_shape = self.shapes[shape_indexes[-1]]
-            return slice(start, end + end_shape.triangles_count)
+            end_count = self._columns['triangles_counts'][shape_indexes[-1]]
+            return slice(start, end + end_count)
         # If the sequence is not continuous, return a numpy array
-        ranges = [self._mesh_triangles_slice(i) for i in shape_indexes]
-        return self._slicess_to_array(ranges)
+        return _ranges_to_array(
+            self._mesh.triangles_index[shape_indexes],
+            self._columns['triangles_counts'][shape_indexes],
+        )
 
     def _vertices_range_seq(
         self, shape_indexes: IndexArray
@@ -518,11 +773,13 @@ class ShapeList:
         ):  # If the sequence is continuous, return a range
             start = self._vertices_index[shape_indexes[0]]
             end = self._vertices_index[shape_indexes[-1]]
-            end_shape = self.shapes[shape_indexes[-1]]
-            return slice(start, end + end_shape.data_displayed.shape[0])
+            end_count = self._columns['vertices_counts'][shape_indexes[-1]]
+            return slice(start, end + end_count)
         # If the sequence is not continuous, return a numpy array
-        slicess = [self._vertices_slice(i) for i in shape_indexes]
-        return self._slicess_to_array(slicess)
+        return _ranges_to_array(
+            self._vertices_index[shape_indexes],
+            self._columns['vertices_counts'][shape_indexes],
+        )
 
     def _mesh_triangles_slice_available(self, shape_index: int) -> slice:
         """Return the available slice of mesh triangles for a given shape index."""
@@ -629,12 +886,15 @@ class ShapeList:
         self,
     ) -> np.ndarray[tuple[int, Literal[2], int], np.dtype[np.int64]]:
         """(N, 2, P) array: slice key for each shape."""
-        return np.array([s.slice_key for s in self.shapes])
+        return self._columns['slice_keys']
 
     @property
     def shape_types(self) -> list[str]:
         """list of str: shape types for each shape."""
-        return [s.name for s in self.shapes]
+        return [
+            _SHAPE_TYPE_NAMES[code]
+            for code in self._columns['shape_type_codes'].tolist()
+        ]
 
     @property
     def edge_color(self) -> ShapeColorArray:
@@ -683,12 +943,12 @@ class ShapeList:
     @property
     def edge_widths(self) -> list[float]:
         """list of float: edge width for each shape."""
-        return [s.edge_width for s in self.shapes]
+        return self._columns['edge_widths'].tolist()
 
     @property
     def z_indices(self) -> list[int]:
         """list of int: z-index for each shape."""
-        return [s.z_index for s in self.shapes]
+        return self._z_index.tolist()
 
     @property
     def slice_key(self):
@@ -708,57 +968,155 @@ class ShapeList:
         self, displayed_indices: IndexArray
     ) -> None:
         """Update the displayed triangles to shape index mapping."""
-        if (
-            self._mesh.displayed_triangles_to_shape_index.shape[0]
-            != self._mesh.displayed_triangles.shape[0]
-        ):
-            self._mesh.displayed_triangles_to_shape_index = np.full(
-                self._mesh.displayed_triangles.shape[0], -1, dtype=IndexDtype
-            )
-        shift_idx = 0
-        for i in displayed_indices:
-            begin = self._mesh.triangles_index[i]
-            end = self._mesh.triangles_index[i + 1]
-            elem_num = end - begin
-            self._mesh.displayed_triangles_to_shape_index[
-                shift_idx : shift_idx + elem_num
-            ] = i
-            shift_idx += elem_num
+        self._mesh.displayed_triangles_to_shape_index = _repeat_indices(
+            displayed_indices,
+            np.diff(self._mesh.triangles_index)[displayed_indices],
+            self._mesh.displayed_triangles.shape[0],
+        )
 
     def _update_displayed_vertices_to_shape_num(
         self, displayed_indices: IndexArray
     ) -> None:
         """Update the displayed vertices to shape index mapping."""
-        if (
-            self.displayed_vertices_to_shape_num.shape[0]
-            != self.displayed_vertices.shape[0]
-        ):
-            self.displayed_vertices_to_shape_num = np.full(
-                self.displayed_vertices.shape[0], -1, dtype=IndexDtype
-            )
-        shift_idx = 0
-        for i in displayed_indices:
-            begin = self._vertices_index[i]
-            end = self._vertices_index[i + 1]
-            elem_num = end - begin
-            self.displayed_vertices_to_shape_num[
-                shift_idx : shift_idx + elem_num
-            ] = i
-            shift_idx += elem_num
-
-    def _update_displayed(self) -> None:
+        self.displayed_vertices_to_shape_num = _repeat_indices(
+            displayed_indices,
+            np.diff(self._vertices_index)[displayed_indices],
+            self.displayed_vertices.shape[0],
+        )
+
+    def _update_displayed(
+        self, indices: int | Iterable[int] | None = None
+    ) -> None:
         """Update the displayed data based on the slice key.
 
         This method must be called from within the `batched_updates` context
         manager:
+
+        Parameters
+        ----------
+        indices : int or iterable of int or None
+            If given, only these shapes changed, without changing their slice
+            key, their number of vertices and triangles, nor the z order, so
+            their displayed data is updated in place. Otherwise all the
+            displayed data is rebuilt.
         """
         assert self.__batched_level >= 1, (
             'call _update_displayed from within self.batched_updates context manager'
         )
         if not self.__batch_force_call:
             self.__update_displayed_called += 1
+            if indices is None:
+                self.__rebuild_displayed = True
+            elif isinstance(indices, int | np.integer):
+                self.__updated_shapes.add(int(indices))
+            else:
+                self.__updated_shapes.update(int(i) for i in indices)
+            return
+
+        updated_shapes = np.array(sorted(self.__updated_shapes), dtype=int)
+        rebuild = self.__rebuild_displayed or (
+            len(self._mesh.displayed_triangles_updates)
+            >= _MAX_DISPLAYED_UPDATES
+        )
+        self.__rebuild_displayed = False
+        self.__updated_shapes = set()
+        if rebuild:
+            self._rebuild_displayed()
+        elif len(updated_shapes):
+            self._patch_displayed(updated_shapes)
+
+    def _triangles_z_position(self) -> IndexArray:
+        """Return the position of each mesh triangle in the z order."""
+        z_order = self._mesh.triangles_z_order
+        if (
+            self._triangles_z_positions is None
+            or self._triangles_z_positions[0] is not z_order
+        ):
+            positions = np.empty(len(z_order), dtype=np.int64)
+            positions[z_order] = np.arange(len(z_order))
+            self._triangles_z_positions = (z_order, positions)
+        return self._triangles_z_positions[1]
+
+    def _displayed_triangles_rows(
+        self, indices: IndexArray
+    ) -> tuple[IndexArray, IndexArray]:
+        """Return the rows of the displayed triangles of some shapes.
+
+        Parameters
+        ----------
+        indices : np.ndarray
+            Sorted indices of displayed shapes.
+
+        Returns
+        -------
+        rows : np.ndarray
+            The sorted rows of ``self._mesh.displayed_triangles`` that
+            belong to the shapes.
+        shapes : np.ndarray
+            The index of the shape of each row.
+        """
+        triangles = _ranges_to_array(
+            self._mesh.triangles_index[indices],
+            self._columns['triangles_counts'][indices],
+        )
+        rows, positions = _find_in_ranges(
+            self._displayed_triangles_range,
+            self._triangles_z_position()[triangles],
+        )
+        order = np.argsort(rows)
+        shapes = (
+            np.searchsorted(
+                self._mesh.triangles_index,
+                self._mesh.triangles_z_order[positions[order]],
+                side='right',
+            )
+            - 1
+        )
+        return rows[order], shapes
+
+    def _patch_displayed(self, indices: IndexArray) -> None:
+        """Update the displayed data of shapes that changed in place.
+
+        The rows of the displayed triangles that were updated are appended
+        to ``self._mesh.displayed_triangles_updates``.
+
+        Parameters
+        ----------
+        indices : np.ndarray
+            Sorted indices of the changed shapes.
+        """
+        indices = indices[self._displayed[indices]]
+        if indices.size == 0:
             return
 
+        triangles = _ranges_to_array(
+            self._mesh.triangles_index[indices],
+            self._columns['triangles_counts'][indices],
+        )
+        rows, positions = _find_in_ranges(
+            self._displayed_triangles_range,
+            self._triangles_z_position()[triangles],
+        )
+        mesh_triangles = self._mesh.triangles_z_order[positions]
+        self._mesh.displayed_triangles[rows] = self._mesh.triangles[
+            mesh_triangles
+        ]
+        self._mesh.displayed_triangles_colors[rows] = (
+            self._mesh.triangles_colors[mesh_triangles]
+        )
+        self._mesh.displayed_triangles_updates.append(rows)
+
+        vertices = _ranges_to_array(
+            self._vertices_index[indices],
+            self._columns['vertices_counts'][indices],
+        )
+        rows, positions = _find_in_ranges(
+            self._displayed_vertices_range, vertices
+        )
+        self.displayed_vertices[rows] = self._vertices[positions]
+
+    def _rebuild_displayed(self) -> None:
+        """Rebuild all the displayed data based on the slice key."""
         # The list slice key is repeated to check against both the min and
         # max values stored in the shapes slice key.
         slice_key = np.array([self.slice_key, self.slice_key])
@@ -767,7 +1125,8 @@ class ShapeList:
         # shape is entirely contained within the current slice.
         if len(self.shapes) > 0:
             self._displayed = np.all(
-                np.abs(self.slice_keys - slice_key) < 0.5, axis=(1, 2)
+                np.abs(self._columns['slice_keys'] - slice_key) < 0.5,
+                axis=(1, 2),
             )
         else:
             self._displayed = np.array([])
@@ -785,9 +1144,12 @@ class ShapeList:
             triangle_ranges = self._mesh_triangles_range_seq(disp_indices)
             vertices_range = self._vertices_range_seq(disp_indices)
 
+        self._displayed_triangles_range = triangle_ranges
+        self._displayed_vertices_range = vertices_range
         self._mesh.displayed_triangles = self._mesh.triangles[
             z_order[triangle_ranges]
         ]
+        self._mesh.displayed_triangles_updates = []
 
         self._update_displayed_triangles_to_shape_index(disp_indices)
 
@@ -884,6 +1246,7 @@ class ShapeList:
             raise TypeError('shape must be subclass of Shape')
 
         if shape_index is None:
+            self._append_columns([shape])
             self.shapes.append(shape)
             self._z_index = np.append(self._z_index, shape.z_index)
 
@@ -896,6 +1259,7 @@ class ShapeList:
         else:
             z_refresh = False
             self.shapes[shape_index] = shape
+            self._update_columns(shape_index)
             self._z_index[shape_index] = shape.z_index
 
             if face_color is None:
@@ -1091,6 +1455,7 @@ class ShapeList:
         self._extend_meshes(face_colors, edge_colors, arrays)
 
         # Update list of shapes
+        self._append_columns(shapes)
         self.shapes.extend(shapes)
 
         if z_refresh:
@@ -1108,16 +1473,59 @@ class ShapeList:
         self._z_order = np.empty(0, dtype=ZOrderDtype)
         self._edge_color = np.empty((0, 4), dtype=ShapeColorDtype)
         self._face_color = np.empty((0, 4), dtype=ShapeColorDtype)
+        self._columns = _shape_columns([], self.ndisplay)
         self._mesh.clear()
         self._update_displayed()
 
+    def _append_columns(self, shapes: Sequence[Shape]) -> None:
+        """Append the columns of shapes added at the end of the list."""
+        columns = _shape_columns(shapes, self.ndisplay)
+        if len(self.shapes) == 0:
+            self._columns = columns
+            return
+        self._columns = typing.cast(
+            ShapeColumnDict,
+            {
+                key: np.concatenate((value, columns[key]))  # type: ignore[literal-required]
+                for key, value in self._columns.items()
+            },
+        )
+
+    def _update_columns(self, index: int) -> bool:
+        """Update the columns of the shape located at index.
+
+        Returns
+        -------
+        bool
+            True if the slice key or the number of vertices or triangles of
+            the shape changed, so that the displayed data must be rebuilt
+            rather than updated in place.
+        """
+        columns = _shape_columns([self.shapes[index]], self.ndisplay)
+        slice_key_changed = not np.array_equal(
+            self._columns['slice_keys'][index], columns['slice_keys'][0]
+        )
+        counts_changed = (
+            self._columns['vertices_counts'][index]
+            != columns['vertices_counts'][0]
+            or self._columns['triangles_counts'][index]
+            != columns['triangles_counts'][0]
+        )
+        for key, value in self._columns.items():
+            value[index] = columns[key][0]  # type: ignore[literal-required]
+        if slice_key_changed:
+            self._clear_cache()
+        else:
+            self._refit_cache(index)
+        return bool(slice_key_changed or counts_changed)
+
     @_batch_dec
     def update(self, index: int) -> None:
         """update shape at index `index`"""
         self._update_vertices(index)
         self._update_mesh_triangles(index)
         self._update_mesh_vertices(index, edge=True, face=True)
-        self._update_displayed()
+        self._update_displayed(index)
 
     def _update_vertices(self, index: int) -> None:
         shape = self.shapes[index]
@@ -1197,6 +1605,8 @@ class ShapeList:
                 self._mesh.triangles[triangles_slice.stop :] += (
                     new_vertices_count - prev_vertices_count
                 )
+                # which are copied in the displayed triangles
+                self._update_displayed()
         else:
             # there are more triangles in the shape than in the mesh
             before_array = self._mesh.triangles[: triangles_slice.start]
@@ -1326,6 +1736,13 @@ class ShapeList:
             for i in indices:
                 del self.shapes[i]
             self._z_index = np.delete(self._z_index, indices)
+            self._columns = typing.cast(
+                ShapeColumnDict,
+                {
+                    key: np.delete(value, indices, axis=0)
+                    for key, value in self._columns.items()
+                },
+            )
             self._update_z_order()
 
         self._clear_cache()
@@ -1347,6 +1764,8 @@ class ShapeList:
             faces and to update the underlying shape vertices
         """
         shape = self.shapes[index]
+        if self._update_columns(index):
+            self._update_displayed()
         if edge and face:
             shape_slice = self._mesh_vertices_slice_available(index)
             current_range = shape_slice.stop - shape_slice.start
@@ -1402,7 +1821,7 @@ class ShapeList:
             )
             self._mesh.vertices_centers[indices] = shape._edge_vertices
             self._mesh.vertices_offsets[indices] = shape._edge_offsets
-            self._update_displayed()
+            self._update_displayed(index)
 
         if face:
             indices = self._mesh_vertices_face_slice(index)
@@ -1410,8 +1829,7 @@ class ShapeList:
             self._mesh.vertices_centers[indices] = shape._face_vertices
             indices = self._vertices_slice(index)
             self._vertices[indices] = shape.data_displayed
-            self._update_displayed()
-        self._clear_cache()
+            self._update_displayed(index)
 
     @_batch_dec
     def _update_z_order(self):
@@ -1475,7 +1893,6 @@ class ShapeList:
             self._edge_color[index] = edge_color
 
         self.update(index)
-        self._update_z_order()
 
     def update_edge_width(self, index, edge_width):
         """Updates the edge width of a single shape located at index.
@@ -1510,7 +1927,7 @@ class ShapeList:
         indices = self._mesh_triangles_edge_slice(index)
         self._mesh.triangles_colors[indices] = self._edge_color[index]
         if update:
-            self._update_displayed()
+            self._update_displayed(index)
 
     @_batch_dec
     def update_edge_colors(
@@ -1527,10 +1944,11 @@ class ShapeList:
             edge_colors_ = repeat(typing.cast(ShapeColor, edge_colors[0]))
         else:
             edge_colors_ = edge_colors
+        indices = list(indices)
         for i, color in zip(indices, edge_colors_, strict=False):
             self.update_edge_color(i, color, update=False)
         if update:
-            self._update_displayed()
+            self._update_displayed(indices)
 
     @_batch_dec
     def update_face_color(
@@ -1552,7 +1970,7 @@ class ShapeList:
         indices = self._mesh_triangles_face_slice(index)
         self._mesh.triangles_colors[indices] = face_color
         if update:
-            self._update_displayed()
+            self._update_displayed(index)
 
     @_batch_dec
     def update_face_colors(
@@ -1570,10 +1988,11 @@ class ShapeList:
         else:
             face_colors_ = face_colors
 
+        indices = list(indices)
         for i, color in zip(indices, face_colors_, strict=False):
             self.update_face_color(i, color, update=False)
         if update:
-            self._update_displayed()
+            self._update_displayed(indices)
 
     def update_dims_order(self, dims_order):
         """Updates dimensions order for all shapes.
@@ -1632,7 +2051,6 @@ class ShapeList:
         """
         self.shapes[index].scale(scale, center=center)
         self.update(index)
-        self._update_z_order()
 
     def rotate(self, index, angle, center=None):
         """Performs a rotation on a single shape located at index
@@ -1677,8 +2095,6 @@ class ShapeList:
         """
         self.shapes[index].transform(transform)
         self.update(index)
-        self._update_z_order()
-        self._clear_cache()
 
     def outline(
         self, indices: int | Sequence[int]
@@ -1818,25 +2234,22 @@ class ShapeList:
         selection_max = np.max(corners, axis=0)
 
         # If the box encompasses all shapes, just get them directly
-        layer_min = np.min(shape_mins, axis=0)
-        layer_max = np.max(shape_maxs, axis=0)
+        tree = self._bounding_boxes_tree
+        layer_min, layer_max = tree.bounds()
         if np.all(selection_min <= layer_min) and np.all(
             selection_max >= layer_max
         ):
             return self._visible_shapes_indices.tolist()
 
         # Get shapes with bounding boxes intersecting the selection box
-        intersects_mask = np.all(shape_maxs >= selection_min, axis=1) & np.all(
-            shape_mins <= selection_max, axis=1
-        )
-
-        intersecting_indices = self._visible_shapes_indices[intersects_mask]
+        positions = tree.query_box(selection_min, selection_max)
 
-        if intersecting_indices.size == 0:
+        if positions.size == 0:
             return []
 
-        shape_mins = shape_mins[intersects_mask]
-        shape_maxs = shape_maxs[intersects_mask]
+        intersecting_indices = self._visible_shapes_indices[positions]
+        shape_mins = shape_mins[positions]
+        shape_maxs = shape_maxs[positions]
 
         shapes_full_in_mask = np.all(
             shape_maxs <= selection_max, axis=1
@@ -1858,17 +2271,9 @@ class ShapeList:
 
     @cached_property
     def _visible_shapes(self) -> list[tuple[int, Shape]]:
-        slice_key = self.slice_key
-        if len(slice_key):
-            return [
-                (i, s)
-                for i, s in enumerate(self.shapes)
-                if (
-                    np.all(s.slice_key[0] <= slice_key)
-                    and np.all(slice_key <= s.slice_key[1])
-                )
-            ]
-        return list(enumerate(self.shapes))
+        return [
+            (i, self.shapes[i]) for i in self._visible_shapes_indices.tolist()
+        ]
 
     @cached_property
     def _bounding_boxes(
@@ -1877,16 +2282,33 @@ class ShapeList:
         np.ndarray[tuple[int, Literal[2, 3]]],
         np.ndarray[tuple[int, Literal[2, 3]]],
     ]:
-        data = np.array([s[1].bounding_box for s in self._visible_shapes])
-        if data.size == 0:
+        if len(self._visible_shapes_indices) == 0:
             return np.empty((0, self.ndisplay)), np.empty((0, self.ndisplay))
+        data = self._columns['bounding_boxes'][self._visible_shapes_indices]
         return data[:, 0], data[:, 1]
 
+    @cached_property
+    def _bounding_boxes_tree(self) -> _BoxTree:
+        """Bounding volume hierarchy of the bounding boxes of visible shapes.
+
+        The indices of the tree are positions in `_visible_shapes_indices`.
+        """
+        return _BoxTree(*self._bounding_boxes)
+
     @cached_property
     def _visible_shapes_indices(
         self,
     ) -> np.ndarray[tuple[int], np.dtype[IndexDtype]]:
-        return np.array([s[0] for s in self._visible_shapes])
+        slice_key = np.asarray(self.slice_key)
+        if len(slice_key) and len(self.shapes):
+            slice_keys = self._columns['slice_keys']
+            visible = np.all(
+                (slice_keys[:, 0] <= slice_key)
+                & (slice_key <= slice_keys[:, 1]),
+                axis=1,
+            )
+            return np.flatnonzero(visible).astype(IndexDtype)
+        return np.arange(len(self.shapes), dtype=IndexDtype)
 
     def inside(self, coord):
         """Determines if any shape at given coord by looking inside triangle
@@ -1905,35 +2327,23 @@ class ShapeList:
         """
         if not self.shapes:
             return None
-        bounding_boxes = self._bounding_boxes
-        in_bbox = np.all(
-            (bounding_boxes[0] <= coord) * (bounding_boxes[1] >= coord),
-            axis=1,
-        )
-        inside_indices = np.flatnonzero(in_bbox)
+        inside_indices = self._bounding_boxes_tree.query_box(coord, coord)
         if inside_indices.size == 0:
             return None
-        try:
-            z_index = [
-                self._visible_shapes[i][1].z_index for i in inside_indices
-            ]
-            pos = np.argsort(z_index)
-            return self._visible_shapes[
-                next(
-                    inside_indices[p]
-                    for p in pos[::-1]
-                    if np.any(
-                        inside_triangles(
-                            self._visible_shapes[inside_indices[p]][
-                                1
-                            ]._all_triangles()
-                            - coord
-                        )
+        shape_indices = self._visible_shapes_indices[inside_indices]
+        pos = np.argsort(self._z_index[shape_indices])
+        return next(
+            (
+                int(shape_indices[p])
+                for p in pos[::-1]
+                if np.any(
+                    inside_triangles(
+                        self.shapes[shape_indices[p]]._all_triangles() - coord
                     )
                 )
-            ][0]
-        except StopIteration:
-            return None
+            ),
+            None,
+        )
 
     def _inside_3d(self, ray_position: np.ndarray, ray_direction: np.ndarray):
         """Determines if any shape is intersected by a ray by looking inside triangle
@@ -1958,14 +2368,27 @@ class ShapeList:
             The point where the ray intersects the mesh face. If there was
             no intersection, returns None.
         """
-        triangles = self._mesh.vertices[self._mesh.displayed_triangles]
-        inside = line_in_triangles_3d(
+        if not self.shapes:
+            return None, None
+        # Only check the triangles of shapes whose bounding box is crossed
+        positions = self._bounding_boxes_tree.query_line(
+            ray_position, ray_direction
+        )
+        if positions.size == 0:
+            return None, None
+        candidates, candidates_shapes = self._displayed_triangles_rows(
+            np.sort(self._visible_shapes_indices[positions])
+        )
+        triangles = self._mesh.vertices[
+            self._mesh.displayed_triangles[candidates]
+        ]
+        intersected = line_in_triangles_3d(
             line_point=ray_position,
             line_direction=ray_direction,
             triangles=triangles,
         )
-        # intersected_shapes = self._mesh.displayed_triangles_index[inside, 0]
-        if not np.any(inside):
+        inside = candidates[intersected]
+        if inside.size == 0:
             return None, None
 
         intersection_points = self._triangle_intersection(
@@ -1976,9 +2399,7 @@ class ShapeList:
         start_to_intersection = intersection_points - ray_position
         distances = np.linalg.norm(start_to_intersection, axis=1)
         closest_shape_index = np.argmin(distances)
-        shape = self._mesh.displayed_triangles_to_shape_index[inside][
-            closest_shape_index
-        ]
+        shape = candidates_shapes[intersected][closest_shape_index]
         intersection = intersection_points[closest_shape_index]
         return shape, intersection
 
@@ -2008,8 +2429,9 @@ class ShapeList:
             (n x 3) array of the intersection of the ray with each of the specified shapes in layer coordinates.
             Only the 3 displayed dimensions are provided.
         """
-        triangles = self._mesh.vertices[self._mesh.displayed_triangles]
-        intersected_triangles = triangles[triangle_indices]
+        intersected_triangles = self._mesh.vertices[
+            self._mesh.displayed_triangles[triangle_indices]
+        ]
         intersection_points = intersect_line_with_triangles(
             line_point=ray_position,
             line_direction=ray_direction,
@@ -2017,7 +2439,9 @@ class ShapeList:
         )
         return intersection_points
 
-    def to_masks(self, mask_shape=None, zoom_factor=1, offset=(0, 0)):
+    def to_masks(
+        self, mask_shape=None, zoom_factor=1, offset=(0, 0), sparse=False
+    ):
         """Returns N binary masks, one for each shape, embedded in an array of
         shape `mask_shape`.
 
@@ -2032,31 +2456,65 @@ class ShapeList:
         offset : 2-tuple
             Offset subtracted from coordinates before multiplying by the
             zoom_factor. Used for putting negative coordinates into the mask.
+        sparse : bool
+            If True, return the coordinates of the `True` points of the masks
+            instead of the masks, which takes memory proportional to the area
+            of the shapes rather than to the size of the masks.
 
         Returns
         -------
-        masks : (N, M, P) np.ndarray
+        masks : (N, M, P) np.ndarray or tuple of np.ndarray
             Array where there is one binary mask of shape MxP for each of
-            N shapes
+            N shapes. If `sparse` is True, a tuple with the shape index and
+            the mask coordinates of each `True` point instead, like the
+            result of `np.nonzero` on the masks.
         """
         if mask_shape is None:
             mask_shape = self.displayed_vertices.max(axis=0).astype('int')
+        mask_shape = tuple(np.asarray(mask_shape, dtype=int))
 
-        masks = np.array(
-            [
-                s.to_mask(mask_shape, zoom_factor=zoom_factor, offset=offset)
-                for s in self.shapes
-            ]
+        if not sparse:
+            masks = np.zeros((len(self.shapes), *mask_shape), dtype=bool)
+            for i, shape in enumerate(self.shapes):
+                coords = shape.to_mask_coords(
+                    mask_shape, zoom_factor=zoom_factor, offset=offset
+                )
+                masks[(i, *coords)] = True
+            return masks
+
+        # Paths can visit the same point more than once, so the points of
+        # each shape are deduplicated (and sorted) through their flat index.
+        flat_coords = [
+            np.unique(
+                np.ravel_multi_index(
+                    s.to_mask_coords(
+                        mask_shape, zoom_factor=zoom_factor, offset=offset
+                    ),
+                    mask_shape,
+                )
+            )
+            for s in self.shapes
+        ]
+        counts = [len(c) for c in flat_coords]
+        shape_indices = np.repeat(np.arange(len(self.shapes)), counts)
+        flat = (
+            np.concatenate(flat_coords)
+            if flat_coords
+            else np.empty(0, dtype=np.intp)
         )
+        return (shape_indices, *np.unravel_index(flat, mask_shape))
 
-        return masks
-
-    def to_labels(self, labels_shape=None, zoom_factor=1, offset=(0, 0)):
+    def to_labels(
+        self, labels_shape=None, zoom_factor=1, offset=(0, 0), out=None
+    ):
         """Returns a integer labels image, where each shape is embedded in an
         array of shape labels_shape with the value of the index + 1
         corresponding to it, and 0 for background. For overlapping shapes
         z-ordering will be respected.
 
+        Each shape is only rasterized within its bounding box, so this takes
+        time proportional to the total area of the shapes.
+
         Parameters
         ----------
         labels_shape : np.ndarray | tuple | None
@@ -2068,25 +2526,54 @@ class ShapeList:
         offset : 2-tuple
             Offset subtracted from coordinates before multiplying by the
             zoom_factor. Used for putting negative coordinates into the mask.
+        out : array-like | None
+            Array to write the labels into, instead of creating a new array,
+            in which case `labels_shape` is ignored. It can be any array
+            supporting reading and writing with slices, such as a zarr array.
+            Chunked arrays are written one chunk at a time. Points outside of
+            all the shapes are left unchanged.
 
         Returns
         -------
         labels : np.ndarray
             MxP integer array where each value is either 0 for background or an
             integer up to N for points inside the corresponding shape.
+            If `out` is given, it is returned.
         """
-        if labels_shape is None:
+        if out is not None:
+            labels_shape = out.shape
+        elif labels_shape is None:
             labels_shape = self.displayed_vertices.max(axis=0).astype(int)
-
-        labels = np.zeros(labels_shape, dtype=int)
-
-        for ind in self._z_order[::-1]:
-            mask = self.shapes[ind].to_mask(
-                labels_shape, zoom_factor=zoom_factor, offset=offset
+        labels_shape = tuple(np.asarray(labels_shape, dtype=int))
+
+        shapes_coords = (
+            (
+                ind + 1,
+                self.shapes[ind].to_mask_coords(
+                    labels_shape, zoom_factor=zoom_factor, offset=offset
+                ),
             )
-            labels[mask] = ind + 1
+            for ind in self._z_order[::-1]
+        )
 
-        return labels
+        if out is None:
+            labels = np.zeros(labels_shape, dtype=int)
+            for label, coords in shapes_coords:
+                labels[coords] = label
+            return labels
+
+        chunk_shape = get_chunk_shape(out) or labels_shape
+        batch: list[tuple[int, tuple[np.ndarray, ...]]] = []
+        batch_size = 0
+        for label, coords in shapes_coords:
+            batch.append((label, coords))
+            batch_size += len(coords[0])
+            if batch_size >= _RASTERIZE_BATCH_SIZE:
+                _write_labels_by_chunk(out, chunk_shape, batch)
+                batch = []
+                batch_size = 0
+        _write_labels_by_chunk(out, chunk_shape, batch)
+        return out
 
     def to_colors(
         self, colors_shape=None, zoom_factor=1, offset=(0, 0), max_shapes=None
@@ -2137,18 +2624,43 @@ class ShapeList:
             z_order_in_view = z_order_in_view[-max_shapes:]
 
         for ind in z_order_in_view:
-            mask = self.shapes[ind].to_mask(
+            coords = self.shapes[ind].to_mask_coords(
                 colors_shape, zoom_factor=zoom_factor, offset=offset
             )
             if type(self.shapes[ind]) in [Path, Line]:
                 col = self._edge_color[ind]
             else:
                 col = self._face_color[ind]
-            colors[mask, :] = col
+            colors[coords] = col
 
         return colors
 
     def _clear_cache(self):
         self.__dict__.pop('_bounding_boxes', None)
+        self.__dict__.pop('_bounding_boxes_tree', None)
         self.__dict__.pop('_visible_shapes', None)
         self.__dict__.pop('_visible_shapes_indices', None)
+
+    def _refit_cache(self, index: int) -> None:
+        """Update the cached bounding boxes after the shape at index changed.
+
+        The shape must still be in the same slices, so that the visible
+        shapes are unchanged.
+        """
+        self.__dict__.pop('_visible_shapes', None)
+        if '_bounding_boxes' not in self.__dict__:
+            return
+        visible = self._visible_shapes_indices
+        position = np.searchsorted(visible, index)
+        if position == len(visible) or visible[position] != index:
+            return
+        shape_mins, shape_maxs = self._bounding_boxes
+        shape_mins[position], shape_maxs[position] = self._columns[
+            'bounding_boxes'
+        ][index]
+        if '_bounding_boxes_tree' in self.__dict__:
+            self._bounding_boxes_tree.refit(
+                [position],
+                shape_mins[position : position + 1],
+                shape_maxs[position : position + 1],
+            )
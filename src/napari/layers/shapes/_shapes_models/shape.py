@@ -15,8 +15,8 @@ from napari.layers.shapes._shapes_utils import (
     _save_failed_triangulation,
     find_planar_axis,
     is_collinear,
-    path_to_mask,
-    poly_to_mask,
+    path_to_coords,
+    poly_to_coords,
     triangulate_edge,
     triangulate_face,
     triangulate_face_and_edges,
@@ -28,7 +28,6 @@ from napari.layers.shapes.shape_types import (
     CoordinateArray,
     TriangleArray,
 )
-from napari.utils.misc import argsort
 from napari.utils.triangulation_backend import TriangulationBackend
 
 try:
@@ -47,6 +46,33 @@ except ImportError:
 TRIANGULATION_BACKEND = TriangulationBackend.pure_python
 
 
+def compiled_triangulation_backend() -> TriangulationBackend | None:
+    """Return the compiled backend used to triangulate new shapes.
+
+    Returns
+    -------
+    TriangulationBackend or None
+        The bermuda, partsegcore or triangle backend, if selected by
+        ``TRIANGULATION_BACKEND`` and installed, or None if shapes are
+        triangulated in Python or numba.
+    """
+    candidates = (
+        (TriangulationBackend.bermuda, bermuda is not None),
+        (
+            TriangulationBackend.partsegcore,
+            partsegcore_triangulate is not None,
+        ),
+        (TriangulationBackend.triangle, 'triangle' in sys.modules),
+    )
+    for backend, available in candidates:
+        if available and TRIANGULATION_BACKEND in {
+            backend,
+            TriangulationBackend.fastest_available,
+        }:
+            return backend
+    return None
+
+
 class Shape(ABC):
     """Base class for a single shape
 
@@ -160,34 +186,14 @@ class Shape(ABC):
         self._bounding_box = np.empty((0, self.ndisplay))
 
     def __new__(cls, *args, **kwargs):
-        if (
-            TRIANGULATION_BACKEND
-            in {
-                TriangulationBackend.bermuda,
-                TriangulationBackend.fastest_available,
-            }
-            and bermuda is not None
-        ):
+        backend = compiled_triangulation_backend()
+        if backend == TriangulationBackend.bermuda:
             cls._set_meshes = cls._set_meshes_compiled_bermuda
             cls._triangulate_edge = cls._triangulate_edge_bermuda
-        elif (
-            TRIANGULATION_BACKEND
-            in {
-                TriangulationBackend.partsegcore,
-                TriangulationBackend.fastest_available,
-            }
-            and partsegcore_triangulate is not None
-        ):
+        elif backend == TriangulationBackend.partsegcore:
             cls._set_meshes = cls._set_meshes_compiled_partseg
             cls._triangulate_edge = cls._triangulate_edge_partseg
-        elif (
-            TRIANGULATION_BACKEND
-            in {
-                TriangulationBackend.triangle,
-                TriangulationBackend.fastest_available,
-            }
-            and 'triangle' in sys.modules
-        ):
+        elif backend == TriangulationBackend.triangle:
             cls._set_meshes = cls._set_meshes_triangle
         else:
             cls._set_meshes = cls._set_meshes_py
@@ -808,7 +814,37 @@ class Shape(ABC):
             mask_shape = np.round(self.data_displayed.max(axis=0)).astype(
                 'int'
             )
+        mask = np.zeros(mask_shape, dtype=bool)
+        mask[self.to_mask_coords(mask_shape, zoom_factor, offset)] = True
+        return mask
+
+    def to_mask_coords(
+        self, mask_shape, zoom_factor=1, offset=(0, 0)
+    ) -> tuple[npt.NDArray[np.intp], ...]:
+        """Return the coordinates of the `True` points of `to_mask`.
+
+        Only the points within the bounding box of the shape are visited, so
+        this is much faster than `to_mask` for shapes that are small compared
+        to the mask.
 
+        Parameters
+        ----------
+        mask_shape : (D,) array
+            Shape of the mask, either 2D or with the dimensionality of the
+            shape.
+        zoom_factor : float
+            Premultiplier applied to coordinates before generating mask. Used
+            for generating as downsampled mask.
+        offset : 2-tuple
+            Offset subtracted from coordinates before multiplying by the
+            zoom_factor. Used for putting negative coordinates into the mask.
+
+        Returns
+        -------
+        coords : tuple of np.ndarray
+            The coordinates of the points along each axis of the mask, which
+            can be used to index it.
+        """
         if len(mask_shape) == 2:
             embedded = False
             shape_plane = mask_shape
@@ -828,32 +864,45 @@ class Shape(ABC):
         data = data[:, -len(shape_plane) :]
 
         if self._filled:
-            mask_p = poly_to_mask(shape_plane, (data - offset) * zoom_factor)
-        else:
-            mask_p = path_to_mask(shape_plane, (data - offset) * zoom_factor)
-
-        # If the mask is to be embedded in a larger array, compute array
-        # and embed as a slice.
-        if embedded:
-            mask = np.zeros(mask_shape, dtype=bool)
-            slice_key: list[int | slice] = [0] * len(mask_shape)
-            for i in range(len(mask_shape)):
-                if i in self.dims_displayed:
-                    slice_key[i] = slice(None)
-                elif self.slice_key is not None:
-                    slice_key[i] = slice(
-                        self.slice_key[0, i], self.slice_key[1, i] + 1
-                    )
-                else:
-                    raise RuntimeError(
-                        'Internal error: self.slice_key is None'
-                    )
-            displayed_order = argsort(self.dims_displayed)
-            mask[tuple(slice_key)] = mask_p.transpose(displayed_order)
+            coords_p = poly_to_coords(
+                shape_plane, (data - offset) * zoom_factor
+            )
         else:
-            mask = mask_p
+            coords_p = path_to_coords(
+                shape_plane, (data - offset) * zoom_factor
+            )
 
-        return mask
+        if not embedded:
+            return coords_p
+
+        # Embed the plane coordinates in the larger array, repeating them
+        # for every index of the slice of the non-displayed dimensions.
+        if self.slice_key is None:
+            raise RuntimeError('Internal error: self.slice_key is None')
+        n_points = len(coords_p[0])
+        axis_ranges = [
+            np.arange(
+                *slice(self.slice_key[0, i], self.slice_key[1, i] + 1).indices(
+                    mask_shape[i]
+                )
+            )
+            for i in range(len(mask_shape))
+            if i not in self.dims_displayed
+        ]
+        grid = [
+            axis_range.ravel()
+            for axis_range in np.meshgrid(*axis_ranges, indexing='ij')
+        ]
+        n_slices = len(grid[0]) if grid else 1
+        coords: list[npt.NDArray[np.intp]] = []
+        not_displayed = iter(grid)
+        for i in range(len(mask_shape)):
+            if i in self.dims_displayed:
+                plane_axis = self.dims_displayed.index(i)
+                coords.append(np.tile(coords_p[plane_axis], n_slices))
+            else:
+                coords.append(np.repeat(next(not_displayed), n_points))
+        return tuple(coords)
 
     def _clean_cache(self) -> None:
         if 'dims_displayed' in self.__dict__:
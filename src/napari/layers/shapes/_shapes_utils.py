@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, overload
 
 import numpy as np
 from skimage import measure
-from skimage.draw import line, polygon2mask
+from skimage.draw import line, polygon as draw_polygon
 from vispy.geometry import Triangulation
 from vispy.visuals.tube import _frenet_frames
 
@@ -1051,6 +1051,41 @@ def generate_tube_meshes(path, closed=False, tube_points=10):
     return centers, offsets, triangles
 
 
+def path_to_coords(
+    mask_shape: npt.ArrayLike, vertices: npt.NDArray
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """Return the coordinates of the points lying along each edge of a path.
+
+    Parameters
+    ----------
+    mask_shape : array (2,)
+        Shape of the mask in which the path is drawn.
+    vertices : array (N, 2)
+        Vertices of the path.
+
+    Returns
+    -------
+    rows, cols : np.ndarray
+        Coordinates of the points along the path. Points shared by
+        consecutive edges are repeated.
+    """
+    mask_shape = np.asarray(mask_shape, dtype=int)
+
+    vertices = np.round(np.clip(vertices, 0, mask_shape - 1)).astype(int)
+
+    # remove identical, consecutive vertices
+    duplicates = np.all(np.diff(vertices, axis=0) == 0, axis=-1)
+    duplicates = np.concatenate(([False], duplicates))
+    vertices = vertices[~duplicates]
+
+    segments = [line(*v1, *v2) for v1, v2 in itertools.pairwise(vertices)]
+    if not segments:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+    rows = np.concatenate([ii for ii, _ in segments]).astype(np.intp)
+    cols = np.concatenate([jj for _, jj in segments]).astype(np.intp)
+    return rows, cols
+
+
 def path_to_mask(
     mask_shape: npt.NDArray, vertices: npt.NDArray
 ) -> npt.NDArray[np.bool_]:
@@ -1070,25 +1105,37 @@ def path_to_mask(
         Boolean array with `True` for points along the path
 
     """
-    mask_shape = np.asarray(mask_shape, dtype=int)
-    mask = np.zeros(mask_shape, dtype=bool)
+    mask = np.zeros(np.asarray(mask_shape, dtype=int), dtype=bool)
+    mask[path_to_coords(mask_shape, vertices)] = 1
+    return mask
 
-    vertices = np.round(np.clip(vertices, 0, mask_shape - 1)).astype(int)
 
-    # remove identical, consecutive vertices
-    duplicates = np.all(np.diff(vertices, axis=0) == 0, axis=-1)
-    duplicates = np.concatenate(([False], duplicates))
-    vertices = vertices[~duplicates]
+def poly_to_coords(
+    mask_shape: npt.ArrayLike, vertices: npt.ArrayLike
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """Return the coordinates of the points lying inside a polygon.
 
-    iis, jjs = [], []
-    for v1, v2 in itertools.pairwise(vertices):
-        ii, jj = line(*v1, *v2)
-        iis.extend(ii.tolist())
-        jjs.extend(jj.tolist())
+    Only the points within the bounding box of the polygon are tested, so
+    this takes time proportional to the area of the polygon rather than to
+    the size of the mask.
 
-    mask[iis, jjs] = 1
+    Parameters
+    ----------
+    mask_shape : np.ndarray | tuple
+        1x2 array of shape of the mask in which the polygon is drawn.
+        Points outside of the mask are left out.
+    vertices : np.ndarray
+        Nx2 array of the vertices of the polygon.
 
-    return mask
+    Returns
+    -------
+    rows, cols : np.ndarray
+        Coordinates of the points inside the polygon.
+    """
+    vertices = np.asarray(vertices)
+    return draw_polygon(
+        vertices[:, 0], vertices[:, 1], tuple(np.asarray(mask_shape, int))
+    )
 
 
 def poly_to_mask(
@@ -1110,7 +1157,9 @@ def poly_to_mask(
     mask : np.ndarray
         Boolean array with `True` for points inside the polygon
     """
-    return polygon2mask(mask_shape, vertices)
+    mask = np.zeros(tuple(np.asarray(mask_shape, int)), dtype=bool)
+    mask[poly_to_coords(mask_shape, vertices)] = True
+    return mask
 
 
 def grid_points_in_poly(shape, vertices):
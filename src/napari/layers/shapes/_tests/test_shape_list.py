@@ -274,6 +274,196 @@ def test_remove_shape(shape_li):
     assert shape_li._vertices_index.shape[0] == 4
 
 
+def _assert_columns_match_shapes(shape_list):
+    shapes = shape_list.shapes
+    assert shape_list.shape_types == [s.name for s in shapes]
+    assert shape_list.edge_widths == [s.edge_width for s in shapes]
+    assert shape_list.z_indices == [s.z_index for s in shapes]
+    npt.assert_array_equal(
+        shape_list.slice_keys, np.array([s.slice_key for s in shapes])
+    )
+    npt.assert_array_equal(
+        shape_list._columns['bounding_boxes'],
+        np.array([s.bounding_box for s in shapes]),
+    )
+    npt.assert_array_equal(
+        shape_list._columns['triangles_counts'],
+        [s.triangles_count for s in shapes],
+    )
+
+
+def test_columns_follow_edits(shape_li_3d):
+    """Test that the per-shape columns stay in sync with the shapes."""
+    _assert_columns_match_shapes(shape_li_3d)
+
+    shape_li_3d.add(
+        Path(np.array([[2, 0, 0], [2, 5, 5], [2, 0, 10]]), edge_width=3)
+    )
+    shape_li_3d.edit(
+        0, np.array([[1, 5, 5], [1, 15, 5], [1, 10, 15]]), new_type=Polygon
+    )
+    shape_li_3d.update_edge_width(1, 4)
+    shape_li_3d.update_z_index(2, 5)
+    shape_li_3d.shift(3, np.array([2, 2]))
+    _assert_columns_match_shapes(shape_li_3d)
+
+    shape_li_3d.remove(1)
+    _assert_columns_match_shapes(shape_li_3d)
+
+    # slice 1 now holds the edited polygon and the shifted rectangle,
+    # which are not contiguous in the list
+    shape_li_3d.slice_key = (1,)
+    npt.assert_array_equal(shape_li_3d._visible_shapes_indices, [0, 2])
+    npt.assert_array_equal(
+        np.unique(shape_li_3d._mesh.displayed_triangles_to_shape_index),
+        [0, 2],
+    )
+    assert shape_li_3d.inside((12, 10)) == 0
+    assert shape_li_3d.inside((-5, -5)) == 2
+    assert shape_li_3d.inside((25, 25)) is None
+
+    shape_li_3d.remove_all()
+    assert shape_li_3d.shape_types == []
+    assert len(shape_li_3d.slice_keys) == 0
+
+
+def test_picking_follows_edits():
+    """Test that picking and box selection stay correct after edits."""
+    shapes = [
+        Rectangle(np.array([[i, j], [i + 1, j + 1]]) * 3)
+        for i in range(20)
+        for j in range(20)
+    ]
+    shape_list = ShapeList()
+    shape_list.add(shapes)
+    assert shape_list.inside((1.5, 1.5)) == 0
+    assert shape_list.inside((4.5, 1.5)) == 20
+    assert shape_list.shapes_in_box(np.array([[0, 0], [4, 4]])) == [
+        0,
+        1,
+        20,
+        21,
+    ]
+
+    # the tree is refitted when a shape moves within the same slice
+    tree = shape_list._bounding_boxes_tree
+    shape_list.shift(0, np.array([100, 100]))
+    assert shape_list._bounding_boxes_tree is tree
+    assert shape_list.inside((1.5, 1.5)) is None
+    assert shape_list.inside((101.5, 101.5)) == 0
+    assert shape_list.shapes_in_box(np.array([[0, 0], [4, 4]])) == [
+        1,
+        20,
+        21,
+    ]
+
+    # and rebuilt when shapes are added or removed
+    shape_list.remove(0)
+    assert shape_list.inside((101.5, 101.5)) is None
+    assert shape_list.inside((1.5, 4.5)) == 0
+
+
+def test_inside_3d():
+    """Test ray picking of shapes in 3D."""
+    shape_list = ShapeList(ndisplay=3)
+    shape_list.add(
+        [
+            Rectangle(
+                np.array([[z, 0, 0], [z, 0, 10], [z, 10, 10], [z, 10, 0]]),
+                ndisplay=3,
+            )
+            for z in range(5)
+        ]
+        + [
+            Rectangle(
+                np.array([[0, 20, 20], [0, 20, 30], [0, 30, 30], [0, 30, 20]]),
+                ndisplay=3,
+            )
+        ]
+    )
+    shape, intersection = shape_list._inside_3d(
+        np.array([-10, 5, 5]), np.array([1, 0, 0])
+    )
+    assert shape == 0
+    npt.assert_array_almost_equal(intersection, [0, 5, 5])
+    shape, _ = shape_list._inside_3d(
+        np.array([10, 25, 25]), np.array([-1, 0, 0])
+    )
+    assert shape == 5
+    assert shape_list._inside_3d(
+        np.array([0, 15, 15]), np.array([1, 0, 0])
+    ) == (None, None)
+
+    # the triangles of the candidate shapes are found from their ranges,
+    # also when the z order does not follow the order of the shapes
+    shape_list.update_z_index(1, 10)
+    shape_list.update_z_index(3, -1)
+    triangles_shapes = np.repeat(
+        np.arange(len(shape_list.shapes)),
+        np.diff(shape_list._mesh.triangles_index),
+    )
+    displayed_shapes = triangles_shapes[
+        shape_list._mesh.triangles_z_order[
+            shape_list._displayed_triangles_range
+        ]
+    ]
+    for indices in ([0], [1, 3], [2, 4, 5]):
+        rows, shapes = shape_list._displayed_triangles_rows(np.array(indices))
+        npt.assert_array_equal(
+            rows, np.flatnonzero(np.isin(displayed_shapes, indices))
+        )
+        npt.assert_array_equal(shapes, displayed_shapes[rows])
+    shape, _ = shape_list._inside_3d(
+        np.array([10, 5, 5]), np.array([-1, 0, 0])
+    )
+    assert shape == 4
+    shape, _ = shape_list._inside_3d(
+        np.array([-10, 5, 5]), np.array([1, 0, 0])
+    )
+    assert shape == 0
+
+
+def _displayed_arrays(shape_list):
+    return (
+        shape_list._mesh.displayed_triangles.copy(),
+        shape_list._mesh.displayed_triangles_colors.copy(),
+        shape_list.displayed_vertices.copy(),
+    )
+
+
+def test_edits_update_displayed_in_place(shape_li_3d):
+    """Test that edits that keep the mesh layout patch the displayed data."""
+    shape_li_3d.update_z_index(3, 2)
+    shape_li_3d.slice_key = (1,)
+    displayed_triangles = shape_li_3d._mesh.displayed_triangles
+
+    shape_li_3d.shift(3, np.array([2, 2]))
+    shape_li_3d.update_edge_width(1, 3)
+    shape_li_3d.update_face_color(3, np.array([1, 0, 0, 1]))
+    shape_li_3d.update_edge_colors([1, 3], np.array([0, 0, 1, 1]))
+    shape_li_3d.edit(1, np.array([[1, 5, 0], [1, 5, 5], [1, 0, 5], [1, 0, 0]]))
+    # shapes that are not displayed are not patched
+    shape_li_3d.shift(0, np.array([1, 1]))
+    assert shape_li_3d._mesh.displayed_triangles is displayed_triangles
+    assert len(shape_li_3d._mesh.displayed_triangles_updates) == 5
+
+    patched = _displayed_arrays(shape_li_3d)
+    with shape_li_3d.batched_updates():
+        shape_li_3d._update_displayed()
+    assert shape_li_3d._mesh.displayed_triangles_updates == []
+    for patched_array, rebuilt_array in zip(
+        patched, _displayed_arrays(shape_li_3d), strict=True
+    ):
+        npt.assert_array_equal(patched_array, rebuilt_array)
+
+    # changing the number of vertices rebuilds the displayed data
+    shape_li_3d.edit(
+        1, np.array([[1, 5, 0], [1, 5, 5], [1, 0, 5]]), new_type=Polygon
+    )
+    assert shape_li_3d._mesh.displayed_triangles is not displayed_triangles
+    assert len(shape_li_3d.displayed_vertices) == 7
+
+
 def test_edit_shape_simple(shape_li):
     """Test editing shapes in ShapeList."""
     initial_shape = shape_li.shapes[0]
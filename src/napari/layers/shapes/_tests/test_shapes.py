@@ -15,8 +15,12 @@ from napari.components import ViewerModel
 from napari.components.dims import Dims
 from napari.layers import Shapes
 from napari.layers.base._base_constants import ActionType
+from napari.layers.shapes._accelerated_triangulate_dispatch import (
+    triangulate_batch,
+)
 from napari.layers.utils._text_constants import Anchor
 from napari.layers.utils.color_encoding import ConstantColorEncoding
+from napari.settings import get_settings
 from napari.utils._test_utils import (
     validate_all_params_in_docstring,
     validate_kwargs_sorted,
@@ -2540,6 +2544,39 @@ def test_to_labels_3D():
     assert np.array_equal(np.unique(labels), [0, 1, 2, 3])
 
 
+def test_to_masks_sparse():
+    """Test that sparse masks have the coordinates of the dense masks."""
+    data = [
+        np.array([[2, 2], [2, 12], [12, 12], [12, 2]]),
+        np.array([[5, 0], [8, 15], [18, 3]]),
+    ]
+    layer = Shapes(data, shape_type=['polygon', 'path'])
+    masks = layer.to_masks(mask_shape=(20, 20))
+    sparse_masks = layer.to_masks(mask_shape=(20, 20), sparse=True)
+    assert len(sparse_masks) == 3
+    for sparse_coords, coords in zip(
+        sparse_masks, np.nonzero(masks), strict=True
+    ):
+        np.testing.assert_array_equal(sparse_coords, coords)
+
+
+def test_to_labels_chunked_out():
+    """Test writing labels into a chunked array, respecting z-order."""
+    zarr = pytest.importorskip('zarr')
+    data = [
+        [[0, 10, 10], [0, 10, 50], [0, 50, 50], [0, 50, 10]],
+        [[0, 30, 30], [0, 30, 70], [0, 70, 70], [0, 70, 30]],
+        [[2, 5, 40], [2, 5, 60], [2, 25, 60], [2, 25, 40]],
+    ]
+    layer = Shapes(np.array(data), shape_type='polygon', z_index=[1, 0, 0])
+    labels_shape = (3, 80, 80)
+    expected = layer.to_labels(labels_shape=labels_shape)
+
+    out = zarr.zeros(labels_shape, chunks=(1, 16, 16), dtype=np.uint16)
+    assert layer.to_labels(out=out) is out
+    np.testing.assert_array_equal(out[:], expected)
+
+
 def test_add_single_shape_consistent_properties():
     """Test adding a single shape ensures correct number of added properties"""
     data = [
@@ -2766,3 +2803,50 @@ def test_default_features_not_changed_when_selected_data_changes():
     np.testing.assert_equal(
         shape.feature_defaults.values[0][1], origin_values[0][1]
     )
+
+
+def test_triangulate_batch_keeps_order():
+    items = list(range(1000))
+    assert triangulate_batch(lambda x: x * 2, items, workers=4) == [
+        x * 2 for x in items
+    ]
+    assert triangulate_batch(lambda x: x, items[:10], workers=4) == list(
+        range(10)
+    )
+
+
+def test_parallel_triangulation_matches_serial():
+    """Test that building shapes in multiple threads gives the same mesh."""
+    pytest.importorskip('bermuda')
+    settings = get_settings().experimental
+    prev_backend = settings.triangulation_backend
+    settings.triangulation_backend = 'bermuda'
+    try:
+        rng = np.random.default_rng(0)
+        angles = np.linspace(0, 2 * np.pi, 12, endpoint=False)
+        data = [
+            center
+            + rng.uniform(1, 3, (12, 1))
+            * np.stack([np.cos(angles), np.sin(angles)], axis=1)
+            for center in rng.uniform(0, 100, (300, 2))
+        ]
+        settings.triangulation_workers = 4
+        parallel = Shapes(data, shape_type='polygon')
+        settings.triangulation_workers = 1
+        serial = Shapes(data, shape_type='polygon')
+    finally:
+        settings.triangulation_backend = prev_backend
+
+    # the order of the edge vertices from bermuda is not deterministic,
+    # so only compare the sets of edge vertices
+    for parallel_shape, serial_shape in zip(
+        parallel._data_view.shapes, serial._data_view.shapes, strict=True
+    ):
+        np.testing.assert_array_equal(parallel_shape.data, serial_shape.data)
+        np.testing.assert_array_equal(
+            parallel_shape._face_triangles, serial_shape._face_triangles
+        )
+        np.testing.assert_array_equal(
+            np.unique(parallel_shape._edge_vertices, axis=0),
+            np.unique(serial_shape._edge_vertices, axis=0),
+        )
@@ -18,6 +18,7 @@ from napari.layers.base._base_mouse_bindings import (
     transform_with_box,
 )
 from napari.layers.shapes._accelerated_triangulate_dispatch import (
+    triangulate_batch,
     warmup_numba_cache,
 )
 from napari.layers.shapes._shape_list import ShapeList
@@ -28,6 +29,9 @@ from napari.layers.shapes._shapes_constants import (
     ShapeType,
     shape_classes,
 )
+from napari.layers.shapes._shapes_models.shape import (
+    compiled_triangulation_backend,
+)
 from napari.layers.shapes._shapes_mouse_bindings import (
     add_ellipse,
     add_line,
@@ -866,9 +870,7 @@ class Shapes(Layer):
         if len(self.data) == 0:
             return np.full((2, self.ndim), np.nan)
 
-        bounding_boxes = np.array(
-            [d._bounding_box for d in self._data_view.shapes]
-        )
+        bounding_boxes = self._data_view._columns['data_bounding_boxes']
         mins = np.min(bounding_boxes[:, 0, :], axis=0)
         maxs = np.max(bounding_boxes[:, 1, :], axis=0)
         return np.vstack([mins, maxs])
@@ -1278,12 +1280,9 @@ class Shapes(Layer):
                     self.current_edge_color = unique_edge_color
 
             unique_edge_width = _unique_element(
-                np.array(
-                    [
-                        self._data_view.shapes[i].edge_width
-                        for i in self.selected_data
-                    ]
-                )
+                self._data_view._columns['edge_widths'][
+                    list(self.selected_data)
+                ]
             )
             if unique_edge_width is not None:
                 with self.block_update_properties():
@@ -2329,24 +2328,29 @@ class Shapes(Layer):
         """Build new shapes and add them to the _data_view"""
 
         shape_inputs = tuple(shape_inputs)
+        dims_order = self._slice_input.order
+        ndisplay = self._slice_input.ndisplay
 
-        # build all shapes
-        sh_inp = tuple(
-            (
-                shape_classes[st](
-                    d,
-                    edge_width=ew,
-                    z_index=z,
-                    dims_order=self._slice_input.order,
-                    ndisplay=self._slice_input.ndisplay,
-                ),
-                ec,
-                fc,
+        def build_shape(shape_input):
+            d, st, ew, _, _, z = shape_input
+            return shape_classes[st](
+                d,
+                edge_width=ew,
+                z_index=z,
+                dims_order=dims_order,
+                ndisplay=ndisplay,
             )
-            for d, st, ew, ec, fc, z in shape_inputs
-        )
 
-        shapes, edge_colors, face_colors = tuple(zip(*sh_inp, strict=False))
+        # build all shapes, triangulating them in parallel if the backend
+        # triangulates in compiled code
+        workers = (
+            get_settings().experimental.triangulation_workers
+            if compiled_triangulation_backend() is not None
+            else 1
+        )
+        shapes = triangulate_batch(build_shape, shape_inputs, workers)
+        edge_colors = tuple(shape_input[3] for shape_input in shape_inputs)
+        face_colors = tuple(shape_input[4] for shape_input in shape_inputs)
 
         # Add all shapes at once (faster than adding them one by one)
         data_view.add(
@@ -3235,7 +3239,7 @@ class Shapes(Layer):
             self.move_to_front()
             self.events.features()
 
-    def to_masks(self, mask_shape=None):
+    def to_masks(self, mask_shape=None, *, sparse=False):
         """Return an array of binary masks, one for each shape.
 
         Parameters
@@ -3243,11 +3247,17 @@ class Shapes(Layer):
         mask_shape : np.ndarray | tuple | None
             tuple defining shape of mask to be generated. If non specified,
             takes the max of all the vertices
+        sparse : bool
+            If True, return the coordinates of the `True` points of the masks
+            instead of the masks, which is much smaller for many shapes.
 
         Returns
         -------
-        masks : np.ndarray
-            Array where there is one binary mask for each shape
+        masks : np.ndarray or tuple of np.ndarray
+            Array where there is one binary mask for each shape. If `sparse`
+            is True, a tuple with the shape index and the mask coordinates of
+            each `True` point instead, like the result of `np.nonzero` on the
+            masks.
         """
         if mask_shape is None:
             # See https://github.com/napari/napari/issues/2778
@@ -3257,11 +3267,11 @@ class Shapes(Layer):
             mask_shape = np.round(self._extent_data[1]) + 1
 
         mask_shape = np.ceil(mask_shape).astype('int')
-        masks = self._data_view.to_masks(mask_shape=mask_shape)
+        masks = self._data_view.to_masks(mask_shape=mask_shape, sparse=sparse)
 
         return masks
 
-    def to_labels(self, labels_shape=None):
+    def to_labels(self, labels_shape=None, *, out=None):
         """Return an integer labels image.
 
         Parameters
@@ -3269,14 +3279,24 @@ class Shapes(Layer):
         labels_shape : np.ndarray | tuple | None
             Tuple defining shape of labels image to be generated. If non
             specified, takes the max of all the vertiecs
+        out : array-like | None
+            Array to write the labels into instead of creating a new one, in
+            which case `labels_shape` is ignored. This can be a chunked array
+            like a zarr array, which is written one chunk at a time, so that
+            labels larger than memory can be generated. Points outside of all
+            the shapes are left unchanged.
 
         Returns
         -------
         labels : np.ndarray
             Integer array where each value is either 0 for background or an
             integer up to N for points inside the shape at the index value - 1.
-            For overlapping shapes z-ordering will be respected.
+            For overlapping shapes z-ordering will be respected. If `out` is
+            given, it is returned.
         """
+        if out is not None:
+            return self._data_view.to_labels(out=out)
+
         if labels_shape is None:
             # See https://github.com/napari/napari/issues/2778
             # Point coordinates land on pixel centers. We want to find the
@@ -1,5 +1,9 @@
+from __future__ import annotations
+
 import warnings
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 import numpy as np
 import numpy.typing as npt
@@ -7,9 +11,137 @@ import numpy.typing as npt
 from napari.layers.base._slice import _next_request_id
 from napari.layers.surface._surface_constants import SurfaceProjectionMode
 from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
+from napari.layers.utils._spatial_index import _SortedAxisIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
 OptArray = npt.NDArray | None
 
+# Number of recent slices whose vertices and faces are kept by an index.
+_MAX_CACHED_SLICES = 16
+
+
+class _SurfaceSliceIndex:
+    """Index of the vertices and faces of a mesh, to slice it quickly.
+
+    The first time an axis is sliced, the vertices are sorted along it, and
+    so are the faces by the smallest coordinate of their vertices. The
+    vertices and faces within a slice are then found by binary search along
+    the most selective axis, instead of checking all of them, and the
+    results of the last few slices are cached.
+
+    The index keeps references to the vertices and faces, which must not be
+    modified in place.
+
+    Parameters
+    ----------
+    vertices : (N, D) array
+        The coordinates of the vertices.
+    faces : (M, 3) array
+        The indices of the vertices of each face.
+    """
+
+    def __init__(self, vertices: npt.NDArray, faces: npt.NDArray) -> None:
+        self.vertices = vertices
+        self.faces = faces
+        self._vertex_index = _SortedAxisIndex(vertices)
+        # For each sliced axis, the indices of the faces sorted by the
+        # smallest coordinate of their vertices along that axis, and these
+        # sorted coordinates.
+        self._face_axes: dict[
+            int, tuple[npt.NDArray[np.intp], npt.NDArray]
+        ] = {}
+        self._slices: OrderedDict[
+            tuple, tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]
+        ] = OrderedDict()
+
+    def query(
+        self,
+        axes: Sequence[int],
+        low: npt.ArrayLike,
+        high: npt.ArrayLike,
+    ) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+        """Find the vertices and faces within a box along some axes.
+
+        Parameters
+        ----------
+        axes : sequence of int
+            The axes along which the box is defined.
+        low : array-like
+            The lower (inclusive) bounds of the box along ``axes``.
+        high : array-like
+            The upper (inclusive) bounds of the box along ``axes``.
+
+        Returns
+        -------
+        vertices : array of int
+            The sorted indices of the vertices within the box.
+        faces : (K, 3) array of int
+            The faces whose vertices are all within the box, in their
+            original order, indexing into ``vertices``.
+        """
+        axes = list(axes)
+        low = np.broadcast_to(np.asarray(low, dtype=np.float64), len(axes))
+        high = np.broadcast_to(np.asarray(high, dtype=np.float64), len(axes))
+        key = (tuple(axes), low.tobytes(), high.tobytes())
+        cached = self._slices.get(key)
+        if cached is not None:
+            self._slices.move_to_end(key)
+            return cached
+
+        vertices = self._vertex_index.query_box(axes, low, high)
+        if len(axes) == 0:
+            faces = np.asarray(self.faces, dtype=np.intp)
+        else:
+            faces = self._query_faces(axes, low, high, vertices)
+        self._slices[key] = (vertices, faces)
+        while len(self._slices) > _MAX_CACHED_SLICES:
+            self._slices.popitem(last=False)
+        return vertices, faces
+
+    def _query_faces(
+        self,
+        axes: list[int],
+        low: npt.NDArray,
+        high: npt.NDArray,
+        vertices: npt.NDArray[np.intp],
+    ) -> npt.NDArray[np.intp]:
+        """Find the faces whose vertices are all within a box."""
+        # A face within the box has its smallest coordinate along each axis
+        # within the box, so only the faces of the axis with the fewest of
+        # them are checked.
+        candidates = None
+        for i, axis in enumerate(axes):
+            order, values = self._sorted_faces(axis)
+            start = np.searchsorted(values, low[i], side='left')
+            stop = np.searchsorted(values, high[i], side='right')
+            if candidates is None or stop - start < len(candidates):
+                candidates = order[start:stop]
+        assert candidates is not None
+        if len(vertices) == 0 or len(candidates) == 0:
+            return np.empty((0, 3), dtype=np.intp)
+        faces = self.faces[np.sort(candidates)]
+        # position of each vertex of the faces among the vertices in the box
+        positions = np.searchsorted(vertices, faces)
+        inside = (
+            vertices[np.minimum(positions, len(vertices) - 1)] == faces
+        ).all(axis=1)
+        return positions[inside]
+
+    def _sorted_faces(
+        self, axis: int
+    ) -> tuple[npt.NDArray[np.intp], npt.NDArray]:
+        sorted_axis = self._face_axes.get(axis)
+        if sorted_axis is None:
+            values = np.asarray(self.vertices)[:, axis][self.faces].min(axis=1)
+            order = np.argsort(values, kind='stable')
+            sorted_axis = (order, values[order])
+            # replace the dict so that concurrent queries see a consistent
+            # state without locking
+            self._face_axes = {**self._face_axes, axis: sorted_axis}
+        return sorted_axis
+
 
 @dataclass(frozen=True)
 class _SurfaceSliceResponse:
@@ -55,6 +187,9 @@ class _SurfaceSliceRequest:
         The layer's data field, which is the main input to slicing.
     data_slice : _ThickNDSlice
         The slicing coordinates and margins in data space.
+    slice_index : _SurfaceSliceIndex or None
+        Index of the vertices and faces of ``data``, used to find the ones
+        within the slice without checking all of them.
     others
         See the corresponding attributes in `Layer` and `Points`.
     """
@@ -65,6 +200,7 @@ class _SurfaceSliceRequest:
     texcoords: np.ndarray | None = field(repr=False)
     data_slice: _ThickNDSlice = field(repr=False)
     projection_mode: SurfaceProjectionMode
+    slice_index: _SurfaceSliceIndex | None = field(default=None, repr=False)
     id: int = field(default_factory=_next_request_id)
 
     def __call__(self) -> _SurfaceSliceResponse:
@@ -129,26 +265,20 @@ class _SurfaceSliceRequest:
             not_disp_for_vert
         ]
 
-        vertices_not_disp = vert_orig[:, not_disp_for_vert]
-        inside_slice = np.all(
-            (vertices_not_disp >= low_vert) & (vertices_not_disp <= high_vert),
-            axis=1,
-        )
-        valid_vertices = np.argwhere(inside_slice).reshape(-1)
-
-        vertices_disp = vert_orig[:, disp_for_vert]
-        vertices = vertices_disp[valid_vertices]
-
-        # mapping of old vertex indices to new vertex indices. Indexing at
-        # a non-valid index is undefined, but shouldn't happen
-        old_to_new = np.empty(vertices_not_disp.shape[0], dtype=int)
-        old_to_new[valid_vertices] = np.arange(valid_vertices.shape[0])
-
-        valid_mask = np.zeros(vertices_not_disp.shape[0], dtype=bool)
-        valid_mask[valid_vertices] = True
-        valid_faces_mask = valid_mask[self.data[1]].all(axis=1)
-        valid_faces = self.data[1][valid_faces_mask]
-        faces = old_to_new[valid_faces]
+        index = self.slice_index
+        if (
+            index is not None
+            and index.vertices is vert_orig
+            and index.faces is self.data[1]
+        ):
+            valid_vertices, faces = index.query(
+                not_disp_for_vert, low_vert, high_vert
+            )
+        else:
+            valid_vertices, faces = self._slice_mesh(
+                not_disp_for_vert, low_vert, high_vert
+            )
+        vertices = vert_orig[np.ix_(valid_vertices, disp_for_vert)]
 
         values = vertex_colors = texcoords = None
 
@@ -176,6 +306,32 @@ class _SurfaceSliceRequest:
             request_id=self.id,
         )
 
+    def _slice_mesh(
+        self, axes: list[int], low: npt.NDArray, high: npt.NDArray
+    ) -> tuple[npt.NDArray, npt.NDArray]:
+        """Find the vertices and faces within a box, checking all of them.
+
+        See `_SurfaceSliceIndex.query`.
+        """
+        vert_orig = self.data[0]
+        vertices_not_disp = vert_orig[:, axes]
+        inside_slice = np.all(
+            (vertices_not_disp >= low) & (vertices_not_disp <= high),
+            axis=1,
+        )
+        valid_vertices = np.argwhere(inside_slice).reshape(-1)
+
+        # mapping of old vertex indices to new vertex indices. Indexing at
+        # a non-valid index is undefined, but shouldn't happen
+        old_to_new = np.empty(vertices_not_disp.shape[0], dtype=int)
+        old_to_new[valid_vertices] = np.arange(valid_vertices.shape[0])
+
+        valid_mask = np.zeros(vertices_not_disp.shape[0], dtype=bool)
+        valid_mask[valid_vertices] = True
+        valid_faces_mask = valid_mask[self.data[1]].all(axis=1)
+        valid_faces = self.data[1][valid_faces_mask]
+        return valid_vertices, old_to_new[valid_faces]
+
     def _empty_response(self) -> _SurfaceSliceResponse:
         return _SurfaceSliceResponse(
             vertices=np.empty((0, self.slice_input.ndisplay), dtype=int),
@@ -1,4 +1,5 @@
 import copy
+import dataclasses
 
 import numpy as np
 import pandas as pd
@@ -531,6 +532,71 @@ def test_surface_with_no_visible_faces():
         )
 
 
+@pytest.mark.parametrize('projection_mode', ['none', 'all'])
+@pytest.mark.parametrize('ndisplay', [2, 3])
+def test_slicing_uses_slice_index(projection_mode, ndisplay):
+    rng = np.random.default_rng(0)
+    # a time series of meshes, with some faces spanning several times
+    vertices = np.concatenate(
+        [
+            rng.integers(0, 10, (3000, 2)),
+            rng.uniform(0, 20, (3000, 2)),
+        ],
+        axis=1,
+    ).astype(float)
+    faces = rng.integers(0, 3000, (6000, 3))
+    # most faces join vertices at the same time and depth
+    order = np.lexsort(vertices[:, 1::-1].T)
+    faces[:5000] = order[rng.integers(0, 2998, (5000, 1)) + [0, 1, 2]]
+    values = rng.random(3000)
+    layer = Surface((vertices, faces, values), projection_mode=projection_mode)
+    for point in [(4, 5, 10, 10), (4.3, 5.2, 10, 10), (9, 0, 0, 0)]:
+        dims = Dims(
+            ndim=4,
+            ndisplay=ndisplay,
+            range=((0, 10, 1),) * 4,
+            point=point,
+            margin_left=(0.5, 1, 0, 0),
+            margin_right=(1, 2, 0, 0),
+        )
+        request = layer._slicing_state._make_slice_request(dims)
+        assert request.slice_index is layer._slice_index
+        response = request()
+        expected = dataclasses.replace(request, slice_index=None)()
+        assert len(response.faces) > 0
+        np.testing.assert_array_equal(response.vertices, expected.vertices)
+        np.testing.assert_array_equal(response.faces, expected.faces)
+        np.testing.assert_array_equal(response.values, expected.values)
+        # the slices are cached
+        np.testing.assert_array_equal(request().faces, expected.faces)
+
+
+def test_slice_index_rebuilt_with_data():
+    vertices = np.array([[0, 0, 0], [0, 1, 0], [0, 1, 1], [1, 0, 0]], float)
+    faces = np.array([[0, 1, 2], [1, 2, 3]])
+    layer = Surface((vertices, faces))
+    index = layer._slice_index
+    assert layer._slice_index is index
+    np.testing.assert_array_equal(layer._view_faces, [[0, 1, 2]])
+
+    layer.data = (vertices + [1, 0, 0], faces)
+    assert layer._slice_index is not index
+    np.testing.assert_array_equal(layer._view_faces, np.empty((0, 3)))
+
+
+def test_slice_index_rebuilt_after_in_place_edit():
+    vertices = np.array([[0, 0, 0], [0, 1, 0], [0, 1, 1], [1, 0, 0]], float)
+    faces = np.array([[0, 1, 2], [1, 2, 3]])
+    layer = Surface((vertices, faces))
+    np.testing.assert_array_equal(layer._view_faces, [[0, 1, 2]])
+
+    # move the last vertex to the plane in view
+    layer.vertices[3, 0] = 0
+    layer.refresh()
+    assert len(layer._view_faces) == 2
+    assert layer._slice_index.vertices is layer.vertices
+
+
 def test_docstring():
     validate_all_params_in_docstring(Surface)
     validate_kwargs_sorted(Surface)
@@ -8,6 +8,7 @@ import numpy as np
 from napari.layers.base import Layer, _LayerSlicingState
 from napari.layers.intensity_mixin import IntensityVisualizationMixin
 from napari.layers.surface._slice import (
+    _SurfaceSliceIndex,
     _SurfaceSliceRequest,
     _SurfaceSliceResponse,
 )
@@ -313,6 +314,7 @@ class Surface(IntensityVisualizationMixin, Layer):
             self._vertex_values = data[2]
         else:
             self._vertex_values = np.ones(len(self._vertices))
+        self._slice_index_cache: _SurfaceSliceIndex | None = None
 
         self._feature_table = _FeatureTable.from_layer(
             features=features,
@@ -500,6 +502,19 @@ class Surface(IntensityVisualizationMixin, Layer):
         """Determine number of dimensions of the layer."""
         return self.vertices.shape[1] + (self.vertex_values.ndim - 1)
 
+    @property
+    def _slice_index(self) -> _SurfaceSliceIndex:
+        """Index of the vertices and faces, rebuilt when they are replaced."""
+        index = self._slice_index_cache
+        if (
+            index is None
+            or index.vertices is not self.vertices
+            or index.faces is not self.faces
+        ):
+            index = _SurfaceSliceIndex(self.vertices, self.faces)
+            self._slice_index_cache = index
+        return index
+
     @property
     def _extent_data(self) -> np.ndarray:
         """Extent of layer in data coordinates.
@@ -817,6 +832,11 @@ class _SurfaceSlicingState(_LayerSlicingState):
         self._view_vertex_colors: np.ndarray | None = None
         self._view_texcoords: np.ndarray | None = None
 
+    def _on_data_modified(self) -> None:
+        # The vertices or faces may have been modified in place, so the
+        # index and the slices it cached must be made again.
+        self.layer._slice_index_cache = None
+
     def _set_view_slice(self) -> None:
         """Sets the view given the indices to slice with."""
 
@@ -847,6 +867,7 @@ class _SurfaceSlicingState(_LayerSlicingState):
             texcoords=self.layer.texcoords,
             data_slice=data_slice,
             projection_mode=self.layer.projection_mode,
+            slice_index=self.layer._slice_index,
         )
 
     def _update_slice_response(self, response: _SurfaceSliceResponse) -> None:
@@ -413,6 +413,192 @@ def test_hide_completed_tracks() -> None:
     np.testing.assert_array_equal(unmasked_connex, original_connex)
 
 
+def _random_tracks(n_tracks=50, seed=0):
+    rng = np.random.default_rng(seed)
+    tracks = []
+    for track_id in range(n_tracks):
+        start = rng.integers(0, 80)
+        times = np.arange(start, start + rng.integers(1, 40))
+        coords = rng.random((len(times), 2)) * 100
+        tracks.append(
+            np.column_stack([np.full(len(times), track_id), times, coords])
+        )
+    return np.concatenate(tracks)
+
+
+def test_window_indices_and_connex() -> None:
+    """The vertices of a time window are the ones within the window and
+    their neighbours, and draw the same segments as all the vertices."""
+    manager = TrackManager(_random_tracks())
+    manager.build_tracks()
+    times = manager.track_times
+    connex = manager.track_connex
+
+    indices = manager.window_indices(20, 30)
+    inside = (times >= 20) & (times <= 30)
+    expected = inside.copy()
+    expected[1:] |= inside[:-1] & connex[:-1]
+    expected[:-1] |= inside[1:] & connex[:-1]
+    np.testing.assert_array_equal(indices, np.flatnonzero(expected))
+    assert manager.window_indices(20, 30) is indices
+
+    segments = np.flatnonzero(manager.window_connex(indices))
+    np.testing.assert_array_equal(
+        indices[segments],
+        np.flatnonzero(connex & expected & np.roll(expected, -1)),
+    )
+
+    # completed tracks are hidden in the window like in all the vertices
+    manager.hide_completed_tracks = True
+    manager.current_time = 25
+    segments = np.flatnonzero(manager.window_connex(indices))
+    np.testing.assert_array_equal(
+        indices[segments],
+        np.flatnonzero(
+            manager.track_connex & expected & np.roll(expected, -1)
+        ),
+    )
+
+
+def test_track_end_times() -> None:
+    data = _random_tracks()
+    manager = TrackManager(data)
+    manager.build_tracks()
+    expected = [data[data[:, 0] == i, 1].max() for i in range(50)]
+    np.testing.assert_array_equal(manager.track_end_times, expected)
+    np.testing.assert_array_equal(
+        manager.vertex_end_times,
+        np.asarray(expected)[manager.track_ids],
+    )
+
+
+def _random_graph(n_tracks=50, seed=0):
+    rng = np.random.default_rng(seed)
+    graph = {}
+    for node in rng.permutation(n_tracks)[: n_tracks // 2]:
+        parents = rng.choice(n_tracks, rng.integers(1, 3), replace=False)
+        graph[int(node)] = [int(p) for p in parents]
+    return graph
+
+
+def _graph_segments(manager):
+    """return the graph edges as sorted rows of node and parent vertices"""
+    vertices = manager.graph_vertices.reshape(-1, 2 * manager.ndim)
+    return vertices[np.lexsort(vertices.T[::-1])]
+
+
+def test_build_graph() -> None:
+    data = _random_tracks()
+    graph = _random_graph()
+    manager = TrackManager(data)
+    manager.build_tracks()
+    manager.graph = graph
+    manager.build_graph()
+
+    expected = []
+    for node, parents in graph.items():
+        track = data[data[:, 0] == node]
+        for parent in parents:
+            parent_track = data[data[:, 0] == parent]
+            expected.append(track[np.argmin(track[:, 1]), 1:])
+            expected.append(parent_track[np.argmax(parent_track[:, 1]), 1:])
+    np.testing.assert_array_equal(manager.graph_vertices, expected)
+    np.testing.assert_array_equal(
+        manager.graph_connex, [True, False] * (len(expected) // 2)
+    )
+
+
+def test_append_tracks() -> None:
+    data = _random_tracks()
+    graph = _random_graph()
+    # new vertices of existing tracks, and new tracks
+    appended = _random_tracks(seed=1)
+    appended[:, 1] += 120
+    appended[appended[:, 0] >= 10, 0] += 50
+    appended_graph = {60: [0], 61: 3, 0: [5]}
+
+    manager = TrackManager(data)
+    manager.features = {'time': data[:, 1]}
+    manager.build_tracks()
+    manager.graph = graph
+    manager.build_graph()
+    manager.append_tracks(appended, graph=appended_graph)
+
+    all_data = np.concatenate([data, appended])
+    expected = TrackManager(all_data)
+    expected.build_tracks()
+    merged_graph = {k: list(v) for k, v in graph.items()}
+    merged_graph.setdefault(0, []).append(5)
+    merged_graph.update({60: [0], 61: [3]})
+    expected.graph = merged_graph
+    expected.build_graph()
+
+    np.testing.assert_array_equal(manager.data, expected.data)
+    assert manager.graph == merged_graph
+    np.testing.assert_array_equal(
+        _graph_segments(manager), _graph_segments(expected)
+    )
+    np.testing.assert_array_equal(
+        manager.features['track_id'], expected.track_ids
+    )
+    # the features of the previous vertices are kept
+    assert len(manager.features) == len(all_data)
+    previous = manager.data[:, 1] < 120
+    np.testing.assert_array_equal(
+        manager.features['time'][previous], manager.data[previous, 1]
+    )
+    # the vertices are sorted by time, and can be looked up
+    np.testing.assert_array_equal(
+        manager._points[:, 0], np.sort(all_data[:, 1])
+    )
+    vertex = appended[0]
+    assert manager.get_value(vertex[1:]) == vertex[0]
+
+
+def test_layer_append_tracks() -> None:
+    data = _random_tracks()
+    layer = Tracks(data, features={'time': data[:, 1]}, graph={5: [0]})
+    appended = _random_tracks(seed=1)
+    appended[:, 0] += 50
+    layer.append_tracks(appended, graph={50: [1]})
+
+    expected = Tracks(np.concatenate([data, appended]))
+    np.testing.assert_array_equal(layer.data, expected.data)
+    np.testing.assert_array_equal(layer.track_connex, expected.track_connex)
+    assert layer.graph == {5: [0], 50: [1]}
+    assert len(layer.track_colors) == len(layer.data)
+    assert not np.isnan(layer.features['time'][layer.data[:, 0] < 50]).any()
+
+
+def test_tracks_displayed_by_time_window() -> None:
+    layer = Tracks(_random_tracks(), tail_length=10, head_length=2)
+    assert layer._track_window is None
+    pos, connex, times = layer._windowed_track_data(None)
+    assert len(pos) == len(connex) == len(times) == len(layer.data)
+
+    layer._min_windowed_vertices = 0
+    layer._slice_dims(Dims(ndim=3, point=(40, 0, 0), range=((0, 120, 1),) * 3))
+    window = layer._track_window
+    assert window[0] <= 40 - 10
+    assert window[1] >= 40 + 2
+    # the window does not change at every time point
+    layer._slice_dims(Dims(ndim=3, point=(41, 0, 0), range=((0, 120, 1),) * 3))
+    assert layer._track_window == window
+
+    pos, connex, times = layer._windowed_track_data(window)
+    indices = layer._manager.window_indices(*window)
+    assert len(pos) == len(connex) == len(times) == len(indices)
+    np.testing.assert_array_equal(times, layer.track_times[indices])
+
+    colors = layer._windowed_track_colors(window)
+    np.testing.assert_array_equal(colors, layer.track_colors[indices])
+    assert layer._windowed_track_colors(window) is colors
+    layer.colormap = 'viridis'
+    new_colors = layer._windowed_track_colors(window)
+    np.testing.assert_array_equal(new_colors, layer.track_colors[indices])
+    assert not np.array_equal(new_colors, colors)
+
+
 def test_docstring():
     validate_all_params_in_docstring(Tracks)
     validate_kwargs_sorted(Tracks)
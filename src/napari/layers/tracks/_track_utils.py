@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -10,6 +11,9 @@ if TYPE_CHECKING:
     import pandas as pd
     from scipy.spatial import cKDTree
 
+# Number of time windows whose vertices are cached.
+_MAX_CACHED_WINDOWS = 8
+
 
 class TrackManager:
     """Manage track data and simplify interactions with the Tracks layer.
@@ -70,6 +74,9 @@ class TrackManager:
         Cached array of end times for each unique track ID, where M is the
         number of unique tracks. Computed lazily and invalidated when track
         data changes.
+    vertex_end_times : array (N,)
+        Cached array of the end time of the track of each vertex in
+        track_vertices.
     """
 
     def __init__(self, data: np.ndarray) -> None:
@@ -79,16 +86,22 @@ class TrackManager:
 
         self._data: npt.NDArray
         self._order: np.ndarray[tuple[int], np.dtype[np.integer]]
-        self._kdtree: cKDTree
+        self._kdtree: cKDTree | None
         self._points: npt.NDArray
         self._points_id: npt.NDArray
         self._points_lookup: dict[int, slice]
         self._ordered_points_idx: npt.NDArray
+        # vertices of the recently displayed time windows
+        self._windows: OrderedDict[tuple[float, float], npt.NDArray]
 
         self._track_vertices: npt.NDArray | None = None
         self._track_connex: npt.NDArray | None = None
 
         self._graph: dict[int, list[int]] | None = None
+        # track IDs of the child and parent of each edge of the graph, in
+        # the order of the graph vertices
+        self._graph_children: npt.NDArray = np.zeros(0, dtype=np.int64)
+        self._graph_parents: npt.NDArray = np.zeros(0, dtype=np.int64)
         self._graph_vertices: npt.NDArray | None = None
         self._graph_connex: npt.NDArray | None = None
 
@@ -98,6 +111,7 @@ class TrackManager:
         self._track_end_times: np.ndarray | None = (
             None  # Cache for track end times (1D array ordered by unique_track_ids)
         )
+        self._vertex_end_times: np.ndarray | None = None
 
     @staticmethod
     def _fast_points_lookup(sorted_time: np.ndarray) -> dict[int, slice]:
@@ -126,9 +140,6 @@ class TrackManager:
     @data.setter
     def data(self, data: list | np.ndarray) -> None:
         """set the vertex data and build the vispy arrays for display"""
-        from scipy.sparse import coo_matrix
-        from scipy.spatial import cKDTree
-
         # convert data to a numpy array if it is not already one
         data = np.asarray(data)
 
@@ -140,11 +151,24 @@ class TrackManager:
         self._data = data[self._order]
 
         # build the indices for sorting points by time
-        self._ordered_points_idx = np.argsort(self._data[:, 1])
+        self._set_ordered_points(np.argsort(self._data[:, 1]))
+
+    def _set_ordered_points(self, ordered_points_idx: npt.NDArray) -> None:
+        """set the order of the vertices by time and the lookup tables
+
+        Parameters
+        ----------
+        ordered_points_idx : array (N,)
+            Indices of the vertices of the sorted data, sorted by time.
+        """
+        from scipy.sparse import coo_matrix
+
+        self._ordered_points_idx = ordered_points_idx
         self._points = self._data[self._ordered_points_idx, 1:]
 
-        # build a tree of the track data to allow fast lookup of nearest track
-        self._kdtree = cKDTree(self._points)
+        # the tree of the track data used to look up the nearest track is
+        # built when first needed
+        self._kdtree = None
 
         # make the lookup table
         # NOTE(arl): it's important to convert the time index to an integer
@@ -165,6 +189,8 @@ class TrackManager:
 
         # Invalidate cached track end times when data changes
         self._track_end_times = None
+        self._vertex_end_times = None
+        self._windows = OrderedDict()
 
     @property
     def features(self) -> 'pd.DataFrame':
@@ -242,7 +268,11 @@ class TrackManager:
     @property
     def unique_track_ids(self) -> npt.NDArray[np.uint32]:
         """return the unique track identifiers"""
-        return np.unique(self.track_ids)
+        track_ids = self.track_ids
+        if len(track_ids) == 0:
+            return track_ids
+        # the data is sorted by ID, so this is faster than np.unique
+        return track_ids[self._track_last_indices()]
 
     def __len__(self) -> int:
         """return the number of tracks"""
@@ -285,17 +315,49 @@ class TrackManager:
             else:
                 new_graph[node_idx] = [parents_idx]
 
-        unique_track_ids = set(self.unique_track_ids)
-
         # check that graph nodes exist in the track id lookup
-        for node_idx, parents_idx in new_graph.items():
-            nodes = [node_idx, *parents_idx]
-            for node in nodes:
-                if node not in unique_track_ids:
-                    raise ValueError(f'graph node {node_idx} not found')
+        unique_track_ids = self.unique_track_ids
+        nodes = np.fromiter(new_graph, dtype=np.int64, count=len(new_graph))
+        children, parents = self._graph_edges(new_graph)
+        missing = np.concatenate(
+            [
+                nodes[~np.isin(nodes, unique_track_ids)],
+                children[~np.isin(parents, unique_track_ids)],
+            ]
+        )
+        if len(missing):
+            missing_nodes = set(missing.tolist())
+            node_idx = next(
+                node for node in new_graph if node in missing_nodes
+            )
+            raise ValueError(f'graph node {node_idx} not found')
 
         return new_graph
 
+    @staticmethod
+    def _graph_edges(
+        graph: dict[int, list[int]],
+    ) -> tuple[npt.NDArray, npt.NDArray]:
+        """return the track IDs of the child and parent of each graph edge"""
+        n_parents = np.fromiter(
+            (len(parents_idx) for parents_idx in graph.values()),
+            dtype=np.intp,
+            count=len(graph),
+        )
+        children = np.repeat(
+            np.fromiter(graph, dtype=np.int64, count=len(graph)), n_parents
+        )
+        parents = np.fromiter(
+            (
+                parent_idx
+                for parents_idx in graph.values()
+                for parent_idx in parents_idx
+            ),
+            dtype=np.int64,
+            count=len(children),
+        )
+        return children, parents
+
     def build_tracks(self) -> None:
         """build the tracks"""
 
@@ -320,32 +382,152 @@ class TrackManager:
 
         # Invalidate cached track end times when tracks are rebuilt
         self._track_end_times = None
+        self._vertex_end_times = None
+        self._windows = OrderedDict()
 
     def build_graph(self) -> None:
         """build the track graph"""
 
-        graph_vertices = []
-        graph_connex = []
-
         assert self.graph is not None
-        for node_idx, parents_idx in self.graph.items():
-            # we join from the first observation of the node, to the last
-            # observation of the parent
-            node_start = self._vertex_indices_from_id(node_idx)[0]
-            node = self.data[node_start, 1:]
-
-            for parent_idx in parents_idx:
-                parent_stop = self._vertex_indices_from_id(parent_idx)[-1]
-                parent = self.data[parent_stop, 1:]
-
-                graph_vertices.append([node, parent])
-                graph_connex.append([True, False])
+        self._graph_children, self._graph_parents = self._graph_edges(
+            self.graph
+        )
 
         # if there is a graph, store the vertices and connection arrays,
         # otherwise, clear the vertex arrays
-        if graph_vertices:
-            self._graph_vertices = np.concatenate(graph_vertices, axis=0)
-            self._graph_connex = np.concatenate(graph_connex, axis=0)
+        if len(self._graph_children):
+            self._graph_vertices, self._graph_connex = self._edge_vertices(
+                self._graph_children, self._graph_parents
+            )
+        else:
+            self._graph_vertices = None
+            self._graph_connex = None
+
+    def _edge_vertices(
+        self, children: npt.NDArray, parents: npt.NDArray
+    ) -> tuple[npt.NDArray, npt.NDArray]:
+        """return the vertices and connections drawing graph edges"""
+        # we join from the first observation of the node, to the last
+        # observation of the parent, which are found in the data sorted by
+        # ID then time
+        ids = self.data[:, 0]
+        node = self.data[np.searchsorted(ids, children, side='left'), 1:]
+        parent = self.data[np.searchsorted(ids, parents, side='right') - 1, 1:]
+
+        vertices = np.stack([node, parent], axis=1).reshape(-1, self.ndim)
+        connex = np.tile([True, False], len(children))
+        return vertices, connex
+
+    def append_tracks(
+        self,
+        data: np.ndarray,
+        graph: dict[int, int | list[int]] | None = None,
+    ) -> None:
+        """append track vertices, and edges of the track graph
+
+        The vertices can belong to new or existing tracks, and their features
+        are set to the default values. The new vertices are merged into the
+        data, which is already sorted, rather than sorting all the vertices
+        again, and only the graph vertices of the new edges, and of the
+        edges joining tracks with new vertices, are computed.
+
+        Parameters
+        ----------
+        data : array (M, D+1)
+            Coordinates of the new vertices. ID,T,(Z),Y,X.
+        graph : dict {int: list}, optional
+            Edges to add to the graph, as a mapping between a track ID and
+            its parents.
+        """
+        data = self._validate_track_data(np.asarray(data))
+        n_previous = len(self._data)
+        new_order = np.lexsort((data[:, 1], data[:, 0]))
+        data = data[new_order]
+        appended_ids = np.unique(data[:, 0])
+
+        # positions of the new vertices in the data sorted by ID then time,
+        # found within the vertices of their track
+        ids, new_ids = self._data[:, 0], data[:, 0]
+        positions = np.empty(len(data), dtype=np.intp)
+        for start, stop, new_start, new_stop in zip(
+            np.searchsorted(ids, appended_ids, side='left'),
+            np.searchsorted(ids, appended_ids, side='right'),
+            np.searchsorted(new_ids, appended_ids, side='left'),
+            np.searchsorted(new_ids, appended_ids, side='right'),
+            strict=True,
+        ):
+            positions[new_start:new_stop] = start + np.searchsorted(
+                self._data[start:stop, 1],
+                data[new_start:new_stop, 1],
+                side='right',
+            )
+        # indices of the new vertices, and of the previous ones, in the
+        # merged data
+        new_indices = positions + np.arange(len(data))
+        previous_indices = (
+            np.arange(n_previous)
+            + np.cumsum(np.bincount(positions, minlength=n_previous + 1))[
+                :n_previous
+            ]
+        )
+
+        # merge the new vertices into the vertices sorted by time
+        times = self._points[:, 0]
+        time_order = np.argsort(data[:, 1], kind='stable')
+        time_positions = np.searchsorted(
+            times, data[time_order, 1], side='right'
+        )
+        ordered_points_idx = np.insert(
+            previous_indices[self._ordered_points_idx],
+            time_positions,
+            new_indices[time_order],
+        )
+
+        self._order = np.insert(self._order, positions, n_previous + new_order)
+        self._data = np.insert(self._data, positions, data, axis=0)
+        self._set_ordered_points(ordered_points_idx)
+
+        # the features are kept in the order of the sorted data
+        feature_order = np.insert(
+            np.arange(n_previous),
+            positions,
+            n_previous + np.arange(len(data)),
+        )
+        self._feature_table.resize(len(self._data))
+        self._feature_table.reorder(feature_order)  # type: ignore[arg-type]
+        self._feature_table.values['track_id'] = self.track_ids
+        self.build_tracks()
+
+        new_graph = self._normalize_track_graph(graph or {})
+        merged_graph = {k: list(v) for k, v in (self._graph or {}).items()}
+        for node_idx, parents_idx in new_graph.items():
+            merged_graph.setdefault(node_idx, []).extend(parents_idx)
+        self._graph = merged_graph
+
+        # edges of tracks with new vertices may start or end at different
+        # vertices, so their graph vertices are computed again
+        children, parents = self._graph_edges(new_graph)
+        changed = np.isin(self._graph_children, appended_ids) | np.isin(
+            self._graph_parents, appended_ids
+        )
+        children = np.concatenate([self._graph_children[changed], children])
+        parents = np.concatenate([self._graph_parents[changed], parents])
+        vertices, _ = self._edge_vertices(children, parents)
+        if self._graph_vertices is not None:
+            kept_vertices = self._graph_vertices[np.repeat(~changed, 2)]
+            vertices = np.concatenate([kept_vertices, vertices])
+
+        self._graph_children = np.concatenate(
+            [self._graph_children[~changed], children]
+        )
+        self._graph_parents = np.concatenate(
+            [self._graph_parents[~changed], parents]
+        )
+        if len(self._graph_children):
+            self._graph_vertices = vertices
+            self._graph_connex = np.tile(
+                [True, False], len(self._graph_children)
+            )
         else:
             self._graph_vertices = None
             self._graph_connex = None
@@ -360,8 +542,10 @@ class TrackManager:
 
     def get_value(self, coords: npt.NDArray) -> npt.NDArray | None:
         """use a kd-tree to lookup the ID of the nearest tree"""
+        from scipy.spatial import cKDTree
+
         if self._kdtree is None:
-            return None
+            self._kdtree = cKDTree(self._points)
 
         # query can return indices to points that do not exist, trim that here
         # then prune to only those in the current frame/time
@@ -396,16 +580,25 @@ class TrackManager:
 
     def _compute_track_end_times(self) -> np.ndarray:
         """Compute the last timestamp for each track as 1D array (private method)"""
-        unique_ids = self.unique_track_ids
-        track_end_times = np.zeros(len(unique_ids), dtype=float)
-
-        for i, track_id in enumerate(unique_ids):
-            indices = self._vertex_indices_from_id(track_id)
-            track_end_times[i] = np.max(
-                self.data[indices, 1]
-            )  # max time for this track
+        # the data is sorted by ID then time, so the last vertex of each
+        # track is the one just before the track id changes
+        return self.data[self._track_last_indices(), 1].astype(float)
+
+    def _track_last_indices(self) -> np.ndarray:
+        """Indices of the last vertex of each track, ordered by track ID"""
+        return np.append(
+            np.flatnonzero(np.diff(self.data[:, 0])), len(self.data) - 1
+        )
 
-        return track_end_times
+    @property
+    def vertex_end_times(self) -> np.ndarray:
+        """Get cached end time of the track of each vertex"""
+        if self._vertex_end_times is None:
+            last = self._track_last_indices()
+            self._vertex_end_times = np.repeat(
+                self.track_end_times, np.diff(last, prepend=-1)
+            )
+        return self._vertex_end_times
 
     def _get_completed_tracks_mask(self) -> np.ndarray:
         """Get boolean mask for vertices belonging to completed tracks"""
@@ -424,6 +617,57 @@ class TrackManager:
 
         return vertices_mask
 
+    def window_indices(self, t_min: float, t_max: float) -> npt.NDArray:
+        """return the track vertices to display in a time window
+
+        These are the vertices with a timestamp between t_min and t_max,
+        and the vertices just before and after them on the same track, so
+        that the segments fading in and out of the window are drawn too.
+        The indices into track_vertices are sorted, and the vertices of
+        the last few windows are cached.
+        """
+        key = (float(t_min), float(t_max))
+        if key in self._windows:
+            self._windows.move_to_end(key)
+            return self._windows[key]
+
+        assert self._track_connex is not None
+        # the points are sorted by time, like the slices of the time lookup
+        times = self._points[:, 0]
+        start = np.searchsorted(times, t_min, side='left')
+        stop = np.searchsorted(times, t_max, side='right')
+        indices = self._ordered_points_idx[start:stop]
+        before = indices[indices > 0] - 1
+        before = before[self._track_connex[before]]
+        after = indices[self._track_connex[indices]] + 1
+        indices = np.sort(np.concatenate([indices, before, after]))
+        # drop duplicates, faster than np.unique
+        indices = indices[np.diff(indices, prepend=-1) != 0]
+
+        self._windows[key] = indices
+        if len(self._windows) > _MAX_CACHED_WINDOWS:
+            self._windows.popitem(last=False)
+        return indices
+
+    def window_connex(self, indices: npt.NDArray) -> npt.NDArray:
+        """vertex connections for drawing the track lines of a time window
+
+        Parameters
+        ----------
+        indices : array (M,)
+            Sorted indices of the vertices of the window, as returned by
+            `window_indices`.
+        """
+        assert self._track_connex is not None
+        connex = self._track_connex[indices]
+        # only connect vertices that are consecutive in the track vertices
+        connex[:-1] &= np.diff(indices) == 1
+        connex[-1:] = False
+
+        if self._hide_completed_tracks and self._current_time is not None:
+            connex &= self.vertex_end_times[indices] >= self._current_time
+        return connex
+
     @property
     def track_vertices(self) -> np.ndarray | None:
         """return the track vertices"""
@@ -2,13 +2,17 @@
 # from napari.utils.events import Event
 # from napari.utils.colormaps import AVAILABLE_COLORMAPS
 
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, Optional
 from warnings import warn
 
 import numpy as np
 
 from napari.layers.base import Layer, _LayerSlicingState
-from napari.layers.tracks._track_utils import TrackManager
+from napari.layers.tracks._track_utils import (
+    _MAX_CACHED_WINDOWS,
+    TrackManager,
+)
 from napari.types import LayerDataType
 from napari.utils.colormaps import AVAILABLE_COLORMAPS, Colormap
 from napari.utils.events import Event
@@ -110,6 +114,9 @@ class Tracks(Layer):
     # The max number of tracks that will ever be used to render the thumbnail
     # If more tracks are present then they are randomly subsampled
     _max_tracks_thumbnail = 1024
+    # Only the vertices within a time window around the current time are
+    # displayed when there are at least this many vertices
+    _min_windowed_vertices = 2**20
     _slicing_state: '_TracksSlicingState'
 
     def __init__(
@@ -188,6 +195,10 @@ class Tracks(Layer):
         self._manager = TrackManager(data)
 
         self._track_colors: np.ndarray | None = None
+        # colors of the vertices of the recently displayed time windows
+        self._window_colors: OrderedDict[tuple[float, float], np.ndarray] = (
+            OrderedDict()
+        )
         self._colormaps_dict = colormaps_dict or {}  # additional colormaps
         self._color_by = 'track_id'  # default color by ID
         self._colormap = colormap
@@ -455,6 +466,36 @@ class Tracks(Layer):
         self._manager.build_graph()
         self.events.rebuild_graph()
 
+    def append_tracks(
+        self,
+        data: np.ndarray,
+        graph: dict[int, int | list[int]] | None = None,
+    ) -> None:
+        """Append track vertices, and edges of the track graph.
+
+        Unlike setting ``data`` and ``graph``, the features of the existing
+        vertices and the existing edges of the graph are kept, and the new
+        vertices are merged into the tracks rather than rebuilding them.
+
+        Parameters
+        ----------
+        data : array (M, D+1)
+            Coordinates of the new vertices, which can belong to new or
+            existing tracks. ID,T,(Z),Y,X. Their features are set to the
+            default values.
+        graph : dict {int: list}, optional
+            Edges to add to the graph, as a mapping between a track ID and
+            its parents.
+        """
+        self._manager.append_tracks(data, graph=graph)
+        self._recolor_tracks()
+
+        # fire events to update shaders
+        self._update_dims()
+        self.events.rebuild_tracks()
+        self.events.rebuild_graph()
+        self.events.data(value=self.data)
+
     @property
     def tail_width(self) -> float:
         """float: Width for all vectors in pixels."""
@@ -593,6 +634,7 @@ class Tracks(Layer):
 
         # actually set the vertex colors
         self._track_colors = colormap.map(vertex_properties)
+        self._window_colors.clear()
 
     @property
     def track_connex(self) -> np.ndarray | None:
@@ -621,6 +663,7 @@ class Tracks(Layer):
             current sorted data.
         """
         self._track_colors = colors
+        self._window_colors.clear()
         self.events.color_by()
 
     @property
@@ -638,6 +681,63 @@ class Tracks(Layer):
         """time points associated with each graph vertex"""
         return self._manager.graph_times
 
+    @property
+    def _track_window(self) -> tuple[float, float] | None:
+        """time window of the track vertices to display, or None for all
+
+        For large datasets, only the vertices within the tail and head
+        lengths of the current time need to be displayed. The window spans
+        twice their total length, on a grid of this length, so that it
+        only changes every few time points and the same windows are used
+        when moving back and forth in time.
+        """
+        if (
+            len(self.data) < self._min_windowed_vertices
+            or not self.use_fade
+            or self.current_time is None
+        ):
+            return None
+        length = max(self.tail_length + self.head_length, 1)
+        start = (
+            np.floor((self.current_time - self.tail_length) / length) * length
+        )
+        return float(start), float(start + 2 * length)
+
+    def _windowed_track_data(
+        self, window: tuple[float, float] | None
+    ) -> tuple[np.ndarray | None, np.ndarray | None, np.ndarray | None]:
+        """return the displayed vertices, connections and times of a window
+
+        All the track vertices are returned when the window is None.
+        """
+        if window is None:
+            return self._view_data, self.track_connex, self.track_times
+        indices = self._manager.window_indices(*window)
+        self._manager.hide_completed_tracks = self._hide_completed_tracks
+        self._manager.current_time = self.current_time
+        assert self._manager.track_vertices is not None
+        vertices = self._manager.track_vertices[indices]
+        return (
+            self._slicing_state._pad_display_data(vertices),
+            self._manager.window_connex(indices),
+            vertices[:, 0],
+        )
+
+    def _windowed_track_colors(
+        self, window: tuple[float, float] | None
+    ) -> np.ndarray | None:
+        """return the colors of the displayed vertices of a window"""
+        if window is None or self.track_colors is None:
+            return self.track_colors
+        if window in self._window_colors:
+            self._window_colors.move_to_end(window)
+        else:
+            indices = self._manager.window_indices(*window)
+            self._window_colors[window] = self.track_colors[indices]
+            if len(self._window_colors) > _MAX_CACHED_WINDOWS:
+                self._window_colors.popitem(last=False)
+        return self._window_colors[window]
+
     @property
     def track_labels(self) -> tuple:
         """return track labels at the current time"""
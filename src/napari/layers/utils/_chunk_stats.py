@@ -0,0 +1,742 @@
+"""Statistics of the values of each chunk of arrays.
+
+The range and a histogram of the values of each chunk of an array can be
+kept in a registry, so that the range, percentiles and histogram of an array
+whose chunks were already read are found by merging these summaries instead
+of reading the array again. The registry is only used when the
+``cache_chunk_statistics`` or ``persist_chunk_statistics`` experimental
+setting is enabled, otherwise the statistics only last for one computation.
+
+The statistics of an array are kept as long as the array exists. When they
+are persisted, the statistics of zarr arrays in local stores, including dask
+arrays made with ``dask.array.from_zarr``, are instead identified by the
+location of the array and saved in the napari cache directory, to be reused
+in later sessions. Their chunks are then fingerprinted with the size and
+modification time of their files, so that only the chunks that were
+modified are read again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from napari.settings import get_settings
+from napari.utils._dask_utils import _is_dask_data
+from napari.utils._platformdirs import user_cache_dir
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+logger = logging.getLogger('napari.layers.utils._chunk_stats')
+
+__all__ = (
+    'ChunkStatistics',
+    'chunk_boundaries',
+    'chunk_slices',
+    'chunk_statistics',
+    'save_chunk_statistics',
+)
+
+# Number of bins of the histogram of each chunk.
+SUMMARY_BINS: int = 256
+# Number of elements of the slabs into which unchunked arrays are split.
+_SLAB_SIZE: int = 2**22
+# Number of elements of a chunk binned at once, to bound temporary memory.
+_BLOCK_SIZE: int = 2**20
+# Number of bins used to merge the histograms of chunks into percentiles.
+_PERCENTILE_BINS: int = 2**16
+# Maximum number of statistics of stored arrays kept in memory.
+_MAX_STORED: int = 16
+# Initial number of chunk summaries that statistics have room for.
+_MIN_SUMMARIES: int = 16
+
+
+def chunk_boundaries(data: Any) -> list[np.ndarray]:
+    """Return the boundaries of the chunks of an array along each axis.
+
+    Dask arrays (or other arrays with per-chunk sizes, like dask-backed
+    xarrays) use their own chunks, arrays with a regular ``chunks``
+    attribute (zarr, h5py) their chunk grid, and other arrays are split
+    into slabs along their first axis.
+
+    Returns
+    -------
+    list of np.ndarray
+        For each axis, the start of each chunk followed by the length of
+        the axis.
+    """
+    shape = tuple(int(s) for s in data.shape)
+    chunks = getattr(data, 'chunks', None)
+    if chunks is not None and all(isinstance(c, tuple) for c in chunks):
+        return [np.cumsum((0, *c)) for c in chunks]
+    if chunks is None:
+        plane_size = max(1, math.prod(shape[1:]))
+        chunks = (max(1, _SLAB_SIZE // plane_size), *shape[1:])
+    return [
+        np.append(np.arange(0, s, max(1, int(c))), s)
+        for s, c in zip(shape, chunks, strict=True)
+    ]
+
+
+def chunk_slices(
+    boundaries: Sequence[np.ndarray], flat_index: int
+) -> tuple[slice, ...]:
+    """Return the slices of a chunk given its index in C order.
+
+    Parameters
+    ----------
+    boundaries : sequence of np.ndarray
+        The chunk boundaries returned by `chunk_boundaries`.
+    flat_index : int
+        The index of the chunk.
+    """
+    index = np.unravel_index(flat_index, [len(b) - 1 for b in boundaries])
+    return tuple(
+        slice(int(b[i]), int(b[i + 1]))
+        for b, i in zip(boundaries, index, strict=True)
+    )
+
+
+class ChunkStatistics:
+    """Range and histogram of the values of each chunk of an array.
+
+    The histogram of a chunk has `SUMMARY_BINS` bins evenly spanning the
+    range of its values, or of width 1 for integers spanning fewer values,
+    and records the number and the mean of the values in each bin. Other
+    histograms and percentiles are estimated by placing the values of each
+    bin at their mean, which is exact for integer chunks spanning fewer than
+    `SUMMARY_BINS` values. Non-finite values are ignored.
+
+    Parameters
+    ----------
+    shape : tuple of int
+        Shape of the array.
+    dtype : np.dtype
+        Data type of the array.
+    boundaries : list of np.ndarray
+        Chunk boundaries of the array, as returned by `chunk_boundaries`.
+    key : str, optional
+        Location of the array when it is stored on disk, in which case its
+        statistics can be saved.
+    fingerprints : np.ndarray, optional
+        (N, 2) int64 array of the size and modification time of the file of
+        each chunk, or -1 for chunks without a file.
+
+    Attributes
+    ----------
+    computed : np.ndarray
+        Whether each chunk has been summarized.
+    mins, maxs : np.ndarray
+        Smallest and largest finite value of each chunk, or NaN for chunks
+        without any.
+
+    Notes
+    -----
+    The histograms are only stored for the chunks that have been summarized,
+    in rows of arrays that grow as chunks are summarized, so that the
+    statistics of arrays with many chunks of which few are read stay small.
+
+    The same statistics can be used by several threads, e.g. those computing
+    the histogram and the range of an image, so recording the summary of a
+    chunk and reading the statistics hold a lock. Chunks can be read and
+    summarized outside of it with `summarize_values`.
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, ...],
+        dtype: np.dtype,
+        boundaries: list[np.ndarray],
+        key: str | None = None,
+        fingerprints: np.ndarray | None = None,
+    ) -> None:
+        self.shape = tuple(int(s) for s in shape)
+        self.dtype = np.dtype(dtype)
+        self.boundaries = boundaries
+        self.key = key
+        self.fingerprints = fingerprints
+        sizes = np.ones(1, dtype=np.int64)
+        for b in boundaries:
+            sizes = np.multiply.outer(sizes, np.diff(b)).ravel()
+        self.sizes = sizes
+        n_chunks = len(sizes)
+        self.computed = np.zeros(n_chunks, dtype=bool)
+        self.mins = np.full(n_chunks, np.nan)
+        self.maxs = np.full(n_chunks, np.nan)
+        # the row of the histogram of each chunk, or -1 if it has none
+        self._rows = np.full(n_chunks, -1, dtype=np.int64)
+        self._n_rows = 0
+        self._counts = np.zeros((0, SUMMARY_BINS), dtype=np.uint32)
+        self._means = np.zeros((0, SUMMARY_BINS), dtype=np.float32)
+        # whether the statistics changed since they were saved or loaded
+        self._modified = False
+        self._lock = threading.RLock()
+
+    @property
+    def n_chunks(self) -> int:
+        """Number of chunks of the array."""
+        return len(self.computed)
+
+    @property
+    def complete(self) -> bool:
+        """Whether all the chunks have been summarized."""
+        return bool(self.computed.all())
+
+    @property
+    def fraction(self) -> float:
+        """Fraction of the elements of the array in summarized chunks."""
+        total = self.sizes.sum()
+        if total == 0:
+            return 1.0
+        with self._lock:
+            return float(self.sizes[self.computed].sum() / total)
+
+    @property
+    def counts(self) -> np.ndarray:
+        """(M, SUMMARY_BINS) array of the bin counts of summarized chunks."""
+        return self.summaries()[0]
+
+    @property
+    def means(self) -> np.ndarray:
+        """(M, SUMMARY_BINS) array of the bin means of summarized chunks."""
+        return self.summaries()[1]
+
+    def summaries(
+        self, indices: Sequence[int] | np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the histograms of some summarized chunks.
+
+        Parameters
+        ----------
+        indices : sequence of int, optional
+            The chunks, by default all the summarized chunks.
+
+        Returns
+        -------
+        counts, means : np.ndarray
+            (M, SUMMARY_BINS) arrays of the number and mean of the values in
+            each bin of each chunk.
+        """
+        with self._lock:
+            if indices is None:
+                indices = np.flatnonzero(self.computed)
+            rows = self._rows[np.asarray(indices, dtype=np.intp)]
+            return self._counts[rows], self._means[rows]
+
+    def _row(self, index: int) -> int:
+        """Return the row of the histogram of a chunk, adding one if needed."""
+        row = int(self._rows[index])
+        if row >= 0:
+            return row
+        row = self._n_rows
+        if row == len(self._counts):
+            capacity = min(max(_MIN_SUMMARIES, 2 * row), self.n_chunks)
+            counts = np.zeros((capacity, SUMMARY_BINS), dtype=np.uint32)
+            means = np.zeros((capacity, SUMMARY_BINS), dtype=np.float32)
+            counts[:row] = self._counts[:row]
+            means[:row] = self._means[:row]
+            self._counts, self._means = counts, means
+        self._rows[index] = row
+        self._n_rows += 1
+        return row
+
+    def _matches(
+        self, shape: tuple[int, ...], dtype: Any, boundaries: list[np.ndarray]
+    ) -> bool:
+        return (
+            self.shape == shape
+            and self.dtype == np.dtype(dtype)
+            and len(self.boundaries) == len(boundaries)
+            and all(
+                np.array_equal(a, b)
+                for a, b in zip(self.boundaries, boundaries, strict=True)
+            )
+        )
+
+    def _refresh(self, fingerprints: np.ndarray) -> None:
+        """Forget the statistics of the chunks whose files changed."""
+        if self.fingerprints is None:
+            changed = np.ones(self.n_chunks, dtype=bool)
+        else:
+            changed = np.any(self.fingerprints != fingerprints, axis=1)
+        with self._lock:
+            if changed.any():
+                self.computed[changed] = False
+                self._modified = True
+            self.fingerprints = fingerprints
+
+    def read_chunk(
+        self, data: Any, index: int
+    ) -> tuple[float, float, np.ndarray, np.ndarray]:
+        """Read a chunk of the array and return its summary.
+
+        The summary is not recorded, see `summarize_values`.
+        """
+        values = np.asarray(data[chunk_slices(self.boundaries, index)])
+        return self.summarize_values(values.ravel())
+
+    def summarize_chunk(self, data: Any, index: int) -> None:
+        """Read a chunk of the array and record its statistics."""
+        self.record(index, *self.read_chunk(data, index))
+
+    def summarize(self, index: int, values: np.ndarray) -> None:
+        """Record the statistics of a chunk given its flattened values."""
+        self.record(index, *self.summarize_values(values))
+
+    def summarize_values(
+        self, values: np.ndarray
+    ) -> tuple[float, float, np.ndarray, np.ndarray]:
+        """Return the summary of the flattened values of a chunk.
+
+        This does not change the statistics, so that chunks can be
+        summarized in other threads and recorded with `record`.
+
+        Returns
+        -------
+        low, high : float
+            Smallest and largest finite value, or NaN if there is none.
+        counts, sums : np.ndarray
+            Number and sum of the values in each bin.
+        """
+        if values.dtype.kind == 'f':
+            finite = np.isfinite(values)
+            if not finite.all():
+                values = values[finite]
+        counts = np.zeros(SUMMARY_BINS, dtype=np.int64)
+        sums = np.zeros(SUMMARY_BINS, dtype=np.float64)
+        low = high = np.nan
+        if values.size:
+            low, high = float(values.min()), float(values.max())
+            width = float(self._bin_widths(low, high))
+            for start in range(0, values.size, _BLOCK_SIZE):
+                block = values[start : start + _BLOCK_SIZE]
+                bins = ((block.astype(np.float64) - low) / width).astype(
+                    np.intp
+                )
+                np.clip(bins, 0, SUMMARY_BINS - 1, out=bins)
+                counts += np.bincount(bins, minlength=SUMMARY_BINS)
+                sums += np.bincount(
+                    bins, weights=block, minlength=SUMMARY_BINS
+                )
+        return low, high, counts, sums
+
+    def record(
+        self,
+        index: int,
+        low: float,
+        high: float,
+        counts: np.ndarray,
+        sums: np.ndarray,
+    ) -> None:
+        """Record the summary of a chunk, as returned by `summarize_values`."""
+        with self._lock:
+            row = self._row(index)
+            self.mins[index] = low
+            self.maxs[index] = high
+            self._counts[row] = counts
+            self._means[row] = sums / np.maximum(counts, 1)
+            self.computed[index] = True
+            self._modified = True
+
+    def _bin_widths(self, low: Any, high: Any) -> np.ndarray:
+        """Return the width of the bins of chunks given their range."""
+        width = np.divide(np.subtract(high, low), SUMMARY_BINS)
+        if self.dtype.kind in 'iub':
+            return np.maximum(width, 1.0)
+        return np.where(width == 0, 1.0, width)
+
+    def value_range(self) -> tuple[float, float] | None:
+        """Return the range of the values of the summarized chunks.
+
+        None is returned when they do not have any finite value.
+        """
+        with self._lock:
+            computed = self.computed.copy()
+            mins, maxs = self.mins[computed], self.maxs[computed]
+        if np.isnan(mins).all():
+            return None
+        return float(np.nanmin(mins)), float(np.nanmax(maxs))
+
+    def histogram(
+        self,
+        bins: int,
+        value_range: tuple[float, float],
+        indices: Sequence[int] | np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Estimate the histogram of the values of summarized chunks.
+
+        Parameters
+        ----------
+        bins : int
+            Number of bins.
+        value_range : tuple of float
+            Range of the bins, as in ``np.histogram``.
+        indices : sequence of int, optional
+            The chunks to include, by default all the summarized chunks.
+
+        Returns
+        -------
+        np.ndarray
+            The number of values in each bin.
+        """
+        with self._lock:
+            if indices is None:
+                indices = np.flatnonzero(self.computed)
+            indices = np.asarray(indices, dtype=np.intp)
+            lows, highs = self.mins[indices], self.maxs[indices]
+            counts, means = self.summaries(indices)
+        widths = self._bin_widths(lows, highs)
+        # the values of a bin are all the same in constant chunks and in
+        # integer chunks with bins of width 1, and are otherwise assumed to
+        # be evenly spread over the bin
+        discrete = lows == highs
+        if self.dtype.kind in 'iub':
+            discrete |= widths == 1
+        point = (counts > 0) & discrete[:, np.newaxis]
+        spread = (counts > 0) & ~discrete[:, np.newaxis]
+        hist, edges = np.histogram(
+            means[point],
+            bins=bins,
+            range=value_range,
+            weights=counts[point],
+        )
+        hist = hist.astype(np.float64)
+        if spread.any():
+            starts = (
+                lows[:, np.newaxis]
+                + np.arange(SUMMARY_BINS) * widths[:, np.newaxis]
+            )
+            stops = starts + widths[:, np.newaxis]
+            hist += np.diff(
+                _spread_counts(
+                    edges, starts[spread], stops[spread], counts[spread]
+                )
+            )
+        return hist
+
+    def percentiles(self, q: Sequence[float]) -> list[float]:
+        """Estimate percentiles of the values of the summarized chunks.
+
+        Parameters
+        ----------
+        q : sequence of float
+            The percentiles, between 0 and 100.
+        """
+        with self._lock:
+            value_range = self.value_range()
+            counts, means = self.summaries()
+        if value_range is None:
+            return [0.0] * len(q)
+        counts, means = counts.ravel(), means.ravel()
+        # merge the bins of all the chunks into finer bins, rather than
+        # sorting the means of every bin
+        low, high = value_range
+        width = (high - low) / _PERCENTILE_BINS or 1.0
+        bins = ((means.astype(np.float64) - low) / width).astype(np.intp)
+        np.clip(bins, 0, _PERCENTILE_BINS - 1, out=bins)
+        merged_counts = np.bincount(
+            bins, weights=counts, minlength=_PERCENTILE_BINS
+        )
+        merged_sums = np.bincount(
+            bins, weights=means * counts, minlength=_PERCENTILE_BINS
+        )
+        cumulative = np.cumsum(merged_counts)
+        ranks = np.asarray(q, dtype=np.float64) / 100 * (cumulative[-1] - 1)
+        positions = np.searchsorted(cumulative, ranks, side='right')
+        positions = np.minimum(positions, _PERCENTILE_BINS - 1)
+        return (merged_sums[positions] / merged_counts[positions]).tolist()
+
+
+def _spread_counts(
+    x: np.ndarray, starts: np.ndarray, stops: np.ndarray, counts: np.ndarray
+) -> np.ndarray:
+    """Return the number of values below x, given counts of values evenly
+    spread over intervals.
+
+    The number is a sum of ramps, evaluated from the cumulative sums of their
+    slopes sorted by where they start and stop.
+    """
+    slopes = counts / (stops - starts)
+    breaks = np.concatenate([starts, stops])
+    changes = np.concatenate([slopes, -slopes])
+    order = np.argsort(breaks, kind='stable')
+    breaks, changes = breaks[order], changes[order]
+    slope = np.concatenate([[0.0], np.cumsum(changes)])
+    offset = np.concatenate([[0.0], np.cumsum(changes * breaks)])
+    before = np.searchsorted(breaks, x, side='right')
+    return x * slope[before] - offset[before]
+
+
+# Statistics of arrays stored on disk by location, most recently used last.
+_stored: OrderedDict[str, ChunkStatistics] = OrderedDict()
+# Statistics of other arrays, by id of the array, along with a weak
+# reference to the array so that reused ids are not mistaken for it.
+_by_id: dict[int, tuple[weakref.ref, ChunkStatistics]] = {}
+
+
+def chunk_statistics(data: Any, create: bool = True) -> ChunkStatistics | None:
+    """Return the statistics of the chunks of an array.
+
+    Parameters
+    ----------
+    data : array-like
+        The array, e.g. a numpy, dask or zarr array.
+    create : bool
+        Whether to register empty statistics for an array that does not
+        have any yet, rather than return None.
+
+    Returns
+    -------
+    ChunkStatistics or None
+        The statistics of the array. When they are persisted, the chunks of
+        arrays stored on disk modified since they were summarized are marked
+        as not summarized. When the registry is disabled by the experimental
+        settings, new statistics are returned (or None if not ``create``).
+    """
+    shape = tuple(int(s) for s in data.shape)
+    boundaries = chunk_boundaries(data)
+    settings = get_settings().experimental
+    if not (
+        settings.cache_chunk_statistics or settings.persist_chunk_statistics
+    ):
+        if not create:
+            return None
+        return ChunkStatistics(shape, data.dtype, boundaries)
+    source = key = None
+    if settings.persist_chunk_statistics:
+        source = _zarr_source(data, boundaries)
+        key = _store_key(source) if source is not None else None
+    if key is None:
+        entry = _by_id.get(id(data))
+        if entry is not None and entry[0]() is data:
+            return entry[1]
+        if not create:
+            return None
+        stats = ChunkStatistics(shape, data.dtype, boundaries)
+        data_id = id(data)
+        try:
+            ref = weakref.ref(data, lambda _: _by_id.pop(data_id, None))
+        except TypeError:
+            # the array type does not support weak references
+            return stats
+        _by_id[data_id] = (ref, stats)
+        return stats
+
+    found = _stored.pop(key, None)
+    if found is not None and not found._matches(shape, data.dtype, boundaries):
+        found = None
+    if found is None:
+        found = _load_chunk_statistics(key, shape, data.dtype, boundaries)
+    if found is not None:
+        found._refresh(_chunk_fingerprints(source, boundaries))
+    elif create:
+        found = ChunkStatistics(
+            shape,
+            data.dtype,
+            boundaries,
+            key,
+            _chunk_fingerprints(source, boundaries),
+        )
+    else:
+        return None
+    _stored[key] = found
+    while len(_stored) > _MAX_STORED:
+        _stored.popitem(last=False)
+    return found
+
+
+def save_chunk_statistics(stats: ChunkStatistics) -> None:
+    """Save the statistics of an array stored on disk in the cache directory.
+
+    This only happens when the ``persist_chunk_statistics`` experimental
+    setting is enabled, and the statistics changed since they were loaded.
+    """
+    if (
+        stats.key is None
+        or not stats._modified
+        or not get_settings().experimental.persist_chunk_statistics
+    ):
+        return
+    path = _sidecar_path(stats.key)
+    temporary = path.with_suffix('.tmp.npz')
+    with stats._lock:
+        arrays = {
+            'key': np.array(stats.key),
+            'shape': np.array(stats.shape, dtype=np.int64),
+            'dtype': np.array(stats.dtype.str),
+            'boundaries': np.concatenate(stats.boundaries),
+            'fingerprints': stats.fingerprints,
+            'computed': stats.computed.copy(),
+            'mins': stats.mins.copy(),
+            'maxs': stats.maxs.copy(),
+            'rows': stats._rows.copy(),
+            'counts': stats._counts[: stats._n_rows].copy(),
+            'means': stats._means[: stats._n_rows].copy(),
+        }
+        stats._modified = False
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(temporary, **arrays)
+        os.replace(temporary, path)
+    except OSError:
+        logger.warning('Could not save chunk statistics', exc_info=True)
+        stats._modified = True
+
+
+def _load_chunk_statistics(
+    key: str, shape: tuple[int, ...], dtype: Any, boundaries: list[np.ndarray]
+) -> ChunkStatistics | None:
+    """Load the statistics saved for an array, if they still match it."""
+    path = _sidecar_path(key)
+    if not path.exists():
+        return None
+    try:
+        with np.load(path) as saved:
+            if (
+                str(saved['key']) != key
+                or tuple(saved['shape'].tolist()) != shape
+                or str(saved['dtype']) != np.dtype(dtype).str
+                or not np.array_equal(
+                    saved['boundaries'], np.concatenate(boundaries)
+                )
+            ):
+                return None
+            stats = ChunkStatistics(
+                shape, dtype, boundaries, key, saved['fingerprints']
+            )
+            stats.computed = saved['computed']
+            stats.mins = saved['mins']
+            stats.maxs = saved['maxs']
+            stats._rows = saved['rows']
+            stats._counts = saved['counts']
+            stats._means = saved['means']
+            stats._n_rows = len(stats._counts)
+    except (OSError, KeyError, ValueError):
+        logger.warning('Could not load chunk statistics', exc_info=True)
+        return None
+    return stats
+
+
+def _sidecar_path(key: str) -> Path:
+    name = hashlib.sha1(key.encode()).hexdigest()
+    return Path(user_cache_dir()) / 'chunk_statistics' / f'{name}.npz'
+
+
+def _is_zarr_array(obj: Any) -> bool:
+    return type(obj).__module__.split('.')[0] == 'zarr' and hasattr(
+        obj, 'store_path'
+    )
+
+
+def _zarr_source(data: Any, boundaries: list[np.ndarray]) -> Any | None:
+    """Return the zarr array holding the data, with the same chunks, if any.
+
+    This is the array itself, or the array read by a dask array made with
+    ``dask.array.from_zarr``.
+    """
+    if _is_zarr_array(data):
+        return data
+    if not _is_dask_data(data) or not hasattr(data, 'name'):
+        return None
+    layers = data.__dask_graph__().layers
+    original = layers.get(f'original-{data.name}')
+    if len(layers) != 2 or original is None or len(original) != 1:
+        return None
+    (array,) = original.values()
+    if (
+        not _is_zarr_array(array)
+        or tuple(array.shape) != tuple(data.shape)
+        or not all(
+            np.array_equal(a, b)
+            for a, b in zip(chunk_boundaries(array), boundaries, strict=True)
+        )
+    ):
+        return None
+    return array
+
+
+def _local_directory(array: Any) -> Path | None:
+    """Return the directory of a zarr array in a local store, if it is.
+
+    Sharded arrays are excluded, since their chunks do not have a file each.
+    """
+    if getattr(array, 'shards', None) is not None:
+        return None
+    store = array.store
+    root = getattr(store, 'root', None)
+    if root is None:
+        # e.g. an fsspec store on the local file system, as made by
+        # dask.array.from_zarr when given a path
+        fs = getattr(store, 'fs', None)
+        fs = getattr(fs, 'sync_fs', fs)
+        protocol = getattr(fs, 'protocol', ())
+        if isinstance(protocol, str):
+            protocol = (protocol,)
+        if 'file' not in protocol:
+            return None
+        root = store.path
+    return Path(root, array.path).resolve()
+
+
+def _store_key(array: Any) -> str | None:
+    """Return the location of a zarr array in a local store, if it is."""
+    directory = _local_directory(array)
+    return None if directory is None else directory.as_uri()
+
+
+def _file_stats(root: Path) -> dict[str, tuple[int, int]]:
+    """Return the size and modification time of the files under a directory.
+
+    The directory is listed in a single pass with ``os.scandir``, rather
+    than querying each file separately, and the files are identified by
+    their path relative to the directory, with ``/`` separators.
+    """
+    found: dict[str, tuple[int, int]] = {}
+    pending = [(str(root), '')]
+    while pending:
+        directory, prefix = pending.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((entry.path, f'{prefix}{entry.name}/'))
+                else:
+                    stat = entry.stat()
+                    found[prefix + entry.name] = (
+                        stat.st_size,
+                        stat.st_mtime_ns,
+                    )
+            except OSError:
+                continue
+    return found
+
+
+def _chunk_fingerprints(
+    array: Any, boundaries: list[np.ndarray]
+) -> np.ndarray:
+    """Return the size and modification time of the file of each chunk."""
+    root = _local_directory(array)
+    files = _file_stats(root) if root is not None else {}
+    grid = [len(b) - 1 for b in boundaries]
+    fingerprints = np.full((math.prod(grid), 2), -1, dtype=np.int64)
+    # chunks that were never written are filled with the fill value and
+    # keep the fingerprint -1
+    missing = (-1, -1)
+    for index, coords in enumerate(np.ndindex(*grid)):
+        fingerprints[index] = files.get(
+            array.metadata.encode_chunk_key(coords), missing
+        )
+    return fingerprints
@@ -0,0 +1,145 @@
+"""Streaming estimation of the range of values of large arrays.
+
+The chunks of the array are summarized in parallel threads and in random
+order, so that the estimates yielded along the way are representative of the
+whole array before the exact range is known. The summaries are kept with the
+statistics of the chunks of the array, so that the chunks are only read
+once.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import numpy as np
+
+from napari.layers.utils._chunk_stats import (
+    ChunkStatistics,
+    chunk_statistics,
+    save_chunk_statistics,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Sequence
+
+__all__ = (
+    'DataRangeEstimate',
+    'cached_data_range',
+    'iter_data_range',
+)
+
+DEFAULT_PERCENTILES: tuple[float, ...] = (0.1, 99.9)
+# Number of intermediate estimates yielded while visiting the chunks.
+_N_ESTIMATES: int = 100
+
+
+class DataRangeEstimate(NamedTuple):
+    """Estimate of the range of the finite values of an array.
+
+    Attributes
+    ----------
+    min : float
+        The smallest value found so far.
+    max : float
+        The largest value found so far.
+    percentiles : dict of float to float
+        Percentiles of the values, estimated from the histograms of
+        the chunks visited so far.
+    fraction : float
+        Fraction of the array visited so far. Once it is 1, ``min`` and
+        ``max`` are exact.
+    """
+
+    min: float
+    max: float
+    percentiles: dict[float, float]
+    fraction: float
+
+    @property
+    def done(self) -> bool:
+        """Whether the whole array has been visited."""
+        return self.fraction >= 1
+
+
+def cached_data_range(
+    data: Any, percentiles: Sequence[float] = DEFAULT_PERCENTILES
+) -> DataRangeEstimate | None:
+    """Return the exact estimate of the range of an array, if known.
+
+    This is the case when all its chunks have been summarized, e.g. by
+    `iter_data_range`, possibly in a previous session for arrays stored on
+    disk.
+    """
+    stats = chunk_statistics(data, create=False)
+    if stats is None or not stats.complete:
+        return None
+    return _make_estimate(stats, percentiles)
+
+
+def iter_data_range(
+    data: Any,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    *,
+    workers: int | None = None,
+) -> Generator[DataRangeEstimate, None, None]:
+    """Yield progressively refined estimates of the range of an array.
+
+    Chunks that were not summarized yet are read in parallel threads and in
+    random order, and up to about 100 intermediate estimates are yielded
+    before the exact one.
+
+    Parameters
+    ----------
+    data : array-like
+        The array, e.g. a numpy, dask or zarr array.
+    percentiles : sequence of float
+        The percentiles to estimate, between 0 and 100.
+    workers : int, optional
+        Number of threads reading chunks, by default the number of CPUs.
+
+    Yields
+    ------
+    DataRangeEstimate
+        The estimates, the last one being exact.
+    """
+    stats = chunk_statistics(data)
+    missing = np.random.default_rng(0).permutation(
+        np.flatnonzero(~stats.computed)
+    )
+    step = max(1, len(missing) // _N_ESTIMATES)
+    pool = ThreadPoolExecutor(max_workers=workers or os.cpu_count())
+    try:
+        # the chunks are read and summarized by the threads, but their
+        # summaries are recorded here, between the estimates
+        summaries = pool.map(lambda i: stats.read_chunk(data, int(i)), missing)
+        for n_summarized, (index, summary) in enumerate(
+            zip(missing, summaries, strict=True), start=1
+        ):
+            stats.record(int(index), *summary)
+            if n_summarized % step == 0 and n_summarized < len(missing):
+                yield _make_estimate(stats, percentiles)
+    finally:
+        # when the generator is closed early, do not wait for the chunks
+        # that are not read yet
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    save_chunk_statistics(stats)
+    yield _make_estimate(stats, percentiles)
+
+
+def _make_estimate(
+    stats: ChunkStatistics, percentiles: Sequence[float]
+) -> DataRangeEstimate:
+    value_range = stats.value_range()
+    if value_range is None:
+        # no finite value, use the same fallback as calc_data_range
+        return DataRangeEstimate(
+            0.0, 1.0, dict.fromkeys(percentiles, 0.0), stats.fraction
+        )
+    return DataRangeEstimate(
+        *value_range,
+        dict(zip(percentiles, stats.percentiles(percentiles), strict=True)),
+        stats.fraction,
+    )
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+
+class _SliceCache:
+    """A thread-safe, bounded, least-recently-used cache of slice responses.
+
+    Slice requests look up their response in this cache before reading any
+    data, and store it there once computed. This allows slices that were
+    computed speculatively (e.g. prefetched while playing an axis) or
+    previously (e.g. when toggling between two planes) to be reused without
+    reading the data again, whatever the array backend.
+
+    Because requests may complete on a slicing thread after the cache was
+    cleared (e.g. because the underlying data changed), each request should
+    capture the ``generation`` of the cache when it is made and pass it to
+    ``put``, so that responses computed from outdated data are discarded.
+
+    Parameters
+    ----------
+    max_entries : int or None
+        The maximum number of responses kept. If None, the number of
+        responses is not limited. If 0, nothing is cached.
+    max_bytes : int or None
+        The maximum total size in bytes of the responses kept. If None,
+        the size is not limited. If 0, nothing is cached.
+
+    Attributes
+    ----------
+    generation : int
+        The version of the cached data, incremented every time the
+        cache is cleared.
+    hits : int
+        The number of lookups that found a response.
+    misses : int
+        The number of lookups that did not find a response.
+    """
+
+    def __init__(
+        self, max_entries: int | None = 0, max_bytes: int | None = None
+    ) -> None:
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._nbytes = 0
+        self._lock = Lock()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_entries(self) -> int | None:
+        """The maximum number of responses kept in the cache."""
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, max_entries: int | None) -> None:
+        with self._lock:
+            self._max_entries = max_entries
+            self._evict()
+
+    @property
+    def max_bytes(self) -> int | None:
+        """The maximum total size in bytes of the responses in the cache."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes: int | None) -> None:
+        with self._lock:
+            self._max_bytes = max_bytes
+            self._evict()
+
+    @property
+    def enabled(self) -> bool:
+        """True if responses can be stored in the cache, False otherwise."""
+        return self._max_entries != 0 and self._max_bytes != 0
+
+    @property
+    def nbytes(self) -> int:
+        """The total size in bytes of the responses in the cache."""
+        return self._nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the response for the given key, or None if not cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(
+        self, key: Hashable, value: Any, generation: int, nbytes: int = 0
+    ) -> None:
+        """Store the response for the given key.
+
+        The response is dropped if the cache has been cleared since the
+        given generation, or if it is larger than the whole cache.
+        """
+        with self._lock:
+            if generation != self.generation or not self.enabled:
+                return
+            if self._max_bytes is not None and nbytes > self._max_bytes:
+                return
+            if key in self._entries:
+                self._nbytes -= self._entries[key][1]
+            self._entries[key] = (value, nbytes)
+            self._entries.move_to_end(key)
+            self._nbytes += nbytes
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all responses and invalidate in-flight requests."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+            self.generation += 1
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (
+                self._max_entries is not None
+                and len(self._entries) > self._max_entries
+            )
+            or (self._max_bytes is not None and self._nbytes > self._max_bytes)
+        ):
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self._nbytes -= nbytes
@@ -0,0 +1,417 @@
+"""Spatial indices of points and boxes for fast box queries."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+
+class _SortedAxisIndex:
+    """Index of (N, D) coordinates sorted along each axis.
+
+    The coordinates along an axis are sorted the first time that axis is
+    queried, which takes O(N log N). After that, finding the points within
+    a box takes O(log N + K), where K is the number of points within the
+    range of the most selective axis of the box.
+
+    The index keeps a reference to the coordinates, which must not be
+    modified in place without calling `moved` or `invalidate`. Changes that
+    create a new coordinates array are handled by `appended` and `removed`,
+    which return a new index updated without sorting again.
+
+    Parameters
+    ----------
+    data : (N, D) array
+        The coordinates to index.
+    """
+
+    def __init__(self, data: npt.NDArray) -> None:
+        self.data = data
+        # For each sorted axis, the indices of the points sorted along that
+        # axis and their sorted coordinates along that axis.
+        self._axes: dict[int, tuple[npt.NDArray[np.intp], npt.NDArray]] = {}
+
+    def invalidate(self, axes: Sequence[int] | None = None) -> None:
+        """Forget the sorting along the given axes, or all the axes if None."""
+        if axes is None:
+            self._axes = {}
+            return
+        self._axes = {
+            axis: value
+            for axis, value in self._axes.items()
+            if axis not in axes
+        }
+
+    def _sorted(self, axis: int) -> tuple[npt.NDArray[np.intp], npt.NDArray]:
+        sorted_axis = self._axes.get(axis)
+        if sorted_axis is None:
+            values = self.data[:, axis]
+            order = np.argsort(values, kind='stable')
+            sorted_axis = (order, values[order])
+            # replace the dict so that concurrent queries see a consistent
+            # state without locking
+            self._axes = {**self._axes, axis: sorted_axis}
+        return sorted_axis
+
+    def query_box(
+        self,
+        axes: Sequence[int],
+        low: npt.ArrayLike,
+        high: npt.ArrayLike,
+    ) -> npt.NDArray[np.intp]:
+        """Find the points within a box along some axes.
+
+        Parameters
+        ----------
+        axes : sequence of int
+            The axes along which the box is defined.
+        low : array-like
+            The lower (inclusive) bounds of the box along ``axes``.
+        high : array-like
+            The upper (inclusive) bounds of the box along ``axes``.
+
+        Returns
+        -------
+        indices : array of int
+            The sorted indices of the points within the box.
+        """
+        axes = list(axes)
+        if len(axes) == 0:
+            return np.arange(len(self.data))
+        low = np.broadcast_to(low, len(axes))
+        high = np.broadcast_to(high, len(axes))
+        # Restrict to the axis with the fewest points within its range,
+        # then check the other axes on those points only.
+        best = None
+        for i, axis in enumerate(axes):
+            order, values = self._sorted(axis)
+            start = np.searchsorted(values, low[i], side='left')
+            stop = np.searchsorted(values, high[i], side='right')
+            if best is None or stop - start < best[2] - best[1]:
+                best = (order, start, stop, i)
+        assert best is not None
+        order, start, stop, best_index = best
+        candidates = order[start:stop]
+        others = [i for i in range(len(axes)) if i != best_index]
+        if others and len(candidates) > 0:
+            coords = self.data[np.ix_(candidates, [axes[i] for i in others])]
+            inside = np.all(
+                (coords >= low[others]) & (coords <= high[others]), axis=1
+            )
+            candidates = candidates[inside]
+        return np.sort(candidates)
+
+    def bounds(
+        self, axes: Sequence[int]
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Return the minimum and maximum coordinates along some axes.
+
+        Like ``np.min`` and ``np.max``, the bounds along an axis are NaN if
+        any coordinate along that axis is NaN.
+
+        Parameters
+        ----------
+        axes : sequence of int
+            The axes along which to compute the bounds.
+
+        Returns
+        -------
+        mins, maxs : array of float
+            The bounds along each of ``axes``.
+        """
+        mins = np.full(len(axes), np.nan)
+        maxs = np.full(len(axes), np.nan)
+        if len(self.data) == 0:
+            return mins, maxs
+        for i, axis in enumerate(axes):
+            _, values = self._sorted(axis)
+            # NaNs are sorted last
+            if not np.isnan(values[-1]):
+                mins[i] = values[0]
+                maxs[i] = values[-1]
+        return mins, maxs
+
+    def appended(self, data: npt.NDArray) -> _SortedAxisIndex:
+        """Return an index of data made by appending points to the data.
+
+        Parameters
+        ----------
+        data : (M, D) array
+            The coordinates of the indexed points followed by the
+            coordinates of the appended points.
+        """
+        index = _SortedAxisIndex(data)
+        n_old = len(self.data)
+        new_indices = np.arange(n_old, len(data))
+        for axis, (order, values) in self._axes.items():
+            new_values = data[n_old:, axis]
+            new_order = np.argsort(new_values, kind='stable')
+            new_values = new_values[new_order]
+            positions = np.searchsorted(values, new_values, side='right')
+            index._axes[axis] = (
+                np.insert(order, positions, new_indices[new_order]),
+                np.insert(values, positions, new_values),
+            )
+        return index
+
+    def removed(
+        self, indices: npt.ArrayLike, data: npt.NDArray
+    ) -> _SortedAxisIndex:
+        """Return an index of data made by removing points from the data.
+
+        Parameters
+        ----------
+        indices : array-like of int
+            The indices of the removed points.
+        data : (M, D) array
+            The coordinates of the remaining points.
+        """
+        index = _SortedAxisIndex(data)
+        is_removed = np.zeros(len(self.data), dtype=bool)
+        is_removed[np.asarray(indices, dtype=np.intp)] = True
+        # the number of removed points before each point
+        shifts = np.cumsum(is_removed)
+        for axis, (order, values) in self._axes.items():
+            keep = ~is_removed[order]
+            kept_order = order[keep]
+            index._axes[axis] = (
+                kept_order - shifts[kept_order],
+                values[keep],
+            )
+        return index
+
+    def moved(self, indices: npt.ArrayLike, axes: Sequence[int]) -> None:
+        """Update the index after some points were moved in place.
+
+        Parameters
+        ----------
+        indices : array-like of int
+            The indices of the moved points.
+        axes : sequence of int
+            The axes along which the points were moved.
+        """
+        indices = np.unique(np.asarray(indices, dtype=np.intp))
+        is_moved = np.zeros(len(self.data), dtype=bool)
+        is_moved[indices] = True
+        sorted_axes = dict(self._axes)
+        for axis in axes:
+            if axis not in sorted_axes:
+                continue
+            order, values = sorted_axes[axis]
+            keep = ~is_moved[order]
+            order, values = order[keep], values[keep]
+            new_values = self.data[indices, axis]
+            new_order = np.argsort(new_values, kind='stable')
+            new_values = new_values[new_order]
+            positions = np.searchsorted(values, new_values, side='right')
+            sorted_axes[axis] = (
+                np.insert(order, positions, indices[new_order]),
+                np.insert(values, positions, new_values),
+            )
+        self._axes = sorted_axes
+
+
+class _BoxTree:
+    """Bounding volume hierarchy of (N, D) axis-aligned boxes.
+
+    The boxes are ordered along a Z-order curve through their centers and
+    grouped into nodes of ``node_size`` consecutive boxes, which are grouped
+    in the same way up to a single root node. Building the tree takes
+    O(N log N). Finding the boxes that overlap a query box or cross a line
+    then visits only the nodes whose bounds overlap the query, which takes
+    about O(log N + K) for K matching boxes when the boxes are small
+    compared to their spread.
+
+    Boxes that change without being added or removed are updated with
+    `refit`, which only recomputes the bounds of their ancestor nodes. The
+    order of the boxes is kept, so the tree stays correct but becomes less
+    selective if boxes move far from where they were when it was built.
+
+    Parameters
+    ----------
+    mins : (N, D) array
+        The minimum corner of each box.
+    maxs : (N, D) array
+        The maximum corner of each box.
+    node_size : int
+        The number of children of each node of the tree.
+    """
+
+    # Number of bits of the quantized center coordinates along each axis
+    # used to order the boxes along the Z-order curve.
+    _CURVE_BITS = 10
+
+    def __init__(
+        self, mins: npt.ArrayLike, maxs: npt.ArrayLike, node_size: int = 16
+    ) -> None:
+        mins = np.asarray(mins, dtype=np.float64)
+        maxs = np.asarray(maxs, dtype=np.float64)
+        self.node_size = node_size
+        self._order = self._curve_order((mins + maxs) / 2)
+        # the position of each box in the order of the tree
+        self._positions = np.empty_like(self._order)
+        self._positions[self._order] = np.arange(len(self._order))
+        # Bounds of the nodes of each level of the tree, starting with the
+        # boxes themselves and ending with the root.
+        self._levels = [(mins[self._order], maxs[self._order])]
+        while len(self._levels[-1][0]) > 1:
+            level_mins, level_maxs = self._levels[-1]
+            starts = np.arange(0, len(level_mins), node_size)
+            self._levels.append(
+                (
+                    np.minimum.reduceat(level_mins, starts, axis=0),
+                    np.maximum.reduceat(level_maxs, starts, axis=0),
+                )
+            )
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    @classmethod
+    def _curve_order(cls, centers: npt.NDArray) -> npt.NDArray[np.intp]:
+        """Return the order of points along a Z-order curve."""
+        if len(centers) < 2:
+            return np.arange(len(centers))
+        low = np.nanmin(centers, axis=0)
+        extent = np.nanmax(centers, axis=0) - low
+        extent[~(extent > 0)] = 1
+        size = 2**cls._CURVE_BITS
+        quantized = np.clip(
+            np.nan_to_num((centers - low) / extent * size), 0, size - 1
+        ).astype(np.int64)
+        ndim = centers.shape[1]
+        codes = np.zeros(len(centers), dtype=np.int64)
+        for bit in range(cls._CURVE_BITS):
+            for axis in range(ndim):
+                codes |= ((quantized[:, axis] >> bit) & 1) << (
+                    bit * ndim + axis
+                )
+        return np.argsort(codes, kind='stable')
+
+    def bounds(self) -> tuple[npt.NDArray, npt.NDArray]:
+        """Return the minimum and maximum corners of all the boxes."""
+        return self._levels[-1][0][0], self._levels[-1][1][0]
+
+    def refit(
+        self, indices: npt.ArrayLike, mins: npt.ArrayLike, maxs: npt.ArrayLike
+    ) -> None:
+        """Update the tree after some boxes changed.
+
+        Parameters
+        ----------
+        indices : array-like of int
+            The indices of the changed boxes.
+        mins : (M, D) array
+            The new minimum corner of each changed box.
+        maxs : (M, D) array
+            The new maximum corner of each changed box.
+        """
+        positions = self._positions[np.asarray(indices, dtype=np.intp)]
+        self._levels[0][0][positions] = mins
+        self._levels[0][1][positions] = maxs
+        children = np.arange(self.node_size)
+        for level in range(1, len(self._levels)):
+            positions = np.unique(positions // self.node_size)
+            child_mins, child_maxs = self._levels[level - 1]
+            # the last node can have fewer children, repeat its last child
+            child_positions = np.minimum(
+                positions[:, np.newaxis] * self.node_size + children,
+                len(child_mins) - 1,
+            )
+            level_mins, level_maxs = self._levels[level]
+            level_mins[positions] = child_mins[child_positions].min(axis=1)
+            level_maxs[positions] = child_maxs[child_positions].max(axis=1)
+
+    def _query(
+        self, overlaps: Callable[[npt.NDArray, npt.NDArray], npt.NDArray]
+    ) -> npt.NDArray[np.intp]:
+        """Find the boxes for which ``overlaps(mins, maxs)`` is True.
+
+        ``overlaps`` must be True for a node whenever it is True for any of
+        the boxes within that node.
+        """
+        if len(self) == 0:
+            return np.empty(0, dtype=np.intp)
+        candidates = np.zeros(1, dtype=np.intp)
+        children = np.arange(self.node_size)
+        for level in range(len(self._levels) - 1, -1, -1):
+            level_mins, level_maxs = self._levels[level]
+            candidates = candidates[
+                overlaps(level_mins[candidates], level_maxs[candidates])
+            ]
+            if level > 0:
+                candidates = (
+                    candidates[:, np.newaxis] * self.node_size + children
+                ).ravel()
+                candidates = candidates[
+                    candidates < len(self._levels[level - 1][0])
+                ]
+        return np.sort(self._order[candidates])
+
+    def query_box(
+        self, low: npt.ArrayLike, high: npt.ArrayLike
+    ) -> npt.NDArray[np.intp]:
+        """Find the boxes that overlap a box.
+
+        Parameters
+        ----------
+        low : array-like
+            The minimum corner of the query box. Boxes that touch the query
+            box are included.
+        high : array-like
+            The maximum corner of the query box.
+
+        Returns
+        -------
+        indices : array of int
+            The sorted indices of the overlapping boxes.
+        """
+        low = np.asarray(low, dtype=np.float64)
+        high = np.asarray(high, dtype=np.float64)
+        return self._query(
+            lambda mins, maxs: np.all((mins <= high) & (maxs >= low), axis=1)
+        )
+
+    def query_line(
+        self, point: npt.ArrayLike, direction: npt.ArrayLike
+    ) -> npt.NDArray[np.intp]:
+        """Find the boxes crossed by an infinite line.
+
+        Parameters
+        ----------
+        point : array-like
+            A point on the line.
+        direction : array-like
+            The direction of the line.
+
+        Returns
+        -------
+        indices : array of int
+            The sorted indices of the boxes crossed by the line.
+        """
+        point = np.asarray(point, dtype=np.float64)
+        direction = np.asarray(direction, dtype=np.float64)
+        parallel = direction == 0
+        # avoid dividing by zero along axes parallel to the line, which are
+        # checked separately
+        inverse = 1 / np.where(parallel, 1, direction)
+
+        def crosses(mins: npt.NDArray, maxs: npt.NDArray) -> npt.NDArray:
+            # parameters of the line at the two planes bounding each axis
+            t_mins = (mins - point) * inverse
+            t_maxs = (maxs - point) * inverse
+            t_near = np.where(parallel, -np.inf, np.minimum(t_mins, t_maxs))
+            t_far = np.where(parallel, np.inf, np.maximum(t_mins, t_maxs))
+            inside_parallel = np.all(
+                ~parallel | ((mins <= point) & (point <= maxs)), axis=1
+            )
+            return inside_parallel & (
+                np.max(t_near, axis=1) <= np.min(t_far, axis=1)
+            )
+
+        return self._query(crosses)
@@ -0,0 +1,168 @@
+from collections import OrderedDict
+
+import dask.array as da
+import numpy as np
+import pytest
+import zarr
+
+from napari.layers.utils import _chunk_stats
+from napari.layers.utils._chunk_stats import (
+    ChunkStatistics,
+    chunk_boundaries,
+    chunk_slices,
+    chunk_statistics,
+    save_chunk_statistics,
+)
+from napari.settings import get_settings
+
+
+@pytest.fixture(autouse=True)
+def _empty_registry(monkeypatch, tmp_path):
+    monkeypatch.setattr(_chunk_stats, '_stored', OrderedDict())
+    monkeypatch.setattr(_chunk_stats, 'user_cache_dir', lambda: tmp_path)
+
+
+def _local_zarr(path):
+    data = zarr.open_array(
+        path, mode='w', shape=(40, 40), chunks=(10, 20), dtype='uint16'
+    )
+    data[:] = np.arange(1600, dtype=np.uint16).reshape(40, 40)
+    return data
+
+
+def _summarize_all(data):
+    stats = chunk_statistics(data)
+    for index in np.flatnonzero(~stats.computed):
+        stats.summarize_chunk(data, index)
+    return stats
+
+
+def test_chunk_slices():
+    boundaries = [np.array([0, 3, 5]), np.array([0, 4, 8, 10])]
+    assert chunk_slices(boundaries, 0) == (slice(0, 3), slice(0, 4))
+    assert chunk_slices(boundaries, 5) == (slice(3, 5), slice(8, 10))
+
+
+def test_integer_statistics_are_exact():
+    data = np.array([[0, 3, 3, 7], [7, 7, 200, np.iinfo(np.int8).max]])
+    data = data.astype(np.int16)
+    stats = ChunkStatistics(
+        data.shape, data.dtype, [np.array([0, 1, 2]), np.array([0, 2, 4])]
+    )
+    for index in range(stats.n_chunks):
+        stats.summarize_chunk(data, index)
+    assert stats.complete
+    assert stats.value_range() == (0, 200)
+    counts = stats.histogram(201, (-0.5, 200.5))
+    np.testing.assert_array_equal(counts, np.bincount(data.ravel())[:201])
+    assert stats.percentiles([0, 50, 100]) == [0, 7, 200]
+
+
+def test_float_statistics_ignore_non_finite_values():
+    data = np.array([np.nan, -np.inf, 0.5, 2.5, np.inf])
+    stats = ChunkStatistics(data.shape, data.dtype, [np.array([0, 3, 5])])
+    stats.summarize_chunk(data, 0)
+    assert not stats.complete
+    assert stats.fraction == pytest.approx(0.6)
+    assert stats.value_range() == (0.5, 0.5)
+    stats.summarize_chunk(data, 1)
+    assert stats.value_range() == (0.5, 2.5)
+    assert stats.histogram(2, (0, 4)).tolist() == [1, 1]
+
+
+def test_statistics_are_only_kept_when_enabled():
+    data = da.zeros((20, 20), chunks=10)
+    stats = chunk_statistics(data)
+    assert chunk_statistics(data) is not stats
+    assert chunk_statistics(data, create=False) is None
+
+
+def test_statistics_of_arrays_in_memory_follow_the_array(tmp_path):
+    get_settings().experimental.cache_chunk_statistics = True
+    data = da.zeros((20, 20), chunks=10)
+    stats = chunk_statistics(data)
+    assert chunk_statistics(data) is stats
+    assert (
+        chunk_statistics(da.zeros((20, 20), chunks=10), create=False) is None
+    )
+    # arrays on disk are not fingerprinted when not persisting
+    data = _local_zarr(tmp_path / 'image.zarr')
+    stats = chunk_statistics(data)
+    assert stats.key is None
+    assert stats.fingerprints is None
+    assert chunk_statistics(data) is stats
+
+
+def test_summaries_are_only_stored_for_summarized_chunks():
+    data = np.arange(10_000, dtype=np.uint16)
+    stats = ChunkStatistics(data.shape, data.dtype, [np.arange(0, 10_001, 10)])
+    assert stats.n_chunks == 1000
+    assert len(stats._counts) == 0
+    for index in (3, 500, 999):
+        stats.summarize_chunk(data, index)
+    assert len(stats._counts) < 100
+    counts, means = stats.summaries([500])
+    assert counts.sum() == 10
+    np.testing.assert_array_equal(means[0][counts[0] > 0], range(5000, 5010))
+    assert stats.counts.shape == (3, _chunk_stats.SUMMARY_BINS)
+
+
+def test_local_zarr_statistics_are_shared_and_refreshed(tmp_path):
+    get_settings().experimental.persist_chunk_statistics = True
+    data = _local_zarr(tmp_path / 'image.zarr')
+    stats = _summarize_all(da.from_zarr(data))
+    assert stats.key == (tmp_path / 'image.zarr').resolve().as_uri()
+    assert stats.n_chunks == 8
+
+    # reopening the same array finds its statistics
+    reopened = da.from_zarr(str(tmp_path / 'image.zarr'))
+    assert chunk_statistics(reopened, create=False) is stats
+    assert stats.complete
+
+    # only the modified chunk is read again
+    data[35, 35] = 5000
+    assert chunk_statistics(reopened) is stats
+    np.testing.assert_array_equal(np.flatnonzero(~stats.computed), [7])
+    stats.summarize_chunk(reopened, 7)
+    assert stats.value_range() == (0, 5000)
+
+    # dask arrays computing something else are not mistaken for the zarr
+    assert chunk_statistics(reopened + 1, create=False) is None
+
+
+def test_statistics_are_saved_between_sessions(tmp_path, monkeypatch):
+    get_settings().experimental.persist_chunk_statistics = True
+    data = _local_zarr(tmp_path / 'image.zarr')
+    stats = _summarize_all(data)
+    save_chunk_statistics(stats)
+
+    # a new session only has the saved statistics
+    monkeypatch.setattr(_chunk_stats, '_stored', OrderedDict())
+    loaded = chunk_statistics(data, create=False)
+    assert loaded is not stats
+    assert loaded.complete
+    assert loaded.value_range() == (0, 1599)
+    np.testing.assert_array_equal(loaded.counts, stats.counts)
+
+    # statistics of a different array with the same location are ignored
+    data = zarr.open_array(
+        tmp_path / 'image.zarr', mode='w', shape=(40, 40), chunks=(20, 20)
+    )
+    monkeypatch.setattr(_chunk_stats, '_stored', OrderedDict())
+    assert chunk_statistics(data, create=False) is None
+
+
+def test_statistics_are_not_saved_by_default(tmp_path):
+    stats = _summarize_all(_local_zarr(tmp_path / 'image.zarr'))
+    save_chunk_statistics(stats)
+    assert not (tmp_path / 'chunk_statistics').exists()
+
+
+def test_chunk_boundaries_of_dask_and_zarr_agree():
+    data = zarr.zeros((25, 30), chunks=(10, 7))
+    for a, b in zip(
+        chunk_boundaries(data),
+        chunk_boundaries(da.from_zarr(data)),
+        strict=True,
+    ):
+        np.testing.assert_array_equal(a, b)
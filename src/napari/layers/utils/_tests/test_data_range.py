@@ -0,0 +1,151 @@
+import threading
+
+import numpy as np
+import pytest
+
+from napari.layers.utils import _chunk_stats
+from napari.layers.utils._chunk_stats import (
+    ChunkStatistics,
+    chunk_boundaries,
+    chunk_statistics,
+)
+from napari.layers.utils._data_range import (
+    cached_data_range,
+    iter_data_range,
+)
+from napari.layers.utils.layer_utils import calc_data_range
+from napari.settings import get_settings
+
+
+@pytest.fixture(autouse=True)
+def _small_slabs(monkeypatch):
+    # split numpy arrays in many chunks
+    monkeypatch.setattr(_chunk_stats, '_SLAB_SIZE', 2**16)
+
+
+def _sparse_volume(n_planes=64):
+    # a few voxels missed by the planes sampled by calc_data_range
+    data = np.zeros((n_planes, 256, 256), dtype=np.float32)
+    data[5, 100, 100] = 1000
+    data[40, 10, 20] = -50
+    return data
+
+
+def test_numpy_range_is_exact():
+    data = _sparse_volume(160)
+    assert calc_data_range(data) != (-50, 1000)
+    estimates = list(iter_data_range(data, workers=1))
+    assert estimates[-1].done
+    assert (estimates[-1].min, estimates[-1].max) == (-50, 1000)
+    assert estimates[-1].percentiles[99.9] == 0
+
+
+def test_dask_range_is_exact():
+    da = pytest.importorskip('dask.array')
+    data = da.from_array(_sparse_volume(), chunks=(8, 128, 128))
+    assert [len(b) - 1 for b in chunk_boundaries(data)] == [8, 2, 2]
+    estimate = list(iter_data_range(data, workers=2))[-1]
+    assert (estimate.min, estimate.max) == (-50, 1000)
+
+
+def test_zarr_range_is_exact():
+    zarr = pytest.importorskip('zarr')
+    data = zarr.zeros((64, 256, 256), chunks=(16, 64, 64), dtype='f4')
+    data[:] = _sparse_volume()
+    assert [len(b) - 1 for b in chunk_boundaries(data)] == [4, 4, 4]
+    estimate = list(iter_data_range(data))[-1]
+    assert (estimate.min, estimate.max) == (-50, 1000)
+
+
+def test_progressive_estimates():
+    data = np.arange(200 * 100 * 100, dtype=np.float64).reshape(200, 100, 100)
+    data[:, 0, 0] = np.nan
+    estimates = list(iter_data_range(data, (50,)))
+    fractions = [e.fraction for e in estimates]
+    assert len(estimates) > 2
+    assert fractions == sorted(fractions)
+    assert not estimates[0].done
+    assert estimates[-1].done
+    assert estimates[-1].min == 1
+    assert estimates[-1].max == data.size - 1
+    assert estimates[-1].percentiles[50] == pytest.approx(
+        data.size / 2, rel=0.05
+    )
+    # the lower bound only decreases, the upper bound only increases
+    assert [e.min for e in estimates] == sorted(
+        (e.min for e in estimates), reverse=True
+    )
+    assert [e.max for e in estimates] == sorted(e.max for e in estimates)
+
+
+def test_exact_range_is_cached():
+    get_settings().experimental.cache_chunk_statistics = True
+    data = _sparse_volume()
+    assert cached_data_range(data) is None
+    estimate = list(iter_data_range(data))[-1]
+    assert cached_data_range(data) == estimate
+    assert cached_data_range(data.copy()) is None
+    assert list(iter_data_range(data)) == [estimate]
+    # other percentiles are estimated without reading the data again
+    (other,) = iter_data_range(data, (1, 99))
+    assert other.percentiles == {1: 0, 99: 0}
+
+
+def test_closed_estimate_is_not_cached():
+    get_settings().experimental.cache_chunk_statistics = True
+    data = _sparse_volume()
+    estimates = iter_data_range(data)
+    next(estimates)
+    estimates.close()
+    assert cached_data_range(data) is None
+
+
+def test_summaries_are_recorded_by_the_consuming_thread(monkeypatch):
+    recorded_by = set()
+    record = ChunkStatistics.record
+
+    def _record(self, *args):
+        recorded_by.add(threading.get_ident())
+        record(self, *args)
+
+    monkeypatch.setattr(ChunkStatistics, 'record', _record)
+    estimate = list(iter_data_range(_sparse_volume(), workers=4))[-1]
+    assert recorded_by == {threading.get_ident()}
+    assert (estimate.min, estimate.max) == (-50, 1000)
+
+
+def test_statistics_shared_between_threads():
+    get_settings().experimental.cache_chunk_statistics = True
+    data = np.arange(64 * 64 * 64, dtype=np.float32).reshape(64, 64, 64)
+    stats = chunk_statistics(data)
+    errors = []
+
+    def _summarize_and_read(indices):
+        # like the histogram worker, summarizing chunks of the same array
+        try:
+            for index in indices:
+                stats.summarize_chunk(data, int(index))
+                stats.value_range()
+                stats.percentiles((50,))
+        except Exception as e:  # noqa: BLE001
+            errors.append(e)
+
+    threads = [
+        threading.Thread(
+            target=_summarize_and_read,
+            args=(range(start, stats.n_chunks, 3),),
+        )
+        for start in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    estimates = list(iter_data_range(data, workers=4))
+    for thread in threads:
+        thread.join()
+    assert not errors
+    assert stats.complete
+    assert (estimates[-1].min, estimates[-1].max) == (0, data.size - 1)
+    # each chunk has its own row of histograms
+    assert np.array_equal(np.sort(stats._rows), np.arange(stats.n_chunks))
+    counts, _ = stats.summaries()
+    assert counts.sum() == data.size
@@ -0,0 +1,93 @@
+from napari.layers.utils._slice_cache import _SliceCache
+
+
+def test_slice_cache_get_put():
+    cache = _SliceCache(max_entries=2)
+    assert cache.get('a') is None
+
+    cache.put('a', 1, cache.generation)
+
+    assert 'a' in cache
+    assert cache.get('a') == 1
+    assert len(cache) == 1
+
+
+def test_slice_cache_evicts_least_recently_used():
+    cache = _SliceCache(max_entries=2)
+    cache.put('a', 1, cache.generation)
+    cache.put('b', 2, cache.generation)
+    # using 'a' makes 'b' the least recently used
+    cache.get('a')
+
+    cache.put('c', 3, cache.generation)
+
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert 'c' in cache
+
+
+def test_slice_cache_shrink_evicts():
+    cache = _SliceCache(max_entries=3)
+    for i in range(3):
+        cache.put(i, i, cache.generation)
+
+    cache.max_entries = 1
+
+    assert len(cache) == 1
+    assert 2 in cache
+
+
+def test_slice_cache_disabled():
+    cache = _SliceCache(max_entries=0)
+
+    cache.put('a', 1, cache.generation)
+
+    assert len(cache) == 0
+
+
+def test_slice_cache_clear_discards_outdated_put():
+    cache = _SliceCache(max_entries=2)
+    cache.put('a', 1, cache.generation)
+    generation = cache.generation
+
+    cache.clear()
+    cache.put('b', 2, generation)
+
+    assert len(cache) == 0
+    cache.put('b', 2, cache.generation)
+    assert cache.get('b') == 2
+
+
+def test_slice_cache_counts_hits_and_misses():
+    cache = _SliceCache(max_entries=2)
+    cache.put('a', 1, cache.generation)
+
+    cache.get('a')
+    cache.get('a')
+    cache.get('b')
+
+    assert cache.hits == 2
+    assert cache.misses == 1
+
+
+def test_slice_cache_evicts_to_fit_max_bytes():
+    cache = _SliceCache(max_entries=None, max_bytes=10)
+    cache.put('a', 1, cache.generation, nbytes=4)
+    cache.put('b', 2, cache.generation, nbytes=4)
+    assert cache.nbytes == 8
+
+    cache.put('c', 3, cache.generation, nbytes=4)
+
+    assert 'a' not in cache
+    assert len(cache) == 2
+    assert cache.nbytes == 8
+
+
+def test_slice_cache_skips_response_larger_than_max_bytes():
+    cache = _SliceCache(max_entries=None, max_bytes=10)
+    cache.put('a', 1, cache.generation, nbytes=4)
+
+    cache.put('b', 2, cache.generation, nbytes=11)
+
+    assert 'a' in cache
+    assert 'b' not in cache
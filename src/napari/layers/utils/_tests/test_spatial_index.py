@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+from napari.layers.utils._spatial_index import _BoxTree, _SortedAxisIndex
+
+
+def _brute_force(data, axes, low, high):
+    coords = data[:, axes]
+    inside = np.all((coords >= low) & (coords <= high), axis=1)
+    return np.flatnonzero(inside)
+
+
+@pytest.mark.parametrize('axes', [[0], [1, 2], [0, 1, 2]])
+def test_query_box_matches_brute_force(axes):
+    rng = np.random.default_rng(0)
+    data = rng.integers(0, 10, size=(500, 3)).astype(float)
+    index = _SortedAxisIndex(data)
+    for _ in range(10):
+        low = rng.uniform(-1, 10, len(axes))
+        high = low + rng.uniform(0, 5, len(axes))
+        np.testing.assert_array_equal(
+            index.query_box(axes, low, high),
+            _brute_force(data, axes, low, high),
+        )
+
+
+def test_query_box_no_axes():
+    index = _SortedAxisIndex(np.zeros((4, 2)))
+    np.testing.assert_array_equal(index.query_box([], [], []), np.arange(4))
+
+
+def test_appended_removed_moved():
+    rng = np.random.default_rng(1)
+    data = rng.uniform(0, 10, size=(100, 2))
+    index = _SortedAxisIndex(data)
+    # sort both axes before updating
+    index.query_box([0, 1], [0, 0], [10, 10])
+
+    data = np.append(data, rng.uniform(0, 10, size=(20, 2)), axis=0)
+    index = index.appended(data)
+    removed = [0, 5, 50, 110]
+    data = np.delete(data, removed, axis=0)
+    index = index.removed(removed, data)
+    data[[1, 2, 3], 1] += 20
+    index.moved([1, 2, 3], [1])
+
+    assert index.data is data
+    for low, high in [([2, 2], [6, 6]), ([0, 15], [10, 40])]:
+        np.testing.assert_array_equal(
+            index.query_box([0, 1], low, high),
+            _brute_force(data, [0, 1], low, high),
+        )
+
+
+def test_bounds():
+    data = np.array([[1.0, 5.0], [3.0, np.nan], [-2.0, 0.0]])
+    mins, maxs = _SortedAxisIndex(data).bounds([0, 1])
+    np.testing.assert_array_equal(mins, [-2, np.nan])
+    np.testing.assert_array_equal(maxs, [3, np.nan])
+
+
+def _random_boxes(rng, n, ndim):
+    mins = rng.uniform(0, 100, size=(n, ndim))
+    return mins, mins + rng.uniform(0, 5, size=(n, ndim))
+
+
+@pytest.mark.parametrize('n', [0, 1, 15, 1000])
+def test_box_tree_query_box_matches_brute_force(n):
+    rng = np.random.default_rng(2)
+    mins, maxs = _random_boxes(rng, n, 2)
+    tree = _BoxTree(mins, maxs, node_size=4)
+    for _ in range(10):
+        low = rng.uniform(-5, 100, 2)
+        high = low + rng.uniform(0, 20, 2)
+        expected = np.flatnonzero(
+            np.all((mins <= high) & (maxs >= low), axis=1)
+        )
+        np.testing.assert_array_equal(tree.query_box(low, high), expected)
+
+
+def test_box_tree_query_line_matches_brute_force():
+    rng = np.random.default_rng(3)
+    mins, maxs = _random_boxes(rng, 200, 3)
+    tree = _BoxTree(mins, maxs, node_size=4)
+    point = (mins[0] + maxs[0]) / 2
+    # a line parallel to an axis crosses the boxes containing the point
+    # along the other axes
+    expected = np.flatnonzero(
+        np.all((mins[:, :2] <= point[:2]) & (maxs[:, :2] >= point[:2]), axis=1)
+    )
+    assert 0 in expected
+    np.testing.assert_array_equal(tree.query_line(point, [0, 0, 1]), expected)
+    # sample points along an oblique line to find the crossed boxes
+    direction = np.array([1, 2, 0.5])
+    samples = point + np.linspace(-100, 100, 20001)[:, np.newaxis] * direction
+    expected = [
+        i
+        for i in range(len(mins))
+        if np.all((samples >= mins[i]) & (samples <= maxs[i]), axis=1).any()
+    ]
+    np.testing.assert_array_equal(tree.query_line(point, direction), expected)
+
+
+def test_box_tree_refit():
+    rng = np.random.default_rng(4)
+    mins, maxs = _random_boxes(rng, 200, 2)
+    tree = _BoxTree(mins, maxs, node_size=4)
+    moved = [3, 50, 199]
+    mins[moved] += 500
+    maxs[moved] += 500
+    tree.refit(moved, mins[moved], maxs[moved])
+    np.testing.assert_array_equal(
+        tree.query_box([400, 400], [700, 700]), moved
+    )
+    np.testing.assert_array_equal(
+        tree.query_box([0, 0], [105, 105]),
+        np.setdiff1d(np.arange(200), moved),
+    )
+    np.testing.assert_array_equal(tree.bounds()[1], maxs.max(axis=0))
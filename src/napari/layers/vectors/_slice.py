@@ -1,13 +1,19 @@
+from __future__ import annotations
+
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import numpy.typing as npt
 
 from napari.layers.base._slice import _next_request_id
 from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
+from napari.layers.vectors._vector_utils import _VectorField
 from napari.layers.vectors._vectors_constants import VectorsProjectionMode
 
+if TYPE_CHECKING:
+    from napari.layers.utils._spatial_index import _SortedAxisIndex
+
 
 @dataclass(frozen=True)
 class _VectorSliceResponse:
@@ -51,6 +57,10 @@ class _VectorSliceRequest:
         The layer's data field, which is the main input to slicing.
     data_slice : _ThickNDSlice
         The slicing coordinates and margins in data space.
+    spatial_index : _SortedAxisIndex or None
+        Index of the (N, 2 * D) array of the start points and projections of
+        ``data``, used to find the vectors near the slice without checking
+        all of them.
     others
         See the corresponding attributes in `Layer` and `Vectors`.
     """
@@ -61,6 +71,7 @@ class _VectorSliceRequest:
     projection_mode: VectorsProjectionMode
     length: float = field(repr=False)
     out_of_slice_display: bool = field(repr=False)
+    spatial_index: _SortedAxisIndex | None = field(default=None, repr=False)
     id: int = field(default_factory=_next_request_id)
 
     def __call__(self) -> _VectorSliceResponse:
@@ -96,7 +107,6 @@ class _VectorSliceRequest:
     def _get_slice_data(
         self, not_disp: list[int]
     ) -> tuple[npt.NDArray, npt.NDArray | int]:
-        data = self.data[:, 0, not_disp]
         alphas: npt.NDArray | int = 1
 
         point, m_left, m_right = self.data_slice[not_disp].as_array()
@@ -114,11 +124,45 @@ class _VectorSliceRequest:
         low[too_thin_slice] -= 0.5
         high[too_thin_slice] += 0.5
 
+        out_of_slice = self.out_of_slice_display and self.slice_input.ndim > 2
+        index = self.spatial_index
+        if isinstance(self.data, _VectorField):
+            # the vectors start on a grid, so only the ones close to the
+            # slice are generated
+            margin = 0
+            if out_of_slice:
+                bounds = self.data.projection_bounds(not_disp)
+                assert bounds is not None
+                mins, maxs = bounds
+                margin = np.maximum(np.abs(mins), np.abs(maxs)) * self.length
+            candidates = self.data.indices_in_box(
+                not_disp, low - margin, high + margin
+            )
+            candidate_data = self.data[candidates]
+            data = candidate_data[:, 0, not_disp]
+            projections = candidate_data[:, 1, not_disp]
+        elif index is not None and len(index.data) == len(self.data):
+            # Only check the vectors that may be displayed, i.e. the ones
+            # starting within their longest projection of the slice.
+            margin = 0
+            if out_of_slice:
+                ndim = self.data.shape[2]
+                mins, maxs = index.bounds([ndim + axis for axis in not_disp])
+                margin = np.maximum(np.abs(mins), np.abs(maxs)) * self.length
+            candidates = index.query_box(not_disp, low - margin, high + margin)
+            candidate_data = self.data[candidates]
+            data = candidate_data[:, 0, not_disp]
+            projections = candidate_data[:, 1, not_disp]
+        else:
+            candidates = None
+            data = self.data[:, 0, not_disp]
+            projections = self.data[:, 1, not_disp]
+
         inside_slice = np.all((data >= low) & (data <= high), axis=1)
         slice_indices = np.where(inside_slice)[0].astype(int)
 
-        if self.out_of_slice_display and self.slice_input.ndim > 2:
-            projected_lengths = abs(self.data[:, 1, not_disp] * self.length)
+        if out_of_slice:
+            projected_lengths = abs(projections * self.length)
 
             # add out of slice points with progressively lower sizes
             dist_from_low = np.abs(data - low)
@@ -138,4 +182,6 @@ class _VectorSliceRequest:
 
             slice_indices = np.where(matches)[0].astype(int)
 
+        if candidates is not None:
+            slice_indices = candidates[slice_indices].astype(int)
         return slice_indices, alphas
@@ -9,6 +9,13 @@ from napari._tests.utils import (
 )
 from napari.components.dims import Dims
 from napari.layers import Vectors
+from napari.layers.utils._slice_input import _SliceInput, _ThickNDSlice
+from napari.layers.vectors._slice import _VectorSliceRequest
+from napari.layers.vectors._vector_utils import (
+    _VectorField,
+    convert_image_to_coordinates,
+)
+from napari.settings import get_settings
 from napari.utils._test_utils import (
     validate_all_params_in_docstring,
     validate_kwargs_sorted,
@@ -734,6 +741,188 @@ def test_out_of_slice_display():
     assert layer.out_of_slice_display is True
 
 
+@pytest.mark.parametrize('out_of_slice_display', [False, True])
+@pytest.mark.parametrize('projection_mode', ['none', 'all'])
+def test_slicing_uses_spatial_index(out_of_slice_display, projection_mode):
+    rng = np.random.default_rng(0)
+    data = np.stack(
+        [rng.uniform(0, 50, (5000, 3)), rng.normal(size=(5000, 3))], axis=1
+    )
+    layer = Vectors(data, length=2)
+    slice_input = _SliceInput(
+        ndisplay=2,
+        world_slice=_ThickNDSlice.make_full(ndim=3),
+        order=(0, 1, 2),
+    )
+    data_slice = _ThickNDSlice(
+        point=(20.3, 0, 0), margin_left=(1, 0, 0), margin_right=(2, 0, 0)
+    )
+    kwargs = {
+        'slice_input': slice_input,
+        'data': layer.data,
+        'data_slice': data_slice,
+        'projection_mode': projection_mode,
+        'length': 2,
+        'out_of_slice_display': out_of_slice_display,
+    }
+    expected = _VectorSliceRequest(**kwargs)()
+    response = _VectorSliceRequest(
+        **kwargs, spatial_index=layer._spatial_index
+    )()
+    assert len(response.indices) > 0
+    np.testing.assert_array_equal(response.indices, expected.indices)
+    np.testing.assert_allclose(response.alphas, expected.alphas)
+
+
+def test_data_modified_in_place_updates_spatial_index():
+    data = np.zeros((3, 2, 3))
+    data[:, 0, 0] = [0, 1, 2]
+    data[:, 1, 1] = 1
+    layer = Vectors(data)
+    layer._slice_dims(Dims(ndim=3, point=(2, 0, 0)))
+    np.testing.assert_array_equal(layer._view_indices, [2])
+
+    # move the first vector to the plane in view
+    layer.data[0, 0, 0] = 2
+    layer.refresh()
+    np.testing.assert_array_equal(layer._view_indices, [0, 2])
+    fresh = Vectors(layer.data.copy())
+    fresh._slice_dims(Dims(ndim=3, point=(2, 0, 0)))
+    np.testing.assert_array_equal(layer._view_indices, fresh._view_indices)
+
+
+def test_level_of_detail():
+    get_settings().experimental.vectors_lod_max_vectors = 500
+    data = np.zeros((100, 100, 2))
+    data[..., 0] = 1
+    layer = Vectors(data, length=0.5)
+    layer._update_draw(1, np.array([[0, 0], [30, 30]]), (100, 100))
+
+    view_data, colors = layer._lod_view
+    assert 0 < len(view_data) <= 500
+    assert len(colors) == len(view_data)
+    # the vectors are averaged over cells of the grid
+    np.testing.assert_allclose(view_data[:, 1], [[1, 0]] * len(view_data))
+    assert np.all(view_data[:, 0] >= -1)
+    assert np.all(view_data[:, 0] <= 31)
+    # unchanged view, the same vectors
+    np.testing.assert_array_equal(layer._lod_view[0], view_data)
+
+    # zoomed in, all the visible vectors are rendered
+    layer._update_draw(0.1, np.array([[10, 10], [13, 13]]), (100, 100))
+    view_data, _ = layer._lod_view
+    starts = layer._view_data[:, 0]
+    ends = starts + 0.5 * layer._view_data[:, 1]
+    visible = np.all((ends >= 9) & (starts <= 14), axis=1)
+    np.testing.assert_array_equal(view_data, layer._view_data[visible])
+
+    get_settings().experimental.vectors_lod_max_vectors = 0
+    assert layer._lod_view is None
+
+
+def test_vector_field_matches_coordinates():
+    rng = np.random.default_rng(0)
+    field = rng.normal(size=(4, 5, 6, 3))
+    vectors = _VectorField(field)
+    expected = convert_image_to_coordinates(field)
+    assert vectors.shape == expected.shape
+    np.testing.assert_array_equal(np.asarray(vectors), expected)
+    for key in [
+        np.array([7, 3, 3, -1]),
+        slice(10, 40, 3),
+        5,
+        (slice(None), 1, [0, 2]),
+        np.ix_([2, 9, 50], [0, 1], [1, 2]),
+        expected[:, 1, 0] > 0,
+    ]:
+        np.testing.assert_array_equal(vectors[key], expected[key])
+
+    inside = vectors.indices_in_box([0, 2], [0.5, -3], [2, 2.5])
+    starts = expected[:, 0]
+    np.testing.assert_array_equal(
+        inside,
+        np.flatnonzero(
+            (starts[:, 0] >= 0.5)
+            & (starts[:, 0] <= 2)
+            & (starts[:, 2] >= -3)
+            & (starts[:, 2] <= 2.5)
+        ),
+    )
+    np.testing.assert_array_equal(
+        vectors.projection_bounds([1]),
+        (expected[:, 1, [1]].min(0), expected[:, 1, [1]].max(0)),
+    )
+
+
+@pytest.mark.parametrize('out_of_slice_display', [False, True])
+@pytest.mark.parametrize('projection_mode', ['none', 'all'])
+def test_slicing_vector_field(out_of_slice_display, projection_mode):
+    field = np.random.default_rng(0).normal(size=(30, 20, 10, 3))
+    layer = Vectors(
+        _VectorField(field),
+        length=2,
+        out_of_slice_display=out_of_slice_display,
+        projection_mode=projection_mode,
+    )
+    assert isinstance(layer.data, _VectorField)
+    coordinates = Vectors(
+        convert_image_to_coordinates(field),
+        length=2,
+        out_of_slice_display=out_of_slice_display,
+        projection_mode=projection_mode,
+    )
+    for vectors in (layer, coordinates):
+        vectors._slice_dims(Dims(ndim=3, point=(2, 0, 0)))
+    np.testing.assert_array_equal(
+        layer._view_indices, coordinates._view_indices
+    )
+    np.testing.assert_allclose(layer._view_alphas, coordinates._view_alphas)
+    np.testing.assert_array_equal(layer._view_data, coordinates._view_data)
+    np.testing.assert_allclose(layer._extent_data, coordinates._extent_data)
+
+
+def test_numpy_image_like_data_is_converted():
+    field = np.random.default_rng(0).normal(size=(4, 5, 2))
+    layer = Vectors(field)
+    assert isinstance(layer.data, np.ndarray)
+    np.testing.assert_array_equal(
+        layer.data, convert_image_to_coordinates(field)
+    )
+
+
+def test_lazy_vector_field():
+    da = pytest.importorskip('dask.array')
+    field = np.random.default_rng(0).normal(size=(10, 40, 50, 3))
+    lazy_field = da.from_array(field, chunks=(1, 40, 50, 3))
+    layer = Vectors(lazy_field)
+    assert layer.data.field is lazy_field
+    assert layer.data.shape == (10 * 40 * 50, 2, 3)
+    # the extent is the grid of start points, without reading the field
+    np.testing.assert_array_equal(layer._extent_data, [[0, 0, 0], [9, 39, 49]])
+
+    layer._slice_dims(Dims(ndim=3, point=(2, 0, 0)))
+    expected = convert_image_to_coordinates(field)
+    np.testing.assert_array_equal(
+        layer._view_data, expected[layer._view_indices][:, :, 1:]
+    )
+    assert np.all(expected[layer._view_indices, 0, 0] == 2)
+
+
+def test_lazy_vector_field_level_of_detail():
+    da = pytest.importorskip('dask.array')
+    get_settings().experimental.vectors_lod_max_vectors = 500
+    field = np.zeros((100, 100, 2))
+    field[..., 0] = 4
+    layer = Vectors(da.from_array(field, chunks=50), length=0.5)
+    coordinates = Vectors(field, length=0.5)
+    for vectors in (layer, coordinates):
+        vectors._update_draw(0.1, np.array([[10, 10], [13, 13]]), (100, 100))
+    # the vectors starting above the view are found without reading the
+    # whole field
+    np.testing.assert_array_equal(layer._lod_view[0], coordinates._lod_view[0])
+    assert layer.data._projection_bounds is None
+
+
 def test_empty_data_from_tuple():
     """Test that empty data raises an error."""
     layer = Vectors(name='vector', ndim=3)
@@ -1,6 +1,20 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any
+
 import numpy as np
 import numpy.typing as npt
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Projections of vectors are read from a field that is not in memory as a
+# block covering them, unless it is larger than this many times the number of
+# vectors (and than the minimum size), in which case they are read one by one.
+_MAX_BLOCK_RATIO = 4
+_MIN_BLOCK_SIZE = 2**16
+
 
 def convert_image_to_coordinates(vectors: npt.NDArray) -> npt.NDArray:
     """To convert an image-like array with elements (y-proj, x-proj) into a
@@ -43,9 +57,216 @@ def convert_image_to_coordinates(vectors: npt.NDArray) -> npt.NDArray:
     return coord_vectors
 
 
+class _VectorField:
+    """Vectors of an image-like array, generated when they are indexed.
+
+    This behaves like the (N, 2, D) array returned by
+    `convert_image_to_coordinates` for an (N1, N2, ..., ND, D) array, with the
+    vectors in the same order, but only the coordinates and projections of
+    the indexed vectors are generated. The image-like array is kept in its
+    own form, e.g. a dask or zarr array, and only the part of it covering
+    the indexed vectors is read.
+
+    It is used for image-like data that is not a numpy array, which would
+    otherwise be read whole. It only supports ``len``, ``shape``, ``dtype``,
+    indexing and ``np.asarray``, which converts it to the (N, 2, D) array.
+
+    Parameters
+    ----------
+    field : (N1, N2, ..., ND, D) array-like
+        The projections of the vector at each pixel.
+    """
+
+    ndim = 3
+
+    def __init__(self, field: Any) -> None:
+        self.field = field
+        self.grid_shape = tuple(int(size) for size in field.shape[:-1])
+        self.shape = (
+            math.prod(self.grid_shape),
+            2,
+            int(field.shape[-1]),
+        )
+        self.dtype = np.result_type(np.intp, field.dtype)
+        self._projection_bounds: tuple[np.ndarray, np.ndarray] | None = None
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    @property
+    def size(self) -> int:
+        return math.prod(self.shape)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(shape={self.shape}, dtype={self.dtype})'
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        vectors = convert_image_to_coordinates(np.asarray(self.field))
+        return vectors.astype(dtype or self.dtype, copy=False)
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        if not isinstance(key, tuple):
+            key = (key,)
+        first, rest = key[0], key[1:]
+        n_vectors = len(self)
+        if isinstance(first, slice):
+            vectors = self._vectors(np.arange(*first.indices(n_vectors)))
+            return vectors[(slice(None), *rest)]
+        if first is Ellipsis:
+            return np.asarray(self)[key]
+        first = np.asarray(first)
+        if first.dtype == bool:
+            first = np.flatnonzero(first)
+        if first.ndim == 0:
+            return self._vectors(np.array([first % n_vectors]))[(0, *rest)]
+        indices = first.ravel().astype(np.intp) % n_vectors
+        if np.all(indices[1:] > indices[:-1]):
+            # sorted without duplicates, as returned by slicing
+            vectors = self._vectors(indices)
+            positions = np.arange(len(indices))
+        else:
+            unique, positions = np.unique(indices, return_inverse=True)
+            vectors = self._vectors(unique)
+        return vectors[(positions.reshape(first.shape), *rest)]
+
+    def indices_in_box(
+        self,
+        axes: Sequence[int],
+        low: npt.ArrayLike,
+        high: npt.ArrayLike,
+    ) -> npt.NDArray[np.intp]:
+        """Find the vectors starting within a box along some axes.
+
+        Since the vectors start on a grid, this does not check any vector.
+
+        Parameters
+        ----------
+        axes : sequence of int
+            The axes along which the box is defined.
+        low : array-like
+            The minimum coordinates of the box along these axes.
+        high : array-like
+            The maximum coordinates of the box along these axes.
+
+        Returns
+        -------
+        np.ndarray
+            The sorted indices of the vectors starting within the box,
+            bounds included.
+        """
+        ranges = [np.arange(size) for size in self.grid_shape]
+        for axis, axis_low, axis_high in zip(
+            axes, np.ravel(low), np.ravel(high), strict=True
+        ):
+            start = max(math.ceil(axis_low), 0)
+            stop = min(math.floor(axis_high) + 1, self.grid_shape[axis])
+            ranges[axis] = np.arange(start, max(start, stop))
+        if any(len(axis_range) == 0 for axis_range in ranges):
+            return np.empty(0, dtype=np.intp)
+        return np.ravel_multi_index(np.ix_(*ranges), self.grid_shape).ravel()
+
+    def projection_bounds(
+        self, axes: Sequence[int], compute: bool = True
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]] | None:
+        """Return the minimum and maximum projections along some axes.
+
+        The bounds are computed once, which reads the whole field.
+
+        Parameters
+        ----------
+        axes : sequence of int
+            The axes of the projections.
+        compute : bool
+            Whether to compute the bounds if they were not computed yet,
+            rather than return None.
+        """
+        if self._projection_bounds is None:
+            if not compute:
+                return None
+            field = self.field
+            if not hasattr(field, 'min'):
+                field = np.asarray(field)
+            grid_axes = tuple(range(len(self.grid_shape)))
+            self._projection_bounds = (
+                np.asarray(field.min(axis=grid_axes), dtype=np.float64),
+                np.asarray(field.max(axis=grid_axes), dtype=np.float64),
+            )
+        mins, maxs = self._projection_bounds
+        return mins[list(axes)], maxs[list(axes)]
+
+    def extent(self, length: float) -> np.ndarray:
+        """Return the (2, D) minimum and maximum start and end points.
+
+        The end points are only taken into account when the field is a numpy
+        array, so that a field that is not in memory is not read.
+        """
+        ndim = self.shape[2]
+        extrema = np.stack(
+            [np.zeros(ndim), np.subtract(self.grid_shape, 1)]
+        ).astype(np.float64)
+        if isinstance(self.field, np.ndarray):
+            for axis in range(ndim):
+                grid_shape = [1] * ndim
+                grid_shape[axis] = -1
+                ends = (
+                    np.arange(self.grid_shape[axis]).reshape(grid_shape)
+                    + length * self.field[..., axis]
+                )
+                extrema[0, axis] = min(extrema[0, axis], ends.min())
+                extrema[1, axis] = max(extrema[1, axis], ends.max())
+        return extrema
+
+    def _vectors(self, indices: np.ndarray) -> np.ndarray:
+        """Generate the (M, 2, D) vectors at some sorted indices."""
+        coordinates = np.stack(
+            np.unravel_index(indices, self.grid_shape), axis=-1
+        )
+        vectors = np.empty((len(indices), 2, self.shape[2]), dtype=self.dtype)
+        vectors[:, 0] = coordinates
+        vectors[:, 1] = self._projections(coordinates)
+        return vectors
+
+    def _projections(self, coordinates: np.ndarray) -> np.ndarray:
+        """Read the (M, D) projections of the field at some pixels."""
+        if isinstance(self.field, np.ndarray) or len(coordinates) == 0:
+            return np.asarray(self.field)[tuple(coordinates.T)]
+        low = coordinates.min(axis=0)
+        high = coordinates.max(axis=0) + 1
+        block_size = math.prod(int(size) for size in high - low)
+        if block_size <= max(
+            _MIN_BLOCK_SIZE, _MAX_BLOCK_RATIO * len(coordinates)
+        ):
+            block = np.asarray(
+                self.field[
+                    tuple(
+                        slice(start, stop)
+                        for start, stop in zip(low, high, strict=True)
+                    )
+                ]
+            )
+            return block[tuple((coordinates - low).T)]
+        if not hasattr(self.field, 'vindex'):
+            return np.asarray(self.field)[tuple(coordinates.T)]
+        # the pixels are indexed along all the axes, as required by zarr
+        return np.stack(
+            [
+                np.asarray(
+                    self.field.vindex[
+                        (
+                            *coordinates.T,
+                            np.full(len(coordinates), axis),
+                        )
+                    ]
+                )
+                for axis in range(self.shape[2])
+            ],
+            axis=-1,
+        )
+
+
 def fix_data_vectors(
     vectors: np.ndarray | None, ndim: int | None
-) -> tuple[np.ndarray, int]:
+) -> tuple[np.ndarray | _VectorField, int]:
     """
     Ensure that vectors array is 3d and have second dimension of size 2
     and third dimension of size ndim (default 2 for empty arrays)
@@ -63,8 +284,10 @@ def fix_data_vectors(
 
     Returns
     -------
-    vectors : (N, 2, D) array
-        Vectors array
+    vectors : (N, 2, D) array or _VectorField
+        Vectors array. The vectors of image-like data that is not a numpy
+        array, e.g. a dask or zarr array, are instead only generated when
+        they are indexed.
     ndim : int
         number of dimensions
 
@@ -75,9 +298,24 @@ def fix_data_vectors(
     """
     if vectors is None:
         vectors = np.array([])
-    vectors = np.asarray(vectors)
+    if (
+        not isinstance(vectors, np.ndarray | _VectorField)
+        and hasattr(vectors, 'shape')
+        and hasattr(vectors, 'dtype')
+        and math.prod(vectors.shape) > 0
+        and vectors.shape[-1] == len(vectors.shape) - 1
+        and not (len(vectors.shape) == 3 and vectors.shape[1] == 2)
+    ):
+        # an (N1, N2, ..., ND, D) array that is image-like and not in
+        # memory, e.g. a dask or zarr array, whose vectors are generated
+        # when needed rather than reading the whole array
+        vectors = _VectorField(vectors)
+    elif not isinstance(vectors, _VectorField):
+        vectors = np.asarray(vectors)
 
-    if vectors.ndim == 3 and vectors.shape[1] == 2:
+    if isinstance(vectors, _VectorField):
+        pass
+    elif vectors.ndim == 3 and vectors.shape[1] == 2:
         # an (N, 2, D) array that is coordinate-like, we're good to go
         pass
     elif vectors.size == 0:
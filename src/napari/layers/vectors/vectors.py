@@ -3,6 +3,7 @@ from copy import copy
 from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
+import numpy.typing as npt
 
 from napari.layers.base import Layer, _LayerSlicingState
 from napari.layers.utils._color_manager_constants import ColorMode
@@ -10,6 +11,7 @@ from napari.layers.utils._slice_input import (
     _SliceInput,
     _ThickNDSlice,
 )
+from napari.layers.utils._spatial_index import _SortedAxisIndex
 from napari.layers.utils.color_manager import ColorManager
 from napari.layers.utils.color_transformations import ColorType
 from napari.layers.utils.layer_utils import _FeatureTable
@@ -17,11 +19,15 @@ from napari.layers.vectors._slice import (
     _VectorSliceRequest,
     _VectorSliceResponse,
 )
-from napari.layers.vectors._vector_utils import fix_data_vectors
+from napari.layers.vectors._vector_utils import (
+    _VectorField,
+    fix_data_vectors,
+)
 from napari.layers.vectors._vectors_constants import (
     VectorsProjectionMode,
     VectorStyle,
 )
+from napari.settings import get_settings
 from napari.types import LayerDataType
 from napari.utils.colormaps import Colormap, ValidColormapArg
 from napari.utils.events import Event
@@ -44,7 +50,10 @@ class Vectors(Layer):
         list of N vectors with start point and projections of the vector in
         D dimensions. An (N1, N2, ..., ND, D) array is interpreted as
         "image-like" data where there is a length D vector of the
-        projections at each pixel.
+        projections at each pixel. Image-like numpy arrays are converted to
+        (N, 2, D) arrays, while other image-like data, e.g. a dask or zarr
+        array, is kept as is and its vectors are only generated for the
+        vectors that are displayed.
     affine : n-D array or napari.utils.transforms.Affine
         (N+1, N+1) affine transformation matrix in homogeneous coordinates.
         The first (N, N) entries correspond to a linear transform and
@@ -132,7 +141,12 @@ class Vectors(Layer):
     Attributes
     ----------
     data : (N, 2, D) array
-        The start point and projections of N vectors in D dimensions.
+        The start point and projections of N vectors in D dimensions. For
+        image-like data that is not a numpy array, e.g. a dask or zarr
+        array, this is instead an array-like object generating the vectors
+        of the pixels when it is indexed. It supports ``len``, ``shape``,
+        ``dtype`` and indexing, and ``np.asarray`` converts it to an
+        (N, 2, D) array, which reads the whole image-like data.
     axis_labels : tuple of str
         Dimension names of the layer data.
     features : Dataframe-like
@@ -279,6 +293,7 @@ class Vectors(Layer):
         self._length = float(length)
 
         self._data = data
+        self._spatial_index = self._make_spatial_index(data)
 
         self._feature_table = _FeatureTable.from_layer(
             features=features,
@@ -334,6 +349,7 @@ class Vectors(Layer):
         previous_n_vectors = len(self.data)
 
         self._data, _ = fix_data_vectors(vectors, self.ndim)
+        self._spatial_index = self._make_spatial_index(self._data)
         n_vectors = len(self.data)
 
         # Adjust the props/color arrays when the number of vectors has changed
@@ -356,10 +372,29 @@ class Vectors(Layer):
                 )
                 self._edge._add(n_colors=adding)
 
-        self._update_dims()
+        self._slicing_state._spatial_index_current = True
+        try:
+            self._update_dims()
+        finally:
+            self._slicing_state._spatial_index_current = False
         self.events.data(value=self.data)
         self._reset_editable()
 
+    @staticmethod
+    def _make_spatial_index(
+        data: np.ndarray | _VectorField,
+    ) -> _SortedAxisIndex | None:
+        """Index the start points and projections of (N, 2, D) vectors.
+
+        The vectors of image-like data start on a grid, so they are found
+        without an index.
+        """
+        if isinstance(data, _VectorField):
+            return None
+        return _SortedAxisIndex(
+            np.reshape(data, (len(data), 2 * data.shape[-1]))
+        )
+
     @property
     def features(self):
         """Dataframe-like features table.
@@ -478,6 +513,8 @@ class Vectors(Layer):
         """
         if len(self.data) == 0:
             extrema = np.full((2, self.ndim), np.nan)
+        elif isinstance(self.data, _VectorField):
+            extrema = self.data.extent(self.length)
         else:
             # Convert from projections to endpoints using the current length
             data = copy(self.data)
@@ -677,6 +714,11 @@ class Vectors(Layer):
         # in ColorManager
         face_color = self.edge_color[self._view_indices]
         face_color[:, -1] *= self._view_alphas
+        return self._triangle_colors(face_color)
+
+    def _triangle_colors(self, colors: np.ndarray) -> np.ndarray:
+        """Repeat the colors of vectors for each of their triangles."""
+        face_color = colors
 
         # Generally, several triangles are drawn for each vector,
         # so we need to duplicate the colors accordingly
@@ -697,6 +739,190 @@ class Vectors(Layer):
 
         return face_color
 
+    @property
+    def _lod_view(self) -> tuple[np.ndarray, np.ndarray] | None:
+        """Vectors in view to render, and their colors, when there are many.
+
+        When there are more vectors in view than the
+        ``vectors_lod_max_vectors`` experimental setting, only the vectors
+        crossing the visible region are rendered. If there are still too
+        many, the vectors starting in each cell of a grid of canvas pixels
+        (or of larger cells, if needed) are replaced by their average. The
+        grid is anchored at the data origin, so the rendered vectors are
+        stable while panning.
+
+        Returns
+        -------
+        lod : tuple of np.ndarray or None
+            The (M, 2, 2) start points and projections of the vectors to
+            render and their (M, 4) colors, or None to render all the
+            vectors in view.
+        """
+        max_vectors = get_settings().experimental.vectors_lod_max_vectors
+        if (
+            max_vectors == 0
+            or len(self._view_indices) <= max_vectors
+            or self._slice_input.ndisplay != 2
+        ):
+            return None
+        key = self._lod_key(max_vectors)
+        lod = self._slicing_state._lod
+        if lod is None or lod[0] != key:
+            self._slicing_state._lod = (key, self._lod_groups())
+            lod = self._slicing_state._lod
+        visible, inverse, counts = lod[1]
+
+        view_data = self._slicing_state._view_data_at(visible)
+        colors = self.edge_color[self._view_indices[visible]]
+        if isinstance(self._view_alphas, np.ndarray):
+            colors[:, -1] *= self._view_alphas[visible]
+        else:
+            colors[:, -1] *= self._view_alphas
+        if inverse is None:
+            return view_data, colors
+        view_data = _average_rows(
+            view_data.reshape(len(view_data), -1), inverse, counts
+        ).reshape(-1, 2, 2)
+        return view_data, _average_rows(colors, inverse, counts)
+
+    def _lod_groups(
+        self,
+    ) -> tuple[npt.NDArray, npt.NDArray | None, npt.NDArray | None]:
+        """Group the vectors in view to render, see `_lod_view`.
+
+        Returns
+        -------
+        visible : np.ndarray
+            Indices within the vectors in view of the vectors crossing the
+            visible region.
+        inverse : np.ndarray or None
+            The group of each visible vector, or None if they are rendered
+            without averaging.
+        counts : np.ndarray or None
+            The number of vectors in each group.
+        """
+        max_vectors = get_settings().experimental.vectors_lod_max_vectors
+        displayed = list(self._slice_input.displayed)
+        corners = self.corner_pixels[:, displayed]
+        if isinstance(self.data, _VectorField):
+            # only generate the vectors starting close to the visible region
+            candidates, view_data = self._lod_field_candidates(
+                displayed, corners
+            )
+        else:
+            candidates = np.arange(len(self._view_indices))
+            view_data = self._slicing_state._view_data_at(candidates)
+        starts = view_data[:, 0]
+        ends = starts + self.length * view_data[:, 1]
+        (visible,) = np.nonzero(
+            np.all(
+                (np.maximum(starts, ends) >= corners[0] - 1)
+                & (np.minimum(starts, ends) <= corners[1] + 1),
+                axis=1,
+            )
+        )
+        visible = candidates[visible]
+        if len(visible) <= max_vectors:
+            return visible, None, None
+
+        starts = self._slicing_state._view_data_at(visible)[:, 0]
+        # size of a canvas pixel in data coordinates
+        cell_size = self.scale_factor / np.abs(self.scale[displayed])
+        while True:
+            cells = np.floor(starts / cell_size).astype(np.int64)
+            cells -= cells.min(axis=0)
+            flat_cells = np.ravel_multi_index(
+                tuple(cells.T), tuple(cells.max(axis=0) + 1)
+            )
+            _, inverse, counts = np.unique(
+                flat_cells, return_inverse=True, return_counts=True
+            )
+            if len(counts) <= max_vectors:
+                return visible, inverse, counts
+            cell_size = cell_size * 2
+
+    def _lod_field_candidates(
+        self, displayed: list[int], corners: npt.NDArray
+    ) -> tuple[npt.NDArray, npt.NDArray]:
+        """Find the vectors in view of a field that may be visible.
+
+        The vectors starting in the visible region are generated first.
+        The other vectors are looked for in a margin around the region of
+        their longest projection, or of the longest projection of the whole
+        field if it was already computed, and of at most the size of the
+        region, so that the whole field is not read.
+
+        Returns
+        -------
+        candidates : np.ndarray
+            Sorted indices within the vectors in view of the candidates.
+        view_data : np.ndarray
+            The view data of the candidates.
+        """
+        low, high = corners[0] - 1, corners[1] + 1
+        inner = self._view_positions(
+            self.data.indices_in_box(displayed, low, high)
+        )
+        inner_data = self._slicing_state._view_data_at(inner)
+        bounds = self.data.projection_bounds(displayed, compute=False)
+        if bounds is None:
+            longest = np.abs(inner_data[:, 1]).max(axis=0, initial=0)
+        else:
+            longest = np.maximum(np.abs(bounds[0]), np.abs(bounds[1]))
+        margin = np.minimum(longest * abs(self.length), high - low)
+        if not np.any(margin > 0):
+            return inner, inner_data
+        outer = self._view_positions(
+            self.data.indices_in_box(displayed, low - margin, high + margin)
+        )
+        ring = np.setdiff1d(outer, inner, assume_unique=True)
+        candidates = np.concatenate([inner, ring])
+        view_data = np.concatenate(
+            [inner_data, self._slicing_state._view_data_at(ring)]
+        )
+        order = np.argsort(candidates)
+        return candidates[order], view_data[order]
+
+    def _view_positions(self, indices: npt.NDArray) -> npt.NDArray:
+        """Return the positions within the vectors in view of some vectors.
+
+        Parameters
+        ----------
+        indices : np.ndarray
+            Sorted indices of vectors, of which the ones not in view are
+            left out.
+        """
+        positions = np.searchsorted(self._view_indices, indices)
+        positions = positions[positions < len(self._view_indices)]
+        return positions[
+            self._view_indices[positions] == indices[: len(positions)]
+        ]
+
+    def _lod_key(self, max_vectors: int) -> tuple:
+        """The state of the view that the rendered vectors depend on."""
+        return (
+            max_vectors,
+            self.scale_factor,
+            self.corner_pixels.tobytes(),
+            self.length,
+        )
+
+    def _update_draw(
+        self, scale_factor, corner_pixels_displayed, shape_threshold
+    ):
+        super()._update_draw(
+            scale_factor, corner_pixels_displayed, shape_threshold
+        )
+        # the rendered vectors depend on the view when using level of detail
+        max_vectors = get_settings().experimental.vectors_lod_max_vectors
+        lod = self._slicing_state._lod
+        if (
+            max_vectors > 0
+            and len(self._view_indices) > max_vectors
+            and (lod is None or lod[0] != self._lod_key(max_vectors))
+        ):
+            self.events.set_data()
+
     def _set_view_slice(self):
         raise NotImplementedError
 
@@ -723,15 +949,17 @@ class Vectors(Layer):
             ).astype(int)[-2:]
             zoom_factor = np.divide(self._thumbnail_shape[:2], shape).min()
 
-            if self._view_data.shape[0] > self._max_vectors_thumbnail:
+            n_view = len(self._view_indices)
+            if n_view > self._max_vectors_thumbnail:
                 thumbnail_indices = np.random.randint(
-                    0, self._view_data.shape[0], self._max_vectors_thumbnail
+                    0, n_view, self._max_vectors_thumbnail
                 )
-                vectors = copy(self._view_data[thumbnail_indices, :, -2:])
-                thumbnail_color_indices = self._view_indices[thumbnail_indices]
             else:
-                vectors = copy(self._view_data[:, :, -2:])
-                thumbnail_color_indices = self._view_indices
+                thumbnail_indices = np.arange(n_view)
+            vectors = self._slicing_state._view_data_at(thumbnail_indices)[
+                :, :, -2:
+            ].copy()
+            thumbnail_color_indices = self._view_indices[thumbnail_indices]
             vectors[:, 1, :] = (
                 vectors[:, 0, :] + vectors[:, 1, :] * self.length
             )
@@ -780,12 +1008,55 @@ class _VectorsSlicingState(_LayerSlicingState):
     def __init__(self, layer: Layer, data: LayerDataType, cache: bool):
         super().__init__(layer, data, cache)
 
-        # Data containing vectors in the currently viewed slice
-        self._view_data: np.ndarray[
-            tuple[int, Literal[2], Literal[2]], np.dtype[np.floating]
-        ] = np.empty((0, 2, 2))
+        # Data containing vectors in the currently viewed slice, generated
+        # when first needed, see _view_data
+        self._view_data_cache: (
+            np.ndarray[
+                tuple[int, Literal[2], Literal[2]], np.dtype[np.floating]
+            ]
+            | None
+        ) = np.empty((0, 2, 2))
         self._view_indices = np.array([], dtype=int)
         self._view_alphas: float | np.ndarray = 1.0
+        # level of detail, see Vectors._lod_view
+        self._lod: tuple[tuple, tuple] | None = None
+        # Whether the spatial index was just made for new data, so that
+        # it does not need to be built again on refresh
+        self._spatial_index_current = False
+
+    def _on_data_modified(self) -> None:
+        if self._spatial_index_current:
+            return
+        # The data may have been modified in place, so the spatial index
+        # must be built again.
+        self.layer._spatial_index = self.layer._make_spatial_index(
+            self.layer.data
+        )
+
+    @property
+    def _view_data(
+        self,
+    ) -> np.ndarray[tuple[int, Literal[2], Literal[2]], np.dtype[np.floating]]:
+        """(M, 2, 2) array: start point and projections of M vectors in 2D."""
+        if self._view_data_cache is None:
+            self._view_data_cache = self._view_data_at(
+                np.arange(len(self._view_indices))
+            )
+        return self._view_data_cache
+
+    def _view_data_at(self, positions: npt.NDArray) -> np.ndarray:
+        """Return the view data of some of the vectors in view.
+
+        Unless the view data is already generated, only the vectors at
+        these positions within the vectors in view are generated, which
+        matters for image-like data.
+        """
+        if self._view_data_cache is not None:
+            return self._view_data_cache[positions]
+        disp = list(self._slice_input.displayed)
+        return self.layer.data[
+            np.ix_(self._view_indices[positions], [0, 1], disp)
+        ]
 
     def _set_view_slice(self):
         request = self.make_slice_request_internal(
@@ -817,6 +1088,7 @@ class _VectorsSlicingState(_LayerSlicingState):
             projection_mode=self.layer.projection_mode,
             out_of_slice_display=self.layer.out_of_slice_display,
             length=self.layer.length,
+            spatial_index=self.layer._spatial_index,
         )
 
     def _update_slice_response(self, response: _VectorSliceResponse):
@@ -829,4 +1101,24 @@ class _VectorsSlicingState(_LayerSlicingState):
 
         self._view_indices = indices
         self._view_alphas = alphas
-        self._view_data = self.layer.data[np.ix_(list(indices), [0, 1], disp)]
+        self._lod = None
+        if isinstance(self.layer.data, _VectorField):
+            self._view_data_cache = None
+        else:
+            self._view_data_cache = self.layer.data[
+                np.ix_(list(indices), [0, 1], disp)
+            ]
+
+
+def _average_rows(
+    values: np.ndarray, groups: np.ndarray, counts: np.ndarray
+) -> np.ndarray:
+    """Average the rows of a 2D array in each group."""
+    sums = np.stack(
+        [
+            np.bincount(groups, weights=column, minlength=len(counts))
+            for column in values.T
+        ],
+        axis=1,
+    )
+    return sums / counts[:, np.newaxis]
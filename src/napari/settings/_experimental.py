@@ -45,6 +45,106 @@ class ExperimentalSettings(EventedSettings):
         validation_alias=AliasChoices('async_', 'async', 'napari_async'),
         json_schema_extra={'requires_restart': False},
     )
+    async_slicing_workers: int = Field(
+        1,
+        title='Number of threads used for asynchronous slicing',
+        description='Number of threads used to slice layers when rendering asynchronously.\n'
+        'Each layer is sliced as a separate task, so using more threads allows multiple layers\n'
+        'to be loaded in parallel.',
+        ge=1,
+        le=64,
+    )
+    slice_prefetch_steps: int = Field(
+        0,
+        title='Number of slices to prefetch while moving through a dimension',
+        description='When stepping or playing through a dimension, slices of image and labels layers\n'
+        'this many steps ahead in the direction of motion are loaded in the background.\n'
+        'Set this to 0 to disable prefetching.',
+        ge=0,
+        le=32,
+    )
+    slice_cache_size: float = Field(
+        0,
+        title='Slice cache size per layer (MB)',
+        description='Maximum memory used by each image and labels layer to keep recently viewed slices,\n'
+        'so that going back to them does not read the data again.\n'
+        'Set this to 0 to only keep the slices needed for prefetching.',
+        ge=0,
+    )
+    multiscale_tile_size: int = Field(
+        0,
+        title='Tile size for 2D multiscale images (pixels)',
+        description='When set, 2D multiscale images are loaded as square tiles of this size,\n'
+        'and recently loaded tiles are kept so that panning only loads newly visible tiles.\n'
+        'Set this to 0 to load the visible region in one go.',
+        ge=0,
+        le=8192,
+    )
+    multiscale_3d_memory: float = Field(
+        0,
+        title='Memory budget for 3D multiscale volumes (MB)',
+        description='When rendering asynchronously, 3D multiscale volumes are first shown at the\n'
+        'coarsest level, then progressively refined with finer levels that fit within this budget.\n'
+        'Set this to 0 to only show the coarsest level.',
+        ge=0,
+    )
+    labels_history_memory: float = Field(
+        0,
+        title='Memory limit of the undo history of each labels layer (MB)',
+        description='Maximum memory used by the compressed undo history of each labels layer.\n'
+        'Once exceeded, the oldest edits are discarded or spilled to disk.\n'
+        'Set this to 0 to not limit the memory used.',
+        ge=0,
+    )
+    labels_history_spill: bool = Field(
+        False,
+        title='Spill labels undo history to disk',
+        description='When the undo history of a labels layer exceeds its memory limit,\n'
+        'store the oldest edits in temporary files instead of discarding them.',
+    )
+    points_lod_max_points: int = Field(
+        0,
+        title='Maximum number of rendered points per points layer',
+        description='When a points layer has more points in view than this, only the points within the\n'
+        'visible region are rendered, and when zoomed out they are further reduced to one point\n'
+        'per screen pixel. Set this to 0 to always render all the points in view.',
+        ge=0,
+    )
+    vectors_lod_max_vectors: int = Field(
+        0,
+        title='Maximum number of rendered vectors per vectors layer',
+        description='When a vectors layer has more vectors in view than this, only the vectors within the\n'
+        'visible region are rendered, and when zoomed out they are averaged over cells of the\n'
+        'screen. Set this to 0 to always render all the vectors in view.',
+        ge=0,
+    )
+    triangulation_workers: int = Field(
+        1,
+        title='Number of threads used to triangulate shapes',
+        description='Number of threads used to triangulate new shapes when adding many shapes at once.\n'
+        'This only speeds up loading with a compiled triangulation backend.',
+        ge=1,
+        le=64,
+    )
+    estimate_data_range: bool = Field(
+        False,
+        title='Estimate the data range of large images in the background',
+        description='Read the whole data of chunked or large images in the background to find their\n'
+        'exact range of values, and use it as the contrast limits range once known.',
+    )
+    cache_chunk_statistics: bool = Field(
+        False,
+        title='Keep the statistics of chunked images in memory',
+        description='Keep the range and histogram of each chunk of images read to compute their histogram\n'
+        'or data range, so that the chunks are not read again while the images are open.',
+    )
+    persist_chunk_statistics: bool = Field(
+        False,
+        title='Save the statistics of chunked images between sessions',
+        description='Save the range and histogram of each chunk of zarr images stored on disk in the\n'
+        'napari cache directory, so that they are not read again when opened in a later session.\n'
+        'This also keeps the statistics in memory.',
+    )
     autoswap_buffers: bool = Field(
         False,
         title='Enable autoswapping rendering buffers.',
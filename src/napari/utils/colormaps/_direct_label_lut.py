@@ -0,0 +1,251 @@
+"""Sorted array lookup table from label values to colors.
+
+This is the representation behind ``DirectLabelColormap``: a sorted array of
+labels with the texture value of each label, and the color of each texture
+value, so that labels are mapped with a binary search (or an offset table
+when the labels are dense) instead of one dict lookup per label.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from napari.utils.colormaps._accelerated_cmap import MAPPING_OF_UNKNOWN_VALUE
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+# Labels spanning at most this many values, or at most this many times the
+# number of labels, are looked up in a dense table rather than searched.
+_DENSE_MIN_SPAN = 2**16
+_DENSE_MAX_RATIO = 4
+# Maximum number of labels whose color changed for a table to be updated
+# rather than rebuilt.
+_MAX_UPDATED_LABELS = 64
+
+
+class _DirectLabelLUT:
+    """Immutable lookup table from label values to texture values and colors.
+
+    Labels with the same color share a texture value, numbered in order of
+    first appearance, and the texture value ``MAPPING_OF_UNKNOWN_VALUE`` is
+    the color of the labels that are not in the table. Since the table is
+    never modified in place, it can be shared between copies of a colormap.
+    The table is only kept in memory: it is not saved with the layer, and
+    is built again from the color dict of a restored colormap.
+
+    Parameters
+    ----------
+    keys : np.ndarray
+        Sorted int64 or uint64 array of the labels.
+    values : np.ndarray
+        uint32 array of the texture value of each label.
+    colors : np.ndarray
+        (N, 4) float32 array of the color of each texture value.
+    """
+
+    def __init__(
+        self, keys: np.ndarray, values: np.ndarray, colors: np.ndarray
+    ) -> None:
+        self.keys = keys
+        self.values = values
+        self.colors = colors
+        # tables used to look up data of each dtype
+        self._tables: dict[np.dtype, tuple[np.ndarray, np.ndarray | int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __deepcopy__(self, memo) -> _DirectLabelLUT:
+        return self
+
+    @classmethod
+    def from_color_dict(
+        cls,
+        color_dict: Mapping[int | None, np.ndarray],
+        previous: _DirectLabelLUT | None = None,
+    ) -> _DirectLabelLUT:
+        """Build the table of a dict from labels to RGBA colors.
+
+        Parameters
+        ----------
+        color_dict : Mapping
+            Mapping from labels to colors, where None maps to the color of
+            labels that are not in the mapping.
+        previous : _DirectLabelLUT, optional
+            A table for the same labels. When only a few labels have a
+            different color, this table is updated rather than rebuilding
+            the texture values from scratch.
+        """
+        default = np.asarray(
+            color_dict.get(None, np.zeros(4)), dtype=np.float32
+        )
+        items = [(k, v) for k, v in color_dict.items() if k is not None]
+        keys = _key_array([k for k, _ in items])
+        colors = np.array(
+            [v for _, v in items], dtype=np.float32, ndmin=2
+        ).reshape(-1, 4)
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        if previous is not None and np.array_equal(previous.keys, sorted_keys):
+            sorted_colors = colors[order]
+            changed = np.flatnonzero(
+                np.any(
+                    previous.colors[previous.values] != sorted_colors, axis=1
+                )
+            )
+            if len(changed) <= _MAX_UPDATED_LABELS:
+                return previous._updated(
+                    changed, sorted_colors[changed], default
+                )
+
+        values, table = _first_appearance_indices(colors)
+        return cls(
+            sorted_keys,
+            values[order],
+            np.concatenate([default[np.newaxis], table]),
+        )
+
+    def lookup(
+        self, data: np.ndarray, dtype: np.dtype | None = None
+    ) -> np.ndarray:
+        """Map an array of labels to texture values.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            Integer array of labels.
+        dtype : np.dtype, optional
+            The dtype of the texture values, by default the smallest
+            unsigned dtype holding all of them.
+
+        Returns
+        -------
+        np.ndarray
+            The texture value of each label, of the same shape as data.
+        """
+        data = np.asarray(data)
+        if dtype is None:
+            dtype = np.min_scalar_type(len(self.colors) - 1)
+        keys, table = self._table(data.dtype)
+        if isinstance(table, np.ndarray):
+            # dense table indexed by label - keys[0], with one extra entry
+            # for labels outside of the table.
+            inside = (data >= keys[0]) & (data <= keys[-1])
+            index = np.where(inside, data - keys[0], len(table) - 1)
+            return table[index].astype(dtype, copy=False)
+        out = np.full(data.shape, MAPPING_OF_UNKNOWN_VALUE, dtype=dtype)
+        if len(keys) == 0:
+            return out
+        positions = np.minimum(np.searchsorted(keys, data), len(keys) - 1)
+        found = keys[positions] == data
+        out[found] = self.values[table + positions[found]]
+        return out
+
+    def _table(
+        self, data_dtype: np.dtype
+    ) -> tuple[np.ndarray, np.ndarray | int]:
+        """Return the keys in the range of a dtype, and how to look them up.
+
+        The second item is either a dense table of the texture values of
+        the labels between the first and last keys, or the offset of the
+        keys in ``self.values``.
+        """
+        if data_dtype in self._tables:
+            return self._tables[data_dtype]
+        data_info = np.iinfo(data_dtype)
+        keys_info = np.iinfo(self.keys.dtype)
+        low, high = np.array(
+            [
+                max(data_info.min, keys_info.min),
+                min(data_info.max, keys_info.max),
+            ],
+            dtype=self.keys.dtype,
+        )
+        start = np.searchsorted(self.keys, low, side='left')
+        stop = np.searchsorted(self.keys, high, side='right')
+        keys = self.keys[start:stop].astype(data_dtype)
+        table: np.ndarray | int = int(start)
+        if len(keys):
+            span = int(keys[-1]) - int(keys[0]) + 1
+            if span <= max(_DENSE_MIN_SPAN, _DENSE_MAX_RATIO * len(keys)):
+                table = np.full(
+                    span + 1, MAPPING_OF_UNKNOWN_VALUE, dtype=np.uint32
+                )
+                table[(keys - keys[0]).astype(np.intp)] = self.values[
+                    start:stop
+                ]
+        self._tables[data_dtype] = (keys, table)
+        return keys, table
+
+    def _updated(
+        self, positions: np.ndarray, colors: np.ndarray, default: np.ndarray
+    ) -> _DirectLabelLUT:
+        """Return a copy of the table with the colors of a few labels changed.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            The positions of the labels in ``self.keys``.
+        colors : np.ndarray
+            (N, 4) array of the new color of each label.
+        default : np.ndarray
+            The color of labels that are not in the table.
+        """
+        values = self.values.copy()
+        table = self.colors.copy()
+        table[MAPPING_OF_UNKNOWN_VALUE] = default
+        for position, color in zip(positions, colors, strict=True):
+            # texture value 0 is reserved for unknown labels
+            matches = np.flatnonzero(np.all(table[1:] == color, axis=1))
+            if len(matches) == 0:
+                table = np.concatenate([table, color[np.newaxis]])
+                matches = [len(table) - 2]
+            values[position] = matches[0] + 1
+        # drop the colors that are not used anymore
+        used = np.zeros(len(table), dtype=bool)
+        used[values] = True
+        used[MAPPING_OF_UNKNOWN_VALUE] = True
+        if not used.all():
+            renumbered = np.cumsum(used, dtype=np.uint32) - 1
+            values = renumbered[values]
+            table = table[used]
+        return type(self)(self.keys, values, table)
+
+
+def _key_array(labels: list[int]) -> np.ndarray:
+    """Return labels as an int64 array, or uint64 if they do not fit."""
+    try:
+        return np.array(labels, dtype=np.int64).reshape(-1)
+    except OverflowError:
+        return np.array(labels, dtype=np.uint64).reshape(-1)
+
+
+def _first_appearance_indices(
+    colors: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Number the distinct colors, from 1, in order of first appearance.
+
+    Returns
+    -------
+    values : np.ndarray
+        uint32 array of the number of the color of each row.
+    table : np.ndarray
+        The distinct colors, in order.
+    """
+    if len(colors) == 0:
+        return np.zeros(0, dtype=np.uint32), colors
+    # compare colors as opaque 16 byte values, which is much faster than
+    # np.unique with axis=0
+    as_bytes = np.ascontiguousarray(colors).view(
+        np.dtype((np.void, colors.dtype.itemsize * 4))
+    )[:, 0]
+    _, first, inverse = np.unique(
+        as_bytes, return_index=True, return_inverse=True
+    )
+    appearance_order = np.argsort(first)
+    rank = np.empty(len(first), dtype=np.uint32)
+    rank[appearance_order] = np.arange(1, len(first) + 1, dtype=np.uint32)
+    return rank[inverse.reshape(-1)], colors[first[appearance_order]]
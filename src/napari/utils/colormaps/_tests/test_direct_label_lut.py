@@ -0,0 +1,123 @@
+import copy
+
+import numpy as np
+import pytest
+
+from napari.utils.colormaps import DirectLabelColormap
+from napari.utils.colormaps._direct_label_lut import _DirectLabelLUT
+
+
+def _random_color_dict(labels, n_colors=5, seed=0):
+    rng = np.random.default_rng(seed)
+    colors = rng.random((n_colors, 4)).astype(np.float32)
+    color_dict = {
+        int(label): colors[rng.integers(n_colors)] for label in labels
+    }
+    color_dict[None] = np.array([1, 1, 1, 1], dtype=np.float32)
+    return color_dict
+
+
+def _expected_colors(color_dict, data):
+    return np.array(
+        [color_dict.get(int(v), color_dict[None]) for v in data.ravel()]
+    ).reshape(data.shape + (4,))
+
+
+@pytest.mark.parametrize(
+    ('labels', 'dtype'),
+    [
+        (np.arange(1, 1000), np.int32),
+        (np.arange(-500, 500), np.int32),
+        (np.arange(0, 2**40, 2**30), np.int64),
+        (np.arange(2**62, 2**62 + 2**40, 2**30), np.uint64),
+        ([2**63 + 5, 2**64 - 1, 3], np.uint64),
+    ],
+)
+def test_lookup_matches_color_dict(labels, dtype):
+    color_dict = _random_color_dict(labels)
+    lut = _DirectLabelLUT.from_color_dict(color_dict)
+    labels = np.array(labels, dtype=dtype)
+    data = np.concatenate([labels, labels + 1, labels - 1]).astype(dtype)
+    np.testing.assert_array_equal(
+        lut.colors[lut.lookup(data)], _expected_colors(color_dict, data)
+    )
+
+
+def test_texture_values_in_order_of_appearance():
+    red, green = np.array([1, 0, 0, 1]), np.array([0, 1, 0, 1])
+    lut = _DirectLabelLUT.from_color_dict(
+        {5: red, 2: green, 7: red, None: np.zeros(4)}
+    )
+    np.testing.assert_array_equal(lut.keys, [2, 5, 7])
+    np.testing.assert_array_equal(lut.values, [2, 1, 1])
+    np.testing.assert_array_equal(lut.colors, [np.zeros(4), red, green])
+
+
+def test_update_few_colors():
+    labels = np.arange(0, 10**6, 7)
+    color_dict = _random_color_dict(labels)
+    lut = _DirectLabelLUT.from_color_dict(color_dict)
+
+    new_color_dict = dict(color_dict)
+    new_color_dict[7] = np.array([0.5, 0.5, 0.5, 1], dtype=np.float32)
+    new_color_dict[14] = color_dict[21]
+    updated = _DirectLabelLUT.from_color_dict(new_color_dict, previous=lut)
+    # the labels array is reused rather than rebuilt
+    assert updated.keys is lut.keys
+    data = np.arange(100)
+    np.testing.assert_array_equal(
+        updated.colors[updated.lookup(data)],
+        _expected_colors(new_color_dict, data),
+    )
+    # the original table is unchanged
+    np.testing.assert_array_equal(
+        lut.colors[lut.lookup(data)], _expected_colors(color_dict, data)
+    )
+
+
+def test_update_drops_unused_colors():
+    red, green = np.array([1, 0, 0, 1]), np.array([0, 1, 0, 1])
+    lut = _DirectLabelLUT.from_color_dict({1: red, 2: green, None: red})
+    updated = _DirectLabelLUT.from_color_dict(
+        {1: red, 2: red, None: red}, previous=lut
+    )
+    assert len(updated.colors) == 2
+    np.testing.assert_array_equal(updated.values, [1, 1])
+
+
+def test_colormap_lut_is_shared():
+    cmap = DirectLabelColormap(
+        color_dict=_random_color_dict(np.arange(0, 2**16, 3))
+    )
+    lut = cmap._label_lut
+    data = np.arange(2**16, dtype=np.uint32)
+    expected = cmap.map(data)
+
+    cmap.selection = 3
+    cmap.use_selection = True
+    cmap.map(data)
+    cmap.use_selection = False
+    assert cmap._label_lut is lut
+    assert copy.deepcopy(cmap)._label_lut is lut
+    np.testing.assert_array_equal(cmap.map(data), expected)
+
+    # replacing the color dict rebuilds the table
+    cmap.color_dict = {1: 'red', None: 'black'}
+    assert cmap._label_lut is not lut
+    np.testing.assert_array_equal(
+        cmap.map(np.array([1, 3], dtype=np.uint32)),
+        [[1, 0, 0, 1], [0, 0, 0, 1]],
+    )
+
+
+def test_update_label_lut_from_previous_colormap():
+    color_dict = _random_color_dict(np.arange(1000))
+    previous = DirectLabelColormap(color_dict=color_dict)
+    previous._label_lut
+    cmap = DirectLabelColormap(color_dict={**color_dict, 10: 'red'})
+    cmap._update_label_lut(previous)
+    assert cmap._label_lut.keys is previous._label_lut.keys
+    np.testing.assert_array_equal(
+        cmap.map(np.array([10, 11], dtype=np.int64)),
+        [[1, 0, 0, 1], color_dict[11]],
+    )
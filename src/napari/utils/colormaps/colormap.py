@@ -24,6 +24,7 @@ from pydantic import (
 
 from napari.utils.color import ColorArray, ColorValue
 from napari.utils.colormaps import _accelerated_cmap as _accel_cmap
+from napari.utils.colormaps._direct_label_lut import _DirectLabelLUT
 from napari.utils.colormaps.colorbars import make_colorbar
 from napari.utils.colormaps.standardize_color import transform_color
 from napari.utils.events import EventedModel
@@ -437,6 +438,10 @@ class DirectLabelColormap(LabelColormapBase):
     ] = Field(default_factory=lambda: defaultdict(lambda: np.zeros(4)))
     use_selection: bool = False
     selection: int = 0
+    _lut: _DirectLabelLUT | None = PrivateAttr(None)
+    # the color dict from which _lut was built, to rebuild it when the
+    # color dict is replaced
+    _lut_source: Any = PrivateAttr(None)
 
     def __init__(self, *args, **kwargs) -> None:
         if 'colors' not in kwargs and not args:
@@ -481,8 +486,25 @@ class DirectLabelColormap(LabelColormapBase):
                 'or provide a defaultdict instance.'
             )
             v = {**v, None: 'transparent'}
+        numeric = {
+            label: color
+            for label, color in v.items()
+            if not isinstance(color, str)
+        }
+        transformed = {}
+        if numeric:
+            try:
+                # transforming all the numeric colors at once is much faster
+                # with many labels than transforming them one by one
+                colors = transform_color(list(numeric.values()))
+            except (AttributeError, KeyError, TypeError, ValueError):
+                colors = []
+            if len(colors) == len(numeric):
+                transformed = dict(zip(numeric, colors, strict=True))
         res = {
-            label: transform_color(color_str)[0]
+            label: transformed[label]
+            if label in transformed
+            else transform_color(color_str)[0]
             for label, color_str in v.items()
         }
         if (
@@ -550,9 +572,8 @@ class DirectLabelColormap(LabelColormapBase):
         return mapped
 
     def _map_without_cache(self, values: np.ndarray) -> np.ndarray:
-        cmap = self._cmap_without_selection()
-        cast = _accel_cmap.labels_raw_to_texture_direct(values, cmap)
-        return self._map_precast(cast, apply_selection=False)
+        lut = self._label_lut
+        return lut.colors[lut.lookup(values, np.dtype(np.intp))]
 
     def _map_precast(self, values, apply_selection) -> np.ndarray:
         """Map values to colors.
@@ -573,30 +594,75 @@ class DirectLabelColormap(LabelColormapBase):
         it is implemented for thumbnail labels,
         where we already have cast values
         """
-        mapped = np.zeros(values.shape + (4,), dtype=np.float32)
-        colors = self._values_mapping_to_minimum_values_set(apply_selection)[1]
-        for idx in np.ndindex(values.shape):
-            value = values[idx]
-            mapped[idx] = colors[value]
-        return mapped
+        colors = self._texture_colors(apply_selection)
+        return colors[np.asarray(values).astype(np.intp)]
+
+    @property
+    def _label_lut(self) -> _DirectLabelLUT:
+        """Lookup table from labels to texture values and colors.
+
+        The table is built once per color dict, and shared by copies of the
+        colormap, whatever the selection.
+        """
+        if self._lut is None or self._lut_source is not self.color_dict:
+            self._clear_cache()
+            self._lut = _DirectLabelLUT.from_color_dict(self.color_dict)
+            self._lut_source = self.color_dict
+        return self._lut
+
+    def _update_label_lut(self, previous: 'DirectLabelColormap') -> None:
+        """Build the lookup table by updating the one of another colormap.
+
+        When the two colormaps only differ by the colors of a few labels,
+        this is much faster than building the table from scratch.
+
+        Parameters
+        ----------
+        previous : DirectLabelColormap
+            The colormap whose table to update. Its table is only used if
+            it was already built.
+        """
+        if previous._lut is None or previous._lut_source is not (
+            previous.color_dict
+        ):
+            return
+        self._clear_cache()
+        self._lut = _DirectLabelLUT.from_color_dict(
+            self.color_dict, previous=previous._lut
+        )
+        self._lut_source = self.color_dict
+
+    def _texture_colors(self, apply_selection: bool = True) -> np.ndarray:
+        """Return the (N, 4) array of the color of each texture value."""
+        if self.use_selection and apply_selection:
+            return np.array(
+                [
+                    (0, 0, 0, 0),
+                    self.color_dict.get(self.selection, self.default_color),
+                ],
+                dtype=np.float32,
+            )
+        return self._label_lut.colors
 
-    @cached_property
+    @property
     def _num_unique_colors(self) -> int:
         """Count the number of unique colors in the colormap.
 
         This number does not include background or the default color for
         unmapped labels.
         """
-        return len({tuple(x) for x in self.color_dict.values()})
+        colors = self._label_lut.colors
+        default_is_label_color = np.any(
+            np.all(colors[1:] == colors[0], axis=1)
+        )
+        if None in self.color_dict and not default_is_label_color:
+            return len(colors)
+        return len(colors) - 1
 
     def _clear_cache(self):
         super()._clear_cache()
-        if '_num_unique_colors' in self.__dict__:
-            del self.__dict__['_num_unique_colors']
-        if '_label_mapping_and_color_dict' in self.__dict__:
-            del self.__dict__['_label_mapping_and_color_dict']
-        if '_array_map' in self.__dict__:
-            del self.__dict__['_array_map']
+        self._lut = None
+        self._lut_source = None
 
     def _values_mapping_to_minimum_values_set(
         self, apply_selection=True
@@ -623,33 +689,23 @@ class DirectLabelColormap(LabelColormapBase):
 
         return self._label_mapping_and_color_dict
 
-    @cached_property
+    @property
     def _label_mapping_and_color_dict(
         self,
     ) -> tuple[dict[int | None, int], dict[int, np.ndarray]]:
-        color_to_labels: dict[tuple[int, ...], list[int | None]] = {}
-        labels_to_new_labels: dict[int | None, int] = {
-            None: _accel_cmap.MAPPING_OF_UNKNOWN_VALUE
-        }
-        new_color_dict: dict[int, np.ndarray] = {
-            _accel_cmap.MAPPING_OF_UNKNOWN_VALUE: self.default_color,
-        }
-
-        for label, color in self.color_dict.items():
-            if label is None:
-                continue
-            color_tup = tuple(color)
-            if color_tup not in color_to_labels:
-                color_to_labels[color_tup] = [label]
-                labels_to_new_labels[label] = len(new_color_dict)
-                new_color_dict[labels_to_new_labels[label]] = color
-            else:
-                color_to_labels[color_tup].append(label)
-                labels_to_new_labels[label] = labels_to_new_labels[
-                    color_to_labels[color_tup][0]
-                ]
-
-        return labels_to_new_labels, new_color_dict
+        lut = self._label_lut
+        if 'label_mapping' not in self._cache_other:
+            labels_to_new_labels: dict[int | None, int] = {
+                None: _accel_cmap.MAPPING_OF_UNKNOWN_VALUE
+            }
+            labels_to_new_labels.update(
+                zip(lut.keys.tolist(), lut.values.tolist(), strict=True)
+            )
+            self._cache_other['label_mapping'] = (
+                labels_to_new_labels,
+                dict(enumerate(lut.colors)),
+            )
+        return self._cache_other['label_mapping']
 
     def _get_typed_dict_mapping(self, data_dtype: np.dtype) -> 'typed.Dict':
         """Create mapping from label values to texture values of smaller dtype.
@@ -670,7 +726,7 @@ class DirectLabelColormap(LabelColormapBase):
         Dict[Optional[int], int]
             Mapping from original values to minimal texture value set.
         """
-
+        lut = self._label_lut
         # we cache the result to avoid recomputing it on each slice;
         # check first if it's already in the cache.
         key = f'_{data_dtype}_typed_dict'
@@ -689,48 +745,16 @@ class DirectLabelColormap(LabelColormapBase):
             value_type=getattr(types, target_type.name),
         )
         iinfo = np.iinfo(data_dtype)
-        for k, v in self._label_mapping_and_color_dict[0].items():
+        for k, v in zip(lut.keys.tolist(), lut.values.tolist(), strict=True):
             # ignore values outside the data dtype, since they will never need
             # to be colormapped from that dtype.
-            if k is not None and iinfo.min <= k <= iinfo.max:
+            if iinfo.min <= k <= iinfo.max:
                 dkt[data_dtype.type(k)] = target_type.type(v)
 
         self._cache_other[key] = dkt
 
         return dkt
 
-    @cached_property
-    def _array_map(self):
-        """Create an array to map labels to texture values of smaller dtype."""
-
-        max_value = max(
-            (abs(x) for x in self.color_dict if x is not None), default=0
-        )
-        if any(x < 0 for x in self.color_dict if x is not None):
-            max_value *= 2
-        if max_value > 2**16:
-            raise RuntimeError(  # pragma: no cover
-                'Cannot use numpy implementation for large values of labels '
-                'direct colormap. Please install numba.'
-            )
-        dtype = _accel_cmap.minimum_dtype_for_labels(
-            self._num_unique_colors + 2
-        )
-        label_mapping = self._values_mapping_to_minimum_values_set()[0]
-
-        # We need 2 + the max value: one because we will be indexing with the
-        # max value, and an extra one so that higher values get clipped to
-        # that index and map to the default value, rather than to the max
-        # value in the map.
-        mapper = np.full(
-            (max_value + 2), _accel_cmap.MAPPING_OF_UNKNOWN_VALUE, dtype=dtype
-        )
-        for key, val in label_mapping.items():
-            if key is None:
-                continue
-            mapper[key] = val
-        return mapper
-
     @property
     def default_color(self) -> np.ndarray:
         return self.color_dict.get(None, np.array((0, 0, 0, 0)))
@@ -903,12 +927,11 @@ def _cast_labels_data_to_texture_dtype_direct(
         return data
 
     if isinstance(data, np.integer):
-        mapper = direct_colormap._label_mapping_and_color_dict[0]
         target_dtype = _accel_cmap.minimum_dtype_for_labels(
             direct_colormap._num_unique_colors + 2
         )
         return target_dtype.type(
-            mapper.get(int(data), _accel_cmap.MAPPING_OF_UNKNOWN_VALUE)
+            direct_colormap._label_lut.lookup(data, target_dtype)
         )
 
     original_shape = np.shape(data)